@@ -1,23 +1,36 @@
-from . import fecparser, cache
-import requests
+import importlib
+import sys
+
+from . import fecparser, cache, client, records, zipfiles
+
+
+__version__ = '0.9.1'
 
 
 FecParserMissingMappingError = cache.FecParserMissingMappingError
+FecTable = fecparser.FecTable
+FecRecord = records.FecRecord
+FecItem = fecparser.FecItem
+ParserState = fecparser.ParserState
+FecClient = client.FecClient
+FilingUnavailableError = client.FilingUnavailableError
+
+# modules that aren't needed to parse a filing are imported the first time
+# they're used, so they don't slow down importing fecfile
+LAZY_MODULES = (
+    'database', 'dataframes', 'export', 'jsonl', 'parallel', 'parsecache',
+)
 
 
-class FilingUnavailableError(Exception):
-    """when http requests for neither the electronic nor paper version
-    of a filing return a 200 status code. Note: for now we don't
-    differentiate between when a filing is unavailable because
-    the request is returning a 500 error and when it doesn't exist and
-    returns 404 errors for both paper and electronic urls"""
-    def __init__(self, opts, msg=None):
-        if msg is None:
-            msg = ('The requested FEC file number ({}) is unavailable. Status code {}.'.format(
-                opts['file_number'],
-                opts['status_code']
-            ))
-        super(FilingUnavailableError, self).__init__(msg)
+def __getattr__(name):
+    if name in LAZY_MODULES:
+        return importlib.import_module('.' + name, __name__)
+    if name == 'ParseResult':
+        from .parallel import ParseResult
+        return ParseResult
+    raise AttributeError(
+        'module {0!r} has no attribute {1!r}'.format(__name__, name)
+    )
 
 
 def loads(input, options={}):
@@ -33,7 +46,37 @@ def loads(input, options={}):
     Including {'as_strings': True} in the options dictionary will not attempt
     to convert values that are normally numeric or datetimes to their native
     python types and will return dictionaries with all values as strings.
+    Including {'stream_csv': True} will split comma-delimited filings
+    (versions 1, 2, 3 and 5) with a single csv reader for the whole filing,
+    which correctly handles quoted values containing newlines. It is about
+    as fast as splitting each line on its own.
+    Including {'columnar': True} will return each type of itemization as an
+    FecTable, which stores values in columns rather than as a list of
+    dictionaries and uses much less memory for large filings.
+    Including {'columns': ['contribution_date', 'contribution_amount']}
+    will only include (and convert the types of) those columns, plus
+    form_type, in itemizations. The header, the filing and text records are
+    always complete.
+    Dates are timezone aware datetimes in US/Eastern, unless options
+    includes {'dates': 'naive'} for naive datetimes, or {'dates': 'date'}
+    for datetime.date instances, which skips the timezone work entirely.
+    Including {'intern': True} will share one string object between equal
+    values of columns that usually repeat across many rows, such as states,
+    cities, employers and codes, which saves memory for large filings.
+    Including {'records': True} will return each row parsed from a line
+    (the filing, itemizations and text records) as an FecRecord, a tuple
+    with an attribute for each column and a to_dict method, instead of a
+    dictionary, which takes about half the memory.
+    If a parse cache has been set up with ``set_parse_cache``, results for
+    ``str`` input are loaded from and saved to it.
     """
+    # set_parse_cache imports parsecache, so it's off until then
+    parsecache = sys.modules.get(__name__ + '.parsecache')
+    if parsecache and parsecache.enabled() and type(input) is str:
+        return parsecache.cached(
+            parsecache.text_digest(input), options,
+            lambda: fecparser.loads(input, options),
+        )
     return fecparser.loads(input, options)
 
 
@@ -55,7 +98,7 @@ def parse_header(hdr):
         return fecparser.parse_header([hdr])
 
 
-def parse_line(line, version, line_num=None):
+def parse_line(line, version, line_num=None, columns=None, dates=None):
     """Deserialize a ``line`` (a ``str`` instance
     containing a line from an FEC document) to a Python object.
 
@@ -65,8 +108,16 @@ def parse_line(line, version, line_num=None):
     ``line_num`` is optional and is used for debugging. If an error or
     warning is encountered, whatever is passed in to ``line_num`` will be
     included in the error/warning message.
+
+    ``columns`` is an optional list of the keys to include, in which case
+    only those values (and form_type) are converted.
+
+    ``dates`` can be 'naive' or 'date', as with the ``dates`` option to
+    ``loads``.
     """
-    return fecparser.parse_line(line, version, line_num)
+    return fecparser.parse_line(
+        line, version, line_num, columns=columns, dates=dates
+    )
 
 
 def from_http(file_number, options={}):
@@ -75,31 +126,60 @@ def from_http(file_number, options={}):
     either a ``str`` or ``int`` as a ``file_number`` and requests it from
     the ``docquery.fec.gov`` server, then parses the response.
     """
-    url = 'https://docquery.fec.gov/dcdev/posted/{n}.fec'.format(n=file_number)
-    req_headers = {'User-Agent': 'Mozilla/5.0'}
-    r = requests.get(url, headers=req_headers, stream=True)
-    if r.status_code == 404:
-        url = 'https://docquery.fec.gov/paper/posted/{n}.fec'.format(
-            n=file_number
-        )
-        r = requests.get(url, headers=req_headers, stream=True)
-    if r.status_code == 404:
-        return None
-    return fecparser.loads(r.iter_lines(), options=options)
+    return client.default_client().from_http(file_number, options)
 
 
 def from_file(file_path, options={}):
     """Utility method for getting a parsed Python representation of an FEC
     filing when you have the .fec file on your computer. This method takes
     a ``str`` of the path to the file, and returns the parsed Python object.
+    The file is read a line at a time through a memory map, and each line is
+    decoded as UTF-8, or as ISO-8859-1 if that fails.
+    If a parse cache has been set up with ``set_parse_cache``, the result is
+    loaded from it when the same file has been parsed with the same options
+    before.
+    """
+    parsecache = sys.modules.get(__name__ + '.parsecache')
+    if parsecache and parsecache.enabled():
+        return parsecache.cached(
+            parsecache.file_digest(file_path), options,
+            lambda: fecparser.parse_file(file_path, options),
+        )
+    return fecparser.parse_file(file_path, options)
+
+
+def cache_stats():
+    """Returns a dictionary with the size, maximum size, and number of hits,
+    misses and evictions of each of the caches used while parsing
+    (``mappings``, ``types`` and ``row_decoders``).
+    """
+    return cache.stats()
+
+
+def clear_cache():
+    """Empties the caches used while parsing and resets their counters.
+    """
+    cache.clear()
+
+
+def set_cache_size(maxsize, name=None):
+    """Sets the maximum number of entries kept in the cache called ``name``
+    (one of the keys returned by ``cache_stats``), or in all of them if
+    ``name`` is not given. Least recently used entries are evicted first.
+    """
+    cache.resize(maxsize, name)
+
+
+def set_parse_cache(cache_dir, max_bytes=2 ** 30):
+    """Saves the results of ``from_file`` and ``loads`` in ``cache_dir``, so
+    parsing the same filing again with the same options loads the saved
+    result instead. Results are keyed by a hash of the filing's contents,
+    the version of fecfile and the options. Once the saved results take up
+    more than ``max_bytes``, the least recently used are deleted. Pass None
+    as ``cache_dir`` to stop using the cache.
     """
-    try:
-        with open(file_path, 'r') as file:
-            unparsed = file.read()
-    except UnicodeDecodeError:
-        with open(file_path, 'r', encoding='ISO-8859-1') as file:
-            unparsed = file.read()
-    return fecparser.loads(unparsed, options=options)
+    from . import parsecache
+    parsecache.configure(cache_dir, max_bytes)
 
 
 def print_example(parsed):
@@ -120,35 +200,204 @@ def iter_http(file_number, options={}):
     string. This method avoids loading the entire filing into memory, as the
     from_http method does.
     """
-    url = 'https://docquery.fec.gov/dcdev/posted/{n}.fec'.format(n=file_number)
-    req_headers = {'User-Agent': 'Mozilla/5.0'}
-    r = requests.get(url, headers=req_headers, stream=True)
-    if r.status_code == 404:
-        url = 'https://docquery.fec.gov/paper/posted/{n}.fec'.format(
-            n=file_number
-        )
-        r = requests.get(url, headers=req_headers, stream=True)
-    if r.status_code == 200:
-        for item in fecparser.iter_lines(r.iter_lines(), options=options):
-            yield item
-    else:
-        raise FilingUnavailableError({'file_number': file_number, 'status_code': r.status_code})
+    return client.default_client().iter_http(file_number, options)
 
 
-def iter_file(file_path, options={}):
+def iter_file(file_path, options={}, state=None):
     """Opens a file at the given file_path and iterates over its
     contents, yielding FecItem instances, which consist of data and
     data_type attributes. The data_type attribute can be one of "header",
     "summary", "itemization", "text", or "F99_text". The data attribute is a
     dictionary for all data types except for "F99_text", for which it is a
     string. This method avoids loading the entire filing into memory, as the
-    from_file method does.
+    from_file method does. Each line is decoded as UTF-8, or as ISO-8859-1 if
+    that fails, so a line in another encoding never restarts the iteration.
+    FecItems also have line_num and offset attributes, the line number and
+    byte offset of the line they start on.
+
+    ``state`` is an optional ParserState, which is updated as each item is
+    yielded. Its ``token`` method returns a resume token for everything up
+    to and including the last item yielded, a dictionary that can be pickled
+    or saved as json. Passing a resume token (or a ParserState made from one
+    with ``ParserState.from_token``) as ``state`` seeks straight to where it
+    left off and yields the items after it, without reading anything before
+    that point.
     """
-    try:
-        with open(file_path, 'r') as file:
-            for item in fecparser.iter_lines(file, options=options):
-                yield item
-    except UnicodeDecodeError:
-        with open(file_path, 'r', encoding='ISO-8859-1') as file:
-            for item in fecparser.iter_lines(file, options=options):
+    if state is None:
+        state = fecparser.ParserState()
+    elif type(state) is dict:
+        state = fecparser.ParserState.from_token(state)
+    with open(file_path, 'rb') as file:
+        with fecparser.memory_map(file) as mapped:
+            mapped.seek(state.offset)
+            lines = fecparser.LineReader(mapped, state.offset)
+            for item in fecparser.iter_lines(lines, options, state):
                 yield item
+
+
+def iter_batches(file_path, options={}, batch_size=10000):
+    """Opens a file at the given file_path and iterates over its contents
+    like iter_file does, except that itemizations are collected into FecTable
+    instances, one per itemization type, instead of being yielded one at a
+    time. Each time a table reaches ``batch_size`` rows, it is yielded as the
+    data of an FecItem with a data_type of "itemizations", and the remaining
+    tables are yielded at the end of the filing. Those FecItems have None as
+    their line_num and offset, since their rows come from many lines.
+    """
+    with open(file_path, 'rb') as file:
+        lines = fecparser.map_lines(file)
+        for item in fecparser.iter_batches(lines, options, batch_size):
+            yield item
+
+
+def to_dataframes(file_path, options={}):
+    """Parses the .fec file at the given file_path and returns a dictionary
+    with a pandas DataFrame for each type of itemization (``Schedule A``,
+    ``Schedule B``, etc.). The DataFrames are built directly from the parsed
+    columns, converting numbers and dates a column at a time with dtypes
+    taken from types.json, instead of from a dictionary per row. Requires
+    pandas, which is not installed with fecfile.
+    """
+    from . import dataframes
+    as_strings = options.get('as_strings', False)
+    parsed = from_file(
+        file_path,
+        options=dict(options, columnar=True, as_strings=True),
+    )
+    return {
+        k: dataframes.table_to_dataframe(
+            table, as_strings, options.get('dates')
+        )
+        for k, table in parsed['itemizations'].items()
+    }
+
+
+def to_arrow(file_path, options={}):
+    """Parses the .fec file at the given file_path and returns a dictionary
+    with a pyarrow Table for each type of itemization, with column types
+    taken from types.json. Requires pyarrow, which is not installed with
+    fecfile.
+    """
+    from . import dataframes
+    parsed = from_file(file_path, options=dict(options, columnar=True))
+    return {
+        k: dataframes.table_to_arrow(
+            table, options.get('as_strings', False), options.get('dates')
+        )
+        for k, table in parsed['itemizations'].items()
+    }
+
+
+def to_csv(file_path, out_dir, options={}, batch_size=10000):
+    """Parses the .fec file at the given file_path and writes a CSV file for
+    each type of itemization to ``out_dir``, named after the type (such as
+    ``schedule_a.csv``). The columns of each file, and their order, come
+    from mappings.json for the filing's version, so a file has a column for
+    every field of every form in its schedule whether or not the filing
+    uses it. Rows are written ``batch_size`` at a time as they are parsed,
+    so the filing is never held in memory. Returns a dictionary of the paths
+    written, keyed by itemization type.
+    """
+    from . import export
+    with open(file_path, 'rb') as file:
+        return export.write_tables(
+            fecparser.map_lines(file), out_dir, 'csv', options, batch_size
+        )
+
+
+def to_parquet(file_path, out_dir, options={}, batch_size=10000):
+    """Like ``to_csv``, but writes a Parquet file for each type of
+    itemization, with a row group for every ``batch_size`` rows and column
+    types taken from types.json. Requires pyarrow, which is not installed
+    with fecfile.
+    """
+    from . import export
+    with open(file_path, 'rb') as file:
+        return export.write_tables(
+            fecparser.map_lines(file), out_dir, 'parquet', options, batch_size
+        )
+
+
+def load_into(conn, source, options={}, filing_id=None,
+              batch_size=10000, table_prefix='', commit=True):
+    """Loads the itemizations in ``source`` (the path to a .fec file, or an
+    iterable of its lines) into a table per itemization type, such as
+    ``schedule_a``, through the DB-API connection ``conn``. Tables are
+    created if they don't exist, with columns from mappings.json and column
+    types from types.json, and any columns an existing table is missing are
+    added. Each row also has a ``filing_id`` column, which defaults to the
+    name of the file without its extension. Rows are inserted with one
+    ``executemany`` call for every ``batch_size`` rows as the filing is
+    parsed. ``table_prefix`` is prepended to each table's name. The
+    transaction is committed at the end unless ``commit`` is False. Returns
+    a dictionary of the number of rows inserted into each table.
+    """
+    from . import database
+    return database.load_into(
+        conn, source, options, filing_id, batch_size, table_prefix, commit
+    )
+
+
+def parse_many(file_paths, workers=None, options={}):
+    """Parses each of the .fec files in ``file_paths`` with ``from_file`` in
+    a pool of ``workers`` processes (by default, one per CPU), and iterates
+    over ParseResult instances as each file finishes, which may not be in the
+    order given. A ParseResult has ``path``, ``data`` and ``error``
+    attributes. ``data`` is the parsed filing, or None if parsing raised an
+    exception, which is then in ``error``; one bad filing doesn't stop the
+    rest. Each worker loads the mappings and compiles their regexes once,
+    before it parses anything.
+    """
+    from . import parallel
+    for result in parallel.parse_many(from_file, file_paths, workers, options):
+        yield result
+
+
+def iter_file_parallel(file_path, options={}, workers=None,
+                       chunk_size=2 ** 24):
+    """Iterates over the .fec file at the given file_path like iter_file,
+    yielding the same FecItem instances in the same order, but splits
+    everything after the summary line into ranges of roughly ``chunk_size``
+    bytes that are parsed in a pool of ``workers`` processes. Ranges always
+    begin at the start of a line and never inside a ``[BEGINTEXT]`` section.
+    This is meant for very large filings. The ``stream_csv`` option is
+    ignored, and warnings about values that can't be parsed are raised in
+    the worker processes.
+    """
+    from . import parallel
+    return parallel.iter_file_chunks(file_path, options, workers, chunk_size)
+
+
+def dump_jsonl(source, out, options={}):
+    """Writes a filing as JSON Lines, with one object per line for each
+    FecItem iter_file would yield, holding its ``data_type`` and ``data``.
+    Dates are written as ISO 8601 strings. ``source`` is the path to a .fec
+    file or an iterable of its lines, and ``out`` is a path or a file opened
+    for writing text. Rows are written as they are parsed, so memory use
+    doesn't grow with the size of the filing. Returns the number of lines
+    written.
+    """
+    from . import jsonl
+    return jsonl.dump_jsonl(source, out, options)
+
+
+def iter_zip(zip_path, options={}, filing_ids=None, form_types=None,
+             workers=1):
+    """Iterates over the filings in a zip archive, such as the FEC's daily
+    bulk downloads, without extracting them to disk. Yields a
+    ``(filing_id, items)`` tuple for each filing, where ``filing_id`` is the
+    name of the .fec file without its extension and ``items`` are the
+    FecItem instances iter_file would yield for it.
+
+    ``filing_ids`` limits the filings to the given ids, without reading the
+    others. ``form_types`` limits them to filings whose summary line has a
+    form type starting with one of the given strings (for example, ``F3X``
+    matches ``F3XN`` and ``F3XA``); only the first lines of other filings are
+    read.
+
+    With the default of one worker, ``items`` is an iterator that parses the
+    filing as it is consumed, and must be consumed before moving on to the
+    next filing. With more workers, filings are parsed in a pool of processes
+    and yielded in the order they finish, with ``items`` as a list.
+    """
+    return zipfiles.iter_zip(zip_path, options, filing_ids, form_types, workers)
@@ -0,0 +1,202 @@
+import asyncio
+from contextlib import asynccontextmanager
+from itertools import islice
+import queue
+
+from . import fecparser
+from .client import FilingUnavailableError, REQUEST_HEADERS, URLS
+from .parallel import ParseResult
+
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+READ_SIZE = 64 * 1024
+BATCH_SIZE = 1000
+
+
+def import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError(
+            'fecfile.aio requires aiohttp, which can be installed '
+            'with `pip install aiohttp`'
+        )
+    return aiohttp
+
+
+def unavailable(file_number, status_code):
+    return FilingUnavailableError(
+        {'file_number': file_number, 'status_code': status_code}
+    )
+
+
+@asynccontextmanager
+async def client_session(session, concurrency=None):
+    """ yields ``session``, or a new session with a pool of ``concurrency``
+    connections that is closed afterwards """
+    if session is not None:
+        yield session
+        return
+    aiohttp = import_aiohttp()
+    connector = aiohttp.TCPConnector(limit=concurrency or 100)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        yield session
+
+
+async def get(session, url, retries, backoff):
+    """ requests ``url``, retrying connection errors and responses with a
+    status in RETRY_STATUSES up to ``retries`` times, waiting ``backoff``
+    seconds before the first retry and twice as long before each one after
+    that """
+    aiohttp = import_aiohttp()
+    for attempt in range(retries + 1):
+        try:
+            response = await session.get(url, headers=REQUEST_HEADERS)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == retries:
+                raise
+        else:
+            if response.status not in RETRY_STATUSES or attempt == retries:
+                return response
+            response.release()
+        await asyncio.sleep(backoff * 2 ** attempt)
+
+
+async def request_filing(session, file_number, urls, retries, backoff):
+    """ returns the response from the first of ``urls`` that doesn't return
+    a 404 error, or the last 404 response """
+    for url in urls:
+        response = await get(
+            session, url.format(n=file_number), retries, backoff
+        )
+        if response.status != 404:
+            break
+        response.release()
+    return response
+
+
+def lines_from_chunks(chunks):
+    """Iterates over the lines in the chunks of bytes taken from the queue
+    ``chunks``, without line endings, until it takes None."""
+    pending = b''
+    for chunk in iter(chunks.get, None):
+        lines = (pending + chunk).splitlines(True)
+        if lines and not lines[-1].endswith(b'\n'):
+            pending = lines.pop()
+        else:
+            pending = b''
+        for line in lines:
+            yield line.rstrip(b'\r\n')
+    if pending:
+        yield pending.rstrip(b'\r')
+
+
+def take(iterator, n):
+    return list(islice(iterator, n))
+
+
+@asynccontextmanager
+async def response_lines(response):
+    """Reads the body of ``response`` in the background, and yields an
+    iterator over its lines that blocks until each one has arrived, so it
+    must be consumed in another thread. Errors reading the body are raised
+    on exit, after the iterator has run out."""
+    chunks = queue.SimpleQueue()
+
+    async def read():
+        try:
+            async for chunk in response.content.iter_chunked(READ_SIZE):
+                chunks.put(chunk)
+        finally:
+            chunks.put(None)
+
+    reader = asyncio.ensure_future(read())
+    try:
+        yield lines_from_chunks(chunks)
+    except BaseException:
+        reader.cancel()
+        raise
+    finally:
+        response.release()
+    await reader
+
+
+async def iter_http(file_number, options={}, session=None, retries=3,
+                    backoff=0.5, urls=URLS):
+    """Asynchronously iterates over the FecItem instances in the filing with
+    the given ``file_number``, like ``fecfile.iter_http``, parsing lines as
+    they arrive. Lines are parsed in a thread, and items are yielded in
+    batches, so other requests on the event loop can make progress in the
+    meantime. Connection errors and 429 or 5xx responses are retried up to
+    ``retries`` times, with exponential backoff starting at ``backoff``
+    seconds. Pass an ``aiohttp.ClientSession`` as ``session`` to share its
+    connection pool between requests; otherwise one is created for this
+    filing. Raises FilingUnavailableError if the filing can't be found.
+    """
+    loop = asyncio.get_running_loop()
+    async with client_session(session) as session:
+        response = await request_filing(
+            session, file_number, urls, retries, backoff
+        )
+        if response.status != 200:
+            response.release()
+            raise unavailable(file_number, response.status)
+        async with response_lines(response) as lines:
+            items = fecparser.iter_lines(lines, options)
+            while True:
+                batch = await loop.run_in_executor(
+                    None, take, items, BATCH_SIZE
+                )
+                for item in batch:
+                    yield item
+                if len(batch) < BATCH_SIZE:
+                    break
+
+
+async def fetch_one(session, file_number, options, retries, backoff, urls):
+    loop = asyncio.get_running_loop()
+    try:
+        response = await request_filing(
+            session, file_number, urls, retries, backoff
+        )
+        if response.status == 404:
+            return ParseResult(file_number)
+        if response.status != 200:
+            response.release()
+            raise unavailable(file_number, response.status)
+        async with response_lines(response) as lines:
+            parsed = await loop.run_in_executor(
+                None, fecparser.loads, lines, options
+            )
+        return ParseResult(file_number, parsed)
+    except Exception as ex:
+        return ParseResult(file_number, error=ex)
+
+
+async def fetch_many(file_numbers, options={}, concurrency=10, session=None,
+                     retries=3, backoff=0.5, urls=URLS):
+    """Downloads and parses the filings with the given ``file_numbers``,
+    with up to ``concurrency`` requests in flight at once, and asynchronously
+    iterates over ParseResult instances as each filing finishes, which may
+    not be in the order given. A ParseResult's ``path`` is the file number,
+    and its ``data`` is the filing parsed as by ``fecfile.from_http``, or None
+    if the filing can't be found. If a filing can't be downloaded or parsed,
+    the exception is in ``error`` and the other filings carry on. Retries
+    and ``session`` work as they do for ``iter_http``.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(file_number):
+        async with semaphore:
+            return await fetch_one(
+                session, file_number, options, retries, backoff, urls
+            )
+
+    async with client_session(session, concurrency) as session:
+        tasks = [asyncio.ensure_future(fetch(n)) for n in file_numbers]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
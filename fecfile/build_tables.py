@@ -0,0 +1,39 @@
+"""Generates fecfile/tables.py from mappings.json and types.json.
+
+The JSON files remain the source of truth. Run ``python -m fecfile.build_tables``
+after editing either of them so that the generated module, which is much
+faster to load than parsing the JSON, stays in sync.
+"""
+import json
+import os
+import pprint
+
+
+this_dir = os.path.dirname(os.path.abspath(__file__))
+mappings_file = os.path.join(this_dir, 'mappings.json')
+types_file = os.path.join(this_dir, 'types.json')
+tables_file = os.path.join(this_dir, 'tables.py')
+
+HEADER = ('# generated by `python -m fecfile.build_tables` from mappings.json '
+          'and types.json\n# do not edit this file directly\n')
+
+
+def render_tables():
+    with open(mappings_file) as data_file:
+        mappings = json.loads(data_file.read())
+    with open(types_file) as data_file:
+        types = json.loads(data_file.read())
+    return '{h}\nMAPPINGS = {m}\n\nTYPES = {t}\n'.format(
+        h=HEADER,
+        m=pprint.pformat(mappings, sort_dicts=False),
+        t=pprint.pformat(types, sort_dicts=False),
+    )
+
+
+def main():
+    with open(tables_file, 'w') as outf:
+        outf.write(render_tables())
+
+
+if __name__ == '__main__':
+    main()
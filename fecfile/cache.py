@@ -1,11 +1,104 @@
+from collections import OrderedDict
+import os
 import re
+import time
+
+
+class LRUCache:
+    """A dictionary-like cache holding at most ``maxsize`` entries. When it is
+    full, the least recently used entry is evicted. Counts hits, misses and
+    evictions so long-running processes can check how well it is working."""
+    def __init__(self, maxsize):
+        self.data = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getitem__(self, key):
+        try:
+            value = self.data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def __setitem__(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        self.evict()
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __len__(self):
+        return len(self.data)
+
+    def evict(self):
+        while len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxsize):
+        self.maxsize = maxsize
+        self.evict()
+
+    def clear(self):
+        self.data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        return {
+            'size': len(self.data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
 
 
 MAPPING_CACHE_KEY = "%s:%s"
-MAPPING_CACHE = {}
+MAPPING_CACHE = LRUCache(1024)
 
 TYPE_CACHE_KEY = "%s:%s:%s"
-TYPE_CACHE = {}
+TYPE_CACHE = LRUCache(32768)
+
+ROW_DECODER_CACHE = LRUCache(1024)
+
+CACHES = {
+    'mappings': MAPPING_CACHE,
+    'types': TYPE_CACHE,
+    'row_decoders': ROW_DECODER_CACHE,
+}
+
+PREFIX_LENGTH = 2
+
+
+def normalize_form(form):
+    """ equivalent spellings of a form type share cache entries """
+    return form.strip().upper()
+
+
+def clear():
+    """ empties every cache and resets its counters """
+    for c in CACHES.values():
+        c.clear()
+
+
+def stats():
+    """ returns the size and hit/miss/eviction counts of every cache """
+    return {name: c.stats() for name, c in CACHES.items()}
+
+
+def resize(maxsize, name=None):
+    """ sets the maximum size of the named cache, or of all of them """
+    for cache_name, c in CACHES.items():
+        if name is None or name == cache_name:
+            c.resize(maxsize)
 
 
 class FecParserMissingMappingError(Exception):
@@ -17,18 +110,187 @@ class FecParserMissingMappingError(Exception):
                 v=opts['version'],
                 f=opts['form'],
             )
+        self.opts = opts
         super(FecParserMissingMappingError, self).__init__(msg)
 
+    def __reduce__(self):
+        return (self.__class__, (self.opts, str(self)))
+
+
+def closing_paren(pattern):
+    """ index of the parenthesis closing the group that opens ``pattern`` """
+    depth = 0
+    in_class = False
+    for i, char in enumerate(pattern):
+        if in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def literal_prefix(pattern):
+    """Returns the lowercase literal text that every string matched by
+    ``pattern`` (with ``re.match``) must start with, or an empty string if
+    there is none we can be sure of."""
+    branches = []
+    depth = 0
+    in_class = False
+    branch_start = 0
+    for i, char in enumerate(pattern):
+        if char == '\\':
+            return ''
+        if in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            branches.append(pattern[branch_start:i])
+            branch_start = i + 1
+    branches.append(pattern[branch_start:])
+    if len(branches) > 1:
+        return os.path.commonprefix([literal_prefix(b) for b in branches])
+    branch = pattern.lstrip('^')
+    if branch.startswith('('):
+        if branch.endswith(')') and closing_paren(branch) == len(branch) - 1:
+            return literal_prefix(branch[1:-1])
+        return ''
+    prefix = ''
+    for i, char in enumerate(branch):
+        if not (char.isalnum() or char == '_'):
+            if char in '*?{':
+                prefix = prefix[:-1]
+            break
+        prefix += char
+    return prefix.lower()
+
+
+class IndexEntry:
+    """One form regex of a RegexIndex along with its version regexes. The
+    patterns are compiled the first time the entry is a lookup candidate, so
+    forms that never appear in a filing cost nothing to load."""
+    def __init__(self, position, form_regex, versions, compile_value=None):
+        self.position = position
+        self.prefix = literal_prefix(form_regex)
+        self.form_regex = form_regex
+        self.raw_versions = versions
+        self.compile_value = compile_value
+        self.pattern = None
+        self.versions = None
+
+    def compile(self):
+        # pattern is set last, so a thread that finds it set can rely on
+        # versions; two threads compiling the same entry does no harm
+        pattern = re.compile(self.form_regex, re.IGNORECASE)
+        self.versions = [
+            (
+                re.compile(version_regex, re.IGNORECASE),
+                self.compile_value(value) if self.compile_value else value,
+            )
+            for version_regex, value in self.raw_versions.items()
+        ]
+        self.pattern = pattern
+
+    def match(self, form):
+        if self.pattern is None:
+            self.compile()
+        return self.pattern.match(form)
+
+    def values(self, version):
+        return [v for p, v in self.versions if p.match(version)]
+
+
+class RegexIndex:
+    """Lookup table for the ``{form_regex: {version_regex: value}}``
+    dictionaries in mappings.json and types.json. Form patterns are grouped by
+    the literal text they start with, so a lookup only tries the regexes that
+    could possibly match instead of every key in the file. Matches are returned
+    in the same order as the keys of the original dictionary."""
+    def __init__(self, table, compile_value=None):
+        start = time.perf_counter()
+        self.entries = [
+            IndexEntry(position, form_regex, versions, compile_value)
+            for position, (form_regex, versions) in enumerate(table.items())
+        ]
+        self.buckets = {}
+        self.short_entries = []
+        for entry in self.entries:
+            if len(entry.prefix) >= PREFIX_LENGTH:
+                key = entry.prefix[:PREFIX_LENGTH]
+                self.buckets.setdefault(key, []).append(entry)
+            else:
+                self.short_entries.append(entry)
+        for key, bucket in self.buckets.items():
+            bucket.extend(
+                e for e in self.short_entries if key.startswith(e.prefix)
+            )
+            bucket.sort(key=lambda e: e.position)
+        self.build_time = time.perf_counter() - start
+
+    def candidates(self, form):
+        lowered = form.lower()
+        bucket = self.buckets.get(lowered[:PREFIX_LENGTH], self.short_entries)
+        return [e for e in bucket if lowered.startswith(e.prefix)]
+
+    def compile_all(self):
+        for entry in self.entries:
+            if entry.pattern is None:
+                entry.compile()
+
+    def lookup(self, form, version):
+        """Returns the values for every form regex matching ``form`` and, within
+        each of those, every version regex matching ``version``, in order."""
+        matches = []
+        for entry in self.candidates(form):
+            if entry.match(form):
+                matches.extend(entry.values(version))
+        return matches
+
+
+def compile_properties(properties):
+    return [
+        (re.compile(k, re.IGNORECASE), v) for k, v in properties.items()
+    ]
+
+
+MAPPING_INDEXES = {}
+TYPE_INDEXES = {}
+
+
+def getMappingIndex(mappings):
+    """ builds the RegexIndex for a mappings dict once and caches it """
+    try:
+        return MAPPING_INDEXES[id(mappings)][1]
+    except KeyError:
+        index = RegexIndex(mappings)
+        MAPPING_INDEXES[id(mappings)] = (mappings, index)
+        return index
+
+
+def getTypeIndex(types):
+    """ builds the RegexIndex for a types dict once and caches it """
+    try:
+        return TYPE_INDEXES[id(types)][1]
+    except KeyError:
+        index = RegexIndex(types, compile_value=compile_properties)
+        TYPE_INDEXES[id(types)] = (types, index)
+        return index
+
 
 def getMapping_from_regex(mappings, form, version):
     """ Raises FecParserMissingMappingError if missing"""
-
-    for mapping in mappings.keys():
-        if re.match(mapping, form, re.IGNORECASE):
-            versions = mappings[mapping].keys()
-            for v in versions:
-                if re.match(v, version, re.IGNORECASE):
-                    return(mappings[mapping][v])
+    for mapping in getMappingIndex(mappings).lookup(form, version):
+        return mapping
 
     raise FecParserMissingMappingError({
         'form': form,
@@ -38,6 +300,7 @@ def getMapping_from_regex(mappings, form, version):
 
 def getMapping(mappings, form, version):
     """ Tries to find the mapping from cache before looking it up w regex """
+    form = normalize_form(form)
     key = MAPPING_CACHE_KEY % (form, version)
     try:
         mapping = MAPPING_CACHE[key]
@@ -49,22 +312,16 @@ def getMapping(mappings, form, version):
 
 def getTypeMapping_from_regex(types, form, version, field):
     """ Tries to find the mapping from cache before looking it up w regex """
-    for mapping in types.keys():
-        if re.match(mapping, form, re.IGNORECASE):
-            versions = types[mapping].keys()
-            for v in versions:
-                if re.match(v, version, re.IGNORECASE):
-                    properties = types[mapping][v]
-                    prop_keys = properties.keys()
-                    for prop_key in prop_keys:
-                        if re.match(prop_key, field, re.IGNORECASE):
-                            prop = properties[prop_key]
-                            return prop
+    for properties in getTypeIndex(types).lookup(form, version):
+        for prop_pattern, prop in properties:
+            if prop_pattern.match(field):
+                return prop
     return None
 
 
 def getTypeMapping(types, form, version, field):
     """ caches the mapping to dict """
+    form = normalize_form(form)
     key = TYPE_CACHE_KEY % (form, version, field)
     try:
         mapping = TYPE_CACHE[key]
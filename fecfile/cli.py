@@ -0,0 +1,221 @@
+"""The ``fecfile`` command, which converts .fec files, directories of them
+and zip archives of them (such as the FEC's daily bulk downloads) to JSON
+Lines, CSV or Parquet files, and reports how fast it went.
+
+Run ``fecfile --help`` (or ``python -m fecfile --help``) for its options.
+"""
+from collections import Counter
+from functools import partial
+import os
+import sys
+import time
+import zipfile
+
+from . import dataframes, export, fecparser, jsonl, parallel, zipfiles
+
+
+FORMATS = ('jsonl', 'csv', 'parquet')
+
+
+def find_filings(sources):
+    """Returns a list of the filings in ``sources``, which are paths to .fec
+    files, directories (searched recursively for .fec files) and zip
+    archives. Each filing is a path, or a ``(zip_path, member_name, size)``
+    tuple for a filing inside a zip archive, where ``size`` is the member's
+    uncompressed size from the archive's directory."""
+    filings = []
+    for source in sources:
+        if os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                filings.extend(
+                    os.path.join(root, f) for f in sorted(files)
+                    if f.lower().endswith('.fec')
+                )
+        elif source.lower().endswith('.zip'):
+            with zipfile.ZipFile(source, 'r') as zip_file:
+                filings.extend(
+                    (source, name, zip_file.getinfo(name).file_size)
+                    for name in zipfiles.selected_members(zip_file)
+                )
+        else:
+            filings.append(source)
+    return filings
+
+
+def filing_id(filing):
+    if type(filing) is tuple:
+        return zipfiles.filing_id(filing[1])
+    return zipfiles.filing_id(filing)
+
+
+def filing_name(filing):
+    if type(filing) is tuple:
+        return '{0}:{1}'.format(filing[0], filing[1])
+    return filing
+
+
+def filing_size(filing):
+    if type(filing) is tuple:
+        return filing[2]
+    return os.path.getsize(filing)
+
+
+def split_duplicates(filings):
+    """ returns the first filing with each filing id, followed by a list of
+    ``(filing, first)`` tuples for the others, whose output would overwrite
+    that of the first filing with the same id """
+    first = {}
+    duplicates = []
+    for filing in filings:
+        first_filing = first.setdefault(filing_id(filing), filing)
+        if first_filing is not filing:
+            duplicates.append((filing, first_filing))
+    return list(first.values()), duplicates
+
+
+def convert_lines(lines, base_path, format, options, counts):
+    """ writes the filing in ``lines`` to ``base_path`` plus the extension
+    for ``format``, or for csv and parquet, to a file per itemization type
+    in the directory ``base_path`` """
+    if format == 'jsonl':
+        jsonl.dump_jsonl(lines, base_path + '.jsonl', options, counts)
+    else:
+        export.write_tables(lines, base_path, format, options, counts=counts)
+
+
+def convert_filing(filing, options, out_dir, format):
+    """Converts one filing, returning the number of itemizations written,
+    the number of bytes read and a Counter of their form types."""
+    base_path = os.path.join(out_dir, filing_id(filing))
+    counts = Counter()
+    if type(filing) is tuple:
+        with zipfile.ZipFile(filing[0], 'r') as zip_file:
+            with zip_file.open(filing[1]) as member:
+                convert_lines(
+                    fecparser.read_lines(member), base_path, format, options,
+                    counts,
+                )
+    else:
+        with open(filing, 'rb') as file:
+            convert_lines(
+                fecparser.map_lines(file), base_path, format, options, counts
+            )
+    return sum(counts.values()), filing_size(filing), counts
+
+
+class Progress:
+    """Adds up the results of converting each filing and prints them to
+    ``out`` as they come in, followed by a report of itemizations and bytes
+    per second and the number of itemizations of each form type."""
+    def __init__(self, total, out=None, quiet=False):
+        self.total = total
+        self.out = out
+        self.quiet = quiet
+        self.start = time.perf_counter()
+        self.done = 0
+        self.failed = 0
+        self.rows = 0
+        self.bytes = 0
+        self.counts = Counter()
+
+    def print(self, message):
+        if not self.quiet:
+            print(message, file=self.out or sys.stderr)
+
+    def add(self, result):
+        self.done += 1
+        name = filing_id(result.path)
+        if result.error is not None:
+            self.failed += 1
+            self.print('[{0}/{1}] {2}: failed: {3!r}'.format(
+                self.done, self.total, name, result.error
+            ))
+            return
+        num_rows, num_bytes, counts = result.data
+        self.rows += num_rows
+        self.bytes += num_bytes
+        self.counts.update(counts)
+        self.print('[{0}/{1}] {2}: {3} itemizations'.format(
+            self.done, self.total, name, num_rows
+        ))
+
+    def report(self):
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        self.print('converted {0} filings ({1} failed) in {2:.2f}s'.format(
+            self.done - self.failed, self.failed, elapsed
+        ))
+        self.print('{0} itemizations, {1:,.0f} itemizations/s'.format(
+            self.rows, self.rows / elapsed
+        ))
+        self.print('{0:,.1f} MB read, {1:,.1f} MB/s'.format(
+            self.bytes / 1e6, self.bytes / 1e6 / elapsed
+        ))
+        for form_type, count in sorted(
+            self.counts.items(), key=lambda item: (-item[1], item[0])
+        ):
+            self.print('    {0:<10} {1}'.format(form_type, count))
+
+
+def split_values(values):
+    """ the values of an option given once for each value, or once with
+    values separated by commas """
+    return [v for value in values for v in value.split(',') if v]
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog='fecfile',
+        description='Converts .fec files, directories of .fec files and zip '
+                    'archives of .fec files to JSON Lines, CSV or Parquet.',
+    )
+    parser.add_argument('sources', nargs='+', metavar='SOURCE',
+                        help='a .fec file, a directory or a zip archive')
+    parser.add_argument('-o', '--out-dir', default='.',
+                        help='where to write the converted files '
+                             '(default: the current directory)')
+    parser.add_argument('-f', '--format', choices=FORMATS, default='jsonl',
+                        help='the format to write (default: jsonl)')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='how many processes to convert filings in '
+                             '(default: 1)')
+    parser.add_argument('--filter', action='append', metavar='PREFIX',
+                        help='only include itemizations starting with PREFIX '
+                             '(repeat it, or separate prefixes with commas, '
+                             'for more than one)')
+    parser.add_argument('--columns', action='append', metavar='COLUMN',
+                        help='only include these columns of itemizations '
+                             '(repeat it, or separate columns with commas)')
+    parser.add_argument('--as-strings', action='store_true',
+                        help="don't convert numbers and dates")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="don't print progress or the final report")
+    args = parser.parse_args(argv)
+    options = {'as_strings': args.as_strings}
+    if args.filter is not None:
+        options['filter_itemizations'] = split_values(args.filter)
+    if args.columns is not None:
+        options['columns'] = split_values(args.columns)
+    if args.format == 'parquet':
+        dataframes.import_pyarrow()
+    os.makedirs(args.out_dir, exist_ok=True)
+    filings, duplicates = split_duplicates(find_filings(args.sources))
+    progress = Progress(len(filings) + len(duplicates), quiet=args.quiet)
+    for filing, first in duplicates:
+        progress.add(parallel.ParseResult(filing, error=ValueError(
+            '{0} has the same filing id as {1}, so it was skipped'.format(
+                filing_name(filing), filing_name(first)
+            )
+        )))
+    convert = partial(convert_filing, out_dir=args.out_dir, format=args.format)
+    for result in parallel.parse_many(
+        convert, filings, args.workers, options
+    ):
+        progress.add(result)
+    progress.report()
+    return 1 if progress.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
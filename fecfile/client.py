@@ -0,0 +1,179 @@
+import json
+import os
+import threading
+
+from . import fecparser
+
+
+URLS = (
+    'https://docquery.fec.gov/dcdev/posted/{n}.fec',
+    'https://docquery.fec.gov/paper/posted/{n}.fec',
+)
+REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+TIMEOUT = (10, 60)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class FilingUnavailableError(Exception):
+    """when http requests for neither the electronic nor paper version
+    of a filing return a 200 status code. Note: for now we don't
+    differentiate between when a filing is unavailable because
+    the request is returning a 500 error and when it doesn't exist and
+    returns 404 errors for both paper and electronic urls"""
+    def __init__(self, opts, msg=None):
+        if msg is None:
+            msg = ('The requested FEC file number ({}) is unavailable. Status code {}.'.format(
+                opts['file_number'],
+                opts['status_code']
+            ))
+        self.opts = opts
+        super(FilingUnavailableError, self).__init__(msg)
+
+    def __reduce__(self):
+        return (self.__class__, (self.opts, str(self)))
+
+
+class FecClient:
+    """Makes http requests for filings over one ``requests.Session``, so
+    connections are kept alive and reused between filings. ``timeout`` is
+    passed to each request. If ``cache_dir`` is given, each filing is saved
+    there along with its ETag and Last-Modified headers, and requesting it
+    again sends them back, so a filing that hasn't changed costs a 304
+    response instead of a download. A client should only be used by one
+    thread at a time, since a Session isn't guaranteed to be thread-safe."""
+    def __init__(self, cache_dir=None, timeout=TIMEOUT, urls=URLS):
+        import requests
+        self.session = requests.Session()
+        self.session.headers.update(REQUEST_HEADERS)
+        self.timeout = timeout
+        self.urls = urls
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def from_http(self, file_number, options={}):
+        """Returns the parsed filing with the given ``file_number``, like
+        ``fecfile.from_http``, or None if it can't be found."""
+        try:
+            lines = self.lines(file_number)
+        except FilingUnavailableError as ex:
+            if ex.opts['status_code'] == 404:
+                return None
+            raise
+        return fecparser.loads(lines, options=options)
+
+    def iter_http(self, file_number, options={}):
+        """Iterates over the FecItem instances in the filing with the given
+        ``file_number``, like ``fecfile.iter_http``."""
+        for item in fecparser.iter_lines(self.lines(file_number), options):
+            yield item
+
+    def lines(self, file_number):
+        """Returns an iterable over the lines of the filing with the given
+        ``file_number``, from the cache if the server says it hasn't
+        changed. Raises FilingUnavailableError if it can't be found."""
+        r = self.request(file_number)
+        if r.status_code == 304:
+            r.close()
+            return self.cached_lines(file_number)
+        if r.status_code != 200:
+            r.close()
+            raise FilingUnavailableError(
+                {'file_number': file_number, 'status_code': r.status_code}
+            )
+        if self.cache_dir is not None and (
+            'ETag' in r.headers or 'Last-Modified' in r.headers
+        ):
+            self.store(file_number, r)
+            return self.cached_lines(file_number)
+        return r.iter_lines()
+
+    def request(self, file_number):
+        """ makes a conditional request for a cached filing to the url it was
+        found at, and otherwise tries each of the urls until one doesn't
+        return a 404 error """
+        validators = self.validators(file_number)
+        if validators is not None:
+            headers = {}
+            if validators['etag']:
+                headers['If-None-Match'] = validators['etag']
+            if validators['last_modified']:
+                headers['If-Modified-Since'] = validators['last_modified']
+            r = self.get(validators['url'], headers)
+            if r.status_code != 404:
+                return r
+            r.close()
+        for url in self.urls:
+            r = self.get(url.format(n=file_number))
+            if r.status_code != 404:
+                break
+            r.close()
+        return r
+
+    def get(self, url, headers=None):
+        return self.session.get(
+            url, headers=headers, stream=True, timeout=self.timeout
+        )
+
+    def cache_paths(self, file_number):
+        base = os.path.join(self.cache_dir, str(file_number))
+        return base + '.fec', base + '.json'
+
+    def validators(self, file_number):
+        """ returns the url, ETag and Last-Modified header saved with a
+        cached filing, or None if it isn't cached """
+        if self.cache_dir is None:
+            return None
+        fec_path, meta_path = self.cache_paths(file_number)
+        if not os.path.exists(fec_path):
+            return None
+        try:
+            with open(meta_path) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, file_number, r):
+        """ saves the body of the response ``r`` and its validators. The
+        filing is written to a temporary file first, so an interrupted
+        download never replaces a complete one. """
+        fec_path, meta_path = self.cache_paths(file_number)
+        with open(fec_path + '.tmp', 'wb') as file:
+            for chunk in r.iter_content(DOWNLOAD_CHUNK_SIZE):
+                file.write(chunk)
+        os.replace(fec_path + '.tmp', fec_path)
+        with open(meta_path, 'w') as file:
+            json.dump({
+                'url': r.url,
+                'etag': r.headers.get('ETag'),
+                'last_modified': r.headers.get('Last-Modified'),
+            }, file)
+
+    def cached_lines(self, file_number):
+        with open(self.cache_paths(file_number)[0], 'rb') as file:
+            for line in fecparser.read_lines(file):
+                yield line
+
+
+# requests doesn't promise that a Session can be shared between threads, so
+# each thread gets a default client of its own
+DEFAULT_CLIENTS = threading.local()
+
+
+def default_client():
+    """ returns the FecClient shared by fecfile.from_http and
+    fecfile.iter_http in the current thread, creating it on first use """
+    try:
+        return DEFAULT_CLIENTS.client
+    except AttributeError:
+        client = DEFAULT_CLIENTS.client = FecClient()
+        return client
@@ -0,0 +1,116 @@
+from array import array
+import math
+
+
+NAN = float('nan')
+
+
+class FloatColumn(array):
+    """A column of floats stored as C doubles, with None stored as NaN."""
+    def __new__(cls, values=()):
+        return super(FloatColumn, cls).__new__(cls, 'd', values)
+
+    def append(self, value):
+        array.append(self, NAN if value is None else value)
+
+
+def values_of(column):
+    if type(column) is FloatColumn:
+        return (None if math.isnan(v) else v for v in column)
+    return iter(column)
+
+
+class FecTable:
+    """Itemizations of one type (``Schedule A``, ``F57``, etc.) stored as
+    columns rather than as a list of dictionaries, so each row doesn't carry
+    its own copy of every key. Float columns are ``FloatColumn`` arrays and
+    all other columns are lists. When a table holds rows from several forms,
+    rows from forms without a given column hold None in it. ``props`` maps
+    each column to its entry in types.json, or None if it has none."""
+    def __init__(self, name):
+        self.name = name
+        self.columns = {}
+        self.props = {}
+        self.num_rows = 0
+        self.plans = {}
+
+    def __len__(self):
+        return self.num_rows
+
+    def __getitem__(self, key):
+        return self.columns[key]
+
+    def keys(self):
+        return self.columns.keys()
+
+    def __getstate__(self):
+        """ leaves out the plans, which hold RowDecoders that can't be
+        pickled """
+        state = self.__dict__.copy()
+        state['plans'] = {}
+        return state
+
+    def append(self, decoder, row):
+        """Adds a row of values returned by ``decoder.values``."""
+        try:
+            targets, missing = self.plans[decoder]
+        except KeyError:
+            targets, missing = self.plan(decoder, row)
+        try:
+            for column, value in zip(targets, row):
+                column.append(value)
+        except TypeError:
+            self.demote_columns(decoder, row)
+            self.append(decoder, row)
+            return
+        for column in missing:
+            column.append(None)
+        self.num_rows += 1
+
+    def plan(self, decoder, row):
+        for k, prop, value in zip(decoder.keys, decoder.props, row):
+            if self.props.setdefault(k, prop) != prop:
+                self.props[k] = None
+            if k not in self.columns:
+                if prop and prop['type'] == 'float' and type(value) is not str:
+                    column = FloatColumn([NAN] * self.num_rows)
+                else:
+                    column = [None] * self.num_rows
+                self.columns[k] = column
+                self.plans = {}
+        targets = [self.columns[k] for k in decoder.keys]
+        missing = [
+            column for k, column in self.columns.items()
+            if k not in decoder.keys
+        ]
+        self.plans[decoder] = (targets, missing)
+        return targets, missing
+
+    def demote_columns(self, decoder, row):
+        """Undoes a partially appended row and converts the float columns
+        that can't hold its values into lists."""
+        self.plans = {}
+        for column in self.columns.values():
+            if len(column) > self.num_rows:
+                column.pop()
+        for k, value in zip(decoder.keys, row):
+            column = self.columns[k]
+            if type(column) is FloatColumn and type(value) is not float:
+                if value is not None:
+                    self.columns[k] = list(values_of(column))
+
+    def column(self, key):
+        """Returns the values of a column as a list, with None for missing
+        values."""
+        return list(values_of(self.columns[key]))
+
+    def rows(self):
+        """Iterates over the rows as dictionaries with a key for every column
+        in the table."""
+        keys = list(self.columns.keys())
+        columns = [values_of(self.columns[k]) for k in keys]
+        for values in zip(*columns):
+            yield dict(zip(keys, values))
+
+    def to_dicts(self):
+        return list(self.rows())
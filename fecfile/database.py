@@ -0,0 +1,147 @@
+"""Loads the itemizations in filings into database tables, one per
+itemization type, through any DB-API 2.0 connection (``sqlite3``,
+``psycopg2``, ``psycopg``...). Rows are inserted with one ``executemany``
+call per batch rather than one statement per row.
+"""
+from datetime import date
+import sys
+
+from . import export, fecparser, zipfiles
+
+
+SQL_TYPES = {
+    'integer': 'INTEGER',
+    'float': 'DOUBLE PRECISION',
+    'date': 'TIMESTAMP',
+}
+PLACEHOLDERS = {
+    'qmark': '?',
+    'format': '%s',
+    'pyformat': '%s',
+}
+
+
+def quote(identifier):
+    return '"{0}"'.format(identifier.replace('"', '""'))
+
+
+def placeholder(conn):
+    """ the parameter marker for the DB-API module ``conn`` comes from """
+    module = sys.modules.get(type(conn).__module__.split('.')[0])
+    paramstyle = getattr(module, 'paramstyle', 'qmark')
+    if paramstyle not in PLACEHOLDERS:
+        raise ValueError(
+            'load_into does not support the {0} paramstyle'.format(paramstyle)
+        )
+    return PLACEHOLDERS[paramstyle]
+
+
+def table_columns(cursor, table):
+    """ returns the names of the columns in ``table``, using only what every
+    DB-API module supports """
+    cursor.execute('SELECT * FROM {0} WHERE 1 = 0'.format(quote(table)))
+    cursor.fetchall()
+    return [column[0] for column in cursor.description]
+
+
+class TableLoader(export.ScheduleWriter):
+    """Inserts rows into the table for one itemization type, creating the
+    table if it doesn't exist and adding any columns it is missing. Each
+    row starts with the filing id, followed by the columns in ``keys``.
+    Dates are inserted as ISO 8601 strings, and values that couldn't be
+    converted to their column's type when the filing was parsed are inserted
+    as nulls."""
+    def __init__(self, conn, table, filing_id, keys, props, options,
+                 batch_size=export.BATCH_SIZE):
+        super(TableLoader, self).__init__(keys, props, options, batch_size)
+        self.conn = conn
+        self.table = table
+        self.filing_id = filing_id
+        self.sql_types = tuple(
+            'TEXT' if self.as_strings or not prop
+            else SQL_TYPES.get(prop['type'], 'TEXT')
+            for prop in props
+        )
+        self.typed = tuple(
+            (i + 1, prop['type']) for i, prop in enumerate(props)
+            if prop and not self.as_strings and prop['type'] in SQL_TYPES
+        )
+        self.cursor = conn.cursor()
+        self.create()
+        self.insert = 'INSERT INTO {0} ({1}) VALUES ({2})'.format(
+            quote(table),
+            ', '.join(quote(k) for k in ('filing_id',) + keys),
+            ', '.join([placeholder(conn)] * (len(keys) + 1)),
+        )
+
+    def create(self):
+        self.cursor.execute('CREATE TABLE IF NOT EXISTS {0} ({1})'.format(
+            quote(self.table),
+            ', '.join(
+                '{0} {1}'.format(quote(k), t) for k, t in
+                zip(('filing_id',) + self.keys, ('TEXT',) + self.sql_types)
+            ),
+        ))
+        columns = table_columns(self.cursor, self.table)
+        for k, t in zip(self.keys, self.sql_types):
+            if k not in columns:
+                self.cursor.execute(
+                    'ALTER TABLE {0} ADD COLUMN {1} {2}'.format(
+                        quote(self.table), quote(k), t
+                    )
+                )
+
+    def write(self, rows):
+        rows = [[self.filing_id] + list(row) for row in rows]
+        for row in rows:
+            for i, type_name in self.typed:
+                value = row[i]
+                if type(value) is str:
+                    # left as it was in the filing, since it couldn't be
+                    # converted
+                    row[i] = None
+                elif type_name == 'date' and isinstance(value, date):
+                    row[i] = value.isoformat()
+        self.cursor.executemany(self.insert, rows)
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.cursor.close()
+
+
+def load_lines(conn, lines, filing_id=None, options={},
+               batch_size=export.BATCH_SIZE, table_prefix=''):
+    """ loads the itemizations in a filing's ``lines``, returning the number
+    of rows inserted into each table """
+    def make_writer(name, keys, props):
+        return TableLoader(
+            conn, table_prefix + export.table_name(name), filing_id, keys,
+            props, options, batch_size,
+        )
+    writers = export.write_schedules(lines, options, make_writer)
+    return {writer.table: writer.num_rows for writer in writers.values()}
+
+
+def load_into(conn, source, options={}, filing_id=None,
+              batch_size=export.BATCH_SIZE, table_prefix='', commit=True):
+    """Loads the itemizations in ``source``, the path to a .fec file or an
+    iterable of its lines, into the database ``conn`` is connected to, and
+    commits unless ``commit`` is False. ``filing_id`` defaults to the name
+    of the file without its extension. Returns the number of rows inserted
+    into each table."""
+    if type(source) is str:
+        if filing_id is None:
+            filing_id = zipfiles.filing_id(source)
+        with open(source, 'rb') as file:
+            return load_into(
+                conn, fecparser.map_lines(file), options, filing_id,
+                batch_size, table_prefix, commit,
+            )
+    loaded = load_lines(
+        conn, source, filing_id, options, batch_size, table_prefix
+    )
+    if commit:
+        conn.commit()
+    return loaded
@@ -0,0 +1,98 @@
+from .columnar import FloatColumn
+
+
+def import_pandas():
+    try:
+        import pandas
+    except ImportError:
+        raise ImportError(
+            'fecfile.to_dataframes requires pandas, which can be installed '
+            'with `pip install pandas`'
+        )
+    return pandas
+
+
+def import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            'fecfile.to_arrow requires pyarrow, which can be installed '
+            'with `pip install pyarrow`'
+        )
+    return pyarrow
+
+
+def series_from_strings(pandas, column, prop, dates=None):
+    """Converts a column parsed with the as_strings option to the type in
+    ``prop`` all at once, following the same rules as fecparser.getTyped.
+    Values that can't be converted become missing values. Dates are only
+    localized to US/Eastern when ``dates`` is None."""
+    strings = pandas.Series(column, dtype=object)
+    if not prop:
+        return strings
+    stripped = strings.str.strip()
+    if prop['type'] == 'float':
+        return pandas.to_numeric(
+            stripped.str.replace('%', '', regex=False),
+            errors='coerce',
+        )
+    if prop['type'] == 'integer':
+        numbers = pandas.to_numeric(stripped, errors='coerce')
+        return numbers.where(numbers % 1 == 0).astype('Int64')
+    if prop['type'] == 'date':
+        parsed = pandas.to_datetime(
+            stripped,
+            format=prop['format'],
+            errors='coerce',
+        )
+        if dates is None:
+            return parsed.dt.tz_localize('US/Eastern')
+        return parsed
+    return strings
+
+
+def table_to_dataframe(table, as_strings=False, dates=None):
+    """Converts an FecTable parsed with the as_strings option to a pandas
+    DataFrame. Unless ``as_strings`` is True, columns are converted using
+    their entries in types.json rather than having their dtypes inferred.
+    Dates are naive datetime64 columns if ``dates`` is 'naive' or 'date'."""
+    pandas = import_pandas()
+    data = {}
+    for k in table.keys():
+        prop = None if as_strings else table.props.get(k)
+        data[k] = series_from_strings(pandas, table[k], prop, dates)
+    return pandas.DataFrame(data)
+
+
+def table_to_arrow(table, as_strings=False, dates=None):
+    """Converts an FecTable to a pyarrow Table. Column types come from the
+    table's entries in types.json rather than being inferred, and date
+    columns match the ``dates`` option the table was parsed with."""
+    pyarrow = import_pyarrow()
+    date_types = {
+        None: pyarrow.timestamp('us', tz='US/Eastern'),
+        'naive': pyarrow.timestamp('us'),
+        'date': pyarrow.date32(),
+    }
+    arrow_types = {
+        'integer': pyarrow.int64(),
+        'float': pyarrow.float64(),
+        'date': date_types[dates],
+    }
+    arrays = []
+    for k in table.keys():
+        column = table[k]
+        prop = table.props.get(k)
+        type_name = prop['type'] if prop and not as_strings else None
+        if type_name == 'float' and type(column) is not FloatColumn:
+            # a float column that also held other values, kept as strings
+            type_name = None
+        if type_name in arrow_types:
+            values = table.column(k)
+            arrays.append(pyarrow.array(values, type=arrow_types[type_name]))
+        else:
+            values = [v if v is None or type(v) is str else str(v)
+                      for v in column]
+            arrays.append(pyarrow.array(values, type=pyarrow.string()))
+    return pyarrow.Table.from_arrays(arrays, names=list(table.keys()))
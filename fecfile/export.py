@@ -0,0 +1,289 @@
+"""Writes the itemizations in a filing to one CSV or Parquet file per
+itemization type (``Schedule A``, ``Schedule B``, ``F65``...), as they are
+parsed. The columns of each file, and their order, come from mappings.json
+for the filing's version, and their types come from types.json, so every
+row group of a file has the same schema however the filing is laid out.
+"""
+from datetime import date
+from operator import itemgetter
+import csv
+import os
+
+from . import fecparser
+from .cache import FecParserMissingMappingError, getMapping, getTypeMapping
+from .dataframes import import_pyarrow
+
+
+BATCH_SIZE = 10000
+FORMATS = ('csv', 'parquet')
+
+# forms within a schedule that have mappings of their own, whose columns are
+# all included in the schedule's files
+SCHEDULE_FORMS = {
+    'Schedule A': ('SA11', 'SA3L'),
+    'Schedule C': ('SC/', 'SC1', 'SC2'),
+}
+
+
+def table_name(itemization_type):
+    return itemization_type.replace(' ', '_').replace('/', '_').lower()
+
+
+def file_name(itemization_type, format):
+    return '{0}.{1}'.format(table_name(itemization_type), format)
+
+
+def schedule_forms(itemization_type):
+    """ form types whose mappings make up the columns of an itemization
+    type's files """
+    if itemization_type in SCHEDULE_FORMS:
+        return SCHEDULE_FORMS[itemization_type]
+    if itemization_type.startswith('Schedule '):
+        return ('S' + itemization_type[len('Schedule '):],)
+    return (itemization_type,)
+
+
+def schedule_schema(itemization_type, version, form=None, columns=None):
+    """Returns the column names for an itemization type's files in
+    ``version`` of the file format, in the order they appear in
+    mappings.json, along with each column's entry in types.json. Columns are
+    taken from the mappings of every form in the schedule, and of ``form``,
+    the form type of the first row. ``columns`` limits them to those
+    columns, plus form_type."""
+    tables = fecparser.load_tables()
+    keys = []
+    props = {}
+    forms = schedule_forms(itemization_type)
+    if form is not None:
+        forms = forms + (form,)
+    for f in forms:
+        try:
+            mapping = getMapping(tables['mappings'], f, version)
+        except FecParserMissingMappingError:
+            continue
+        for k in mapping:
+            if k in props:
+                continue
+            if columns is not None and k != 'form_type' and k not in columns:
+                continue
+            keys.append(k)
+            props[k] = getTypeMapping(tables['types'], f, version, k)
+    return tuple(keys), tuple(props[k] for k in keys)
+
+
+class ScheduleWriter:
+    """Collects rows for one itemization type, in the order of the columns
+    in ``keys``, and writes them ``batch_size`` rows at a time. Rows come
+    from RowDecoders, and are rearranged to match ``keys`` with a plan made
+    once per decoder. Subclasses write the batches."""
+    def __init__(self, keys, props, options, batch_size=BATCH_SIZE):
+        self.keys = keys
+        self.props = props
+        self.as_strings = options.get('as_strings', False)
+        self.dates = options.get('dates')
+        self.batch_size = batch_size
+        self.plans = {}
+        self.rows = []
+        self.num_rows = 0
+
+    def plan(self, decoder):
+        """ returns a function that takes a row from ``decoder`` and returns
+        its values in the order of ``keys``, with None for missing ones """
+        positions = {k: i for i, k in enumerate(decoder.keys)}
+        missing = len(decoder.keys)
+        indexes = tuple(positions.get(k, missing) for k in self.keys)
+        if indexes == tuple(range(missing)):
+            plan = None
+        elif len(indexes) == 1:
+            plan = lambda row: ((row + [None])[indexes[0]],)
+        else:
+            getter = itemgetter(*indexes)
+            plan = lambda row: getter(row + [None])
+        self.plans[decoder] = plan
+        return plan
+
+    def append(self, decoder, row):
+        try:
+            plan = self.plans[decoder]
+        except KeyError:
+            plan = self.plan(decoder)
+        self.rows.append(row if plan is None else plan(row))
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            self.write(self.rows)
+            self.num_rows += len(self.rows)
+            self.rows = []
+
+    def close(self):
+        self.flush()
+
+
+def csv_value(value):
+    if type(value) is str or value is None:
+        return value
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+class CsvWriter(ScheduleWriter):
+    """Writes rows to a CSV file with a header row of column names. Dates
+    are written in ISO 8601 format and missing values as empty strings."""
+    def __init__(self, path, keys, props, options, batch_size=BATCH_SIZE):
+        super(CsvWriter, self).__init__(keys, props, options, batch_size)
+        self.path = path
+        self.date_indexes = tuple(
+            i for i, prop in enumerate(props)
+            if prop and prop['type'] == 'date'
+        )
+        self.file = open(path, 'w', encoding='utf-8', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(keys)
+
+    def write(self, rows):
+        if self.date_indexes and not self.as_strings:
+            rows = [list(row) for row in rows]
+            for row in rows:
+                for i in self.date_indexes:
+                    row[i] = csv_value(row[i])
+        self.writer.writerows(rows)
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.file.close()
+
+
+PYTHON_TYPES = {
+    'integer': (int,),
+    'float': (float, int),
+    'date': (date,),
+}
+
+
+class ParquetWriter(ScheduleWriter):
+    """Writes rows to a Parquet file, one row group per batch. Integer,
+    float and date columns get the matching Arrow types, and the rest are
+    strings. Values that couldn't be converted when the filing was parsed
+    (which raise a FecParserTypeWarning) are written as nulls."""
+    def __init__(self, path, keys, props, options, batch_size=BATCH_SIZE):
+        super(ParquetWriter, self).__init__(keys, props, options, batch_size)
+        self.path = path
+        pyarrow = import_pyarrow()
+        import pyarrow.parquet
+        self.pyarrow = pyarrow
+        date_types = {
+            None: pyarrow.timestamp('us', tz='US/Eastern'),
+            'naive': pyarrow.timestamp('us'),
+            'date': pyarrow.date32(),
+        }
+        arrow_types = {
+            'integer': pyarrow.int64(),
+            'float': pyarrow.float64(),
+            'date': date_types[self.dates],
+        }
+        self.type_names = tuple(
+            None if self.as_strings or not prop else prop['type']
+            for prop in props
+        )
+        self.schema = pyarrow.schema([
+            (k, arrow_types.get(type_name, pyarrow.string()))
+            for k, type_name in zip(keys, self.type_names)
+        ])
+        self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+
+    def array(self, values, type_name, arrow_type):
+        pyarrow = self.pyarrow
+        try:
+            return pyarrow.array(values, type=arrow_type)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, TypeError):
+            pass
+        if type_name in PYTHON_TYPES:
+            python_types = PYTHON_TYPES[type_name]
+            values = [
+                v if isinstance(v, python_types) and type(v) is not bool
+                else None
+                for v in values
+            ]
+        else:
+            values = [v if v is None else str(v) for v in values]
+        return pyarrow.array(values, type=arrow_type)
+
+    def write(self, rows):
+        arrays = [
+            self.array(list(values), type_name, field.type)
+            for values, type_name, field in zip(
+                zip(*rows), self.type_names, self.schema
+            )
+        ]
+        self.writer.write_table(
+            self.pyarrow.Table.from_arrays(arrays, schema=self.schema)
+        )
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.writer.close()
+
+
+WRITERS = {
+    'csv': CsvWriter,
+    'parquet': ParquetWriter,
+}
+
+
+def write_schedules(lines, options, make_writer, counts=None):
+    """Parses a filing's ``lines`` and appends each itemization to the
+    ScheduleWriter for its itemization type, which ``make_writer`` returns
+    when called with the type's name, column names and types the first time
+    it comes up. Closes the writers at the end, and returns them in a
+    dictionary keyed by itemization type. If ``counts`` is given, the number
+    of itemizations of each form type is added to it."""
+    columns = options.get('columns')
+    writers = {}
+    try:
+        for data_type, decoder, data in fecparser.iter_records(lines, options):
+            if data_type != 'itemization':
+                continue
+            form_type = data[decoder.form_type_index]
+            if counts is not None:
+                counts[form_type] += 1
+            name = fecparser.itemization_type(form_type)
+            try:
+                writer = writers[name]
+            except KeyError:
+                keys, props = schedule_schema(
+                    name, decoder.version, form_type, columns
+                )
+                writer = writers[name] = make_writer(name, keys, props)
+            writer.append(decoder, data)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return writers
+
+
+def write_tables(lines, out_dir, format, options={}, batch_size=BATCH_SIZE,
+                 counts=None):
+    """Writes the itemizations in a filing's ``lines`` to a file per
+    itemization type in ``out_dir``, in ``format`` ('csv' or 'parquet'),
+    ``batch_size`` rows at a time. Returns a dictionary of the paths written,
+    keyed by itemization type. If ``counts`` is given, the number of
+    itemizations of each form type is added to it."""
+    if format not in WRITERS:
+        raise ValueError('format must be one of {0}'.format(FORMATS))
+    writer_class = WRITERS[format]
+    os.makedirs(out_dir, exist_ok=True)
+
+    def make_writer(name, keys, props):
+        return writer_class(
+            os.path.join(out_dir, file_name(name, format)),
+            keys, props, options, batch_size,
+        )
+    writers = write_schedules(lines, options, make_writer, counts)
+    return {name: writer.path for name, writer in writers.items()}
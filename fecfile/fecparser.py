@@ -1,11 +1,21 @@
+from contextlib import contextmanager
 from datetime import datetime
-from pytz import timezone
+from operator import itemgetter
 import csv
 import json
-import os
+import mmap
 import warnings
 
-from .cache import getTypeMapping, getMapping
+from .columnar import FecTable
+from .records import record_type
+from .cache import (
+    getTypeMapping,
+    getMapping,
+    getMappingIndex,
+    getTypeIndex,
+    normalize_form,
+    ROW_DECODER_CACHE,
+)
 
 COLUMN_SEPARATOR = chr(0x1c)
 
@@ -15,22 +25,48 @@ class FecParserTypeWarning(UserWarning):
 
 
 class FecItem:
-    def __init__(self, data_type, data):
+    """One record from a filing. ``line_num`` and ``offset`` are the line
+    number and byte offset of the line it starts on, when they are known."""
+    __slots__ = ('data_type', 'data', 'line_num', 'offset')
+
+    def __init__(self, data_type, data, line_num=None, offset=None):
         self.data_type = data_type
         self.data = data
+        self.line_num = line_num
+        self.offset = offset
+
+
+TABLES = {}
+
+
+def load_tables():
+    """ imports the mappings and types generated by build_tables on first use,
+    rather than when fecfile is imported. TABLES is filled in one step so
+    that other threads never see it partly loaded. """
+    if not TABLES:
+        from pytz import timezone
+        from . import tables
+        TABLES.update({
+            'mappings': tables.MAPPINGS,
+            'types': tables.TYPES,
+            'eastern': timezone('US/Eastern'),
+        })
+    return TABLES
+
+
+def warm_caches():
+    """ loads the mappings and types and compiles all of their regexes """
+    tables = load_tables()
+    getMappingIndex(tables['mappings']).compile_all()
+    getTypeIndex(tables['types']).compile_all()
 
 
-this_file = os.path.abspath(__file__)
-this_dir = os.path.dirname(this_file)
-mappings_file = os.path.join(this_dir, 'mappings.json')
-types_file = os.path.join(this_dir, 'types.json')
-mappings = {}
-types = {}
-with open(mappings_file) as data_file:
-    mappings = json.loads(data_file.read())
-with open(types_file) as data_file:
-    types = json.loads(data_file.read())
-eastern = timezone('US/Eastern')
+def __getattr__(name):
+    if name in ('mappings', 'types', 'eastern'):
+        return load_tables()[name]
+    raise AttributeError(
+        'module {m} has no attribute {n}'.format(m=__name__, n=name)
+    )
 
 
 comma_versions = ['1', '2', '3', '5']
@@ -43,58 +79,339 @@ def include_line(line, filter_list):
     return False
 
 
+def line_prefixes(filter_list):
+    """ compiles filter_itemizations into the tuples of ``str`` and ``bytes``
+    prefixes that lines must start with to be included, so undecoded lines
+    can be checked with a single call to ``startswith`` """
+    prefixes = tuple(filter_list) + tuple('"' + f for f in filter_list)
+    return prefixes, tuple(p.encode('utf-8') for p in prefixes)
+
+
+def itemization_type(form_type):
+    if form_type[0] == 'S':
+        return 'Schedule ' + form_type[1]
+    return form_type
+
+
 def loads(input, options={}):
     out = {'itemizations': {}, 'text': [], 'header': {}, 'filing': {}}
     iterable_input = input.split('\n') if type(input) is str else input
-    for item in iter_lines(iterable_input, options=options):
-        if item.data_type == 'header':
-            out['header'] = item.data
-        if item.data_type == 'summary':
-            out['filing'] = item.data
-        if item.data_type == 'F99_text':
-            out['F99_text'] = item.data
-        if item.data_type == 'text':
-            out['text'].append(item.data)
-        if item.data_type == 'itemization':
-            form_type = item.data['form_type']
-            if form_type[0] == 'S':
-                form_type = 'Schedule ' + item.data['form_type'][1]
-            if form_type in out['itemizations']:
-                out['itemizations'][form_type].append(item.data)
+    columnar = options.get('columnar', False)
+    build = row_builder(options)
+    for data_type, decoder, data in iter_records(iterable_input, options):
+        if data_type == 'itemization':
+            form_type = itemization_type(data[decoder.form_type_index])
+            if columnar:
+                try:
+                    table = out['itemizations'][form_type]
+                except KeyError:
+                    table = out['itemizations'][form_type] = FecTable(form_type)
+                table.append(decoder, data)
+            elif form_type in out['itemizations']:
+                out['itemizations'][form_type].append(build(decoder, data))
             else:
-                out['itemizations'][form_type] = [item.data]
+                out['itemizations'][form_type] = [build(decoder, data)]
+            continue
+        if decoder is not None:
+            data = build(decoder, data)
+        if data_type == 'header':
+            out['header'] = data
+        if data_type == 'summary':
+            out['filing'] = data
+        if data_type == 'F99_text':
+            out['F99_text'] = data
+        if data_type == 'text':
+            out['text'].append(data)
     return out
 
 
-def iter_lines(lines, options={}):
-    version = None
-    current_line_num = 0
-    header_lines = []
-    text_section = False
-    f99_text = ''
-    summary = False
+def parse_file(file_path, options={}):
+    """ parses the file at file_path with loads, reading its lines through a
+    memory map and decoding each one as UTF-8, or as ISO-8859-1 if that
+    fails """
+    with open(file_path, 'rb') as file:
+        return loads(map_lines(file), options=options)
+
+
+def iter_batches(lines, options={}, batch_size=10000):
+    """Like iter_lines, but instead of yielding an FecItem per itemization,
+    collects itemizations into an FecTable per itemization type and yields
+    FecItems with a data_type of "itemizations" and the table as data, each
+    time a table reaches ``batch_size`` rows and once more for each table at
+    the end of the filing. Those FecItems have no line_num or offset, since
+    their rows come from many lines."""
+    tables = {}
+    build = row_builder(options)
+    state = ParserState()
+    for data_type, decoder, data in iter_records(lines, options, state):
+        if data_type != 'itemization':
+            if decoder is not None:
+                data = build(decoder, data)
+            yield FecItem(
+                data_type, data, state.record_line_num, state.record_offset
+            )
+            continue
+        form_type = itemization_type(data[decoder.form_type_index])
+        try:
+            table = tables[form_type]
+        except KeyError:
+            table = tables[form_type] = FecTable(form_type)
+        table.append(decoder, data)
+        if len(table) >= batch_size:
+            del tables[form_type]
+            yield FecItem('itemizations', table)
+    for table in tables.values():
+        yield FecItem('itemizations', table)
+
+
+class LineReader:
+    """Iterates over the lines of a file opened in binary mode (or anything
+    else with a ``readline`` method returning bytes), without their line
+    endings. Lines are split the way a file opened in text mode would be, on
+    ``\n``, ``\r\n`` or a lone ``\r``. ``offset`` is the byte offset just
+    past the last line returned, counting from ``offset``, which should be
+    the position the file was at to begin with."""
+    def __init__(self, file, offset=0):
+        self.readline = file.readline
+        self.offset = offset
+        self.parts = []
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.parts:
+            part = self.parts.pop()
+            self.offset += len(part)
+            return part.rstrip(b'\r\n')
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        if b'\r' in line:
+            self.parts = line.splitlines(True)
+            self.parts.reverse()
+            return self.__next__()
+        self.offset += len(line)
+        if line.endswith(b'\n'):
+            return line[:-1]
+        return line
+
+
+def read_lines(file):
+    """ returns a LineReader over the lines of a file opened in binary
+    mode """
+    return LineReader(file)
+
+
+@contextmanager
+def memory_map(file):
+    """ yields a read-only memory map of a file opened in binary mode, or
+    the file itself if it can't be mapped """
+    try:
+        mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        # empty files can't be mapped, and neither can pipes
+        mm = None
+    if mm is None:
+        yield file
+        return
+    try:
+        yield mm
+    finally:
+        mm.close()
+
+
+def map_lines(file):
+    """Iterates over the lines of a file opened in binary mode like
+    read_lines, but reads them through a memory map, so the file is never
+    held in memory as one string."""
+    with memory_map(file) as mapped:
+        for line in read_lines(mapped):
+            yield line
+
+
+def decode_line(line_unk):
+    try:
+        return line_unk if type(line_unk) is str else line_unk.decode('utf-8')
+    except UnicodeDecodeError:
+        return line_unk.decode('ISO-8859-1')
+
+
+def decode_lines(lines):
     for line_unk in lines:
+        yield decode_line(line_unk)
+
+
+class LineFeeder:
+    """Supplies lines to a single csv.reader shared by a whole comma-delimited
+    filing. The line to parse next is set with ``feed``. If a quoted field
+    continues past the end of that line, the reader pulls the rest of the
+    record from ``lines``, and ``continuations`` counts the extra lines."""
+    def __init__(self, lines):
+        self.lines = lines
+        self.pending = None
+        self.continuations = 0
+
+    def feed(self, line):
+        self.pending = line
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.pending
+        if line is None:
+            line = next(self.lines)
+            self.continuations += 1
+        self.pending = None
+        # the reader needs the line ending to keep it in a quoted value
+        return line + '\n'
+
+
+def iter_lines(lines, options={}, state=None):
+    if state is None:
+        state = ParserState()
+    build = row_builder(options)
+    for data_type, decoder, data in iter_records(lines, options, state):
+        if decoder is not None:
+            data = build(decoder, data)
+        yield FecItem(
+            data_type, data, state.record_line_num, state.record_offset
+        )
+
+
+TOKEN_KEYS = ('offset', 'line_num', 'version', 'summary', 'text_section',
+              'f99_text', 'header')
+
+
+class ParserState:
+    """Where iter_records is in a filing: the version from its header, the
+    number of lines (and, when reading from a LineReader, bytes) read so
+    far, whether the summary line has been seen, whether it is inside a text
+    section, the F99 text collected so far and the header. iter_records
+    updates the state it is given before yielding each record, along with
+    the line number and byte offset the record started at, and a state can
+    be passed to iter_records to start parsing partway through a filing."""
+    def __init__(self, version=None, line_num=0, summary=False, f99_text='',
+                 offset=0, text_section=False, header=None):
+        self.version = version
+        self.line_num = line_num
+        self.summary = summary
+        self.f99_text = f99_text
+        self.offset = offset
+        self.text_section = text_section
+        self.header = header
+        self.record_line_num = None
+        self.record_offset = None
+
+    def token(self):
+        """ returns the state as a dictionary that can be pickled or saved as
+        json, for resuming with from_token """
+        return {k: getattr(self, k) for k in TOKEN_KEYS}
+
+    @classmethod
+    def from_token(cls, token):
+        return cls(**{k: token[k] for k in TOKEN_KEYS})
+
+
+def line_splitting(version, options, decoded_lines):
+    """ returns whether to split lines on ASCII 28, and the LineFeeder and
+    csv.reader to use when streaming comma-delimited filings """
+    if version[0] not in comma_versions:
+        return True, None, None
+    if options.get('stream_csv', False):
+        feeder = LineFeeder(decoded_lines)
+        return False, feeder, csv.reader(feeder)
+    return False, None, None
+
+
+def iter_records(lines, options={}, state=None):
+    """Does the work of iter_lines, but yields ``(data_type, decoder, data)``
+    tuples. For summaries, itemizations and text records, ``decoder`` is the
+    RowDecoder for the line and ``data`` is the list of values it returned,
+    so callers that don't need a dictionary per row can avoid building one.
+    For headers and F99 text, ``decoder`` is None and ``data`` is what the
+    corresponding FecItem would hold. Byte offsets are only tracked when
+    ``lines`` is a LineReader."""
+    if state is None:
+        state = ParserState()
+    version = state.version
+    current_line_num = state.line_num
+    header_lines = []
+    header_start = None
+    text_section = state.text_section
+    text_start = (None, None)
+    f99_text = state.f99_text
+    summary = state.summary
+    as_strings = options.get('as_strings', False)
+    projection = None
+    if options.get('columns') is not None:
+        projection = tuple(options['columns'])
+    dates = options.get('dates')
+    # tables of interned strings for this parse, keyed by column name, and
+    # the tables each decoder uses
+    intern_tables = {} if options.get('intern', False) else None
+    decoder_tables = {}
+    interned = None
+    str_prefixes = bytes_prefixes = None
+    if 'filter_itemizations' in options:
+        str_prefixes, bytes_prefixes = line_prefixes(
+            options['filter_itemizations']
+        )
+    position = lines if isinstance(lines, LineReader) else None
+    offset = None if position is None else position.offset
+    lines = iter(lines)
+    decoded_lines = decode_lines(lines)
+    ascii_separator = True
+    feeder = None
+    reader = None
+    if version is not None:
+        ascii_separator, feeder, reader = line_splitting(
+            version, options, decoded_lines
+        )
+    for line in lines:
         current_line_num += 1
-        try:
-            line = line_unk if type(line_unk) is str else line_unk.decode('utf-8')
-        except UnicodeDecodeError:
-            line = line_unk.decode('ISO-8859-1')
+        line_offset = offset
+        if position is not None:
+            offset = position.offset
+        if summary and str_prefixes is not None:
+            if type(line) is str:
+                if not line.startswith(str_prefixes):
+                    continue
+            elif not line.startswith(bytes_prefixes):
+                continue
+        line = decode_line(line)
         if version is None:
+            if not header_lines:
+                header_start = (current_line_num, line_offset)
             header_lines.append(line)
             header, version, header_length = parse_header(header_lines)
             if header is not None:
-                yield FecItem('header', header)
+                state.version = version
+                state.header = header
+                state.line_num = current_line_num
+                state.offset = offset
+                state.record_line_num, state.record_offset = header_start
+                yield 'header', None, header
+            if version is not None:
+                state.version = version
+                ascii_separator, feeder, reader = line_splitting(
+                    version, options, decoded_lines
+                )
         else:
-            if summary and 'filter_itemizations' in options:
-                if not include_line(line, options['filter_itemizations']):
-                    continue
             stripped = line.strip().upper()
             if stripped == '[BEGINTEXT]' or stripped == '[BEGIN TEXT]':
                 text_section = True
+                text_start = (current_line_num, line_offset)
                 continue
             if stripped == '[ENDTEXT]' or stripped == '[END TEXT]':
                 text_section = False
-                yield FecItem('F99_text', f99_text)
+                state.line_num = current_line_num
+                state.offset = offset
+                state.text_section = False
+                state.f99_text = f99_text
+                state.record_line_num, state.record_offset = text_start
+                yield 'F99_text', None, f99_text
                 continue
             if text_section:
                 if f99_text == '':
@@ -102,33 +419,64 @@ def iter_lines(lines, options={}):
                 else:
                     f99_text += '\n' + line
                 continue
-            as_strings = options.get('as_strings', False)
-            parsed = parse_line(line, version, current_line_num, as_strings)
-            if parsed is None:
+            line_num = current_line_num
+            if reader is not None and COLUMN_SEPARATOR not in line:
+                feeder.feed(line)
+                fields = strip_quotes(next(reader, []))
+                current_line_num += feeder.continuations
+                feeder.continuations = 0
+                if position is not None:
+                    offset = position.offset
+            else:
+                fields = fields_from_line(line, use_ascii_28=ascii_separator)
+            if len(fields) < 2:
                 continue
+            decoder = getRowDecoder(fields[0].strip(), version)
+            if summary and projection is not None and decoder.has_form_type:
+                decoder = decoder.variant(projection, dates)
+            elif dates is not None:
+                decoder = decoder.variant(None, dates)
+            if intern_tables is not None:
+                try:
+                    interned = decoder_tables[decoder]
+                except KeyError:
+                    interned = decoder_tables[decoder] = decoder.intern_tables(
+                        intern_tables
+                    )
+            row = decoder.values(fields, line_num, as_strings, interned)
+            state.line_num = current_line_num
+            state.offset = offset
+            state.record_line_num = line_num
+            state.record_offset = line_offset
             if summary:
-                if 'form_type' in parsed:
-                    yield FecItem('itemization', parsed)
+                if decoder.has_form_type:
+                    yield 'itemization', decoder, row
                 else:
-                    yield FecItem('text', parsed)
+                    yield 'text', decoder, row
             else:
-                summary = True
-                yield FecItem('summary', parsed)
+                summary = state.summary = True
+                yield 'summary', decoder, row
+
+
+def strip_quotes(fields):
+    # joining is much quicker than checking each field in Python, and
+    # fields are rarely left quoted
+    if '"' not in ''.join(fields):
+        return fields
+    return [
+        f[1:-1] if f.startswith('"') and f.endswith('"') else f
+        for f in fields
+    ]
 
 
 def fields_from_line(line, use_ascii_28=False):
     if (COLUMN_SEPARATOR in line) or use_ascii_28:
         fields = line.split(COLUMN_SEPARATOR)
     else:
-        reader = csv.reader([line])
-        fields = next(reader)
-    for field in fields:
-        if field.startswith('"') and field.endswith('"'):
-            field = field[1:-1]
-    return list(map(
-        lambda x: x[1:-1] if (x.startswith('"') and x.endswith('"')) else x,
-        fields
-    ))
+        fields = next(csv.reader([line]))
+    if '"' not in line:
+        return fields
+    return strip_quotes(fields)
 
 
 def parse_header(lines):
@@ -162,31 +510,284 @@ def parse_header(lines):
     return parsed, fields[1], 1
 
 
-def parse_line(line, version, line_num=None, as_strings=False):
+def parse_line(line, version, line_num=None, as_strings=False, columns=None,
+               dates=None):
     ascii_separator = True
     if version is None or version[0] in comma_versions:
         ascii_separator = False
     fields = fields_from_line(line, use_ascii_28=ascii_separator)
+    return parse_fields(fields, version, line_num, as_strings, columns, dates)
+
+
+def parse_fields(fields, version, line_num=None, as_strings=False,
+                 columns=None, dates=None):
     if len(fields) < 2:
         return None
     form = fields[0].strip()
-    this_version_mapping = getMapping(mappings, form, version)
-    out = {}
-    for i in range(len(this_version_mapping)):
-        val = fields[i] if i < len(fields) else ''
-        k = this_version_mapping[i]
-        if as_strings:
-            out[k] = val
+    decoder = getRowDecoder(form, version)
+    if columns is not None or dates is not None:
+        decoder = decoder.variant(
+            None if columns is None else tuple(columns), dates
+        )
+    return decoder.decode(fields, line_num, as_strings)
+
+
+INTERN_LIMIT = 4096
+# columns whose names end with one of these usually hold a few values
+# repeated across many rows; ids, names, streets and memos are mostly unique
+INTERNED_SUFFIXES = (
+    'code', '_cd', 'type', 'state', 'city', 'employer', 'occupation',
+    'prefix', 'suffix', 'office', 'district', 'fec_id',
+    'committee_id_number', 'sched_name',
+)
+
+
+def interned_column(key):
+    """ whether a column usually holds a few values repeated across many
+    rows, such as codes, states, cities, employers, occupations and
+    committee ids, judging by its name in mappings.json """
+    return key.endswith(INTERNED_SUFFIXES)
+
+
+class RowDecoder:
+    """Converts the split fields of a line into a dictionary for a single
+    (form, version) pair. The column names and the converter for each column
+    are resolved from mappings.json and types.json once, when the decoder is
+    built, so decoding a row does no per-value lookups. A decoder built with
+    ``selected`` only takes and converts those columns, plus form_type."""
+    def __init__(self, form, version, columns, converters, props,
+                 selected=None):
+        self.form = form
+        self.version = version
+        self.columns = columns
+        self.converters = converters
+        self.column_props = props
+        self.padding = [''] * len(columns)
+        self.variants = {}
+        # a few mappings repeat a column name, in which case the last field
+        # wins, so each key is only taken from (and converted) once
+        positions = {}
+        for i, k in enumerate(columns):
+            positions[k] = i
+        if selected is not None:
+            positions = {
+                k: i for k, i in positions.items()
+                if k in selected or k == 'form_type'
+            }
+        self.keys = tuple(positions.keys())
+        self.has_form_type = 'form_type' in positions
+        if self.has_form_type:
+            self.form_type_index = self.keys.index('form_type')
+        self.indexes = tuple(positions.values())
+        self.props = tuple(props[i] for i in self.indexes)
+        self.type_names = tuple(
+            prop['type'] if prop else None for prop in self.props
+        )
+        if len(self.indexes) > 1:
+            self.getter = itemgetter(*self.indexes)
+        elif self.indexes:
+            self.getter = lambda fields: (fields[self.indexes[0]],)
         else:
-            out[k] = getTyped(form, version, k, val, line_num)
-    return out
+            self.getter = lambda fields: ()
+        self.typed = tuple(
+            (pos, self.keys[pos], converters[i], self.type_names[pos])
+            for pos, i in enumerate(self.indexes)
+            if converters[i] is not identity
+        )
+        self.record = None
+        # string columns that interned_column picks out
+        self.intern_columns = tuple(
+            (pos, k) for pos, k in enumerate(self.keys)
+            if converters[self.indexes[pos]] is identity
+            and interned_column(k)
+        )
+
+    def intern_tables(self, tables):
+        """ returns the position of each column that interned_column picks
+        out, along with its table in ``tables``, a dictionary of tables keyed
+        by column name, adding any that are missing """
+        return tuple(
+            (pos, tables.setdefault(k, {})) for pos, k in self.intern_columns
+        )
+
+    def values(self, fields, line_num=None, as_strings=False, interned=None):
+        """Returns a list of values in the same order as ``keys``. If
+        ``interned`` is given, as returned by intern_tables, equal strings in
+        each of those columns share the first object seen, which is kept in
+        the column's table. Tables stop growing at INTERN_LIMIT values."""
+        if len(fields) < len(self.columns):
+            fields = fields + self.padding[len(fields):]
+        row = list(self.getter(fields))
+        if interned is not None:
+            for pos, table in interned:
+                value = row[pos]
+                try:
+                    row[pos] = table[value]
+                except KeyError:
+                    if len(table) < INTERN_LIMIT:
+                        table[value] = value
+        if as_strings:
+            return row
+        for pos, k, converter, type_name in self.typed:
+            try:
+                row[pos] = converter(row[pos])
+            except ValueError:
+                warnings.warn(
+                    'cannot parse value: {v}, as type: {t}, '
+                    'for field: {f}, in form: {o}, '
+                    'version: {r} (line {n})'.format(
+                        v=row[pos],
+                        t=type_name,
+                        f=k,
+                        o=self.form,
+                        r=self.version,
+                        n='unknown' if line_num is None else line_num + 1,
+                    ),
+                    FecParserTypeWarning,
+                )
+                row[pos] = None
+        return row
+
+    def variant(self, columns=None, dates=None):
+        """ returns a decoder for the same form and version that only takes
+        the columns in the tuple ``columns``, if it isn't None, and converts
+        dates as described in date_converter """
+        key = (columns, dates)
+        try:
+            return self.variants[key]
+        except KeyError:
+            decoder = self.variants[key] = RowDecoder(
+                self.form,
+                self.version,
+                self.columns,
+                tuple(getConverter(p, dates) for p in self.column_props),
+                self.column_props,
+                None if columns is None else frozenset(columns),
+            )
+            return decoder
+
+    def decode(self, fields, line_num=None, as_strings=False):
+        return self.to_dict(self.values(fields, line_num, as_strings))
+
+    def to_dict(self, row):
+        return dict(zip(self.keys, row))
+
+    def to_record(self, row):
+        """ returns the row as an FecRecord whose type is made for this
+        decoder's keys the first time it is needed """
+        if self.record is None:
+            self.record = record_type(self.form, self.keys)
+        return self.record(row)
+
+
+def row_builder(options):
+    """ returns the function that turns a decoder and the values it returned
+    into a row: RowDecoder.to_record with the records option, and
+    RowDecoder.to_dict otherwise """
+    if options.get('records', False):
+        return RowDecoder.to_record
+    return RowDecoder.to_dict
+
+
+def identity(value):
+    return value
+
+
+def to_float(value):
+    stripped = value.strip()
+    if stripped == '' or stripped.lower() in nones:
+        return None
+    return float(stripped.replace('%', ''))
+
+
+DATE_MEMO_SIZE = 4096
+DATE_CONVERTERS = {}
+
+
+def parse_yyyymmdd(value):
+    """ parses an eight digit %Y%m%d date without going through strptime,
+    returning None for anything else """
+    if len(value) == 8 and value.isdigit():
+        return datetime(int(value[:4]), int(value[4:6]), int(value[6:]))
+    return None
+
+
+def date_converter(format, dates=None):
+    """Returns a converter for dates in ``format``, shared by every decoder.
+    Dates are timezone aware datetimes in US/Eastern, or naive datetimes if
+    ``dates`` is 'naive', or ``datetime.date`` instances if it is 'date'.
+    Filings repeat the same few dates over and over, so converted values are
+    memoized by the string they came from."""
+    key = (format, dates)
+    if key in DATE_CONVERTERS:
+        return DATE_CONVERTERS[key]
+    eastern = load_tables()['eastern']
+    memo = {}
+
+    def to_date(value):
+        try:
+            return memo[value]
+        except KeyError:
+            pass
+        stripped = value.strip()
+        if stripped == '':
+            return None
+        parsed = None
+        if format == '%Y%m%d':
+            parsed = parse_yyyymmdd(stripped)
+        if parsed is None:
+            parsed = datetime.strptime(stripped, format)
+        if dates == 'date':
+            parsed = parsed.date()
+        elif dates != 'naive':
+            parsed = eastern.localize(parsed)
+        if len(memo) >= DATE_MEMO_SIZE:
+            memo.clear()
+        memo[value] = parsed
+        return parsed
+    DATE_CONVERTERS[key] = to_date
+    return to_date
+
+
+def getConverter(prop, dates=None):
+    if prop:
+        if prop['type'] == 'integer':
+            return int
+        if prop['type'] == 'float':
+            return to_float
+        if prop['type'] == 'date':
+            return date_converter(prop['format'], dates)
+    return identity
+
+
+def getRowDecoder(form, version):
+    """ builds the RowDecoder for a form/version pair, caching it """
+    form = normalize_form(form)
+    key = (form, version)
+    try:
+        decoder = ROW_DECODER_CACHE[key]
+    except KeyError:
+        tables = load_tables()
+        columns = tuple(getMapping(tables['mappings'], form, version))
+        props = [
+            getTypeMapping(tables['types'], form, version, k) for k in columns
+        ]
+        decoder = RowDecoder(
+            form,
+            version,
+            columns,
+            tuple(getConverter(prop) for prop in props),
+            tuple(props),
+        )
+        ROW_DECODER_CACHE[key] = decoder
+    return decoder
 
 
 nones = ['none', 'n/a']
 
 
 def getTyped(form, version, field, value, line_num):
-    prop = getTypeMapping(types, form, version, field)
+    prop = getTypeMapping(load_tables()['types'], form, version, field)
     if prop:
         try:
             if prop['type'] == 'integer':
@@ -198,14 +799,7 @@ def getTyped(form, version, field, value, line_num):
                 sanitized = stripped.replace('%', '')
                 return float(sanitized)
             if prop['type'] == 'date':
-                format = prop['format']
-                stripped = value.strip()
-                if stripped == '':
-                    return None
-                parsed_date = datetime.strptime(
-                    stripped,
-                    format)
-                return eastern.localize(parsed_date)
+                return date_converter(prop['format'])(value)
         except ValueError:
             warnings.warn(
                 'cannot parse value: {v}, as type: {t}, '
@@ -0,0 +1,138 @@
+"""Writes filings as JSON Lines, one object per header, summary,
+itemization and text record, without holding the filing in memory.
+
+Run ``python -m fecfile.jsonl filing.fec [output.jsonl]`` to convert a file
+from the command line; without an output path, lines go to stdout.
+"""
+from datetime import date
+import json
+from json.encoder import encode_basestring_ascii
+import sys
+
+from . import fecparser
+
+
+BUFFER_LINES = 1000
+LINE_PREFIXES = {
+    data_type: '{{"data_type":{0},"data":'.format(json.dumps(data_type))
+    for data_type in ('header', 'summary', 'itemization', 'text', 'F99_text')
+}
+
+
+def encode_value(value):
+    """ encodes one parsed value as json, checking for the most common types
+    first """
+    value_type = type(value)
+    if value_type is str:
+        return encode_basestring_ascii(value)
+    if value is None:
+        return 'null'
+    if value_type is float:
+        if value != value or value in (float('inf'), float('-inf')):
+            return json.dumps(value)
+        return float.__repr__(value)
+    if value_type is int:
+        return int.__repr__(value)
+    if isinstance(value, date):
+        return '"' + value.isoformat() + '"'
+    return json.dumps(value, default=str)
+
+
+class JsonRowEncoder:
+    """Encodes the values a RowDecoder returns as a json object. The keys,
+    with the punctuation around them, are encoded once per decoder."""
+    def __init__(self, decoder):
+        self.prefixes = tuple(
+            ('{' if i == 0 else ',') + encode_basestring_ascii(k) + ':'
+            for i, k in enumerate(decoder.keys)
+        )
+
+    def encode(self, row):
+        if not self.prefixes:
+            return '{}'
+        parts = []
+        for prefix, value in zip(self.prefixes, row):
+            parts.append(prefix)
+            if type(value) is str:
+                parts.append(encode_basestring_ascii(value))
+            else:
+                parts.append(encode_value(value))
+        parts.append('}')
+        return ''.join(parts)
+
+
+def iter_jsonl(lines, options={}, counts=None):
+    """Iterates over the lines of JSON Lines for a filing's ``lines``, each
+    an object with ``data_type`` and ``data`` keys like an FecItem's. If
+    ``counts`` is given, the number of itemizations of each form type is
+    added to it."""
+    encoders = {}
+    for data_type, decoder, data in fecparser.iter_records(lines, options):
+        if decoder is None:
+            encoded = json.dumps(data, default=str)
+        else:
+            try:
+                encoder = encoders[decoder]
+            except KeyError:
+                encoder = encoders[decoder] = JsonRowEncoder(decoder)
+            encoded = encoder.encode(data)
+            if counts is not None and data_type == 'itemization':
+                counts[data[decoder.form_type_index]] += 1
+        yield LINE_PREFIXES[data_type] + encoded + '}\n'
+
+
+def write_jsonl(lines, out, options={}, counts=None):
+    """ writes the JSON Lines for ``lines`` to the text file ``out`` in
+    batches of BUFFER_LINES, returning the number of lines written """
+    buffer = []
+    num_lines = 0
+    for line in iter_jsonl(lines, options, counts):
+        buffer.append(line)
+        if len(buffer) >= BUFFER_LINES:
+            out.write(''.join(buffer))
+            num_lines += len(buffer)
+            buffer = []
+    out.write(''.join(buffer))
+    return num_lines + len(buffer)
+
+
+def dump_jsonl(source, out, options={}, counts=None):
+    """Writes the filing at the path ``source``, or in the iterable of lines
+    ``source``, to ``out``, which is a path or a file opened for writing
+    text. Returns the number of lines written."""
+    if type(source) is str:
+        with open(source, 'rb') as file:
+            return dump_jsonl(fecparser.map_lines(file), out, options, counts)
+    if type(out) is str:
+        with open(out, 'w', encoding='utf-8') as file:
+            return write_jsonl(source, file, options, counts)
+    return write_jsonl(source, out, options, counts)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog='python -m fecfile.jsonl',
+        description='Converts a .fec file to JSON Lines.',
+    )
+    parser.add_argument('source', help='the .fec file to convert')
+    parser.add_argument('out', nargs='?',
+                        help='where to write (default: stdout)')
+    parser.add_argument('--as-strings', action='store_true',
+                        help="don't convert numbers and dates")
+    parser.add_argument('--filter', action='append', metavar='PREFIX',
+                        help='only include itemizations starting with PREFIX '
+                             '(repeat it, or separate prefixes with commas, '
+                             'for more than one)')
+    args = parser.parse_args(argv)
+    options = {'as_strings': args.as_strings}
+    if args.filter is not None:
+        options['filter_itemizations'] = [
+            p for prefixes in args.filter for p in prefixes.split(',') if p
+        ]
+    dump_jsonl(args.source, sys.stdout if args.out is None else args.out,
+               options)
+
+
+if __name__ == '__main__':
+    main()
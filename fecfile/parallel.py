@@ -0,0 +1,218 @@
+from collections import deque
+from itertools import islice
+import io
+import mmap
+import os
+import re
+
+from . import fecparser
+
+
+class ParseResult:
+    """The outcome of parsing one file with parse_many. ``data`` is what
+    ``function`` returned for the file, or None if it raised an exception, in
+    which case the exception is in ``error``."""
+    def __init__(self, path, data=None, error=None):
+        self.path = path
+        self.data = data
+        self.error = error
+
+
+def warm_worker():
+    """ loads the mappings and compiles every regex before any file is
+    parsed, so each worker pays that cost once, up front """
+    fecparser.warm_caches()
+
+
+def parse_one(function, path, options):
+    try:
+        return ParseResult(path, function(path, options))
+    except Exception as ex:
+        return ParseResult(path, error=ex)
+
+
+def parse_many(function, paths, workers=None, options={}):
+    """Calls ``function(path, options)`` for each of ``paths`` in a pool of
+    ``workers`` processes, yielding a ParseResult for each path as soon as it
+    is finished. An exception raised while parsing one file is returned in
+    its ParseResult instead of stopping the others. With ``workers=1``, the
+    files are parsed one at a time in the current process."""
+    if workers == 1:
+        for path in paths:
+            yield parse_one(function, path, options)
+        return
+    # concurrent.futures is slow to import, so it's left until it's needed
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    with ProcessPoolExecutor(workers, initializer=warm_worker) as executor:
+        futures = {
+            executor.submit(parse_one, function, path, options): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as ex:
+                yield ParseResult(futures[future], error=ex)
+
+
+# lines end in \n, \r\n or a lone \r, as they do for fecparser.LineReader
+LINE_BREAK = re.compile(rb'\r\n?|\n')
+# starts with a literal, so the regex engine can skip ahead to each "["
+# rather than trying every position; marker_line checks the rest of the line
+TEXT_MARKER = re.compile(rb'\[(BEGIN ?TEXT|END ?TEXT)\]', re.IGNORECASE)
+CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def line_end(mm, pos):
+    """ returns the offset of the start of the line after the one ``pos`` is
+    in, or the end of ``mm`` """
+    match = LINE_BREAK.search(mm, pos)
+    return len(mm) if match is None else match.end()
+
+
+def marker_line(mm, match):
+    """ returns the offset of the start of the line a TEXT_MARKER match is
+    on, or None if anything but spaces and tabs share the line with it """
+    line_start = max(
+        mm.rfind(b'\n', 0, match.start()), mm.rfind(b'\r', 0, match.start())
+    ) + 1
+    next_break = LINE_BREAK.search(mm, match.end())
+    line_stop = len(mm) if next_break is None else next_break.start()
+    if (mm[line_start:match.start()].strip(b' \t')
+            or mm[match.end():line_stop].strip(b' \t')):
+        return None
+    return line_start
+
+
+def text_sections(mm):
+    """ returns the (start, end) byte offsets of each [BEGINTEXT] line and
+    the end of its matching [ENDTEXT] line """
+    sections = []
+    start = None
+    for match in TEXT_MARKER.finditer(mm):
+        line_start = marker_line(mm, match)
+        if line_start is None:
+            continue
+        if match.group(1).upper().startswith(b'BEGIN'):
+            if start is None:
+                start = line_start
+        elif start is not None:
+            sections.append((start, line_end(mm, match.end())))
+            start = None
+    if start is not None:
+        sections.append((start, len(mm)))
+    return sections
+
+
+def chunk_boundaries(mm, start, chunk_size):
+    """Splits the bytes from ``start`` to the end of ``mm`` into ranges of
+    roughly ``chunk_size`` bytes that begin at the start of a line and don't
+    begin inside a text section."""
+    sections = text_sections(mm)
+    boundaries = [start]
+    while boundaries[-1] < len(mm):
+        end = line_end(mm, boundaries[-1] + chunk_size)
+        for section_start, section_end in sections:
+            if section_start < end < section_end:
+                end = min(section_end, len(mm))
+        boundaries.append(end)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def count_lines(mm, start, end, step=CHUNK_SIZE):
+    """ counts the line breaks between two offsets, which must both be at the
+    start of a line, ``step`` bytes at a time """
+    count = 0
+    for i in range(start, end, step):
+        block = mm[i:min(i + step, end)]
+        count += block.count(b'\n')
+        if b'\r' in block:
+            # \r\n is one line break, and a lone \r is another
+            count += block.count(b'\r') - block.count(b'\r\n')
+            block_end = i + len(block)
+            if (block.endswith(b'\r') and block_end < end
+                    and mm[block_end:block_end + 1] == b'\n'):
+                count -= 1
+    return count
+
+
+def parse_range(file_path, start, end, version, line_num, options):
+    """Parses the lines between two byte offsets of a file, which must come
+    after the summary line and not begin inside a text section, returning
+    the data type, data, line number and byte offset of each record.
+    ``line_num`` is the number of lines before ``start``."""
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    state = fecparser.ParserState(version, line_num, summary=True)
+    build = fecparser.row_builder(options)
+    lines = fecparser.LineReader(io.BytesIO(data), start)
+    return [
+        (
+            data_type,
+            data if decoder is None else build(decoder, data),
+            state.record_line_num,
+            state.record_offset,
+        )
+        for data_type, decoder, data in fecparser.iter_records(
+            lines, options, state
+        )
+    ]
+
+
+def iter_file_chunks(file_path, options={}, workers=None,
+                     chunk_size=CHUNK_SIZE):
+    """Yields the same FecItems as iterating over the file at ``file_path``
+    with iter_lines, but parses everything after the summary line in byte
+    ranges of about ``chunk_size`` bytes spread over a pool of ``workers``
+    processes. Items are yielded in the order of the lines in the file."""
+    options = dict(options)
+    options.pop('stream_csv', None)
+    state = fecparser.ParserState()
+    build = fecparser.row_builder(options)
+    with open(file_path, 'rb') as file:
+        records = fecparser.iter_records(
+            fecparser.read_lines(file), options, state
+        )
+        for data_type, decoder, data in records:
+            if decoder is not None:
+                data = build(decoder, data)
+            yield fecparser.FecItem(
+                data_type, data, state.record_line_num, state.record_offset
+            )
+            if data_type == 'summary':
+                break
+        if not state.summary:
+            return
+        offset = state.offset
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ranges = chunk_boundaries(mm, offset, chunk_size)
+            line_nums = [state.line_num]
+            for start, end in ranges[:-1]:
+                line_nums.append(line_nums[-1] + count_lines(mm, start, end))
+    jobs = [
+        (file_path, start, end, state.version, line_num, options)
+        for (start, end), line_num in zip(ranges, line_nums)
+    ]
+    if workers == 1 or len(jobs) == 1:
+        for job in jobs:
+            for item in parse_range(*job):
+                yield fecparser.FecItem(*item)
+        return
+    workers = workers or os.cpu_count() or 1
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(workers, initializer=warm_worker) as executor:
+        # only keep a couple of ranges per worker in flight, so results
+        # don't pile up in memory when the caller is slower than the pool
+        jobs = iter(jobs)
+        pending = deque(
+            executor.submit(parse_range, *job)
+            for job in islice(jobs, workers * 2)
+        )
+        while pending:
+            results = pending.popleft().result()
+            job = next(jobs, None)
+            if job is not None:
+                pending.append(executor.submit(parse_range, *job))
+            for item in results:
+                yield fecparser.FecItem(*item)
@@ -0,0 +1,104 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+
+SETTINGS = {'cache_dir': None, 'max_bytes': 0}
+READ_SIZE = 1024 * 1024
+SUFFIX = '.pickle'
+
+
+def configure(cache_dir, max_bytes):
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+    SETTINGS['cache_dir'] = cache_dir
+    SETTINGS['max_bytes'] = max_bytes
+
+
+def enabled():
+    return SETTINGS['cache_dir'] is not None
+
+
+def file_digest(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(READ_SIZE), b''):
+            digest.update(block)
+    return digest
+
+
+def text_digest(text):
+    return hashlib.sha256(
+        text.encode('utf-8', 'surrogatepass') if type(text) is str else text
+    )
+
+
+def cache_key(digest, options):
+    """ combines the hash of a filing's contents with the library version
+    and the options it is parsed with, since all three change the result """
+    from . import __version__
+    digest = digest.copy()
+    digest.update(repr((__version__, sorted(options.items()))).encode())
+    return digest.hexdigest()
+
+
+def cached(digest, options, parse):
+    """Returns the result for ``digest`` and ``options`` stored in the cache
+    directory, or calls ``parse`` and stores what it returns. Unreadable
+    entries are treated as missing and deleted. Each entry is written to a
+    temporary file of its own and renamed into place, so processes saving
+    the same entry at once don't write over each other."""
+    cache_dir = SETTINGS['cache_dir']
+    path = os.path.join(cache_dir, cache_key(digest, options) + SUFFIX)
+    try:
+        with open(path, 'rb') as file:
+            parsed = pickle.load(file)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # truncated, corrupt, or pickled by an incompatible version
+        remove(path)
+    else:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return parsed
+    parsed = parse()
+    fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=cache_dir)
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            pickle.dump(parsed, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except BaseException:
+        remove(temp_path)
+        raise
+    evict(SETTINGS['cache_dir'], SETTINGS['max_bytes'])
+    return parsed
+
+
+def remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def evict(cache_dir, max_bytes):
+    """ deletes the least recently used entries until the ones left take up
+    at most ``max_bytes`` """
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(SUFFIX):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for mtime, size, path in entries)
+    for mtime, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
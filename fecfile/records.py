@@ -0,0 +1,58 @@
+import keyword
+from operator import itemgetter
+
+
+RECORD_TYPES = {}
+
+
+class FecRecord(tuple):
+    """A row of values from one line of a filing, stored as a tuple. Each
+    record type is made for one form's columns by ``record_type``, and has
+    an attribute for every column whose name is a valid identifier (such as
+    ``row.contribution_amount``). ``to_dict`` returns the dictionary the row
+    would otherwise have been parsed into."""
+    __slots__ = ()
+    columns = ()
+
+    def to_dict(self):
+        return dict(zip(self.columns, self))
+
+    def __repr__(self):
+        return '{0}({1})'.format(type(self).__name__, ', '.join(
+            '{0}={1!r}'.format(k, v) for k, v in zip(self.columns, self)
+        ))
+
+    def __reduce__(self):
+        # record types are made at runtime, so pickles refer to them by the
+        # arguments to record_type rather than by name
+        cls = type(self)
+        return (make_record, (cls.__name__, cls.columns, tuple(self)))
+
+
+def attribute_name(key):
+    return (
+        key.isidentifier()
+        and not keyword.iskeyword(key)
+        and not key.startswith('_')
+        and not hasattr(FecRecord, key)
+    )
+
+
+def record_type(name, columns):
+    """ returns the FecRecord subclass called ``name`` for rows with the
+    tuple of keys ``columns``, making it on first use """
+    key = (name, columns)
+    try:
+        return RECORD_TYPES[key]
+    except KeyError:
+        pass
+    namespace = {'__slots__': (), 'columns': columns}
+    for i, k in enumerate(columns):
+        if attribute_name(k):
+            namespace[k] = property(itemgetter(i))
+    cls = RECORD_TYPES[key] = type(name, (FecRecord,), namespace)
+    return cls
+
+
+def make_record(name, columns, values):
+    return record_type(name, columns)(values)
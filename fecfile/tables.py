@@ -0,0 +1,11149 @@
+# generated by `python -m fecfile.build_tables` from mappings.json and types.json
+# do not edit this file directly
+
+MAPPINGS = {'^hdr$': {'^(P3|P2.6)': ['record_type',
+                          'fec_version',
+                          'soft_name',
+                          'batch_number',
+                          'received_date',
+                          'report_id'],
+           '^(P2.2|P2.3|P2.4)': ['record_type',
+                                 'fec_version',
+                                 'soft_name',
+                                 'batch_number',
+                                 'report_id'],
+           '^P1': ['record_type', 'fec_version', 'soft_name', 'batch_number'],
+           '^[6-8]': ['record_type',
+                      'ef_type',
+                      'fec_version',
+                      'soft_name',
+                      'soft_ver',
+                      'report_id',
+                      'report_number',
+                      'comment'],
+           '^[3-5]': ['record_type',
+                      'ef_type',
+                      'fec_version',
+                      'soft_name',
+                      'soft_ver',
+                      'name_delim',
+                      'report_id',
+                      'report_number',
+                      'comment']},
+ '^f1[an]': {'^P3.2|^P3.3|^P3.4': ['form_type',
+                                   'filer_committee_id_number',
+                                   'change_of_committee_name',
+                                   'committee_name',
+                                   'change_of_address',
+                                   'street_1',
+                                   'street_2',
+                                   'city',
+                                   'state',
+                                   'zip_code',
+                                   'change_of_committee_email',
+                                   'committee_email',
+                                   'change_of_committee_url',
+                                   'committee_url',
+                                   'effective_date',
+                                   'signature_last_name',
+                                   'signature_first_name',
+                                   'signature_middle_name',
+                                   'signature_prefix',
+                                   'signature_suffix',
+                                   'date_signed',
+                                   'committee_type',
+                                   'candidate_last_name',
+                                   'candidate_first_name',
+                                   'candidate_middle_name',
+                                   'candidate_prefix',
+                                   'candidate_suffix',
+                                   'candidate_office',
+                                   'candidate_state',
+                                   'candidate_district',
+                                   'party_code',
+                                   'party_type',
+                                   'organization_type',
+                                   'lobbyist_registrant_pac',
+                                   'lobbyist_registrant_pac_2',
+                                   'leadership_pac',
+                                   'affiliated_committee_name',
+                                   'affiliated_last_name',
+                                   'affiliated_first_name',
+                                   'affiliated_middle_name',
+                                   'affiliated_prefix',
+                                   'affiliated_suffix',
+                                   'affiliated_street_1',
+                                   'affiliated_street_2',
+                                   'affiliated_city',
+                                   'affiliated_state',
+                                   'affiliated_zip_code',
+                                   'affiliated_relationship_code',
+                                   'custodian_last_name',
+                                   'custodian_first_name',
+                                   'custodian_middle_name',
+                                   'custodian_prefix',
+                                   'custodian_suffix',
+                                   'custodian_street_1',
+                                   'custodian_street_2',
+                                   'custodian_city',
+                                   'custodian_state',
+                                   'custodian_zip_code',
+                                   'custodian_title',
+                                   'custodian_telephone',
+                                   'treasurer_last_name',
+                                   'treasurer_first_name',
+                                   'treasurer_middle_name',
+                                   'treasurer_prefix',
+                                   'treasurer_suffix',
+                                   'treasurer_street_1',
+                                   'treasurer_street_2',
+                                   'treasurer_city',
+                                   'treasurer_state',
+                                   'treasurer_zip_code',
+                                   'treasurer_title',
+                                   'treasurer_telephone',
+                                   'agent_last_name',
+                                   'agent_first_name',
+                                   'agent_middle_name',
+                                   'agent_prefix',
+                                   'agent_suffix',
+                                   'agent_street_1',
+                                   'agent_street_2',
+                                   'agent_city',
+                                   'agent_state',
+                                   'agent_zip_code',
+                                   'agent_title',
+                                   'agent_telephone',
+                                   'bank_name',
+                                   'bank_street_1',
+                                   'bank_street_2',
+                                   'bank_city',
+                                   'bank_state',
+                                   'bank_zip_code',
+                                   'bank2_name',
+                                   'bank2_street_1',
+                                   'bank2_street_2',
+                                   'bank2_city',
+                                   'bank2_state',
+                                   'bank2_zip_code',
+                                   'beginning_image_number',
+                                   'end_image_number',
+                                   'receipt_date'],
+             '^P2.6|^P3.0|^P3.1': ['form_type',
+                                   'filer_committee_id_number',
+                                   'change_of_committee_name',
+                                   'committee_name',
+                                   'change_of_address',
+                                   'street_1',
+                                   'street_2',
+                                   'city',
+                                   'state',
+                                   'zip_code',
+                                   'change_of_committee_email',
+                                   'committee_email',
+                                   'change_of_committee_url',
+                                   'committee_url',
+                                   'effective_date',
+                                   'signature_last_name',
+                                   'signature_first_name',
+                                   'signature_middle_name',
+                                   'signature_prefix',
+                                   'signature_suffix',
+                                   'date_signed',
+                                   'committee_type',
+                                   'candidate_last_name',
+                                   'candidate_first_name',
+                                   'candidate_middle_name',
+                                   'candidate_prefix',
+                                   'candidate_suffix',
+                                   'candidate_office',
+                                   'candidate_state',
+                                   'candidate_district',
+                                   'party_code',
+                                   'party_type',
+                                   'organization_type',
+                                   'lobbyist_registrant_pac',
+                                   'lobbyist_registrant_pac_2',
+                                   'leadership_pac',
+                                   'affiliated_committee_name',
+                                   'affiliated_last_name',
+                                   'affiliated_first_name',
+                                   'affiliated_middle_name',
+                                   'affiliated_prefix',
+                                   'affiliated_suffix',
+                                   'affiliated_street_1',
+                                   'affiliated_street_2',
+                                   'affiliated_city',
+                                   'affiliated_state',
+                                   'affiliated_zip_code',
+                                   'affiliated_relationship_code',
+                                   'custodian_last_name',
+                                   'custodian_first_name',
+                                   'custodian_middle_name',
+                                   'custodian_prefix',
+                                   'custodian_suffix',
+                                   'custodian_street_1',
+                                   'custodian_street_2',
+                                   'custodian_city',
+                                   'custodian_state',
+                                   'custodian_zip_code',
+                                   'custodian_title',
+                                   'custodian_telephone',
+                                   'treasurer_last_name',
+                                   'treasurer_first_name',
+                                   'treasurer_middle_name',
+                                   'treasurer_prefix',
+                                   'treasurer_suffix',
+                                   'treasurer_street_1',
+                                   'treasurer_street_2',
+                                   'treasurer_city',
+                                   'treasurer_state',
+                                   'treasurer_zip_code',
+                                   'treasurer_title',
+                                   'treasurer_telephone',
+                                   'agent_last_name',
+                                   'agent_first_name',
+                                   'agent_middle_name',
+                                   'agent_prefix',
+                                   'agent_suffix',
+                                   'agent_street_1',
+                                   'agent_street_2',
+                                   'agent_city',
+                                   'agent_state',
+                                   'agent_zip_code',
+                                   'agent_title',
+                                   'agent_telephone',
+                                   'bank_name',
+                                   'bank_street_1',
+                                   'bank_street_2',
+                                   'bank_city',
+                                   'bank_state',
+                                   'bank_zip_code',
+                                   'bank2_name',
+                                   'bank2_street_1',
+                                   'bank2_street_2',
+                                   'bank2_city',
+                                   'bank2_state',
+                                   'bank2_zip_code',
+                                   'beginning_image_number'],
+             '^P2.4': ['form_type',
+                       'filer_committee_id_number',
+                       'change_of_committee_name',
+                       'committee_name',
+                       'change_of_address',
+                       'street_1',
+                       'street_2',
+                       'city',
+                       'state',
+                       'zip_code',
+                       'committee_email',
+                       'committee_url',
+                       'committee_fax_number',
+                       'effective_date',
+                       'signature_last_name',
+                       'signature_first_name',
+                       'signature_middle_name',
+                       'signature_prefix',
+                       'signature_suffix',
+                       'date_signed',
+                       'committee_type',
+                       'candidate_last_name',
+                       'candidate_first_name',
+                       'candidate_middle_name',
+                       'candidate_prefix',
+                       'candidate_suffix',
+                       'candidate_office',
+                       'candidate_state',
+                       'candidate_district',
+                       'party_code',
+                       'party_type',
+                       'organization_type',
+                       'leadership_pac',
+                       'affiliated_committee_name',
+                       'affiliated_street_1',
+                       'affiliated_street_2',
+                       'affiliated_city',
+                       'affiliated_state',
+                       'affiliated_zip_code',
+                       'affiliated_relationship_code',
+                       'custodian_last_name',
+                       'custodian_first_name',
+                       'custodian_middle_name',
+                       'custodian_prefix',
+                       'custodian_suffix',
+                       'custodian_street_1',
+                       'custodian_street_2',
+                       'custodian_city',
+                       'custodian_state',
+                       'custodian_zip_code',
+                       'custodian_title',
+                       'custodian_telephone',
+                       'treasurer_last_name',
+                       'treasurer_first_name',
+                       'treasurer_middle_name',
+                       'treasurer_prefix',
+                       'treasurer_suffix',
+                       'treasurer_street_1',
+                       'treasurer_street_2',
+                       'treasurer_city',
+                       'treasurer_state',
+                       'treasurer_zip_code',
+                       'treasurer_title',
+                       'treasurer_telephone',
+                       'agent_last_name',
+                       'agent_first_name',
+                       'agent_middle_name',
+                       'agent_prefix',
+                       'agent_suffix',
+                       'agent_street_1',
+                       'agent_street_2',
+                       'agent_city',
+                       'agent_state',
+                       'agent_zip_code',
+                       'agent_title',
+                       'agent_telephone',
+                       'bank_name',
+                       'bank_street_1',
+                       'bank_street_2',
+                       'bank_city',
+                       'bank_state',
+                       'bank_zip_code',
+                       'bank2_name',
+                       'bank2_street_1',
+                       'bank2_street_2',
+                       'bank2_city',
+                       'bank2_state',
+                       'bank2_zip_code',
+                       'beginning_image_number'],
+             '^P1.0|^P2.2|^P2.3': ['form_type',
+                                   'filer_committee_id_number',
+                                   'change_of_committee_name',
+                                   'committee_name',
+                                   'change_of_address',
+                                   'street_1',
+                                   'street_2',
+                                   'city',
+                                   'state',
+                                   'zip_code',
+                                   'committee_email',
+                                   'committee_url',
+                                   'committee_fax_number',
+                                   'effective_date',
+                                   'signature_last_name',
+                                   'signature_first_name',
+                                   'signature_middle_name',
+                                   'signature_prefix',
+                                   'signature_suffix',
+                                   'date_signed',
+                                   'committee_type',
+                                   'candidate_last_name',
+                                   'candidate_first_name',
+                                   'candidate_middle_name',
+                                   'candidate_prefix',
+                                   'candidate_suffix',
+                                   'candidate_office',
+                                   'candidate_state',
+                                   'candidate_district',
+                                   'party_code',
+                                   'party_type',
+                                   'affiliated_committee_name',
+                                   'affiliated_street_1',
+                                   'affiliated_street_2',
+                                   'affiliated_city',
+                                   'affiliated_state',
+                                   'affiliated_zip_code',
+                                   'affiliated_relationship_code',
+                                   'organization_type',
+                                   'custodian_last_name',
+                                   'custodian_first_name',
+                                   'custodian_middle_name',
+                                   'custodian_prefix',
+                                   'custodian_suffix',
+                                   'custodian_street_1',
+                                   'custodian_street_2',
+                                   'custodian_city',
+                                   'custodian_state',
+                                   'custodian_zip_code',
+                                   'custodian_title',
+                                   'custodian_telephone',
+                                   'treasurer_last_name',
+                                   'treasurer_first_name',
+                                   'treasurer_middle_name',
+                                   'treasurer_prefix',
+                                   'treasurer_suffix',
+                                   'treasurer_street_1',
+                                   'treasurer_street_2',
+                                   'treasurer_city',
+                                   'treasurer_state',
+                                   'treasurer_zip_code',
+                                   'treasurer_title',
+                                   'treasurer_telephone',
+                                   'agent_last_name',
+                                   'agent_first_name',
+                                   'agent_middle_name',
+                                   'agent_prefix',
+                                   'agent_suffix',
+                                   'agent_street_1',
+                                   'agent_street_2',
+                                   'agent_city',
+                                   'agent_state',
+                                   'agent_zip_code',
+                                   'agent_title',
+                                   'agent_telephone',
+                                   'bank_name',
+                                   'bank_street_1',
+                                   'bank_street_2',
+                                   'bank_city',
+                                   'bank_state',
+                                   'bank_zip_code',
+                                   'beginning_image_number'],
+             '^8.5|8.4': ['form_type',
+                          'filer_committee_id_number',
+                          'change_of_committee_name',
+                          'committee_name',
+                          'change_of_address',
+                          'street_1',
+                          'street_2',
+                          'city',
+                          'state',
+                          'zip_code',
+                          'change_of_committee_email',
+                          'committee_email',
+                          'change_of_committee_url',
+                          'committee_url',
+                          'effective_date',
+                          'signature_last_name',
+                          'signature_first_name',
+                          'signature_middle_name',
+                          'signature_prefix',
+                          'signature_suffix',
+                          'date_signed',
+                          'committee_type',
+                          'candidate_id_number',
+                          'candidate_last_name',
+                          'candidate_first_name',
+                          'candidate_middle_name',
+                          'candidate_prefix',
+                          'candidate_suffix',
+                          'candidate_office',
+                          'candidate_state',
+                          'candidate_district',
+                          'party_code',
+                          'party_type',
+                          'organization_type',
+                          'lobbyist_registrant_pac',
+                          'lobbyist_registrant_pac_2',
+                          'leadership_pac',
+                          'lobbyist_registrant_pac_3',
+                          'lobbyist_registrant_pac_4',
+                          'affiliated_committee_id_number',
+                          'affiliated_committee_name',
+                          'affiliated_candidate_id_number',
+                          'affiliated_last_name',
+                          'affiliated_first_name',
+                          'affiliated_middle_name',
+                          'affiliated_prefix',
+                          'affiliated_suffix',
+                          'affiliated_street_1',
+                          'affiliated_street_2',
+                          'affiliated_city',
+                          'affiliated_state',
+                          'affiliated_zip_code',
+                          'affiliated_relationship_code',
+                          'custodian_last_name',
+                          'custodian_first_name',
+                          'custodian_middle_name',
+                          'custodian_prefix',
+                          'custodian_suffix',
+                          'custodian_street_1',
+                          'custodian_street_2',
+                          'custodian_city',
+                          'custodian_state',
+                          'custodian_zip_code',
+                          'custodian_title',
+                          'custodian_telephone',
+                          'treasurer_last_name',
+                          'treasurer_first_name',
+                          'treasurer_middle_name',
+                          'treasurer_prefix',
+                          'treasurer_suffix',
+                          'treasurer_street_1',
+                          'treasurer_street_2',
+                          'treasurer_city',
+                          'treasurer_state',
+                          'treasurer_zip_code',
+                          'treasurer_title',
+                          'treasurer_telephone',
+                          'agent_last_name',
+                          'agent_first_name',
+                          'agent_middle_name',
+                          'agent_prefix',
+                          'agent_suffix',
+                          'agent_street_1',
+                          'agent_street_2',
+                          'agent_city',
+                          'agent_state',
+                          'agent_zip_code',
+                          'agent_title',
+                          'agent_telephone',
+                          'bank_name',
+                          'bank_street_1',
+                          'bank_street_2',
+                          'bank_city',
+                          'bank_state',
+                          'bank_zip_code',
+                          'bank2_name',
+                          'bank2_street_1',
+                          'bank2_street_2',
+                          'bank2_city',
+                          'bank2_state',
+                          'bank2_zip_code'],
+             '^8.3|8.2|8.1|8.0|7.0|6.4': ['form_type',
+                                          'filer_committee_id_number',
+                                          'change_of_committee_name',
+                                          'committee_name',
+                                          'change_of_address',
+                                          'street_1',
+                                          'street_2',
+                                          'city',
+                                          'state',
+                                          'zip_code',
+                                          'change_of_committee_email',
+                                          'committee_email',
+                                          'change_of_committee_url',
+                                          'committee_url',
+                                          'effective_date',
+                                          'signature_last_name',
+                                          'signature_first_name',
+                                          'signature_middle_name',
+                                          'signature_prefix',
+                                          'signature_suffix',
+                                          'date_signed',
+                                          'committee_type',
+                                          'candidate_id_number',
+                                          'candidate_last_name',
+                                          'candidate_first_name',
+                                          'candidate_middle_name',
+                                          'candidate_prefix',
+                                          'candidate_suffix',
+                                          'candidate_office',
+                                          'candidate_state',
+                                          'candidate_district',
+                                          'party_code',
+                                          'party_type',
+                                          'organization_type',
+                                          'lobbyist_registrant_pac',
+                                          'lobbyist_registrant_pac_2',
+                                          'leadership_pac',
+                                          'affiliated_committee_id_number',
+                                          'affiliated_committee_name',
+                                          'affiliated_candidate_id_number',
+                                          'affiliated_last_name',
+                                          'affiliated_first_name',
+                                          'affiliated_middle_name',
+                                          'affiliated_prefix',
+                                          'affiliated_suffix',
+                                          'affiliated_street_1',
+                                          'affiliated_street_2',
+                                          'affiliated_city',
+                                          'affiliated_state',
+                                          'affiliated_zip_code',
+                                          'affiliated_relationship_code',
+                                          'custodian_last_name',
+                                          'custodian_first_name',
+                                          'custodian_middle_name',
+                                          'custodian_prefix',
+                                          'custodian_suffix',
+                                          'custodian_street_1',
+                                          'custodian_street_2',
+                                          'custodian_city',
+                                          'custodian_state',
+                                          'custodian_zip_code',
+                                          'custodian_title',
+                                          'custodian_telephone',
+                                          'treasurer_last_name',
+                                          'treasurer_first_name',
+                                          'treasurer_middle_name',
+                                          'treasurer_prefix',
+                                          'treasurer_suffix',
+                                          'treasurer_street_1',
+                                          'treasurer_street_2',
+                                          'treasurer_city',
+                                          'treasurer_state',
+                                          'treasurer_zip_code',
+                                          'treasurer_title',
+                                          'treasurer_telephone',
+                                          'agent_last_name',
+                                          'agent_first_name',
+                                          'agent_middle_name',
+                                          'agent_prefix',
+                                          'agent_suffix',
+                                          'agent_street_1',
+                                          'agent_street_2',
+                                          'agent_city',
+                                          'agent_state',
+                                          'agent_zip_code',
+                                          'agent_title',
+                                          'agent_telephone',
+                                          'bank_name',
+                                          'bank_street_1',
+                                          'bank_street_2',
+                                          'bank_city',
+                                          'bank_state',
+                                          'bank_zip_code',
+                                          'bank2_name',
+                                          'bank2_street_1',
+                                          'bank2_street_2',
+                                          'bank2_city',
+                                          'bank2_state',
+                                          'bank2_zip_code'],
+             '^6.3|6.2|6.1': ['form_type',
+                              'filer_committee_id_number',
+                              'change_of_committee_name',
+                              'committee_name',
+                              'change_of_address',
+                              'street_1',
+                              'street_2',
+                              'city',
+                              'state',
+                              'zip_code',
+                              'change_of_committee_email',
+                              'committee_email',
+                              'change_of_committee_url',
+                              'committee_url',
+                              'effective_date',
+                              'signature_last_name',
+                              'signature_first_name',
+                              'signature_middle_name',
+                              'signature_prefix',
+                              'signature_suffix',
+                              'date_signed',
+                              'committee_type',
+                              'candidate_id_number',
+                              'candidate_last_name',
+                              'candidate_first_name',
+                              'candidate_middle_name',
+                              'candidate_prefix',
+                              'candidate_suffix',
+                              'candidate_office',
+                              'candidate_state',
+                              'candidate_district',
+                              'party_code',
+                              'party_type',
+                              'organization_type',
+                              'lobbyist_registrant_pac',
+                              'lobbyist_registrant_pac_2',
+                              'leadership_pac',
+                              'affiliated_committee_id_number',
+                              'affiliated_committee_name',
+                              'affiliated_candidate_id_number',
+                              'affiliated_last_name',
+                              'affiliated_first_name',
+                              'affiliated_middle_name',
+                              'affiliated_prefix',
+                              'affiliated_suffix',
+                              'affiliated_street_1',
+                              'affiliated_street_2',
+                              'affiliated_city',
+                              'affiliated_state',
+                              'affiliated_zip_code',
+                              'affiliated_relationship_code',
+                              'custodian_last_name',
+                              'custodian_first_name',
+                              'custodian_middle_name',
+                              'custodian_prefix',
+                              'custodian_suffix',
+                              'custodian_street_1',
+                              'custodian_street_2',
+                              'custodian_city',
+                              'custodian_state',
+                              'custodian_zip_code',
+                              'custodian_title',
+                              'custodian_telephone',
+                              'treasurer_last_name',
+                              'treasurer_first_name',
+                              'treasurer_middle_name',
+                              'treasurer_prefix',
+                              'treasurer_suffix',
+                              'treasurer_street_1',
+                              'treasurer_street_2',
+                              'treasurer_city',
+                              'treasurer_state',
+                              'treasurer_zip_code',
+                              'treasurer_title',
+                              'treasurer_telephone',
+                              'agent_last_name',
+                              'agent_first_name',
+                              'agent_middle_name',
+                              'agent_prefix',
+                              'agent_suffix',
+                              'agent_street_1',
+                              'agent_street_2',
+                              'agent_city',
+                              'agent_state',
+                              'agent_zip_code',
+                              'agent_title',
+                              'agent_telephone',
+                              'bank_name',
+                              'bank_street_1',
+                              'bank_street_2',
+                              'bank_city',
+                              'bank_state',
+                              'bank_zip_code',
+                              'bank2_name',
+                              'bank2_street_1',
+                              'bank2_street_2',
+                              'bank2_city',
+                              'bank2_state',
+                              'bank2_zip_code'],
+             '^5.3|5.2|5.1|5.0': ['form_type',
+                                  'filer_committee_id_number',
+                                  'committee_name',
+                                  'street_1',
+                                  'street_2',
+                                  'city',
+                                  'state',
+                                  'zip_code',
+                                  'effective_date',
+                                  'change_of_committee_name',
+                                  'change_of_address',
+                                  'committee_type',
+                                  'candidate_id_number',
+                                  'candidate_name',
+                                  'candidate_office',
+                                  'candidate_state',
+                                  'candidate_district',
+                                  'party_code',
+                                  'party_type',
+                                  'affiliated_committee_id_number',
+                                  'affiliated_committee_name',
+                                  'affiliated_street_1',
+                                  'affiliated_street_2',
+                                  'affiliated_city',
+                                  'affiliated_state',
+                                  'affiliated_zip_code',
+                                  'affiliated_relationship_code',
+                                  'organization_type',
+                                  'custodian_name',
+                                  'custodian_street_1',
+                                  'custodian_street_2',
+                                  'custodian_city',
+                                  'custodian_state',
+                                  'custodian_zip_code',
+                                  'custodian_title',
+                                  'custodian_telephone',
+                                  'treasurer_name',
+                                  'treasurer_street_1',
+                                  'treasurer_street_2',
+                                  'treasurer_city',
+                                  'treasurer_state',
+                                  'treasurer_zip_code',
+                                  'treasurer_title',
+                                  'treasurer_telephone',
+                                  'agent_name',
+                                  'agent_street_1',
+                                  'agent_street_2',
+                                  'agent_city',
+                                  'agent_state',
+                                  'agent_zip_code',
+                                  'agent_title',
+                                  'agent_telephone',
+                                  'bank_name',
+                                  'bank_street_1',
+                                  'bank_street_2',
+                                  'bank_city',
+                                  'bank_state',
+                                  'bank_zip_code',
+                                  'signature_name',
+                                  'date_signed',
+                                  'committee_email',
+                                  'committee_url',
+                                  'committee_fax_number'],
+             '^3.0': ['form_type',
+                      'filer_committee_id_number',
+                      'committee_name',
+                      'street_1',
+                      'street_2',
+                      'city',
+                      'state',
+                      'zip_code',
+                      'effective_date',
+                      'change_of_committee_name',
+                      'change_of_address',
+                      'committee_type',
+                      'candidate_id_number',
+                      'candidate_name',
+                      'candidate_office',
+                      'candidate_state',
+                      'candidate_district',
+                      'party_code',
+                      'party_type',
+                      'affiliated_committee_id_number',
+                      'affiliated_committee_name',
+                      'affiliated_street_1',
+                      'affiliated_street_2',
+                      'affiliated_city',
+                      'affiliated_state',
+                      'affiliated_zip_code',
+                      'affiliated_relationship_code',
+                      'organization_type',
+                      'custodian_name',
+                      'custodian_street_1',
+                      'custodian_street_2',
+                      'custodian_city',
+                      'custodian_state',
+                      'custodian_zip_code',
+                      'custodian_title',
+                      'custodian_telephone',
+                      'treasurer_name',
+                      'treasurer_street_1',
+                      'treasurer_street_2',
+                      'treasurer_city',
+                      'treasurer_state',
+                      'treasurer_zip_code',
+                      'treasurer_title',
+                      'treasurer_telephone',
+                      'agent_name',
+                      'agent_street_1',
+                      'agent_street_2',
+                      'agent_city',
+                      'agent_state',
+                      'agent_zip_code',
+                      'agent_title',
+                      'agent_telephone',
+                      'bank_name',
+                      'bank_street_1',
+                      'bank_street_2',
+                      'bank_city',
+                      'bank_state',
+                      'bank_zip_code',
+                      'signature_name',
+                      'date_signed',
+                      'committee_email',
+                      'committee_url'],
+             '^2': ['form_type',
+                    'filer_committee_id_number',
+                    'committee_name',
+                    'street_1',
+                    'street_2',
+                    'city',
+                    'state',
+                    'zip_code',
+                    'effective_date',
+                    'change_of_committee_name',
+                    'change_of_address',
+                    'committee_type',
+                    'candidate_id_number',
+                    'candidate_name',
+                    'candidate_office',
+                    'candidate_state',
+                    'candidate_district',
+                    'party_code',
+                    'party_type',
+                    'affiliated_committee_id_number',
+                    'affiliated_committee_name',
+                    'affiliated_street_1',
+                    'affiliated_street_2',
+                    'affiliated_city',
+                    'affiliated_state',
+                    'affiliated_zip_code',
+                    'affiliated_relationship_code',
+                    'organization_type',
+                    'custodian_name',
+                    'custodian_street_1',
+                    'custodian_street_2',
+                    'custodian_city',
+                    'custodian_state',
+                    'custodian_zip_code',
+                    'custodian_title',
+                    'custodian_telephone',
+                    'treasurer_name',
+                    'treasurer_street_1',
+                    'treasurer_street_2',
+                    'treasurer_city',
+                    'treasurer_state',
+                    'treasurer_zip_code',
+                    'treasurer_title',
+                    'treasurer_telephone',
+                    'agent_name',
+                    'agent_street_1',
+                    'agent_street_2',
+                    'agent_city',
+                    'agent_state',
+                    'agent_zip_code',
+                    'agent_title',
+                    'agent_telephone',
+                    'bank_name',
+                    'bank_street_1',
+                    'bank_street_2',
+                    'bank_city',
+                    'bank_state',
+                    'bank_zip_code',
+                    'signature_name',
+                    'date_signed']},
+ '^f13[an]': {'^P3.2|^P3.3|^P3.4': ['form_type',
+                                    'filer_committee_id_number',
+                                    'committee_name',
+                                    'change_of_address',
+                                    'street_1',
+                                    'street_2',
+                                    'city',
+                                    'state',
+                                    'zip_code',
+                                    'report_code',
+                                    'amendment_date',
+                                    'coverage_from_date',
+                                    'coverage_through_date',
+                                    'total_donations_accepted',
+                                    'total_donations_refunded',
+                                    'net_donations',
+                                    'designated_last_name',
+                                    'designated_first_name',
+                                    'designated_middle_name',
+                                    'designated_prefix',
+                                    'designated_suffix',
+                                    'date_signed',
+                                    'beginning_image_number',
+                                    'end_image_number',
+                                    'receipt_date'],
+              '^P3.0|^P3.1': ['form_type',
+                              'filer_committee_id_number',
+                              'committee_name',
+                              'change_of_address',
+                              'street_1',
+                              'street_2',
+                              'city',
+                              'state',
+                              'zip_code',
+                              'report_code',
+                              'amendment_date',
+                              'coverage_from_date',
+                              'coverage_through_date',
+                              'total_donations_accepted',
+                              'total_donations_refunded',
+                              'net_donations',
+                              'designated_last_name',
+                              'designated_first_name',
+                              'designated_middle_name',
+                              'designated_prefix',
+                              'designated_suffix',
+                              'date_signed',
+                              'beginning_image_number'],
+              '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                               'filer_committee_id_number',
+                                                               'committee_name',
+                                                               'change_of_address',
+                                                               'street_1',
+                                                               'street_2',
+                                                               'city',
+                                                               'state',
+                                                               'zip_code',
+                                                               'report_code',
+                                                               'amendment_date',
+                                                               'coverage_from_date',
+                                                               'coverage_through_date',
+                                                               'total_donations_accepted',
+                                                               'total_donations_refunded',
+                                                               'net_donations',
+                                                               'designated_last_name',
+                                                               'designated_first_name',
+                                                               'designated_middle_name',
+                                                               'designated_prefix',
+                                                               'designated_suffix',
+                                                               'date_signed'],
+              '^5.3|5.2': ['form_type',
+                           'filer_committee_id_number',
+                           'committee_name',
+                           'street_1',
+                           'street_2',
+                           'city',
+                           'state',
+                           'zip_code',
+                           'change_of_address',
+                           'report_code',
+                           'amendment_date',
+                           'coverage_from_date',
+                           'coverage_through_date',
+                           'total_donations_accepted',
+                           'total_donations_refunded',
+                           'net_donations',
+                           'designated_last_name',
+                           'designated_first_name',
+                           'designated_middle_name',
+                           'designated_prefix',
+                           'designated_suffix',
+                           'date_signed']},
+ '^f132': {'^P3.2|^P3.3|^P3.4': ['form_type',
+                                 'filer_committee_id_number',
+                                 'contributor_organization_name',
+                                 'contributor_last_name',
+                                 'contributor_first_name',
+                                 'contributor_middle_name',
+                                 'contributor_prefix',
+                                 'contributor_suffix',
+                                 'contributor_street_1',
+                                 'contributor_street_2',
+                                 'contributor_city',
+                                 'contributor_state',
+                                 'contributor_zip',
+                                 'donation_date',
+                                 'donation_amount',
+                                 'donation_aggregate_amount',
+                                 'memo_code',
+                                 'memo_text_description',
+                                 'image_number'],
+           '^P3.0|^P3.1': ['form_type',
+                           'filer_committee_id_number',
+                           'contributor_organization_name',
+                           'contributor_last_name',
+                           'contributor_first_name',
+                           'contributor_middle_name',
+                           'contributor_prefix',
+                           'contributor_suffix',
+                           'contributor_street_1',
+                           'contributor_street_2',
+                           'contributor_city',
+                           'contributor_state',
+                           'contributor_zip',
+                           'donation_date',
+                           'donation_amount',
+                           'donation_aggregate_amount',
+                           'memo_text_description',
+                           'image_number'],
+           '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                            'filer_committee_id_number',
+                                                            'transaction_id_number',
+                                                            'back_reference_tran_id_number',
+                                                            'back_reference_sched_name',
+                                                            'entity_type',
+                                                            'contributor_organization_name',
+                                                            'contributor_last_name',
+                                                            'contributor_first_name',
+                                                            'contributor_middle_name',
+                                                            'contributor_prefix',
+                                                            'contributor_suffix',
+                                                            'contributor_street_1',
+                                                            'contributor_street_2',
+                                                            'contributor_city',
+                                                            'contributor_state',
+                                                            'contributor_zip',
+                                                            'donation_date',
+                                                            'donation_amount',
+                                                            'donation_aggregate_amount',
+                                                            'memo_code',
+                                                            'memo_text_description'],
+           '^5.3|5.2': ['form_type',
+                        'filer_committee_id_number',
+                        'entity_type',
+                        'contributor_organization_name',
+                        'contributor_last_name',
+                        'contributor_first_name',
+                        'contributor_middle_name',
+                        'contributor_prefix',
+                        'contributor_suffix',
+                        'contributor_street_1',
+                        'contributor_street_2',
+                        'contributor_city',
+                        'contributor_state',
+                        'contributor_zip',
+                        'donation_date',
+                        'donation_amount',
+                        'donation_aggregate_amount',
+                        '',
+                        'transaction_id_number',
+                        'back_reference_tran_id_number',
+                        'back_reference_sched_name']},
+ '^f133': {'^P3.2|^P3.3|^P3.4': ['form_type',
+                                 'filer_committee_id_number',
+                                 'contributor_organization_name',
+                                 'contributor_last_name',
+                                 'contributor_first_name',
+                                 'contributor_middle_name',
+                                 'contributor_prefix',
+                                 'contributor_suffix',
+                                 'contributor_street_1',
+                                 'contributor_street_2',
+                                 'contributor_city',
+                                 'contributor_state',
+                                 'contributor_zip',
+                                 'refund_date',
+                                 'refund_amount',
+                                 'memo_code',
+                                 'memo_text_description',
+                                 'image_number'],
+           '^P3.0|^P3.1': ['form_type',
+                           'filer_committee_id_number',
+                           'contributor_organization_name',
+                           'contributor_last_name',
+                           'contributor_first_name',
+                           'contributor_middle_name',
+                           'contributor_prefix',
+                           'contributor_suffix',
+                           'contributor_street_1',
+                           'contributor_street_2',
+                           'contributor_city',
+                           'contributor_state',
+                           'contributor_zip',
+                           'refund_date',
+                           'refund_amount',
+                           'memo_text_description',
+                           'image_number'],
+           '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                            'filer_committee_id_number',
+                                                            'transaction_id_number',
+                                                            'back_reference_tran_id_number',
+                                                            'back_reference_sched_name',
+                                                            'entity_type',
+                                                            'contributor_organization_name',
+                                                            'contributor_last_name',
+                                                            'contributor_first_name',
+                                                            'contributor_middle_name',
+                                                            'contributor_prefix',
+                                                            'contributor_suffix',
+                                                            'contributor_street_1',
+                                                            'contributor_street_2',
+                                                            'contributor_city',
+                                                            'contributor_state',
+                                                            'contributor_zip',
+                                                            'refund_date',
+                                                            'refund_amount',
+                                                            'memo_code',
+                                                            'memo_text_description'],
+           '^5.3|5.2': ['form_type',
+                        'filer_committee_id_number',
+                        'entity_type',
+                        'contributor_organization_name',
+                        'contributor_last_name',
+                        'contributor_first_name',
+                        'contributor_middle_name',
+                        'contributor_prefix',
+                        'contributor_suffix',
+                        'contributor_street_1',
+                        'contributor_street_2',
+                        'contributor_city',
+                        'contributor_state',
+                        'contributor_zip',
+                        'refund_date',
+                        'refund_amount',
+                        '',
+                        'transaction_id_number',
+                        'back_reference_tran_id_number',
+                        'back_reference_sched_name']},
+ '^(f1m$|f1m[a|n])': {'^P3.2|^P3.3|^P3.4': ['form_type',
+                                            'filer_committee_id_number',
+                                            'committee_name',
+                                            'street_1',
+                                            'street_2',
+                                            'city',
+                                            'state',
+                                            'zip_code',
+                                            'committee_type',
+                                            'affiliated_date_f1_filed',
+                                            'affiliated_committee_name',
+                                            'affiliated_committee_id_number',
+                                            'first_candidate_last_name',
+                                            'first_candidate_first_name',
+                                            'first_candidate_middle_name',
+                                            'first_candidate_prefix',
+                                            'first_candidate_suffix',
+                                            'first_candidate_office',
+                                            'first_candidate_state',
+                                            'first_candidate_district',
+                                            'first_candidate_contribution_date',
+                                            'second_candidate_last_name',
+                                            'second_candidate_first_name',
+                                            'second_candidate_middle_name',
+                                            'second_candidate_prefix',
+                                            'second_candidate_suffix',
+                                            'second_candidate_office',
+                                            'second_candidate_state',
+                                            'second_candidate_district',
+                                            'second_candidate_contribution_date',
+                                            'third_candidate_last_name',
+                                            'third_candidate_first_name',
+                                            'third_candidate_middle_name',
+                                            'third_candidate_prefix',
+                                            'third_candidate_suffix',
+                                            'third_candidate_office',
+                                            'third_candidate_state',
+                                            'third_candidate_district',
+                                            'third_candidate_contribution_date',
+                                            'fourth_candidate_last_name',
+                                            'fourth_candidate_first_name',
+                                            'fourth_candidate_middle_name',
+                                            'fourth_candidate_prefix',
+                                            'fourth_candidate_suffix',
+                                            'fourth_candidate_office',
+                                            'fourth_candidate_state',
+                                            'fourth_candidate_district',
+                                            'fourth_candidate_contribution_date',
+                                            'fifth_candidate_last_name',
+                                            'fifth_candidate_first_name',
+                                            'fifth_candidate_middle_name',
+                                            'fifth_candidate_prefix',
+                                            'fifth_candidate_suffix',
+                                            'fifth_candidate_office',
+                                            'fifth_candidate_state',
+                                            'fifth_candidate_district',
+                                            'fifth_candidate_contribution_date',
+                                            'fifty_first_contributor_date',
+                                            'original_registration_date',
+                                            'requirements_met_date',
+                                            'treasurer_last_name',
+                                            'treasurer_first_name',
+                                            'treasurer_middle_name',
+                                            'treasurer_prefix',
+                                            'treasurer_suffix',
+                                            'date_signed',
+                                            'beginning_image_number',
+                                            'end_image_number',
+                                            'receipt_date'],
+                      '^P1|^P2|^P3.0|^P3.1': ['form_type',
+                                              'filer_committee_id_number',
+                                              'committee_name',
+                                              'street_1',
+                                              'street_2',
+                                              'city',
+                                              'state',
+                                              'zip_code',
+                                              'committee_type',
+                                              'affiliated_date_f1_filed',
+                                              'affiliated_committee_name',
+                                              'affiliated_committee_id_number',
+                                              'first_candidate_last_name',
+                                              'first_candidate_first_name',
+                                              'first_candidate_middle_name',
+                                              'first_candidate_prefix',
+                                              'first_candidate_suffix',
+                                              'first_candidate_office',
+                                              'first_candidate_state',
+                                              'first_candidate_district',
+                                              'first_candidate_contribution_date',
+                                              'second_candidate_last_name',
+                                              'second_candidate_first_name',
+                                              'second_candidate_middle_name',
+                                              'second_candidate_prefix',
+                                              'second_candidate_suffix',
+                                              'second_candidate_office',
+                                              'second_candidate_state',
+                                              'second_candidate_district',
+                                              'second_candidate_contribution_date',
+                                              'third_candidate_last_name',
+                                              'third_candidate_first_name',
+                                              'third_candidate_middle_name',
+                                              'third_candidate_prefix',
+                                              'third_candidate_suffix',
+                                              'third_candidate_office',
+                                              'third_candidate_state',
+                                              'third_candidate_district',
+                                              'third_candidate_contribution_date',
+                                              'fourth_candidate_last_name',
+                                              'fourth_candidate_first_name',
+                                              'fourth_candidate_middle_name',
+                                              'fourth_candidate_prefix',
+                                              'fourth_candidate_suffix',
+                                              'fourth_candidate_office',
+                                              'fourth_candidate_state',
+                                              'fourth_candidate_district',
+                                              'fourth_candidate_contribution_date',
+                                              'fifth_candidate_last_name',
+                                              'fifth_candidate_first_name',
+                                              'fifth_candidate_middle_name',
+                                              'fifth_candidate_prefix',
+                                              'fifth_candidate_suffix',
+                                              'fifth_candidate_office',
+                                              'fifth_candidate_state',
+                                              'fifth_candidate_district',
+                                              'fifth_candidate_contribution_date',
+                                              'fifty_first_contributor_date',
+                                              'original_registration_date',
+                                              'requirements_met_date',
+                                              'treasurer_last_name',
+                                              'treasurer_first_name',
+                                              'treasurer_middle_name',
+                                              'treasurer_prefix',
+                                              'treasurer_suffix',
+                                              'date_signed',
+                                              'beginning_image_number'],
+                      '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                                       'filer_committee_id_number',
+                                                                       'committee_name',
+                                                                       'street_1',
+                                                                       'street_2',
+                                                                       'city',
+                                                                       'state',
+                                                                       'zip_code',
+                                                                       'committee_type',
+                                                                       'affiliated_date_f1_filed',
+                                                                       'affiliated_committee_id_number',
+                                                                       'affiliated_committee_name',
+                                                                       'first_candidate_id_number',
+                                                                       'first_candidate_last_name',
+                                                                       'first_candidate_first_name',
+                                                                       'first_candidate_middle_name',
+                                                                       'first_candidate_prefix',
+                                                                       'first_candidate_suffix',
+                                                                       'first_candidate_office',
+                                                                       'first_candidate_state',
+                                                                       'first_candidate_district',
+                                                                       'first_candidate_contribution_date',
+                                                                       'second_candidate_id_number',
+                                                                       'second_candidate_last_name',
+                                                                       'second_candidate_first_name',
+                                                                       'second_candidate_middle_name',
+                                                                       'second_candidate_prefix',
+                                                                       'second_candidate_suffix',
+                                                                       'second_candidate_office',
+                                                                       'second_candidate_state',
+                                                                       'second_candidate_district',
+                                                                       'second_candidate_contribution_date',
+                                                                       'third_candidate_id_number',
+                                                                       'third_candidate_last_name',
+                                                                       'third_candidate_first_name',
+                                                                       'third_candidate_middle_name',
+                                                                       'third_candidate_prefix',
+                                                                       'third_candidate_suffix',
+                                                                       'third_candidate_office',
+                                                                       'third_candidate_state',
+                                                                       'third_candidate_district',
+                                                                       'third_candidate_contribution_date',
+                                                                       'fourth_candidate_id_number',
+                                                                       'fourth_candidate_last_name',
+                                                                       'fourth_candidate_first_name',
+                                                                       'fourth_candidate_middle_name',
+                                                                       'fourth_candidate_prefix',
+                                                                       'fourth_candidate_suffix',
+                                                                       'fourth_candidate_office',
+                                                                       'fourth_candidate_state',
+                                                                       'fourth_candidate_district',
+                                                                       'fourth_candidate_contribution_date',
+                                                                       'fifth_candidate_id_number',
+                                                                       'fifth_candidate_last_name',
+                                                                       'fifth_candidate_first_name',
+                                                                       'fifth_candidate_middle_name',
+                                                                       'fifth_candidate_prefix',
+                                                                       'fifth_candidate_suffix',
+                                                                       'fifth_candidate_office',
+                                                                       'fifth_candidate_state',
+                                                                       'fifth_candidate_district',
+                                                                       'fifth_candidate_contribution_date',
+                                                                       'fifty_first_contributor_date',
+                                                                       'original_registration_date',
+                                                                       'requirements_met_date',
+                                                                       'treasurer_last_name',
+                                                                       'treasurer_first_name',
+                                                                       'treasurer_middle_name',
+                                                                       'treasurer_prefix',
+                                                                       'treasurer_suffix',
+                                                                       'date_signed'],
+                      '^5.3|5.2|5.1|5.0|^3.0': ['form_type',
+                                                'filer_committee_id_number',
+                                                'committee_name',
+                                                'street_1',
+                                                'street_2',
+                                                'city',
+                                                'state',
+                                                'zip_code',
+                                                'committee_type',
+                                                'affiliated_date_f1_filed',
+                                                'affiliated_committee_id_number',
+                                                'affiliated_committee_name',
+                                                'first_candidate_id_number',
+                                                'first_candidate_name',
+                                                'first_candidate_office',
+                                                'first_candidate_state',
+                                                'first_candidate_district',
+                                                'first_candidate_contribution_date',
+                                                'second_candidate_id_number',
+                                                'second_candidate_name',
+                                                'second_candidate_office',
+                                                'second_candidate_state',
+                                                'second_candidate_district',
+                                                'second_candidate_contribution_date',
+                                                'third_candidate_id_number',
+                                                'third_candidate_name',
+                                                'third_candidate_office',
+                                                'third_candidate_state',
+                                                'third_candidate_district',
+                                                'third_candidate_contribution_date',
+                                                'fourth_candidate_id_number',
+                                                'fourth_candidate_name',
+                                                'fourth_candidate_office',
+                                                'fourth_candidate_state',
+                                                'fourth_candidate_district',
+                                                'fourth_candidate_contribution_date',
+                                                'fifth_candidate_id_number',
+                                                'fifth_candidate_name',
+                                                'fifth_candidate_office',
+                                                'fifth_candidate_state',
+                                                'fifth_candidate_district',
+                                                'fifth_candidate_contribution_date',
+                                                'fifty_first_contributor_date',
+                                                'original_registration_date',
+                                                'requirements_met_date',
+                                                'treasurer_name',
+                                                'date_signed']},
+ '^f1s': {'^P2.6|^P3': ['form_type',
+                        'filer_committee_id_number',
+                        'joint_fund_participant_committee_name',
+                        'joint_fund_participant_committee_id_number',
+                        'affiliated_committee_name',
+                        'affiliated_last_name',
+                        'affiliated_first_name',
+                        'affiliated_middle_name',
+                        'affiliated_prefix',
+                        'affiliated_suffix',
+                        'affiliated_street_1',
+                        'affiliated_street_2',
+                        'affiliated_city',
+                        'affiliated_state',
+                        'affiliated_zip_code',
+                        'affiliated_relationship_code',
+                        'agent_last_name',
+                        'agent_first_name',
+                        'agent_middle_name',
+                        'agent_prefix',
+                        'agent_suffix',
+                        'agent_street_1',
+                        'agent_street_2',
+                        'agent_city',
+                        'agent_state',
+                        'agent_zip_code',
+                        'agent_title',
+                        'agent_telephone',
+                        'bank_name',
+                        'bank_street_1',
+                        'bank_street_2',
+                        'bank_city',
+                        'bank_state',
+                        'bank_zip_code',
+                        'beginning_image_number'],
+          '^P2.4': ['form_type',
+                    'filer_committee_id_number',
+                    'joint_fund_participant_committee_name',
+                    'joint_fund_participant_committee_id_number',
+                    'affiliated_committee_name',
+                    'affiliated_street_1',
+                    'affiliated_street_2',
+                    'affiliated_city',
+                    'affiliated_state',
+                    'affiliated_zip_code',
+                    'affiliated_relationship_code',
+                    'agent_last_name',
+                    'agent_first_name',
+                    'agent_middle_name',
+                    'agent_prefix',
+                    'agent_suffix',
+                    'agent_street_1',
+                    'agent_street_2',
+                    'agent_city',
+                    'agent_state',
+                    'agent_zip_code',
+                    'agent_title',
+                    'agent_telephone',
+                    'bank_name',
+                    'bank_street_1',
+                    'bank_street_2',
+                    'bank_city',
+                    'bank_state',
+                    'bank_zip_code',
+                    'beginning_image_number'],
+          '^P1|^P2.2|^P2.3': ['form_type',
+                              'filer_committee_id_number',
+                              'affiliated_committee_name',
+                              'affiliated_street_1',
+                              'affiliated_street_2',
+                              'affiliated_city',
+                              'affiliated_state',
+                              'affiliated_zip_code',
+                              'affiliated_relationship_code',
+                              'affiliated_organization_type',
+                              'agent_last_name',
+                              'agent_first_name',
+                              'agent_middle_name',
+                              'agent_prefix',
+                              'agent_suffix',
+                              'agent_street_1',
+                              'agent_street_2',
+                              'agent_city',
+                              'agent_state',
+                              'agent_zip_code',
+                              'agent_title',
+                              'agent_telephone',
+                              'bank_name',
+                              'bank_street_1',
+                              'bank_street_2',
+                              'bank_city',
+                              'bank_state',
+                              'bank_zip_code',
+                              'beginning_image_number'],
+          '^8.5': ['form_type',
+                   'filer_committee_id_number',
+                   'joint_fund_participant_committee_name',
+                   'joint_fund_participant_committee_id_number',
+                   'joint_fund_participant_committee_type',
+                   'affiliated_committee_id_number',
+                   'affiliated_committee_name',
+                   'affiliated_candidate_id_number',
+                   'affiliated_last_name',
+                   'affiliated_first_name',
+                   'affiliated_middle_name',
+                   'affiliated_prefix',
+                   'affiliated_suffix',
+                   'affiliated_street_1',
+                   'affiliated_street_2',
+                   'affiliated_city',
+                   'affiliated_state',
+                   'affiliated_zip_code',
+                   'affiliated_relationship_code',
+                   'agent_last_name',
+                   'agent_first_name',
+                   'agent_middle_name',
+                   'agent_prefix',
+                   'agent_suffix',
+                   'agent_street_1',
+                   'agent_street_2',
+                   'agent_city',
+                   'agent_state',
+                   'agent_zip_code',
+                   'agent_title',
+                   'agent_telephone',
+                   'bank_name',
+                   'bank_street_1',
+                   'bank_street_2',
+                   'bank_city',
+                   'bank_state',
+                   'bank_zip_code'],
+          '^8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2': ['form_type',
+                                                   'filer_committee_id_number',
+                                                   'joint_fund_participant_committee_name',
+                                                   'joint_fund_participant_committee_id_number',
+                                                   'affiliated_committee_id_number',
+                                                   'affiliated_committee_name',
+                                                   'affiliated_candidate_id_number',
+                                                   'affiliated_last_name',
+                                                   'affiliated_first_name',
+                                                   'affiliated_middle_name',
+                                                   'affiliated_prefix',
+                                                   'affiliated_suffix',
+                                                   'affiliated_street_1',
+                                                   'affiliated_street_2',
+                                                   'affiliated_city',
+                                                   'affiliated_state',
+                                                   'affiliated_zip_code',
+                                                   'affiliated_relationship_code',
+                                                   'agent_last_name',
+                                                   'agent_first_name',
+                                                   'agent_middle_name',
+                                                   'agent_prefix',
+                                                   'agent_suffix',
+                                                   'agent_street_1',
+                                                   'agent_street_2',
+                                                   'agent_city',
+                                                   'agent_state',
+                                                   'agent_zip_code',
+                                                   'agent_title',
+                                                   'agent_telephone',
+                                                   'bank_name',
+                                                   'bank_street_1',
+                                                   'bank_street_2',
+                                                   'bank_city',
+                                                   'bank_state',
+                                                   'bank_zip_code'],
+          '^6.1': ['form_type',
+                   'filer_committee_id_number',
+                   'affiliated_committee_id_number',
+                   'affiliated_committee_name',
+                   'affiliated_street_1',
+                   'affiliated_street_2',
+                   'affiliated_city',
+                   'affiliated_state',
+                   'affiliated_zip_code',
+                   'affiliated_relationship_code',
+                   '',
+                   'agent_last_name',
+                   'agent_first_name',
+                   'agent_middle_name',
+                   'agent_prefix',
+                   'agent_suffix',
+                   'agent_street_1',
+                   'agent_street_2',
+                   'agent_city',
+                   'agent_state',
+                   'agent_zip_code',
+                   'agent_title',
+                   'agent_telephone',
+                   'bank_name',
+                   'bank_street_1',
+                   'bank_street_2',
+                   'bank_city',
+                   'bank_state',
+                   'bank_zip_code'],
+          '^5.3|5.2|5.1|5.0': [],
+          '^3.0': []},
+ '(^f2$)|(^f2[^4])': {'^P3.4': ['form_type',
+                                'candidate_id_number',
+                                'candidate_last_name',
+                                'candidate_first_name',
+                                'candidate_middle_name',
+                                'candidate_prefix',
+                                'candidate_suffix',
+                                'candidate_street_1',
+                                'candidate_street_2',
+                                'change_of_address',
+                                'candidate_city',
+                                'candidate_state',
+                                'candidate_zip_code',
+                                'candidate_party_code',
+                                'candidate_office',
+                                'candidate_state',
+                                'candidate_district',
+                                'election_year',
+                                'committee_name',
+                                'committee_street_1',
+                                'committee_street_2',
+                                'committee_city',
+                                'committee_state',
+                                'committee_zip_code',
+                                'authorized_committee_name',
+                                'authorized_committee_street_1',
+                                'authorized_committee_street_2',
+                                'authorized_committee_city',
+                                'authorized_committee_state',
+                                'authorized_committee_zip_code',
+                                'candidate_signature_last_name',
+                                'candidate_signature_first_name',
+                                'candidate_signature_middle_name',
+                                'candidate_signature_prefix',
+                                'candidate_signature_suffix',
+                                'date_signed',
+                                'beginning_image_number',
+                                'end_image_number',
+                                'receipt_date',
+                                'vice_president_last_name',
+                                'vice_president_first_name',
+                                'vice_president_middle_name',
+                                'vice_president_prefix',
+                                'vice_president_suffix'],
+                      '^P3.3|^P3.2': ['form_type',
+                                      'candidate_id_number',
+                                      'candidate_last_name',
+                                      'candidate_first_name',
+                                      'candidate_middle_name',
+                                      'candidate_prefix',
+                                      'candidate_suffix',
+                                      'candidate_street_1',
+                                      'candidate_street_2',
+                                      'change_of_address',
+                                      'candidate_city',
+                                      'candidate_state',
+                                      'candidate_zip_code',
+                                      'candidate_party_code',
+                                      'candidate_office',
+                                      'candidate_state',
+                                      'candidate_district',
+                                      'election_year',
+                                      'committee_name',
+                                      'committee_street_1',
+                                      'committee_street_2',
+                                      'committee_city',
+                                      'committee_state',
+                                      'committee_zip_code',
+                                      'authorized_committee_name',
+                                      'authorized_committee_street_1',
+                                      'authorized_committee_street_2',
+                                      'authorized_committee_city',
+                                      'authorized_committee_state',
+                                      'authorized_committee_zip_code',
+                                      'candidate_signature_last_name',
+                                      'candidate_signature_first_name',
+                                      'candidate_signature_middle_name',
+                                      'candidate_signature_prefix',
+                                      'candidate_signature_suffix',
+                                      'date_signed',
+                                      'beginning_image_number',
+                                      'end_image_number',
+                                      'receipt_date'],
+                      '^P(3.1|3.0|2.6)': ['form_type',
+                                          'candidate_id_number',
+                                          'candidate_last_name',
+                                          'candidate_first_name',
+                                          'candidate_middle_name',
+                                          'candidate_prefix',
+                                          'candidate_suffix',
+                                          'candidate_street_1',
+                                          'candidate_street_2',
+                                          'change_of_address',
+                                          'candidate_city',
+                                          'candidate_state',
+                                          'candidate_zip_code',
+                                          'candidate_party_code',
+                                          'candidate_office',
+                                          'candidate_state',
+                                          'candidate_district',
+                                          'election_year',
+                                          'committee_name',
+                                          'committee_street_1',
+                                          'committee_street_2',
+                                          'committee_city',
+                                          'committee_state',
+                                          'committee_zip_code',
+                                          'authorized_committee_name',
+                                          'authorized_committee_street_1',
+                                          'authorized_committee_street_2',
+                                          'authorized_committee_city',
+                                          'authorized_committee_state',
+                                          'authorized_committee_zip_code',
+                                          'candidate_signature_last_name',
+                                          'candidate_signature_first_name',
+                                          'candidate_signature_middle_name',
+                                          'candidate_signature_prefix',
+                                          'candidate_signature_suffix',
+                                          'date_signed',
+                                          'beginning_image_number'],
+                      '^P(2.4|2.3|2.2|1)': ['form_type',
+                                            'candidate_id_number',
+                                            'candidate_last_name',
+                                            'candidate_first_name',
+                                            'candidate_middle_name',
+                                            'candidate_prefix',
+                                            'candidate_suffix',
+                                            'candidate_street_1',
+                                            'candidate_street_2',
+                                            'change_of_address',
+                                            'candidate_city',
+                                            'candidate_state',
+                                            'candidate_zip_code',
+                                            'candidate_party_code',
+                                            'candidate_office',
+                                            'candidate_state',
+                                            'candidate_district',
+                                            'election_year',
+                                            'committee_name',
+                                            'committee_street_1',
+                                            'committee_street_2',
+                                            'committee_city',
+                                            'committee_state',
+                                            'committee_zip_code',
+                                            'authorized_committee_name',
+                                            'authorized_committee_street_1',
+                                            'authorized_committee_street_2',
+                                            'authorized_committee_city',
+                                            'authorized_committee_state',
+                                            'authorized_committee_zip_code',
+                                            'primary_personal_funds_declared',
+                                            'general_personal_funds_declared',
+                                            'candidate_signature_last_name',
+                                            'candidate_signature_first_name',
+                                            'candidate_signature_middle_name',
+                                            'candidate_signature_prefix',
+                                            'candidate_signature_suffix',
+                                            'date_signed',
+                                            'beginning_image_number'],
+                      '^8.5|8.4|8.3|8.2': ['form_type',
+                                           'candidate_id_number',
+                                           'candidate_last_name',
+                                           'candidate_first_name',
+                                           'candidate_middle_name',
+                                           'candidate_prefix',
+                                           'candidate_suffix',
+                                           'vice_president_last_name',
+                                           'vice_president_first_name',
+                                           'vice_president_middle_name',
+                                           'vice_president_prefix',
+                                           'vice_president_suffix',
+                                           'change_of_address',
+                                           'candidate_street_1',
+                                           'candidate_street_2',
+                                           'candidate_city',
+                                           'candidate_state',
+                                           'candidate_zip_code',
+                                           'candidate_party_code',
+                                           'candidate_office',
+                                           'candidate_state',
+                                           'candidate_district',
+                                           'election_year',
+                                           'committee_id_number',
+                                           'committee_name',
+                                           'committee_street_1',
+                                           'committee_street_2',
+                                           'committee_city',
+                                           'committee_state',
+                                           'committee_zip_code',
+                                           'authorized_committee_id_number',
+                                           'authorized_committee_name',
+                                           'authorized_committee_street_1',
+                                           'authorized_committee_street_2',
+                                           'authorized_committee_city',
+                                           'authorized_committee_state',
+                                           'authorized_committee_zip_code',
+                                           'candidate_signature_last_name',
+                                           'candidate_signature_first_name',
+                                           'candidate_signature_middle_name',
+                                           'candidate_signature_prefix',
+                                           'candidate_signature_suffix',
+                                           'date_signed'],
+                      '^8.1|8.0|7.0|6.4': ['form_type',
+                                           'candidate_id_number',
+                                           'candidate_last_name',
+                                           'candidate_first_name',
+                                           'candidate_middle_name',
+                                           'candidate_prefix',
+                                           'candidate_suffix',
+                                           'change_of_address',
+                                           'candidate_street_1',
+                                           'candidate_street_2',
+                                           'candidate_city',
+                                           'candidate_state',
+                                           'candidate_zip_code',
+                                           'candidate_party_code',
+                                           'candidate_office',
+                                           'candidate_state',
+                                           'candidate_district',
+                                           'election_year',
+                                           'committee_id_number',
+                                           'committee_name',
+                                           'committee_street_1',
+                                           'committee_street_2',
+                                           'committee_city',
+                                           'committee_state',
+                                           'committee_zip_code',
+                                           'authorized_committee_id_number',
+                                           'authorized_committee_name',
+                                           'authorized_committee_street_1',
+                                           'authorized_committee_street_2',
+                                           'authorized_committee_city',
+                                           'authorized_committee_state',
+                                           'authorized_committee_zip_code',
+                                           'candidate_signature_last_name',
+                                           'candidate_signature_first_name',
+                                           'candidate_signature_middle_name',
+                                           'candidate_signature_prefix',
+                                           'candidate_signature_suffix',
+                                           'date_signed'],
+                      '^6.3|6.2|6.1': ['form_type',
+                                       'candidate_id_number',
+                                       'candidate_last_name',
+                                       'candidate_first_name',
+                                       'candidate_middle_name',
+                                       'candidate_prefix',
+                                       'candidate_suffix',
+                                       'change_of_address',
+                                       'candidate_street_1',
+                                       'candidate_street_2',
+                                       'candidate_city',
+                                       'candidate_state',
+                                       'candidate_zip_code',
+                                       'candidate_party_code',
+                                       'candidate_office',
+                                       'candidate_state',
+                                       'candidate_district',
+                                       'election_year',
+                                       'committee_id_number',
+                                       'committee_name',
+                                       'committee_street_1',
+                                       'committee_street_2',
+                                       'committee_city',
+                                       'committee_state',
+                                       'committee_zip_code',
+                                       'authorized_committee_id_number',
+                                       'authorized_committee_name',
+                                       'authorized_committee_street_1',
+                                       'authorized_committee_street_2',
+                                       'authorized_committee_city',
+                                       'authorized_committee_state',
+                                       'authorized_committee_zip_code',
+                                       'primary_personal_funds_declared',
+                                       'general_personal_funds_declared',
+                                       'candidate_signature_last_name',
+                                       'candidate_signature_first_name',
+                                       'candidate_signature_middle_name',
+                                       'candidate_signature_prefix',
+                                       'candidate_signature_suffix',
+                                       'date_signed'],
+                      '^5.3|5.2|5.1|5.0': ['form_type',
+                                           'candidate_id_number',
+                                           'candidate_name',
+                                           'candidate_street_1',
+                                           'candidate_street_2',
+                                           'candidate_city',
+                                           'candidate_state',
+                                           'candidate_zip_code',
+                                           'candidate_party_code',
+                                           'candidate_office',
+                                           'candidate_state',
+                                           'candidate_district',
+                                           'election_year',
+                                           'committee_id_number',
+                                           'committee_name',
+                                           'committee_street_1',
+                                           'committee_street_2',
+                                           'committee_city',
+                                           'committee_state',
+                                           'committee_zip_code',
+                                           'authorized_committee_id_number',
+                                           'authorized_committee_name',
+                                           'authorized_committee_street_1',
+                                           'authorized_committee_street_2',
+                                           'authorized_committee_city',
+                                           'authorized_committee_state',
+                                           'authorized_committee_zip_code',
+                                           'candidate_signature_name',
+                                           'date_signed',
+                                           'primary_personal_funds_declared',
+                                           'general_personal_funds_declared',
+                                           'candidate_last_name',
+                                           'candidate_first_name',
+                                           'candidate_middle_name',
+                                           'candidate_prefix',
+                                           'candidate_suffix'],
+                      '^3.0': ['form_type',
+                               'candidate_id_number',
+                               'candidate_name',
+                               'candidate_street_1',
+                               'candidate_street_2',
+                               'candidate_city',
+                               'candidate_state',
+                               'candidate_zip_code',
+                               'candidate_party_code',
+                               'candidate_office',
+                               'candidate_state',
+                               'candidate_district',
+                               'election_year',
+                               'committee_id_number',
+                               'committee_name',
+                               'committee_street_1',
+                               'committee_street_2',
+                               'committee_city',
+                               'committee_state',
+                               'committee_zip_code',
+                               'authorized_committee_id_number',
+                               'authorized_committee_name',
+                               'authorized_committee_street_1',
+                               'authorized_committee_street_2',
+                               'authorized_committee_city',
+                               'authorized_committee_state',
+                               'authorized_committee_zip_code',
+                               'candidate_signature_name',
+                               'date_signed']},
+ '(^f24$)|(^f24[an])': {'^(P3.4|P3.3|P3.2)': ['form_type',
+                                              'filer_committee_id_number',
+                                              'committee_name',
+                                              'report_type',
+                                              'original_amendment_date',
+                                              'treasurer_last_name',
+                                              'treasurer_first_name',
+                                              'treasurer_middle_name',
+                                              'treasurer_prefix',
+                                              'treasurer_suffix',
+                                              'date_signed',
+                                              'beginning_image_number',
+                                              'end_image_number',
+                                              'receipt_date'],
+                        '^(P3.1|P3.0)': ['form_type',
+                                         'filer_committee_id_number',
+                                         'committee_name',
+                                         'report_type',
+                                         'original_amendment_date',
+                                         'treasurer_last_name',
+                                         'treasurer_first_name',
+                                         'treasurer_middle_name',
+                                         'treasurer_prefix',
+                                         'treasurer_suffix',
+                                         'date_signed',
+                                         'beginning_image_number'],
+                        '^(P2|P1)': ['form_type',
+                                     'filer_committee_id_number',
+                                     'committee_name',
+                                     'report_type',
+                                     'treasurer_last_name',
+                                     'treasurer_first_name',
+                                     'treasurer_middle_name',
+                                     'treasurer_prefix',
+                                     'treasurer_suffix',
+                                     'date_signed',
+                                     'beginning_image_number'],
+                        '^8.5|8.4|8.3|8.2|8.1|8.0': ['form_type',
+                                                     'filer_committee_id_number',
+                                                     'report_type',
+                                                     'original_amendment_date',
+                                                     'committee_name',
+                                                     'street_1',
+                                                     'street_2',
+                                                     'city',
+                                                     'state',
+                                                     'zip_code',
+                                                     'treasurer_last_name',
+                                                     'treasurer_first_name',
+                                                     'treasurer_middle_name',
+                                                     'treasurer_prefix',
+                                                     'treasurer_suffix',
+                                                     'date_signed'],
+                        '^7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                 'filer_committee_id_number',
+                                                 'report_type',
+                                                 'committee_name',
+                                                 'street_1',
+                                                 'street_2',
+                                                 'city',
+                                                 'state',
+                                                 'zip_code',
+                                                 'treasurer_last_name',
+                                                 'treasurer_first_name',
+                                                 'treasurer_middle_name',
+                                                 'treasurer_prefix',
+                                                 'treasurer_suffix',
+                                                 'date_signed'],
+                        '^5.0|5.1|5.2|5.3': ['form_type',
+                                             'filer_committee_id_number',
+                                             'committee_name',
+                                             'street_1',
+                                             'street_2',
+                                             'city',
+                                             'state',
+                                             'zip_code',
+                                             '',
+                                             'date_signed',
+                                             'report_type'],
+                        '^3': ['form_type',
+                               'filer_committee_id_number',
+                               'committee_name',
+                               'street_1',
+                               'street_2',
+                               'city',
+                               'state',
+                               'zip_code',
+                               '',
+                               'date_signed']},
+ '^f3[a|n|t]': {'^P3.2|^P3.3|^P3.4': ['form_type',
+                                      'filer_committee_id_number',
+                                      'committee_name',
+                                      'change_of_address',
+                                      'street_1',
+                                      'street_2',
+                                      'city',
+                                      'state',
+                                      'zip_code',
+                                      'election_state',
+                                      'election_district',
+                                      'report_code',
+                                      'election_date',
+                                      'state_of_election',
+                                      'coverage_from_date',
+                                      'coverage_through_date',
+                                      'treasurer_last_name',
+                                      'treasurer_first_name',
+                                      'treasurer_middle_name',
+                                      'treasurer_prefix',
+                                      'treasurer_suffix',
+                                      'date_signed',
+                                      'col_a_total_contributions_no_loans',
+                                      'col_a_total_contributions_refunds',
+                                      'col_a_net_contributions',
+                                      'col_a_total_operating_expenditures',
+                                      'col_a_total_offset_to_operating_expenditures',
+                                      'col_a_net_operating_expenditures',
+                                      'col_a_cash_on_hand_close_of_period',
+                                      'col_a_debts_to',
+                                      'col_a_debts_by',
+                                      'col_a_individual_contributions_itemized',
+                                      'col_a_individual_contributions_unitemized',
+                                      'col_a_total_individual_contributions',
+                                      'col_a_political_party_contributions',
+                                      'col_a_pac_contributions',
+                                      'col_a_candidate_contributions',
+                                      'col_a_total_contributions',
+                                      'col_a_transfers_from_authorized',
+                                      'col_a_candidate_loans',
+                                      'col_a_other_loans',
+                                      'col_a_total_loans',
+                                      'col_a_offset_to_operating_expenditures',
+                                      'col_a_other_receipts',
+                                      'col_a_total_receipts',
+                                      'col_a_operating_expenditures',
+                                      'col_a_transfers_to_authorized',
+                                      'col_a_candidate_loan_repayments',
+                                      'col_a_other_loan_repayments',
+                                      'col_a_total_loan_repayments',
+                                      'col_a_refunds_to_individuals',
+                                      'col_a_refunds_to_party_committees',
+                                      'col_a_refunds_to_other_committees',
+                                      'col_a_total_refunds',
+                                      'col_a_other_disbursements',
+                                      'col_a_total_disbursements',
+                                      'col_b_total_contributions_no_loans',
+                                      'col_b_total_contributions_refunds',
+                                      'col_b_net_contributions',
+                                      'col_b_total_operating_expenditures',
+                                      'col_b_total_offset_to_operating_expenditures',
+                                      'col_b_net_operating_expenditures',
+                                      'col_b_individual_contributions_itemized',
+                                      'col_b_individual_contributions_unitemized',
+                                      'col_b_total_individual_contributions',
+                                      'col_b_political_party_contributions',
+                                      'col_b_pac_contributions',
+                                      'col_b_candidate_contributions',
+                                      'col_b_total_contributions',
+                                      'col_b_transfers_from_authorized',
+                                      'col_b_candidate_loans',
+                                      'col_b_other_loans',
+                                      'col_b_total_loans',
+                                      'col_b_offset_to_operating_expenditures',
+                                      'col_b_other_receipts',
+                                      'col_b_total_receipts',
+                                      'col_b_operating_expenditures',
+                                      'col_b_transfers_to_authorized',
+                                      'col_b_candidate_loan_repayments',
+                                      'col_b_other_loan_repayments',
+                                      'col_b_total_loan_repayments',
+                                      'col_b_refunds_to_individuals',
+                                      'col_b_refunds_to_party_committees',
+                                      'col_b_refunds_to_other_committees',
+                                      'col_b_total_refunds',
+                                      'col_b_other_disbursements',
+                                      'col_b_total_disbursements',
+                                      'col_a_cash_beginning_reporting_period',
+                                      'col_a_total_receipts_period',
+                                      'col_a_subtotals',
+                                      'col_a_total_disbursements_period',
+                                      'col_a_cash_on_hand_close',
+                                      'beginning_image_number',
+                                      'end_image_number',
+                                      'receipt_date'],
+                '^(P2.6|P3.0|P3.1)': ['form_type',
+                                      'filer_committee_id_number',
+                                      'committee_name',
+                                      'change_of_address',
+                                      'street_1',
+                                      'street_2',
+                                      'city',
+                                      'state',
+                                      'zip_code',
+                                      'election_state',
+                                      'election_district',
+                                      'report_code',
+                                      'election_date',
+                                      'state_of_election',
+                                      'coverage_from_date',
+                                      'coverage_through_date',
+                                      'treasurer_last_name',
+                                      'treasurer_first_name',
+                                      'treasurer_middle_name',
+                                      'treasurer_prefix',
+                                      'treasurer_suffix',
+                                      'date_signed',
+                                      'col_a_total_contributions_no_loans',
+                                      'col_a_total_contributions_refunds',
+                                      'col_a_net_contributions',
+                                      'col_a_total_operating_expenditures',
+                                      'col_a_total_offset_to_operating_expenditures',
+                                      'col_a_net_operating_expenditures',
+                                      'col_a_cash_on_hand_close_of_period',
+                                      'col_a_debts_to',
+                                      'col_a_debts_by',
+                                      'col_a_individual_contributions_itemized',
+                                      'col_a_individual_contributions_unitemized',
+                                      'col_a_total_individual_contributions',
+                                      'col_a_political_party_contributions',
+                                      'col_a_pac_contributions',
+                                      'col_a_candidate_contributions',
+                                      'col_a_total_contributions',
+                                      'col_a_transfers_from_authorized',
+                                      'col_a_candidate_loans',
+                                      'col_a_other_loans',
+                                      'col_a_total_loans',
+                                      'col_a_offset_to_operating_expenditures',
+                                      'col_a_other_receipts',
+                                      'col_a_total_receipts',
+                                      'col_a_operating_expenditures',
+                                      'col_a_transfers_to_authorized',
+                                      'col_a_candidate_loan_repayments',
+                                      'col_a_other_loan_repayments',
+                                      'col_a_total_loan_repayments',
+                                      'col_a_refunds_to_individuals',
+                                      'col_a_refunds_to_party_committees',
+                                      'col_a_refunds_to_other_committees',
+                                      'col_a_total_refunds',
+                                      'col_a_other_disbursements',
+                                      'col_a_total_disbursements',
+                                      'col_b_total_contributions_no_loans',
+                                      'col_b_total_contributions_refunds',
+                                      'col_b_net_contributions',
+                                      'col_b_total_operating_expenditures',
+                                      'col_b_total_offset_to_operating_expenditures',
+                                      'col_b_net_operating_expenditures',
+                                      'col_b_individual_contributions_itemized',
+                                      'col_b_individual_contributions_unitemized',
+                                      'col_b_total_individual_contributions',
+                                      'col_b_political_party_contributions',
+                                      'col_b_pac_contributions',
+                                      'col_b_candidate_contributions',
+                                      'col_b_total_contributions',
+                                      'col_b_transfers_from_authorized',
+                                      'col_b_candidate_loans',
+                                      'col_b_other_loans',
+                                      'col_b_total_loans',
+                                      'col_b_offset_to_operating_expenditures',
+                                      'col_b_other_receipts',
+                                      'col_b_total_receipts',
+                                      'col_b_operating_expenditures',
+                                      'col_b_transfers_to_authorized',
+                                      'col_b_candidate_loan_repayments',
+                                      'col_b_other_loan_repayments',
+                                      'col_b_total_loan_repayments',
+                                      'col_b_refunds_to_individuals',
+                                      'col_b_refunds_to_party_committees',
+                                      'col_b_refunds_to_other_committees',
+                                      'col_b_total_refunds',
+                                      'col_b_other_disbursements',
+                                      'col_b_total_disbursements',
+                                      'col_a_cash_beginning_reporting_period',
+                                      'col_a_total_receipts_period',
+                                      'col_a_subtotals',
+                                      'col_a_total_disbursements_period',
+                                      'col_a_cash_on_hand_close',
+                                      'beginning_image_number'],
+                '^(P1|P2.2|P2.3|P2.4)': ['form_type',
+                                         'filer_committee_id_number',
+                                         'committee_name',
+                                         'change_of_address',
+                                         'street_1',
+                                         'street_2',
+                                         'city',
+                                         'state',
+                                         'zip_code',
+                                         'election_state',
+                                         'election_district',
+                                         'report_code',
+                                         'election_date',
+                                         'state_of_election',
+                                         'coverage_from_date',
+                                         'coverage_through_date',
+                                         'treasurer_last_name',
+                                         'treasurer_first_name',
+                                         'treasurer_middle_name',
+                                         'treasurer_prefix',
+                                         'treasurer_suffix',
+                                         'date_signed',
+                                         'col_a_total_contributions_no_loans',
+                                         'col_a_total_contributions_refunds',
+                                         'col_a_net_contributions',
+                                         'col_a_total_operating_expenditures',
+                                         'col_a_total_offset_to_operating_expenditures',
+                                         'col_a_net_operating_expenditures',
+                                         'col_a_cash_on_hand_close_of_period',
+                                         'col_a_debts_to',
+                                         'col_a_debts_by',
+                                         'col_a_individual_contributions_itemized',
+                                         'col_a_individual_contributions_unitemized',
+                                         'col_a_total_individual_contributions',
+                                         'col_a_political_party_contributions',
+                                         'col_a_pac_contributions',
+                                         'col_a_candidate_contributions',
+                                         'col_a_total_contributions',
+                                         'col_a_transfers_from_authorized',
+                                         'col_a_candidate_loans',
+                                         'col_a_other_loans',
+                                         'col_a_total_loans',
+                                         'col_a_offset_to_operating_expenditures',
+                                         'col_a_other_receipts',
+                                         'col_a_total_receipts',
+                                         'col_a_operating_expenditures',
+                                         'col_a_transfers_to_authorized',
+                                         'col_a_candidate_loan_repayments',
+                                         'col_a_other_loan_repayments',
+                                         'col_a_total_loan_repayments',
+                                         'col_a_refunds_to_individuals',
+                                         'col_a_refunds_to_party_committees',
+                                         'col_a_refunds_to_other_committees',
+                                         'col_a_total_refunds',
+                                         'col_a_other_disbursements',
+                                         'col_a_total_disbursements',
+                                         'col_b_total_contributions_no_loans',
+                                         'col_b_total_contributions_refunds',
+                                         'col_b_net_contributions',
+                                         'col_b_total_operating_expenditures',
+                                         'col_b_total_offset_to_operating_expenditures',
+                                         'col_b_net_operating_expenditures',
+                                         'col_b_individual_contributions_itemized',
+                                         'col_b_individual_contributions_unitemized',
+                                         'col_b_total_individual_contributions',
+                                         'col_b_political_party_contributions',
+                                         'col_b_pac_contributions',
+                                         'col_b_candidate_contributions',
+                                         'col_b_total_contributions',
+                                         'col_b_transfers_from_authorized',
+                                         'col_b_candidate_loans',
+                                         'col_b_other_loans',
+                                         'col_b_total_loans',
+                                         'col_b_offset_to_operating_expenditures',
+                                         'col_b_other_receipts',
+                                         'col_b_total_receipts',
+                                         'col_b_operating_expenditures',
+                                         'col_b_transfers_to_authorized',
+                                         'col_b_candidate_loan_repayments',
+                                         'col_b_other_loan_repayments',
+                                         'col_b_total_loan_repayments',
+                                         'col_b_refunds_to_individuals',
+                                         'col_b_refunds_to_party_committees',
+                                         'col_b_refunds_to_other_committees',
+                                         'col_b_total_refunds',
+                                         'col_b_other_disbursements',
+                                         'col_b_total_disbursements',
+                                         'col_a_cash_beginning_reporting_period',
+                                         'col_a_total_receipts_period',
+                                         'col_a_subtotals',
+                                         'col_a_total_disbursements_period',
+                                         'col_a_cash_on_hand_close',
+                                         'candidate_last_name',
+                                         'candidate_first_name',
+                                         'candidate_middle_name',
+                                         'candidate_prefix',
+                                         'candidate_suffix',
+                                         'candidate_id_number',
+                                         'report_type',
+                                         'col_b_gross_receipts_authorized_primary',
+                                         'col_b_aggregate_personal_funds_primary',
+                                         'col_b_gross_receipts_minus_personal_funds_primary',
+                                         'col_b_gross_receipts_authorized_general',
+                                         'col_b_aggregate_personal_funds_general',
+                                         'col_b_gross_receipts_minus_personal_funds_general',
+                                         'beginning_image_number'],
+                '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4': ['form_type',
+                                                     'filer_committee_id_number',
+                                                     'committee_name',
+                                                     'change_of_address',
+                                                     'street_1',
+                                                     'street_2',
+                                                     'city',
+                                                     'state',
+                                                     'zip_code',
+                                                     'election_state',
+                                                     'election_district',
+                                                     'report_code',
+                                                     'election_code',
+                                                     'election_date',
+                                                     'state_of_election',
+                                                     'coverage_from_date',
+                                                     'coverage_through_date',
+                                                     'treasurer_last_name',
+                                                     'treasurer_first_name',
+                                                     'treasurer_middle_name',
+                                                     'treasurer_prefix',
+                                                     'treasurer_suffix',
+                                                     'date_signed',
+                                                     'col_a_total_contributions_no_loans',
+                                                     'col_a_total_contributions_refunds',
+                                                     'col_a_net_contributions',
+                                                     'col_a_total_operating_expenditures',
+                                                     'col_a_total_offset_to_operating_expenditures',
+                                                     'col_a_net_operating_expenditures',
+                                                     'col_a_cash_on_hand_close_of_period',
+                                                     'col_a_debts_to',
+                                                     'col_a_debts_by',
+                                                     'col_a_individual_contributions_itemized',
+                                                     'col_a_individual_contributions_unitemized',
+                                                     'col_a_total_individual_contributions',
+                                                     'col_a_political_party_contributions',
+                                                     'col_a_pac_contributions',
+                                                     'col_a_candidate_contributions',
+                                                     'col_a_total_contributions',
+                                                     'col_a_transfers_from_authorized',
+                                                     'col_a_candidate_loans',
+                                                     'col_a_other_loans',
+                                                     'col_a_total_loans',
+                                                     'col_a_offset_to_operating_expenditures',
+                                                     'col_a_other_receipts',
+                                                     'col_a_total_receipts',
+                                                     'col_a_operating_expenditures',
+                                                     'col_a_transfers_to_authorized',
+                                                     'col_a_candidate_loan_repayments',
+                                                     'col_a_other_loan_repayments',
+                                                     'col_a_total_loan_repayments',
+                                                     'col_a_refunds_to_individuals',
+                                                     'col_a_refunds_to_party_committees',
+                                                     'col_a_refunds_to_other_committees',
+                                                     'col_a_total_refunds',
+                                                     'col_a_other_disbursements',
+                                                     'col_a_total_disbursements',
+                                                     'col_a_cash_beginning_reporting_period',
+                                                     'col_a_total_receipts_period',
+                                                     'col_a_subtotals',
+                                                     'col_a_total_disbursements_period',
+                                                     'col_a_cash_on_hand_close',
+                                                     'col_b_total_contributions_no_loans',
+                                                     'col_b_total_contributions_refunds',
+                                                     'col_b_net_contributions',
+                                                     'col_b_total_operating_expenditures',
+                                                     'col_b_total_offset_to_operating_expenditures',
+                                                     'col_b_net_operating_expenditures',
+                                                     'col_b_individual_contributions_itemized',
+                                                     'col_b_individual_contributions_unitemized',
+                                                     'col_b_total_individual_contributions',
+                                                     'col_b_political_party_contributions',
+                                                     'col_b_pac_contributions',
+                                                     'col_b_candidate_contributions',
+                                                     'col_b_total_contributions',
+                                                     'col_b_transfers_from_authorized',
+                                                     'col_b_candidate_loans',
+                                                     'col_b_other_loans',
+                                                     'col_b_total_loans',
+                                                     'col_b_offset_to_operating_expenditures',
+                                                     'col_b_other_receipts',
+                                                     'col_b_total_receipts',
+                                                     'col_b_operating_expenditures',
+                                                     'col_b_transfers_to_authorized',
+                                                     'col_b_candidate_loan_repayments',
+                                                     'col_b_other_loan_repayments',
+                                                     'col_b_total_loan_repayments',
+                                                     'col_b_refunds_to_individuals',
+                                                     'col_b_refunds_to_party_committees',
+                                                     'col_b_refunds_to_other_committees',
+                                                     'col_b_total_refunds',
+                                                     'col_b_other_disbursements',
+                                                     'col_b_total_disbursements'],
+                '^6.3|6.2|6.1': ['form_type',
+                                 'filer_committee_id_number',
+                                 'committee_name',
+                                 'change_of_address',
+                                 'street_1',
+                                 'street_2',
+                                 'city',
+                                 'state',
+                                 'zip_code',
+                                 'election_state',
+                                 'election_district',
+                                 'report_code',
+                                 'election_code',
+                                 'election_date',
+                                 'state_of_election',
+                                 'coverage_from_date',
+                                 'coverage_through_date',
+                                 'treasurer_last_name',
+                                 'treasurer_first_name',
+                                 'treasurer_middle_name',
+                                 'treasurer_prefix',
+                                 'treasurer_suffix',
+                                 'date_signed',
+                                 'candidate_id_number',
+                                 'candidate_last_name',
+                                 'candidate_first_name',
+                                 'candidate_middle_name',
+                                 'candidate_prefix',
+                                 'candidate_suffix',
+                                 'report_type',
+                                 'col_a_total_contributions_no_loans',
+                                 'col_a_total_contributions_refunds',
+                                 'col_a_net_contributions',
+                                 'col_a_total_operating_expenditures',
+                                 'col_a_total_offset_to_operating_expenditures',
+                                 'col_a_net_operating_expenditures',
+                                 'col_a_cash_on_hand_close_of_period',
+                                 'col_a_debts_to',
+                                 'col_a_debts_by',
+                                 'col_a_individual_contributions_itemized',
+                                 'col_a_individual_contributions_unitemized',
+                                 'col_a_total_individual_contributions',
+                                 'col_a_political_party_contributions',
+                                 'col_a_pac_contributions',
+                                 'col_a_candidate_contributions',
+                                 'col_a_total_contributions',
+                                 'col_a_transfers_from_authorized',
+                                 'col_a_candidate_loans',
+                                 'col_a_other_loans',
+                                 'col_a_total_loans',
+                                 'col_a_offset_to_operating_expenditures',
+                                 'col_a_other_receipts',
+                                 'col_a_total_receipts',
+                                 'col_a_operating_expenditures',
+                                 'col_a_transfers_to_authorized',
+                                 'col_a_candidate_loan_repayments',
+                                 'col_a_other_loan_repayments',
+                                 'col_a_total_loan_repayments',
+                                 'col_a_refunds_to_individuals',
+                                 'col_a_refunds_to_party_committees',
+                                 'col_a_refunds_to_other_committees',
+                                 'col_a_total_refunds',
+                                 'col_a_other_disbursements',
+                                 'col_a_total_disbursements',
+                                 'col_a_cash_beginning_reporting_period',
+                                 'col_a_total_receipts_period',
+                                 'col_a_subtotals',
+                                 'col_a_total_disbursements_period',
+                                 'col_a_cash_on_hand_close',
+                                 'col_b_total_contributions_no_loans',
+                                 'col_b_total_contributions_refunds',
+                                 'col_b_net_contributions',
+                                 'col_b_total_operating_expenditures',
+                                 'col_b_total_offset_to_operating_expenditures',
+                                 'col_b_net_operating_expenditures',
+                                 'col_b_individual_contributions_itemized',
+                                 'col_b_individual_contributions_unitemized',
+                                 'col_b_total_individual_contributions',
+                                 'col_b_political_party_contributions',
+                                 'col_b_pac_contributions',
+                                 'col_b_candidate_contributions',
+                                 'col_b_total_contributions',
+                                 'col_b_transfers_from_authorized',
+                                 'col_b_candidate_loans',
+                                 'col_b_other_loans',
+                                 'col_b_total_loans',
+                                 'col_b_offset_to_operating_expenditures',
+                                 'col_b_other_receipts',
+                                 'col_b_total_receipts',
+                                 'col_b_operating_expenditures',
+                                 'col_b_transfers_to_authorized',
+                                 'col_b_candidate_loan_repayments',
+                                 'col_b_other_loan_repayments',
+                                 'col_b_total_loan_repayments',
+                                 'col_b_refunds_to_individuals',
+                                 'col_b_refunds_to_party_committees',
+                                 'col_b_refunds_to_other_committees',
+                                 'col_b_total_refunds',
+                                 'col_b_other_disbursements',
+                                 'col_b_total_disbursements',
+                                 'col_b_gross_receipts_authorized_primary',
+                                 'col_b_aggregate_personal_funds_primary',
+                                 'col_b_gross_receipts_minus_personal_funds_primary',
+                                 'col_b_gross_receipts_authorized_general',
+                                 'col_b_aggregate_personal_funds_general',
+                                 'col_b_gross_receipts_minus_personal_funds_general'],
+                '^5.3|5.2|5.1|5.0': ['form_type',
+                                     'filer_committee_id_number',
+                                     'committee_name',
+                                     'street_1',
+                                     'street_2',
+                                     'city',
+                                     'state',
+                                     'zip_code',
+                                     'change_of_address',
+                                     'election_state',
+                                     'election_district',
+                                     'report_code',
+                                     'election_code',
+                                     'election_date',
+                                     'state_of_election',
+                                     'primary_election',
+                                     'general_election',
+                                     'special_election',
+                                     'runoff_election',
+                                     'coverage_from_date',
+                                     'coverage_through_date',
+                                     'col_a_total_contributions_no_loans',
+                                     'col_a_total_contributions_refunds',
+                                     'col_a_net_contributions',
+                                     'col_a_total_operating_expenditures',
+                                     'col_a_total_offset_to_operating_expenditures',
+                                     'col_a_net_operating_expenditures',
+                                     'col_a_cash_on_hand_close_of_period',
+                                     'col_a_debts_to',
+                                     'col_a_debts_by',
+                                     'col_a_individual_contributions_itemized',
+                                     'col_a_individual_contributions_unitemized',
+                                     'col_a_total_individual_contributions',
+                                     'col_a_political_party_contributions',
+                                     'col_a_pac_contributions',
+                                     'col_a_candidate_contributions',
+                                     'col_a_total_contributions',
+                                     'col_a_transfers_from_authorized',
+                                     'col_a_candidate_loans',
+                                     'col_a_other_loans',
+                                     'col_a_total_loans',
+                                     'col_a_offset_to_operating_expenditures',
+                                     'col_a_other_receipts',
+                                     'col_a_total_receipts',
+                                     'col_a_operating_expenditures',
+                                     'col_a_transfers_to_authorized',
+                                     'col_a_candidate_loan_repayments',
+                                     'col_a_other_loan_repayments',
+                                     'col_a_total_loan_repayments',
+                                     'col_a_refunds_to_individuals',
+                                     'col_a_refunds_to_party_committees',
+                                     'col_a_refunds_to_other_committees',
+                                     'col_a_total_refunds',
+                                     'col_a_other_disbursements',
+                                     'col_a_total_disbursements',
+                                     'col_a_cash_beginning_reporting_period',
+                                     'col_a_total_receipts_period',
+                                     'col_a_subtotals',
+                                     'col_a_total_disbursements_period',
+                                     'col_a_cash_on_hand_close',
+                                     'col_b_total_contributions_no_loans',
+                                     'col_b_total_contributions_refunds',
+                                     'col_b_net_contributions',
+                                     'col_b_total_operating_expenditures',
+                                     'col_b_total_offset_to_operating_expenditures',
+                                     'col_b_net_operating_expenditures',
+                                     'col_b_individual_contributions_itemized',
+                                     'col_b_individual_contributions_unitemized',
+                                     'col_b_total_individual_contributions',
+                                     'col_b_political_party_contributions',
+                                     'col_b_pac_contributions',
+                                     'col_b_candidate_contributions',
+                                     'col_b_total_contributions',
+                                     'col_b_transfers_from_authorized',
+                                     'col_b_candidate_loans',
+                                     'col_b_other_loans',
+                                     'col_b_total_loans',
+                                     'col_b_offset_to_operating_expenditures',
+                                     'col_b_other_receipts',
+                                     'col_b_total_receipts',
+                                     'col_b_operating_expenditures',
+                                     'col_b_transfers_to_authorized',
+                                     'col_b_candidate_loan_repayments',
+                                     'col_b_other_loan_repayments',
+                                     'col_b_total_loan_repayments',
+                                     'col_b_refunds_to_individuals',
+                                     'col_b_refunds_to_party_committees',
+                                     'col_b_refunds_to_other_committees',
+                                     'col_b_total_refunds',
+                                     'col_b_other_disbursements',
+                                     'col_b_total_disbursements',
+                                     'treasurer_name',
+                                     'date_signed',
+                                     'candidate_id_number',
+                                     'candidate_name',
+                                     'report_type',
+                                     'col_b_gross_receipts_authorized_primary',
+                                     'col_b_aggregate_personal_funds_primary',
+                                     'col_b_gross_receipts_minus_personal_funds_primary',
+                                     'col_b_gross_receipts_authorized_general',
+                                     'col_b_aggregate_personal_funds_general',
+                                     'col_b_gross_receipts_minus_personal_funds_general'],
+                '^3.0|^2|^1': ['form_type',
+                               'filer_committee_id_number',
+                               'committee_name',
+                               'street_1',
+                               'street_2',
+                               'city',
+                               'state',
+                               'zip_code',
+                               'change_of_address',
+                               'election_state',
+                               'election_district',
+                               'report_code',
+                               'election_code',
+                               'election_date',
+                               'state_of_election',
+                               'primary_election',
+                               'general_election',
+                               'special_election',
+                               'runoff_election',
+                               'coverage_from_date',
+                               'coverage_through_date',
+                               'col_a_total_contributions_no_loans',
+                               'col_a_total_contributions_refunds',
+                               'col_a_net_contributions',
+                               'col_a_total_operating_expenditures',
+                               'col_a_total_offset_to_operating_expenditures',
+                               'col_a_net_operating_expenditures',
+                               'col_a_cash_on_hand_close_of_period',
+                               'col_a_debts_to',
+                               'col_a_debts_by',
+                               'col_a_individual_contributions_itemized',
+                               'col_a_individual_contributions_unitemized',
+                               'col_a_total_individual_contributions',
+                               'col_a_political_party_contributions',
+                               'col_a_pac_contributions',
+                               'col_a_candidate_contributions',
+                               'col_a_total_contributions',
+                               'col_a_transfers_from_authorized',
+                               'col_a_candidate_loans',
+                               'col_a_other_loans',
+                               'col_a_total_loans',
+                               'col_a_offset_to_operating_expenditures',
+                               'col_a_other_receipts',
+                               'col_a_total_receipts',
+                               'col_a_operating_expenditures',
+                               'col_a_transfers_to_authorized',
+                               'col_a_candidate_loan_repayments',
+                               'col_a_other_loan_repayments',
+                               'col_a_total_loan_repayments',
+                               'col_a_refunds_to_individuals',
+                               'col_a_refunds_to_party_committees',
+                               'col_a_refunds_to_other_committees',
+                               'col_a_total_refunds',
+                               'col_a_other_disbursements',
+                               'col_a_total_disbursements',
+                               'col_a_cash_beginning_reporting_period',
+                               'col_a_total_receipts_period',
+                               'col_a_subtotals',
+                               'col_a_total_disbursements_period',
+                               'col_a_cash_on_hand_close',
+                               'col_b_total_contributions_no_loans',
+                               'col_b_total_contributions_refunds',
+                               'col_b_net_contributions',
+                               'col_b_total_operating_expenditures',
+                               'col_b_total_offset_to_operating_expenditures',
+                               'col_b_net_operating_expenditures',
+                               'col_b_individual_contributions_itemized',
+                               'col_b_individual_contributions_unitemized',
+                               'col_b_total_individual_contributions',
+                               'col_b_political_party_contributions',
+                               'col_b_pac_contributions',
+                               'col_b_candidate_contributions',
+                               'col_b_total_contributions',
+                               'col_b_transfers_from_authorized',
+                               'col_b_candidate_loans',
+                               'col_b_other_loans',
+                               'col_b_total_loans',
+                               'col_b_offset_to_operating_expenditures',
+                               'col_b_other_receipts',
+                               'col_b_total_receipts',
+                               'col_b_operating_expenditures',
+                               'col_b_transfers_to_authorized',
+                               'col_b_candidate_loan_repayments',
+                               'col_b_other_loan_repayments',
+                               'col_b_total_loan_repayments',
+                               'col_b_refunds_to_individuals',
+                               'col_b_refunds_to_party_committees',
+                               'col_b_refunds_to_other_committees',
+                               'col_b_total_refunds',
+                               'col_b_other_disbursements',
+                               'col_b_total_disbursements',
+                               'treasurer_name',
+                               'date_signed']},
+ '^f3l[a|n]': {'^P(3.4|3.3|3.2)': ['form_type',
+                                   'filer_committee_id_number',
+                                   'committee_name',
+                                   'change_of_address',
+                                   'street_1',
+                                   'street_2',
+                                   'city',
+                                   'state',
+                                   'zip_code',
+                                   'election_state',
+                                   'election_district',
+                                   'report_code',
+                                   'election_date',
+                                   'election_state',
+                                   'semi_annual_period',
+                                   'coverage_from_date',
+                                   'coverage_through_date',
+                                   'semi_annual_period_jan_june',
+                                   'semi_annual_period_jul_dec',
+                                   'quarterly_monthly_bundled_contributions',
+                                   'semi_annual_bundled_contributions',
+                                   'treasurer_last_name',
+                                   'treasurer_first_name',
+                                   'treasurer_middle_name',
+                                   'treasurer_prefix',
+                                   'treasurer_suffix',
+                                   'date_signed',
+                                   'beginning_image_number',
+                                   'end_image_number',
+                                   'receipt_date'],
+               '^P(3.1|3.0|2.6)': ['form_type',
+                                   'filer_committee_id_number',
+                                   'committee_name',
+                                   'change_of_address',
+                                   'street_1',
+                                   'street_2',
+                                   'city',
+                                   'state',
+                                   'zip_code',
+                                   'election_state',
+                                   'election_district',
+                                   'report_code',
+                                   'election_date',
+                                   'election_state',
+                                   'semi_annual_period',
+                                   'coverage_from_date',
+                                   'coverage_through_date',
+                                   'semi_annual_period_jan_june',
+                                   'semi_annual_period_jul_dec',
+                                   'quarterly_monthly_bundled_contributions',
+                                   'semi_annual_bundled_contributions',
+                                   'treasurer_last_name',
+                                   'treasurer_first_name',
+                                   'treasurer_middle_name',
+                                   'treasurer_prefix',
+                                   'treasurer_suffix',
+                                   'date_signed',
+                                   'beginning_image_number'],
+               '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4': ['form_type',
+                                                    'filer_committee_id_number',
+                                                    'committee_name',
+                                                    'change_of_address',
+                                                    'street_1',
+                                                    'street_2',
+                                                    'city',
+                                                    'state',
+                                                    'zip_code',
+                                                    'election_state',
+                                                    'election_district',
+                                                    'report_code',
+                                                    'election_date',
+                                                    '',
+                                                    'semi_annual_period',
+                                                    'coverage_from_date',
+                                                    'coverage_through_date',
+                                                    'semi_annual_period_jan_june',
+                                                    'semi_annual_period_jul_dec',
+                                                    'quarterly_monthly_bundled_contributions',
+                                                    'semi_annual_bundled_contributions',
+                                                    'treasurer_last_name',
+                                                    'treasurer_first_name',
+                                                    'treasurer_middle_name',
+                                                    'treasurer_prefix',
+                                                    'treasurer_suffix',
+                                                    'date_signed']},
+ '(^f3p$)|(^f3p[^s|3|z])': {'^P3.2|^P3.3|^P3.4': ['form_type',
+                                                  'filer_committee_id_number',
+                                                  'committee_name',
+                                                  'change_of_address',
+                                                  'street_1',
+                                                  'street_2',
+                                                  'city',
+                                                  'state',
+                                                  'zip_code',
+                                                  'activity_primary',
+                                                  'activity_general',
+                                                  'report_code',
+                                                  'date_of_election',
+                                                  'state_of_election',
+                                                  'coverage_from_date',
+                                                  'coverage_through_date',
+                                                  'treasurer_last_name',
+                                                  'treasurer_first_name',
+                                                  'treasurer_middle_name',
+                                                  'treasurer_prefix',
+                                                  'treasurer_suffix',
+                                                  'date_signed',
+                                                  'col_a_cash_on_hand_beginning_period',
+                                                  'col_a_total_receipts',
+                                                  'col_a_subtotal',
+                                                  'col_a_total_disbursements',
+                                                  'col_a_cash_on_hand_close_of_period',
+                                                  'col_a_debts_to',
+                                                  'col_a_debts_by',
+                                                  'col_a_expenditures_subject_to_limits',
+                                                  'col_a_net_contributions',
+                                                  'col_a_net_operating_expenditures',
+                                                  'col_a_federal_funds',
+                                                  'col_a_individuals_itemized',
+                                                  'col_a_individuals_unitemized',
+                                                  'col_a_individual_contribution_total',
+                                                  'col_a_political_party_committees_receipts',
+                                                  'col_a_other_political_committees_pacs',
+                                                  'col_a_the_candidate',
+                                                  'col_a_total_contributions',
+                                                  'col_a_transfers_from_aff_other_party_cmttees',
+                                                  'col_a_received_from_or_guaranteed_by_cand',
+                                                  'col_a_other_loans',
+                                                  'col_a_total_loans',
+                                                  'col_a_operating',
+                                                  'col_a_fundraising',
+                                                  'col_a_legal_and_accounting',
+                                                  'col_a_total_offsets_to_expenditures',
+                                                  'col_a_other_receipts',
+                                                  'col_a_total_receipts',
+                                                  'col_a_operating_expenditures',
+                                                  'col_a_transfers_to_other_authorized_committees',
+                                                  'col_a_fundraising_disbursements',
+                                                  'col_a_exempt_legal_accounting_disbursement',
+                                                  'col_a_made_or_guaranteed_by_candidate',
+                                                  'col_a_other_repayments',
+                                                  'col_a_total_loan_repayments_made',
+                                                  'col_a_individuals',
+                                                  'col_a_political_party_committees_refunds',
+                                                  'col_a_other_political_committees',
+                                                  'col_a_total_contributions_refunds',
+                                                  'col_a_other_disbursements',
+                                                  'col_a_total_disbursements',
+                                                  'col_a_items_on_hand_to_be_liquidated',
+                                                  'col_a_alabama',
+                                                  'col_a_alaska',
+                                                  'col_a_arizona',
+                                                  'col_a_arkansas',
+                                                  'col_a_california',
+                                                  'col_a_colorado',
+                                                  'col_a_connecticut',
+                                                  'col_a_delaware',
+                                                  'col_a_dist_of_columbia',
+                                                  'col_a_florida',
+                                                  'col_a_georgia',
+                                                  'col_a_hawaii',
+                                                  'col_a_idaho',
+                                                  'col_a_illinois',
+                                                  'col_a_indiana',
+                                                  'col_a_iowa',
+                                                  'col_a_kansas',
+                                                  'col_a_kentucky',
+                                                  'col_a_louisiana',
+                                                  'col_a_maine',
+                                                  'col_a_maryland',
+                                                  'col_a_massachusetts',
+                                                  'col_a_michigan',
+                                                  'col_a_minnesota',
+                                                  'col_a_mississippi',
+                                                  'col_a_missouri',
+                                                  'col_a_montana',
+                                                  'col_a_nebraska',
+                                                  'col_a_nevada',
+                                                  'col_a_new_hampshire',
+                                                  'col_a_new_jersey',
+                                                  'col_a_new_mexico',
+                                                  'col_a_new_york',
+                                                  'col_a_north_carolina',
+                                                  'col_a_north_dakota',
+                                                  'col_a_ohio',
+                                                  'col_a_oklahoma',
+                                                  'col_a_oregon',
+                                                  'col_a_pennsylvania',
+                                                  'col_a_rhode_island',
+                                                  'col_a_south_carolina',
+                                                  'col_a_south_dakota',
+                                                  'col_a_tennessee',
+                                                  'col_a_texas',
+                                                  'col_a_utah',
+                                                  'col_a_vermont',
+                                                  'col_a_virginia',
+                                                  'col_a_washington',
+                                                  'col_a_west_virginia',
+                                                  'col_a_wisconsin',
+                                                  'col_a_wyoming',
+                                                  'col_a_puerto_rico',
+                                                  'col_a_guam',
+                                                  'col_a_virgin_islands',
+                                                  'col_a_totals',
+                                                  'col_b_federal_funds',
+                                                  'col_b_individuals_itemized',
+                                                  'col_b_individuals_unitemized',
+                                                  'col_b_individual_contribution_total',
+                                                  'col_b_political_party_committees_receipts',
+                                                  'col_b_other_political_committees_pacs',
+                                                  'col_b_the_candidate',
+                                                  'col_b_total_contributions_other_than_loans',
+                                                  'col_b_transfers_from_aff_other_party_cmttees',
+                                                  'col_b_received_from_or_guaranteed_by_cand',
+                                                  'col_b_other_loans',
+                                                  'col_b_total_loans',
+                                                  'col_b_operating',
+                                                  'col_b_fundraising',
+                                                  'col_b_legal_and_accounting',
+                                                  'col_b_total_offsets_to_operating_expenditures',
+                                                  'col_b_other_receipts',
+                                                  'col_b_total_receipts',
+                                                  'col_b_operating_expenditures',
+                                                  'col_b_transfers_to_other_authorized_committees',
+                                                  'col_b_fundraising_disbursements',
+                                                  'col_b_exempt_legal_accounting_disbursement',
+                                                  'col_b_made_or_guaranteed_by_the_candidate',
+                                                  'col_b_other_repayments',
+                                                  'col_b_total_loan_repayments_made',
+                                                  'col_b_individuals',
+                                                  'col_b_political_party_committees_refunds',
+                                                  'col_b_other_political_committees',
+                                                  'col_b_total_contributions_refunds',
+                                                  'col_b_other_disbursements',
+                                                  'col_b_total_disbursements',
+                                                  'col_b_alabama',
+                                                  'col_b_alaska',
+                                                  'col_b_arizona',
+                                                  'col_b_arkansas',
+                                                  'col_b_california',
+                                                  'col_b_colorado',
+                                                  'col_b_connecticut',
+                                                  'col_b_delaware',
+                                                  'col_b_dist_of_columbia',
+                                                  'col_b_florida',
+                                                  'col_b_georgia',
+                                                  'col_b_hawaii',
+                                                  'col_b_idaho',
+                                                  'col_b_illinois',
+                                                  'col_b_indiana',
+                                                  'col_b_iowa',
+                                                  'col_b_kansas',
+                                                  'col_b_kentucky',
+                                                  'col_b_louisiana',
+                                                  'col_b_maine',
+                                                  'col_b_maryland',
+                                                  'col_b_massachusetts',
+                                                  'col_b_michigan',
+                                                  'col_b_minnesota',
+                                                  'col_b_mississippi',
+                                                  'col_b_missouri',
+                                                  'col_b_montana',
+                                                  'col_b_nebraska',
+                                                  'col_b_nevada',
+                                                  'col_b_new_hampshire',
+                                                  'col_b_new_jersey',
+                                                  'col_b_new_mexico',
+                                                  'col_b_new_york',
+                                                  'col_b_north_carolina',
+                                                  'col_b_north_dakota',
+                                                  'col_b_ohio',
+                                                  'col_b_oklahoma',
+                                                  'col_b_oregon',
+                                                  'col_b_pennsylvania',
+                                                  'col_b_rhode_island',
+                                                  'col_b_south_carolina',
+                                                  'col_b_south_dakota',
+                                                  'col_b_tennessee',
+                                                  'col_b_texas',
+                                                  'col_b_utah',
+                                                  'col_b_vermont',
+                                                  'col_b_virginia',
+                                                  'col_b_washington',
+                                                  'col_b_west_virginia',
+                                                  'col_b_wisconsin',
+                                                  'col_b_wyoming',
+                                                  'col_b_puerto_rico',
+                                                  'col_b_guam',
+                                                  'col_b_virgin_islands',
+                                                  'col_b_totals',
+                                                  'beginning_image_number',
+                                                  'end_image_number',
+                                                  'receipt_date'],
+                            '^8.5|8.4|8.3|8.2|8.1|8.0|7.0': ['form_type',
+                                                             'filer_committee_id_number',
+                                                             'committee_name',
+                                                             'change_of_address',
+                                                             'street_1',
+                                                             'street_2',
+                                                             'city',
+                                                             'state',
+                                                             'zip_code',
+                                                             'activity_primary',
+                                                             'activity_general',
+                                                             'report_code',
+                                                             'election_code',
+                                                             'date_of_election',
+                                                             'state_of_election',
+                                                             'coverage_from_date',
+                                                             'coverage_through_date',
+                                                             'treasurer_last_name',
+                                                             'treasurer_first_name',
+                                                             'treasurer_middle_name',
+                                                             'treasurer_prefix',
+                                                             'treasurer_suffix',
+                                                             'date_signed',
+                                                             'col_a_cash_on_hand_beginning_period',
+                                                             'col_a_total_receipts',
+                                                             'col_a_subtotal',
+                                                             'col_a_total_disbursements',
+                                                             'col_a_cash_on_hand_close_of_period',
+                                                             'col_a_debts_to',
+                                                             'col_a_debts_by',
+                                                             'col_a_expenditures_subject_to_limits',
+                                                             'col_a_net_contributions',
+                                                             'col_a_net_operating_expenditures',
+                                                             'col_a_federal_funds',
+                                                             'col_a_individuals_itemized',
+                                                             'col_a_individuals_unitemized',
+                                                             'col_a_individual_contribution_total',
+                                                             'col_a_political_party_committees_receipts',
+                                                             'col_a_other_political_committees_pacs',
+                                                             'col_a_the_candidate',
+                                                             'col_a_total_contributions',
+                                                             'col_a_transfers_from_aff_other_party_cmttees',
+                                                             'col_a_received_from_or_guaranteed_by_cand',
+                                                             'col_a_other_loans',
+                                                             'col_a_total_loans',
+                                                             'col_a_operating',
+                                                             'col_a_fundraising',
+                                                             'col_a_legal_and_accounting',
+                                                             'col_a_total_offsets_to_expenditures',
+                                                             'col_a_other_receipts',
+                                                             'col_a_total_receipts',
+                                                             'col_a_operating_expenditures',
+                                                             'col_a_transfers_to_other_authorized_committees',
+                                                             'col_a_fundraising_disbursements',
+                                                             'col_a_exempt_legal_accounting_disbursement',
+                                                             'col_a_made_or_guaranteed_by_candidate',
+                                                             'col_a_other_repayments',
+                                                             'col_a_total_loan_repayments_made',
+                                                             'col_a_individuals',
+                                                             'col_a_political_party_committees_refunds',
+                                                             'col_a_other_political_committees',
+                                                             'col_a_total_contributions_refunds',
+                                                             'col_a_other_disbursements',
+                                                             'col_a_total_disbursements',
+                                                             'col_a_items_on_hand_to_be_liquidated',
+                                                             'col_a_alabama',
+                                                             'col_a_alaska',
+                                                             'col_a_arizona',
+                                                             'col_a_arkansas',
+                                                             'col_a_california',
+                                                             'col_a_colorado',
+                                                             'col_a_connecticut',
+                                                             'col_a_delaware',
+                                                             'col_a_dist_of_columbia',
+                                                             'col_a_florida',
+                                                             'col_a_georgia',
+                                                             'col_a_hawaii',
+                                                             'col_a_idaho',
+                                                             'col_a_illinois',
+                                                             'col_a_indiana',
+                                                             'col_a_iowa',
+                                                             'col_a_kansas',
+                                                             'col_a_kentucky',
+                                                             'col_a_louisiana',
+                                                             'col_a_maine',
+                                                             'col_a_maryland',
+                                                             'col_a_massachusetts',
+                                                             'col_a_michigan',
+                                                             'col_a_minnesota',
+                                                             'col_a_mississippi',
+                                                             'col_a_missouri',
+                                                             'col_a_montana',
+                                                             'col_a_nebraska',
+                                                             'col_a_nevada',
+                                                             'col_a_new_hampshire',
+                                                             'col_a_new_jersey',
+                                                             'col_a_new_mexico',
+                                                             'col_a_new_york',
+                                                             'col_a_north_carolina',
+                                                             'col_a_north_dakota',
+                                                             'col_a_ohio',
+                                                             'col_a_oklahoma',
+                                                             'col_a_oregon',
+                                                             'col_a_pennsylvania',
+                                                             'col_a_rhode_island',
+                                                             'col_a_south_carolina',
+                                                             'col_a_south_dakota',
+                                                             'col_a_tennessee',
+                                                             'col_a_texas',
+                                                             'col_a_utah',
+                                                             'col_a_vermont',
+                                                             'col_a_virginia',
+                                                             'col_a_washington',
+                                                             'col_a_west_virginia',
+                                                             'col_a_wisconsin',
+                                                             'col_a_wyoming',
+                                                             'col_a_puerto_rico',
+                                                             'col_a_guam',
+                                                             'col_a_virgin_islands',
+                                                             'col_a_totals',
+                                                             'col_b_federal_funds',
+                                                             'col_b_individuals_itemized',
+                                                             'col_b_individuals_unitemized',
+                                                             'col_b_individual_contribution_total',
+                                                             'col_b_political_party_committees_receipts',
+                                                             'col_b_other_political_committees_pacs',
+                                                             'col_b_the_candidate',
+                                                             'col_b_total_contributions_other_than_loans',
+                                                             'col_b_transfers_from_aff_other_party_cmttees',
+                                                             'col_b_received_from_or_guaranteed_by_cand',
+                                                             'col_b_other_loans',
+                                                             'col_b_total_loans',
+                                                             'col_b_operating',
+                                                             'col_b_fundraising',
+                                                             'col_b_legal_and_accounting',
+                                                             'col_b_total_offsets_to_operating_expenditures',
+                                                             'col_b_other_receipts',
+                                                             'col_b_total_receipts',
+                                                             'col_b_operating_expenditures',
+                                                             'col_b_transfers_to_other_authorized_committees',
+                                                             'col_b_fundraising_disbursements',
+                                                             'col_b_exempt_legal_accounting_disbursement',
+                                                             'col_b_made_or_guaranteed_by_the_candidate',
+                                                             'col_b_other_repayments',
+                                                             'col_b_total_loan_repayments_made',
+                                                             'col_b_individuals',
+                                                             'col_b_political_party_committees_refunds',
+                                                             'col_b_other_political_committees',
+                                                             'col_b_total_contributions_refunds',
+                                                             'col_b_other_disbursements',
+                                                             'col_b_total_disbursements',
+                                                             'col_b_alabama',
+                                                             'col_b_alaska',
+                                                             'col_b_arizona',
+                                                             'col_b_arkansas',
+                                                             'col_b_california',
+                                                             'col_b_colorado',
+                                                             'col_b_connecticut',
+                                                             'col_b_delaware',
+                                                             'col_b_dist_of_columbia',
+                                                             'col_b_florida',
+                                                             'col_b_georgia',
+                                                             'col_b_hawaii',
+                                                             'col_b_idaho',
+                                                             'col_b_illinois',
+                                                             'col_b_indiana',
+                                                             'col_b_iowa',
+                                                             'col_b_kansas',
+                                                             'col_b_kentucky',
+                                                             'col_b_louisiana',
+                                                             'col_b_maine',
+                                                             'col_b_maryland',
+                                                             'col_b_massachusetts',
+                                                             'col_b_michigan',
+                                                             'col_b_minnesota',
+                                                             'col_b_mississippi',
+                                                             'col_b_missouri',
+                                                             'col_b_montana',
+                                                             'col_b_nebraska',
+                                                             'col_b_nevada',
+                                                             'col_b_new_hampshire',
+                                                             'col_b_new_jersey',
+                                                             'col_b_new_mexico',
+                                                             'col_b_new_york',
+                                                             'col_b_north_carolina',
+                                                             'col_b_north_dakota',
+                                                             'col_b_ohio',
+                                                             'col_b_oklahoma',
+                                                             'col_b_oregon',
+                                                             'col_b_pennsylvania',
+                                                             'col_b_rhode_island',
+                                                             'col_b_south_carolina',
+                                                             'col_b_south_dakota',
+                                                             'col_b_tennessee',
+                                                             'col_b_texas',
+                                                             'col_b_utah',
+                                                             'col_b_vermont',
+                                                             'col_b_virginia',
+                                                             'col_b_washington',
+                                                             'col_b_west_virginia',
+                                                             'col_b_wisconsin',
+                                                             'col_b_wyoming',
+                                                             'col_b_puerto_rico',
+                                                             'col_b_guam',
+                                                             'col_b_virgin_islands',
+                                                             'col_b_totals'],
+                            '^6.4|6.3|6.2|6.1': ['form_type',
+                                                 'filer_committee_id_number',
+                                                 'committee_name',
+                                                 'change_of_address',
+                                                 'street_1',
+                                                 'street_2',
+                                                 'city',
+                                                 'state',
+                                                 'zip_code',
+                                                 'activity_primary',
+                                                 'activity_general',
+                                                 'report_code',
+                                                 'election_code',
+                                                 'date_of_election',
+                                                 'state_of_election',
+                                                 'coverage_from_date',
+                                                 'coverage_through_date',
+                                                 'treasurer_last_name',
+                                                 'treasurer_first_name',
+                                                 'treasurer_middle_name',
+                                                 'treasurer_prefix',
+                                                 'treasurer_suffix',
+                                                 'date_signed',
+                                                 'col_a_cash_on_hand_beginning_period',
+                                                 'col_a_total_receipts',
+                                                 'col_a_subtotal',
+                                                 'col_a_total_disbursements',
+                                                 'col_a_cash_on_hand_close_of_period',
+                                                 'col_a_debts_to',
+                                                 'col_a_debts_by',
+                                                 'col_a_expenditures_subject_to_limits',
+                                                 'col_a_net_contributions',
+                                                 'col_a_net_operating_expenditures',
+                                                 'col_a_federal_funds',
+                                                 'col_a_individual_contribution_total',
+                                                 'col_a_political_party_committees_receipts',
+                                                 'col_a_other_political_committees_pacs',
+                                                 'col_a_the_candidate',
+                                                 'col_a_total_contributions',
+                                                 'col_a_transfers_from_aff_other_party_cmttees',
+                                                 'col_a_received_from_or_guaranteed_by_cand',
+                                                 'col_a_other_loans',
+                                                 'col_a_total_loans',
+                                                 'col_a_operating',
+                                                 'col_a_fundraising',
+                                                 'col_a_legal_and_accounting',
+                                                 'col_a_total_offsets_to_expenditures',
+                                                 'col_a_other_receipts',
+                                                 'col_a_total_receipts',
+                                                 'col_a_operating_expenditures',
+                                                 'col_a_transfers_to_other_authorized_committees',
+                                                 'col_a_fundraising_disbursements',
+                                                 'col_a_exempt_legal_accounting_disbursement',
+                                                 'col_a_made_or_guaranteed_by_candidate',
+                                                 'col_a_other_repayments',
+                                                 'col_a_total_loan_repayments_made',
+                                                 'col_a_individuals',
+                                                 'col_a_political_party_committees_refunds',
+                                                 'col_a_other_political_committees',
+                                                 'col_a_total_contributions_refunds',
+                                                 'col_a_other_disbursements',
+                                                 'col_a_total_disbursements',
+                                                 'col_a_items_on_hand_to_be_liquidated',
+                                                 'col_a_alabama',
+                                                 'col_a_alaska',
+                                                 'col_a_arizona',
+                                                 'col_a_arkansas',
+                                                 'col_a_california',
+                                                 'col_a_colorado',
+                                                 'col_a_connecticut',
+                                                 'col_a_delaware',
+                                                 'col_a_dist_of_columbia',
+                                                 'col_a_florida',
+                                                 'col_a_georgia',
+                                                 'col_a_hawaii',
+                                                 'col_a_idaho',
+                                                 'col_a_illinois',
+                                                 'col_a_indiana',
+                                                 'col_a_iowa',
+                                                 'col_a_kansas',
+                                                 'col_a_kentucky',
+                                                 'col_a_louisiana',
+                                                 'col_a_maine',
+                                                 'col_a_maryland',
+                                                 'col_a_massachusetts',
+                                                 'col_a_michigan',
+                                                 'col_a_minnesota',
+                                                 'col_a_mississippi',
+                                                 'col_a_missouri',
+                                                 'col_a_montana',
+                                                 'col_a_nebraska',
+                                                 'col_a_nevada',
+                                                 'col_a_new_hampshire',
+                                                 'col_a_new_jersey',
+                                                 'col_a_new_mexico',
+                                                 'col_a_new_york',
+                                                 'col_a_north_carolina',
+                                                 'col_a_north_dakota',
+                                                 'col_a_ohio',
+                                                 'col_a_oklahoma',
+                                                 'col_a_oregon',
+                                                 'col_a_pennsylvania',
+                                                 'col_a_rhode_island',
+                                                 'col_a_south_carolina',
+                                                 'col_a_south_dakota',
+                                                 'col_a_tennessee',
+                                                 'col_a_texas',
+                                                 'col_a_utah',
+                                                 'col_a_vermont',
+                                                 'col_a_virginia',
+                                                 'col_a_washington',
+                                                 'col_a_west_virginia',
+                                                 'col_a_wisconsin',
+                                                 'col_a_wyoming',
+                                                 'col_a_puerto_rico',
+                                                 'col_a_guam',
+                                                 'col_a_virgin_islands',
+                                                 'col_a_totals',
+                                                 'col_b_federal_funds',
+                                                 'col_b_individual_contribution_total',
+                                                 'col_b_political_party_committees_receipts',
+                                                 'col_b_other_political_committees_pacs',
+                                                 'col_b_the_candidate',
+                                                 'col_b_total_contributions_other_than_loans',
+                                                 'col_b_transfers_from_aff_other_party_cmttees',
+                                                 'col_b_received_from_or_guaranteed_by_cand',
+                                                 'col_b_other_loans',
+                                                 'col_b_total_loans',
+                                                 'col_b_operating',
+                                                 'col_b_fundraising',
+                                                 'col_b_legal_and_accounting',
+                                                 'col_b_total_offsets_to_operating_expenditures',
+                                                 'col_b_other_receipts',
+                                                 'col_b_total_receipts',
+                                                 'col_b_operating_expenditures',
+                                                 'col_b_transfers_to_other_authorized_committees',
+                                                 'col_b_fundraising_disbursements',
+                                                 'col_b_exempt_legal_accounting_disbursement',
+                                                 'col_b_made_or_guaranteed_by_the_candidate',
+                                                 'col_b_other_repayments',
+                                                 'col_b_total_loan_repayments_made',
+                                                 'col_b_individuals',
+                                                 'col_b_political_party_committees_refunds',
+                                                 'col_b_other_political_committees',
+                                                 'col_b_total_contributions_refunds',
+                                                 'col_b_other_disbursements',
+                                                 'col_b_total_disbursements',
+                                                 'col_b_alabama',
+                                                 'col_b_alaska',
+                                                 'col_b_arizona',
+                                                 'col_b_arkansas',
+                                                 'col_b_california',
+                                                 'col_b_colorado',
+                                                 'col_b_connecticut',
+                                                 'col_b_delaware',
+                                                 'col_b_dist_of_columbia',
+                                                 'col_b_florida',
+                                                 'col_b_georgia',
+                                                 'col_b_hawaii',
+                                                 'col_b_idaho',
+                                                 'col_b_illinois',
+                                                 'col_b_indiana',
+                                                 'col_b_iowa',
+                                                 'col_b_kansas',
+                                                 'col_b_kentucky',
+                                                 'col_b_louisiana',
+                                                 'col_b_maine',
+                                                 'col_b_maryland',
+                                                 'col_b_massachusetts',
+                                                 'col_b_michigan',
+                                                 'col_b_minnesota',
+                                                 'col_b_mississippi',
+                                                 'col_b_missouri',
+                                                 'col_b_montana',
+                                                 'col_b_nebraska',
+                                                 'col_b_nevada',
+                                                 'col_b_new_hampshire',
+                                                 'col_b_new_jersey',
+                                                 'col_b_new_mexico',
+                                                 'col_b_new_york',
+                                                 'col_b_north_carolina',
+                                                 'col_b_north_dakota',
+                                                 'col_b_ohio',
+                                                 'col_b_oklahoma',
+                                                 'col_b_oregon',
+                                                 'col_b_pennsylvania',
+                                                 'col_b_rhode_island',
+                                                 'col_b_south_carolina',
+                                                 'col_b_south_dakota',
+                                                 'col_b_tennessee',
+                                                 'col_b_texas',
+                                                 'col_b_utah',
+                                                 'col_b_vermont',
+                                                 'col_b_virginia',
+                                                 'col_b_washington',
+                                                 'col_b_west_virginia',
+                                                 'col_b_wisconsin',
+                                                 'col_b_wyoming',
+                                                 'col_b_puerto_rico',
+                                                 'col_b_guam',
+                                                 'col_b_virgin_islands',
+                                                 'col_b_totals'],
+                            '^5.3|5.2': ['form_type',
+                                         'filer_committee_id_number',
+                                         'committee_name',
+                                         'street_1',
+                                         'street_2',
+                                         'city',
+                                         'state',
+                                         'zip_code',
+                                         'change_of_address',
+                                         'activity_primary',
+                                         'activity_general',
+                                         'report_code',
+                                         'election_code',
+                                         'date_of_election',
+                                         'state_of_election',
+                                         'coverage_from_date',
+                                         'coverage_through_date',
+                                         'col_a_cash_on_hand_beginning_period',
+                                         'col_a_total_receipts',
+                                         'col_a_subtotal',
+                                         'col_a_total_disbursements',
+                                         'col_a_cash_on_hand_close_of_period',
+                                         'col_a_debts_to',
+                                         'col_a_debts_by',
+                                         'col_a_expenditures_subject_to_limits',
+                                         'col_a_net_contributions',
+                                         'col_a_net_operating_expenditures',
+                                         'col_a_federal_funds',
+                                         'col_a_individual_contribution_total',
+                                         'col_a_political_party_committees_receipts',
+                                         'col_a_other_political_committees_pacs',
+                                         'col_a_the_candidate',
+                                         'col_a_total_contributions',
+                                         'col_a_transfers_from_aff_other_party_cmttees',
+                                         'col_a_received_from_or_guaranteed_by_cand',
+                                         'col_a_other_loans',
+                                         'col_a_total_loans',
+                                         'col_a_operating',
+                                         'col_a_fundraising',
+                                         'col_a_legal_and_accounting',
+                                         'col_a_total_offsets_to_expenditures',
+                                         'col_a_other_receipts',
+                                         'col_a_total_receipts',
+                                         'col_a_operating_expenditures',
+                                         'col_a_transfers_to_other_authorized_committees',
+                                         'col_a_fundraising_disbursements',
+                                         'col_a_exempt_legal_accounting_disbursement',
+                                         'col_a_made_or_guaranteed_by_candidate',
+                                         'col_a_other_repayments',
+                                         'col_a_total_loan_repayments_made',
+                                         'col_a_individuals',
+                                         'col_a_political_party_committees_refunds',
+                                         'col_a_other_political_committees',
+                                         'col_a_total_contributions_refunds',
+                                         'col_a_other_disbursements',
+                                         'col_a_total_disbursements',
+                                         'col_a_items_on_hand_to_be_liquidated',
+                                         'col_a_alabama',
+                                         'col_a_alaska',
+                                         'col_a_arizona',
+                                         'col_a_arkansas',
+                                         'col_a_california',
+                                         'col_a_colorado',
+                                         'col_a_connecticut',
+                                         'col_a_delaware',
+                                         'col_a_dist_of_columbia',
+                                         'col_a_florida',
+                                         'col_a_georgia',
+                                         'col_a_hawaii',
+                                         'col_a_idaho',
+                                         'col_a_illinois',
+                                         'col_a_indiana',
+                                         'col_a_iowa',
+                                         'col_a_kansas',
+                                         'col_a_kentucky',
+                                         'col_a_louisiana',
+                                         'col_a_maine',
+                                         'col_a_maryland',
+                                         'col_a_massachusetts',
+                                         'col_a_michigan',
+                                         'col_a_minnesota',
+                                         'col_a_mississippi',
+                                         'col_a_missouri',
+                                         'col_a_montana',
+                                         'col_a_nebraska',
+                                         'col_a_nevada',
+                                         'col_a_new_hampshire',
+                                         'col_a_new_jersey',
+                                         'col_a_new_mexico',
+                                         'col_a_new_york',
+                                         'col_a_north_carolina',
+                                         'col_a_north_dakota',
+                                         'col_a_ohio',
+                                         'col_a_oklahoma',
+                                         'col_a_oregon',
+                                         'col_a_pennsylvania',
+                                         'col_a_rhode_island',
+                                         'col_a_south_carolina',
+                                         'col_a_south_dakota',
+                                         'col_a_tennessee',
+                                         'col_a_texas',
+                                         'col_a_utah',
+                                         'col_a_vermont',
+                                         'col_a_virginia',
+                                         'col_a_washington',
+                                         'col_a_west_virginia',
+                                         'col_a_wisconsin',
+                                         'col_a_wyoming',
+                                         'col_a_puerto_rico',
+                                         'col_a_guam',
+                                         'col_a_virgin_islands',
+                                         'col_a_totals',
+                                         'col_b_federal_funds',
+                                         'col_b_individual_contribution_total',
+                                         'col_b_political_party_committees_receipts',
+                                         'col_b_other_political_committees_pacs',
+                                         'col_b_the_candidate',
+                                         'col_b_total_contributions_other_than_loans',
+                                         'col_b_transfers_from_aff_other_party_cmttees',
+                                         'col_b_received_from_or_guaranteed_by_cand',
+                                         'col_b_other_loans',
+                                         'col_b_total_loans',
+                                         'col_b_operating',
+                                         'col_b_fundraising',
+                                         'col_b_legal_and_accounting',
+                                         'col_b_total_offsets_to_operating_expenditures',
+                                         'col_b_other_receipts',
+                                         'col_b_total_receipts',
+                                         'col_b_operating_expenditures',
+                                         'col_b_transfers_to_other_authorized_committees',
+                                         'col_b_fundraising_disbursements',
+                                         'col_b_exempt_legal_accounting_disbursement',
+                                         'col_b_made_or_guaranteed_by_the_candidate',
+                                         'col_b_other_repayments',
+                                         'col_b_total_loan_repayments_made',
+                                         'col_b_individuals',
+                                         'col_b_political_party_committees_refunds',
+                                         'col_b_other_political_committees',
+                                         'col_b_total_contributions_refunds',
+                                         'col_b_other_disbursements',
+                                         'col_b_total_disbursements',
+                                         'col_b_alabama',
+                                         'col_b_alaska',
+                                         'col_b_arizona',
+                                         'col_b_arkansas',
+                                         'col_b_california',
+                                         'col_b_colorado',
+                                         'col_b_connecticut',
+                                         'col_b_delaware',
+                                         'col_b_dist_of_columbia',
+                                         'col_b_florida',
+                                         'col_b_georgia',
+                                         'col_b_hawaii',
+                                         'col_b_idaho',
+                                         'col_b_illinois',
+                                         'col_b_indiana',
+                                         'col_b_iowa',
+                                         'col_b_kansas',
+                                         'col_b_kentucky',
+                                         'col_b_louisiana',
+                                         'col_b_maine',
+                                         'col_b_maryland',
+                                         'col_b_massachusetts',
+                                         'col_b_michigan',
+                                         'col_b_minnesota',
+                                         'col_b_mississippi',
+                                         'col_b_missouri',
+                                         'col_b_montana',
+                                         'col_b_nebraska',
+                                         'col_b_nevada',
+                                         'col_b_new_hampshire',
+                                         'col_b_new_jersey',
+                                         'col_b_new_mexico',
+                                         'col_b_new_york',
+                                         'col_b_north_carolina',
+                                         'col_b_north_dakota',
+                                         'col_b_ohio',
+                                         'col_b_oklahoma',
+                                         'col_b_oregon',
+                                         'col_b_pennsylvania',
+                                         'col_b_rhode_island',
+                                         'col_b_south_carolina',
+                                         'col_b_south_dakota',
+                                         'col_b_tennessee',
+                                         'col_b_texas',
+                                         'col_b_utah',
+                                         'col_b_vermont',
+                                         'col_b_virginia',
+                                         'col_b_washington',
+                                         'col_b_west_virginia',
+                                         'col_b_wisconsin',
+                                         'col_b_wyoming',
+                                         'col_b_puerto_rico',
+                                         'col_b_guam',
+                                         'col_b_virgin_islands',
+                                         'col_b_totals',
+                                         'treasurer_name',
+                                         'date_signed'],
+                            '^(5.1|5.0|3|2|1)': ['form_type',
+                                                 'filer_committee_id_number',
+                                                 'committee_name',
+                                                 'street_1',
+                                                 'street_2',
+                                                 'city',
+                                                 'state',
+                                                 'zip_code',
+                                                 'change_of_address',
+                                                 'activity_primary',
+                                                 'activity_general',
+                                                 'report_code',
+                                                 'election_code',
+                                                 'date_of_election',
+                                                 'state_of_election',
+                                                 'coverage_from_date',
+                                                 'coverage_through_date',
+                                                 'col_a_cash_on_hand_beginning_period',
+                                                 'col_a_total_receipts',
+                                                 'col_a_subtotal',
+                                                 'col_a_total_disbursements',
+                                                 'col_a_cash_on_hand_close_of_period',
+                                                 'col_a_debts_to',
+                                                 'col_a_debts_by',
+                                                 'col_a_expenditures_subject_to_limits',
+                                                 'col_a_net_contributions',
+                                                 'col_a_net_operating_expenditures',
+                                                 'col_a_federal_funds',
+                                                 'col_a_individual_contribution_total',
+                                                 'col_a_political_party_committees_receipts',
+                                                 'col_a_other_political_committees_pacs',
+                                                 'col_a_the_candidate',
+                                                 'col_a_total_contributions',
+                                                 'col_a_transfers_from_aff_other_party_cmttees',
+                                                 'col_a_received_from_or_guaranteed_by_cand',
+                                                 'col_a_other_loans',
+                                                 'col_a_total_loans',
+                                                 'col_a_operating',
+                                                 'col_a_fundraising',
+                                                 'col_a_legal_and_accounting',
+                                                 'col_a_total_offsets_to_expenditures',
+                                                 'col_a_other_receipts',
+                                                 'col_a_total_receipts',
+                                                 'col_a_operating_expenditures',
+                                                 'col_a_transfers_to_other_authorized_committees',
+                                                 'col_a_fundraising_disbursements',
+                                                 'col_a_exempt_legal_accounting_disbursement',
+                                                 'col_a_made_or_guaranteed_by_candidate',
+                                                 'col_a_other_repayments',
+                                                 'col_a_total_loan_repayments_made',
+                                                 'col_a_individuals',
+                                                 'col_a_political_party_committees_refunds',
+                                                 'col_a_other_political_committees',
+                                                 'col_a_total_contributions_refunds',
+                                                 'col_a_other_disbursements',
+                                                 'col_a_total_disbursements',
+                                                 'col_a_items_on_hand_to_be_liquidated',
+                                                 'col_a_alabama',
+                                                 'col_a_alaska',
+                                                 'col_a_arizona',
+                                                 'col_a_arkansas',
+                                                 'col_a_california',
+                                                 'col_a_colorado',
+                                                 'col_a_connecticut',
+                                                 'col_a_delaware',
+                                                 'col_a_dist_of_columbia',
+                                                 'col_a_florida',
+                                                 'col_a_georgia',
+                                                 'col_a_hawaii',
+                                                 'col_a_idaho',
+                                                 'col_a_illinois',
+                                                 'col_a_indiana',
+                                                 'col_a_iowa',
+                                                 'col_a_kansas',
+                                                 'col_a_kentucky',
+                                                 'col_a_louisiana',
+                                                 'col_a_maine',
+                                                 'col_a_maryland',
+                                                 'col_a_massachusetts',
+                                                 'col_a_michigan',
+                                                 'col_a_minnesota',
+                                                 'col_a_mississippi',
+                                                 'col_a_missouri',
+                                                 'col_a_montana',
+                                                 'col_a_nebraska',
+                                                 'col_a_nevada',
+                                                 'col_a_new_hampshire',
+                                                 'col_a_new_jersey',
+                                                 'col_a_new_mexico',
+                                                 'col_a_new_york',
+                                                 'col_a_north_carolina',
+                                                 'col_a_north_dakota',
+                                                 'col_a_ohio',
+                                                 'col_a_oklahoma',
+                                                 'col_a_oregon',
+                                                 'col_a_pennsylvania',
+                                                 'col_a_rhode_island',
+                                                 'col_a_south_carolina',
+                                                 'col_a_south_dakota',
+                                                 'col_a_tennessee',
+                                                 'col_a_texas',
+                                                 'col_a_utah',
+                                                 'col_a_vermont',
+                                                 'col_a_virginia',
+                                                 'col_a_washington',
+                                                 'col_a_west_virginia',
+                                                 'col_a_wisconsin',
+                                                 'col_a_wyoming',
+                                                 'col_a_puerto_rico',
+                                                 'col_a_guam',
+                                                 'col_a_virgin_islands',
+                                                 'col_a_totals',
+                                                 'col_b_federal_funds',
+                                                 'col_b_individual_contribution_total',
+                                                 'col_b_political_party_committees_receipts',
+                                                 'col_b_other_political_committees_pacs',
+                                                 'col_b_the_candidate',
+                                                 'col_b_total_contributions_other_than_loans',
+                                                 'col_b_transfers_from_aff_other_party_cmttees',
+                                                 'col_b_received_from_or_guaranteed_by_cand',
+                                                 'col_b_other_loans',
+                                                 'col_b_total_loans',
+                                                 'col_b_operating',
+                                                 'col_b_fundraising',
+                                                 'col_b_legal_and_accounting',
+                                                 'col_b_total_offsets_to_operating_expenditures',
+                                                 'col_b_other_receipts',
+                                                 'col_b_total_receipts',
+                                                 'col_b_operating_expenditures',
+                                                 'col_b_transfers_to_other_authorized_committees',
+                                                 'col_b_fundraising_disbursements',
+                                                 'col_b_exempt_legal_accounting_disbursement',
+                                                 'col_b_made_or_guaranteed_by_the_candidate',
+                                                 'col_b_other_repayments',
+                                                 'col_b_total_loan_repayments_made',
+                                                 'col_b_individuals',
+                                                 'col_b_political_party_committees_refunds',
+                                                 'col_b_other_political_committees',
+                                                 'col_b_total_contributions_refunds',
+                                                 'col_b_other_disbursements',
+                                                 'col_b_total_disbursements',
+                                                 'col_b_alabama',
+                                                 'col_b_alaska',
+                                                 'col_b_arizona',
+                                                 'col_b_arkansas',
+                                                 'col_b_california',
+                                                 'col_b_colorado',
+                                                 'col_b_connecticut',
+                                                 'col_b_delaware',
+                                                 'col_b_dist_of_columbia',
+                                                 'col_b_florida',
+                                                 'col_b_georgia',
+                                                 'col_b_hawaii',
+                                                 'col_b_idaho',
+                                                 'col_b_illinois',
+                                                 'col_b_indiana',
+                                                 'col_b_iowa',
+                                                 'col_b_kansas',
+                                                 'col_b_kentucky',
+                                                 'col_b_louisiana',
+                                                 'col_b_maine',
+                                                 'col_b_maryland',
+                                                 'col_b_massachusetts',
+                                                 'col_b_michigan',
+                                                 'col_b_minnesota',
+                                                 'col_b_mississippi',
+                                                 'col_b_missouri',
+                                                 'col_b_montana',
+                                                 'col_b_nebraska',
+                                                 'col_b_nevada',
+                                                 'col_b_new_hampshire',
+                                                 'col_b_new_jersey',
+                                                 'col_b_new_mexico',
+                                                 'col_b_new_york',
+                                                 'col_b_north_carolina',
+                                                 'col_b_north_dakota',
+                                                 'col_b_ohio',
+                                                 'col_b_oklahoma',
+                                                 'col_b_oregon',
+                                                 'col_b_pennsylvania',
+                                                 'col_b_rhode_island',
+                                                 'col_b_south_carolina',
+                                                 'col_b_south_dakota',
+                                                 'col_b_tennessee',
+                                                 'col_b_texas',
+                                                 'col_b_utah',
+                                                 'col_b_vermont',
+                                                 'col_b_virginia',
+                                                 'col_b_washington',
+                                                 'col_b_west_virginia',
+                                                 'col_b_wisconsin',
+                                                 'col_b_wyoming',
+                                                 'col_b_puerto_rico',
+                                                 'col_b_guam',
+                                                 'col_b_virgin_islands',
+                                                 'col_b_totals',
+                                                 'treasurer_name',
+                                                 'date_signed']},
+ '^f3p31': {'^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                             'filer_committee_id_number',
+                                                             'transaction_id_number',
+                                                             'entity_type',
+                                                             'contributor_organization_name',
+                                                             'contributor_last_name',
+                                                             'contributor_first_name',
+                                                             'contributor_middle_name',
+                                                             'contributor_prefix',
+                                                             'contributor_suffix',
+                                                             'contributor_street_1',
+                                                             'contributor_street_2',
+                                                             'contributor_city',
+                                                             'contributor_state',
+                                                             'contributor_zip_code',
+                                                             'election_code',
+                                                             'item_description',
+                                                             'item_contribution_aquired_date',
+                                                             'item_fair_market_value',
+                                                             'contributor_employer',
+                                                             'contributor_occupation',
+                                                             'memo_code',
+                                                             'memo_text_description'],
+            '^5.3': ['form_type',
+                     'filer_committee_id_number',
+                     'entity_type',
+                     'contributor_name',
+                     'contributor_street_1',
+                     'contributor_street_2',
+                     'contributor_city',
+                     'contributor_state',
+                     'contributor_zip_code',
+                     'election_code',
+                     'contributor_employer',
+                     'contributor_occupation',
+                     'item_contribution_aquired_date',
+                     'item_fair_market_value',
+                     'transaction_code',
+                     'transaction_description',
+                     'fec_committee_id_number',
+                     'fec_candidate_id_number',
+                     'candidate_name',
+                     'candidate_office',
+                     'candidate_state',
+                     'candidate_district',
+                     'conduit_name',
+                     'conduit_street_1',
+                     'conduit_street_2',
+                     'conduit_city',
+                     'conduit_state',
+                     'conduit_zip_code',
+                     'memo_code',
+                     'memo_text_description',
+                     '',
+                     'transaction_id_number'],
+            '^5.2|5.1|5.0|^3': ['form_type',
+                                'filer_committee_id_number',
+                                'entity_type',
+                                'contributor_name',
+                                'contributor_street_1',
+                                'contributor_street_2',
+                                'contributor_city',
+                                'contributor_state',
+                                'contributor_zip_code',
+                                'election_code',
+                                'contributor_employer',
+                                'contributor_occupation',
+                                'item_contribution_aquired_date',
+                                'item_fair_market_value',
+                                'transaction_code',
+                                'transaction_description',
+                                'fec_committee_id_number',
+                                'fec_candidate_id_number',
+                                'candidate_name',
+                                'candidate_office',
+                                'candidate_state',
+                                'candidate_district',
+                                'conduit_name',
+                                'conduit_street_1',
+                                'conduit_street_2',
+                                'conduit_city',
+                                'conduit_state',
+                                'conduit_zip_code',
+                                'memo_code',
+                                'memo_text_description',
+                                '',
+                                'transaction_id_number']},
+ '^f3ps': {'^8.5|8.4|8.3|8.2|8.1|8.0|7.0': ['form_type',
+                                            'filer_committee_id_number',
+                                            'date_general_election',
+                                            'date_day_after_general_election',
+                                            'net_contributions',
+                                            'net_expenditures',
+                                            'federal_funds',
+                                            'a_i_individuals_itemized',
+                                            'a_ii_individuals_unitemized',
+                                            'a_iii_individual_contribution_total',
+                                            'b_political_party_committees',
+                                            'c_other_political_committees_pacs',
+                                            'd_the_candidate',
+                                            'e_total_contributions_other_than_loans',
+                                            'transfers_from_aff_other_party_committees',
+                                            'a_received_from_or_guaranteed_by_candidate',
+                                            'b_other_loans',
+                                            'c_total_loans',
+                                            'a_operating',
+                                            'b_fundraising',
+                                            'c_legal_and_accounting',
+                                            'd_total_offsets_to_operating_expenditures',
+                                            'other_receipts',
+                                            'total_receipts',
+                                            'operating_expenditures',
+                                            'transfers_to_other_authorized_committees',
+                                            'fundraising_disbursements',
+                                            'exempt_legal_and_accounting_disbursements',
+                                            'a_made_or_guaranteed_by_the_candidate',
+                                            'b_other_repayments',
+                                            'c_total_loan_repayments_made',
+                                            'a_individuals',
+                                            'b_political_party_committees',
+                                            'c_other_political_committees',
+                                            'd_total_contributions_refunds',
+                                            'other_disbursements',
+                                            'total_disbursements',
+                                            'alabama',
+                                            'alaska',
+                                            'arizona',
+                                            'arkansas',
+                                            'california',
+                                            'colorado',
+                                            'connecticut',
+                                            'delaware',
+                                            'dist_of_columbia',
+                                            'florida',
+                                            'georgia',
+                                            'hawaii',
+                                            'idaho',
+                                            'illinois',
+                                            'indiana',
+                                            'iowa',
+                                            'kansas',
+                                            'kentucky',
+                                            'louisiana',
+                                            'maine',
+                                            'maryland',
+                                            'massachusetts',
+                                            'michigan',
+                                            'minnesota',
+                                            'mississippi',
+                                            'missouri',
+                                            'montana',
+                                            'nebraska',
+                                            'nevada',
+                                            'new_hampshire',
+                                            'new_jersey',
+                                            'new_mexico',
+                                            'new_york',
+                                            'north_carolina',
+                                            'north_dakota',
+                                            'ohio',
+                                            'oklahoma',
+                                            'oregon',
+                                            'pennsylvania',
+                                            'rhode_island',
+                                            'south_carolina',
+                                            'south_dakota',
+                                            'tennessee',
+                                            'texas',
+                                            'utah',
+                                            'vermont',
+                                            'virginia',
+                                            'washington',
+                                            'west_virginia',
+                                            'wisconsin',
+                                            'wyoming',
+                                            'puerto_rico',
+                                            'guam',
+                                            'virgin_islands',
+                                            'totals'],
+           '^6.4|6.3|6.2|6.1': ['form_type',
+                                'filer_committee_id_number',
+                                'date_general_election',
+                                'date_day_after_general_election',
+                                'net_contributions',
+                                'net_expenditures',
+                                'federal_funds',
+                                'a_individuals',
+                                'b_political_party_committees',
+                                'c_other_political_committees_pacs',
+                                'd_the_candidate',
+                                'e_total_contributions_other_than_loans',
+                                'transfers_from_aff_other_party_committees',
+                                'a_received_from_or_guaranteed_by_candidate',
+                                'b_other_loans',
+                                'c_total_loans',
+                                'a_operating',
+                                'b_fundraising',
+                                'c_legal_and_accounting',
+                                'd_total_offsets_to_operating_expenditures',
+                                'other_receipts',
+                                'total_receipts',
+                                'operating_expenditures',
+                                'transfers_to_other_authorized_committees',
+                                'fundraising_disbursements',
+                                'exempt_legal_and_accounting_disbursements',
+                                'a_made_or_guaranteed_by_the_candidate',
+                                'b_other_repayments',
+                                'c_total_loan_repayments_made',
+                                'a_individuals',
+                                'b_political_party_committees',
+                                'c_other_political_committees',
+                                'd_total_contributions_refunds',
+                                'other_disbursements',
+                                'total_disbursements',
+                                'alabama',
+                                'alaska',
+                                'arizona',
+                                'arkansas',
+                                'california',
+                                'colorado',
+                                'connecticut',
+                                'delaware',
+                                'dist_of_columbia',
+                                'florida',
+                                'georgia',
+                                'hawaii',
+                                'idaho',
+                                'illinois',
+                                'indiana',
+                                'iowa',
+                                'kansas',
+                                'kentucky',
+                                'louisiana',
+                                'maine',
+                                'maryland',
+                                'massachusetts',
+                                'michigan',
+                                'minnesota',
+                                'mississippi',
+                                'missouri',
+                                'montana',
+                                'nebraska',
+                                'nevada',
+                                'new_hampshire',
+                                'new_jersey',
+                                'new_mexico',
+                                'new_york',
+                                'north_carolina',
+                                'north_dakota',
+                                'ohio',
+                                'oklahoma',
+                                'oregon',
+                                'pennsylvania',
+                                'rhode_island',
+                                'south_carolina',
+                                'south_dakota',
+                                'tennessee',
+                                'texas',
+                                'utah',
+                                'vermont',
+                                'virginia',
+                                'washington',
+                                'west_virginia',
+                                'wisconsin',
+                                'wyoming',
+                                'puerto_rico',
+                                'guam',
+                                'virgin_islands',
+                                'totals'],
+           '^5.3|5.2|5.1|5.0|^3': ['form_type',
+                                   'filer_committee_id_number',
+                                   'net_contributions',
+                                   'net_expenditures',
+                                   'federal_funds',
+                                   'a_individuals',
+                                   'b_political_party_committees',
+                                   'c_other_political_committees_pacs',
+                                   'd_the_candidate',
+                                   'e_total_contributions_other_than_loans',
+                                   'transfers_from_aff_other_party_committees',
+                                   'a_received_from_or_guaranteed_by_candidate',
+                                   'b_other_loans',
+                                   'c_total_loans',
+                                   'a_operating',
+                                   'b_fundraising',
+                                   'c_legal_and_accounting',
+                                   'd_total_offsets_to_operating_expenditures',
+                                   'other_receipts',
+                                   'total_receipts',
+                                   'operating_expenditures',
+                                   'transfers_to_other_authorized_committees',
+                                   'fundraising_disbursements',
+                                   'exempt_legal_and_accounting_disbursements',
+                                   'a_made_or_guaranteed_by_the_candidate',
+                                   'b_other_repayments',
+                                   'c_total_loan_repayments_made',
+                                   'a_individuals',
+                                   'b_political_party_committees',
+                                   'c_other_political_committees',
+                                   'd_total_contributions_refunds',
+                                   'other_disbursements',
+                                   'total_disbursements',
+                                   'alabama',
+                                   'alaska',
+                                   'arizona',
+                                   'arkansas',
+                                   'california',
+                                   'colorado',
+                                   'connecticut',
+                                   'delaware',
+                                   'dist_of_columbia',
+                                   'florida',
+                                   'georgia',
+                                   'hawaii',
+                                   'idaho',
+                                   'illinois',
+                                   'indiana',
+                                   'iowa',
+                                   'kansas',
+                                   'kentucky',
+                                   'louisiana',
+                                   'maine',
+                                   'maryland',
+                                   'massachusetts',
+                                   'michigan',
+                                   'minnesota',
+                                   'mississippi',
+                                   'missouri',
+                                   'montana',
+                                   'nebraska',
+                                   'nevada',
+                                   'new_hampshire',
+                                   'new_jersey',
+                                   'new_mexico',
+                                   'new_york',
+                                   'north_carolina',
+                                   'north_dakota',
+                                   'ohio',
+                                   'oklahoma',
+                                   'oregon',
+                                   'pennsylvania',
+                                   'rhode_island',
+                                   'south_carolina',
+                                   'south_dakota',
+                                   'tennessee',
+                                   'texas',
+                                   'utah',
+                                   'vermont',
+                                   'virginia',
+                                   'washington',
+                                   'west_virginia',
+                                   'wisconsin',
+                                   'wyoming',
+                                   'puerto_rico',
+                                   'guam',
+                                   'virgin_islands',
+                                   'totals',
+                                   'date_general_election',
+                                   'date_day_after_general_election']},
+ '(^f3pz1)': {'^8.4|8.3|8.2': ['form_type',
+                               'filer_committee_id_number',
+                               'principal_committee_name',
+                               'coverage_from_date',
+                               'coverage_through_date',
+                               'authorized_committee_id_number',
+                               'authorized_committee_name',
+                               'col_a_cash_beginning_reporting_period',
+                               'col_a_cash_on_hand_close',
+                               'col_a_debts_to',
+                               'col_a_debts_by',
+                               'col_a_expenditures_subject_to_limits',
+                               'col_a_net_contributions',
+                               'col_a_net_operating_expenditures',
+                               'col_a_federal_funds',
+                               'col_a_individual_contributions',
+                               'col_a_political_party_contributions',
+                               'col_a_pac_contributions',
+                               'col_a_candidate_contributions',
+                               'col_a_total_contributions',
+                               'col_a_transfers_from_authorized',
+                               'col_a_candidate_loans',
+                               'col_a_other_loans',
+                               'col_a_total_loans',
+                               'col_a_offset_to_operating_expenditures',
+                               'col_a_offset_to_fundraising_expenditures',
+                               'col_a_offset_to_legal_expenditures',
+                               'col_a_total_offset',
+                               'col_a_other_receipts',
+                               'col_a_total_receipts',
+                               'col_a_operating_expenditures',
+                               'col_a_transfers_to_authorized',
+                               'col_a_fundraising_disbursements',
+                               'col_a_exempt_legal_disbursements',
+                               'col_a_loan_repayments_by_candidate',
+                               'col_a_loan_repayments_other',
+                               'col_a_loan_repayments_total',
+                               'col_a_refunds_individuals',
+                               'col_a_refunds_parties',
+                               'col_a_refunds_pacs',
+                               'col_a_refunds_total',
+                               'col_a_other_disbursements',
+                               'col_a_total_disbursements',
+                               'col_a_items_on_hand_to_be_liquidated']},
+ '(^f3pz2)': {'^8.4|8.3|8.2': ['form_type',
+                               'filer_committee_id_number',
+                               'principal_committee_name',
+                               'coverage_from_date',
+                               'coverage_through_date',
+                               'col_a_cash_beginning_reporting_period',
+                               'col_a_cash_on_hand_close',
+                               'col_a_debts_to',
+                               'col_a_debts_by',
+                               'col_a_expenditures_subject_to_limits',
+                               'col_a_net_contributions',
+                               'col_a_net_operating_expenditures',
+                               'col_a_federal_funds',
+                               'col_a_individual_contributions',
+                               'col_a_political_party_contributions',
+                               'col_a_pac_contributions',
+                               'col_a_candidate_contributions',
+                               'col_a_total_contributions',
+                               'col_a_transfers_from_authorized',
+                               'col_a_candidate_loans',
+                               'col_a_other_loans',
+                               'col_a_total_loans',
+                               'col_a_offset_to_operating_expenditures',
+                               'col_a_offset_to_fundraising_expenditures',
+                               'col_a_offset_to_legal_expenditures',
+                               'col_a_total_offset',
+                               'col_a_other_receipts',
+                               'col_a_total_receipts',
+                               'col_a_operating_expenditures',
+                               'col_a_transfers_to_authorized',
+                               'col_a_fundraising_disbursements',
+                               'col_a_exempt_legal_disbursements',
+                               'col_a_loan_repayments_by_candidate',
+                               'col_a_loan_repayments_other',
+                               'col_a_loan_repayments_total',
+                               'col_a_refunds_individuals',
+                               'col_a_refunds_parties',
+                               'col_a_refunds_pacs',
+                               'col_a_refunds_total',
+                               'col_a_other_disbursements',
+                               'col_a_total_disbursements',
+                               'col_a_items_on_hand_to_be_liquidated']},
+ '^f3s': {'^P3|^P2': ['form_type',
+                      'filer_committee_id_number',
+                      'date_general_election',
+                      'date_day_after_general_election',
+                      'a_i_individuals_itemized',
+                      'a_ii_individuals_unitemized',
+                      'a_iii_individuals_total',
+                      'b_political_party_committees',
+                      'c_all_other_political_committees_pacs',
+                      'd_the_candidate',
+                      'e_total_contributions',
+                      'transfers_from_other_auth_committees',
+                      'a_loans_made_or_guarn_by_the_candidate',
+                      'b_all_other_loans',
+                      'c_total_loans',
+                      'offsets_to_operating_expenditures',
+                      'other_receipts',
+                      'total_receipts',
+                      'operating_expenditures',
+                      'transfers_to_other_auth_committees',
+                      'a_loan_repayment_by_candidate',
+                      'b_loan_repayments_all_other_loans',
+                      'c_total_loan_repayments',
+                      'a_refund_individuals_other_than_pol_cmtes',
+                      'b_refund_political_party_committees',
+                      'c_refund_other_political_committees',
+                      'd_total_contributions_refunds',
+                      'other_disbursements',
+                      'total_disbursements',
+                      'a_total_contributions_no_loans',
+                      'c_net_operating_expenditures',
+                      'beginning_image_number'],
+          '^P1': ['form_type',
+                  'filer_committee_id_number',
+                  'date_general_election',
+                  'date_day_after_general_election',
+                  'a_iii_individuals_total',
+                  'b_political_party_committees',
+                  'c_all_other_political_committees_pacs',
+                  'd_the_candidate',
+                  'e_total_contributions',
+                  'transfers_from_other_auth_committees',
+                  'a_loans_made_or_guarn_by_the_candidate',
+                  'b_all_other_loans',
+                  'c_total_loans',
+                  'offsets_to_operating_expenditures',
+                  'other_receipts',
+                  'total_receipts',
+                  'operating_expenditures',
+                  'transfers_to_other_auth_committees',
+                  'a_loan_repayment_by_candidate',
+                  'b_loan_repayments_all_other_loans',
+                  'c_total_loan_repayments',
+                  'a_refund_individuals_other_than_pol_cmtes',
+                  'b_refund_political_party_committees',
+                  'c_refund_other_political_committees',
+                  'd_total_contributions_refunds',
+                  'other_disbursements',
+                  'total_disbursements',
+                  'beginning_image_number'],
+          '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                           'filer_committee_id_number',
+                                                           'date_general_election',
+                                                           'date_day_after_general_election',
+                                                           'a_total_contributions_no_loans',
+                                                           'b_total_contribution_refunds',
+                                                           'c_net_contributions',
+                                                           'a_total_operating_expenditures',
+                                                           'b_total_offsets_to_operating_expenditures',
+                                                           'c_net_operating_expenditures',
+                                                           'a_i_individuals_itemized',
+                                                           'a_ii_individuals_unitemized',
+                                                           'a_iii_individuals_total',
+                                                           'b_political_party_committees',
+                                                           'c_all_other_political_committees_pacs',
+                                                           'd_the_candidate',
+                                                           'e_total_contributions',
+                                                           'transfers_from_other_auth_committees',
+                                                           'a_loans_made_or_guarn_by_the_candidate',
+                                                           'b_all_other_loans',
+                                                           'c_total_loans',
+                                                           'offsets_to_operating_expenditures',
+                                                           'other_receipts',
+                                                           'total_receipts',
+                                                           'operating_expenditures',
+                                                           'transfers_to_other_auth_committees',
+                                                           'a_loan_repayment_by_candidate',
+                                                           'b_loan_repayments_all_other_loans',
+                                                           'c_total_loan_repayments',
+                                                           'a_refund_individuals_other_than_pol_cmtes',
+                                                           'b_refund_political_party_committees',
+                                                           'c_refund_other_political_committees',
+                                                           'd_total_contributions_refunds',
+                                                           'other_disbursements',
+                                                           'total_disbursements'],
+          '^5.3|5.2|5.1|5.0|^3': ['form_type',
+                                  'filer_committee_id_number',
+                                  'a_total_contributions_no_loans',
+                                  'b_total_contribution_refunds',
+                                  'c_net_contributions',
+                                  'a_total_operating_expenditures',
+                                  'b_total_offsets_to_operating_expenditures',
+                                  'c_net_operating_expenditures',
+                                  'a_i_individuals_itemized',
+                                  'a_ii_individuals_unitemized',
+                                  'a_iii_individuals_total',
+                                  'b_political_party_committees',
+                                  'c_all_other_political_committees_pacs',
+                                  'd_the_candidate',
+                                  'e_total_contributions',
+                                  'transfers_from_other_auth_committees',
+                                  'a_loans_made_or_guarn_by_the_candidate',
+                                  'b_all_other_loans',
+                                  'c_total_loans',
+                                  'offsets_to_operating_expenditures',
+                                  'other_receipts',
+                                  'total_receipts',
+                                  'operating_expenditures',
+                                  'transfers_to_other_auth_committees',
+                                  'a_loan_repayment_by_candidate',
+                                  '',
+                                  'c_total_loan_repayments',
+                                  'a_refund_individuals_other_than_pol_cmtes',
+                                  '',
+                                  '',
+                                  'd_total_contributions_refunds',
+                                  'other_disbursements',
+                                  'total_disbursements',
+                                  'date_general_election',
+                                  'date_day_after_general_election']},
+ '(^f3x$)|(^f3x[ant])': {'^P3.2|^P3.3|^P3.4': ['form_type',
+                                               'filer_committee_id_number',
+                                               'committee_name',
+                                               'change_of_address',
+                                               'street_1',
+                                               'street_2',
+                                               'city',
+                                               'state',
+                                               'zip_code',
+                                               'report_code',
+                                               'date_of_election',
+                                               'state_of_election',
+                                               'coverage_from_date',
+                                               'coverage_through_date',
+                                               'treasurer_last_name',
+                                               'treasurer_first_name',
+                                               'treasurer_middle_name',
+                                               'treasurer_prefix',
+                                               'treasurer_suffix',
+                                               'date_signed',
+                                               'col_a_cash_on_hand_beginning_period',
+                                               'col_a_total_receipts',
+                                               'col_a_subtotal',
+                                               'col_a_total_disbursements',
+                                               'col_a_cash_on_hand_close_of_period',
+                                               'col_a_debts_to',
+                                               'col_a_debts_by',
+                                               'qualified_committee',
+                                               'col_a_individuals_itemized',
+                                               'col_a_individuals_unitemized',
+                                               'col_a_individual_contribution_total',
+                                               'col_a_political_party_committees',
+                                               'col_a_other_political_committees_pacs',
+                                               'col_a_total_contributions',
+                                               'col_a_transfers_from_aff_other_party_cmttees',
+                                               'col_a_total_loans',
+                                               'col_a_total_loan_repayments_received',
+                                               'col_a_offsets_to_expenditures',
+                                               'col_a_federal_refunds',
+                                               'col_a_other_federal_receipts',
+                                               'col_a_transfers_from_nonfederal_h3',
+                                               'col_a_levin_funds',
+                                               'col_a_total_nonfederal_transfers',
+                                               'col_a_total_receipts',
+                                               'col_a_total_federal_receipts',
+                                               'col_a_shared_operating_expenditures_federal',
+                                               'col_a_shared_operating_expenditures_nonfederal',
+                                               'col_a_other_federal_operating_expenditures',
+                                               'col_a_total_operating_expenditures',
+                                               'col_a_transfers_to_affiliated',
+                                               'col_a_contributions_to_candidates',
+                                               'col_a_independent_expenditures',
+                                               'col_a_coordinated_expenditures_by_party_committees',
+                                               'col_a_total_loan_repayments_made',
+                                               'col_a_loans_made',
+                                               'col_a_refunds_to_individuals',
+                                               'col_a_refunds_to_party_committees',
+                                               'col_a_refunds_to_other_committees',
+                                               'col_a_total_refunds',
+                                               'col_a_other_disbursements',
+                                               'col_a_federal_election_activity_federal_share',
+                                               'col_a_federal_election_activity_levin_share',
+                                               'col_a_federal_election_activity_all_federal',
+                                               'col_a_federal_election_activity_total',
+                                               'col_a_total_disbursements',
+                                               'col_a_total_federal_disbursements',
+                                               'col_a_total_contributions',
+                                               'col_a_total_contributions_refunds',
+                                               'col_a_net_contributions',
+                                               'col_a_total_federal_operating_expenditures',
+                                               'col_a_total_offsets_to_expenditures',
+                                               'col_a_net_operating_expenditures',
+                                               'col_b_cash_on_hand_jan_1',
+                                               'col_b_year',
+                                               'col_b_total_receipts',
+                                               'col_b_subtotal',
+                                               'col_b_total_disbursements',
+                                               'col_b_cash_on_hand_close_of_period',
+                                               'col_b_individuals_itemized',
+                                               'col_b_individuals_unitemized',
+                                               'col_b_individual_contribution_total',
+                                               'col_b_political_party_committees',
+                                               'col_b_other_political_committees_pacs',
+                                               'col_b_total_contributions',
+                                               'col_b_transfers_from_aff_other_party_cmttees',
+                                               'col_b_total_loans',
+                                               'col_b_total_loan_repayments_received',
+                                               'col_b_offsets_to_expenditures',
+                                               'col_b_federal_refunds',
+                                               'col_b_other_federal_receipts',
+                                               'col_b_transfers_from_nonfederal_h3',
+                                               'col_b_levin_funds',
+                                               'col_b_total_nonfederal_transfers',
+                                               'col_b_total_receipts',
+                                               'col_b_total_federal_receipts',
+                                               'col_b_shared_operating_expenditures_federal',
+                                               'col_b_shared_operating_expenditures_nonfederal',
+                                               'col_b_other_federal_operating_expenditures',
+                                               'col_b_total_operating_expenditures',
+                                               'col_b_transfers_to_affiliated',
+                                               'col_b_contributions_to_candidates',
+                                               'col_b_independent_expenditures',
+                                               'col_b_coordinated_expenditures_by_party_committees',
+                                               'col_b_total_loan_repayments_made',
+                                               'col_b_loans_made',
+                                               'col_b_refunds_to_individuals',
+                                               'col_b_refunds_to_party_committees',
+                                               'col_b_refunds_to_other_committees',
+                                               'col_b_total_refunds',
+                                               'col_b_other_disbursements',
+                                               'col_b_federal_election_activity_federal_share',
+                                               'col_b_federal_election_activity_levin_share',
+                                               'col_b_federal_election_activity_all_federal',
+                                               'col_b_federal_election_activity_total',
+                                               'col_b_total_disbursements',
+                                               'col_b_total_federal_disbursements',
+                                               'col_b_total_contributions',
+                                               'col_b_total_contributions_refunds',
+                                               'col_b_net_contributions',
+                                               'col_b_total_federal_operating_expenditures',
+                                               'col_b_total_offsets_to_expenditures',
+                                               'col_b_net_operating_expenditures',
+                                               'beginning_image_number',
+                                               'end_image_number',
+                                               'receipt_date'],
+                         '^P1|^P2|^P3.0|^P3.1': ['form_type',
+                                                 'filer_committee_id_number',
+                                                 'committee_name',
+                                                 'change_of_address',
+                                                 'street_1',
+                                                 'street_2',
+                                                 'city',
+                                                 'state',
+                                                 'zip_code',
+                                                 'report_code',
+                                                 'date_of_election',
+                                                 'state_of_election',
+                                                 'coverage_from_date',
+                                                 'coverage_through_date',
+                                                 'treasurer_last_name',
+                                                 'treasurer_first_name',
+                                                 'treasurer_middle_name',
+                                                 'treasurer_prefix',
+                                                 'treasurer_suffix',
+                                                 'date_signed',
+                                                 'col_a_cash_on_hand_beginning_period',
+                                                 'col_a_total_receipts',
+                                                 'col_a_subtotal',
+                                                 'col_a_total_disbursements',
+                                                 'col_a_cash_on_hand_close_of_period',
+                                                 'col_a_debts_to',
+                                                 'col_a_debts_by',
+                                                 'qualified_committee',
+                                                 'col_a_individuals_itemized',
+                                                 'col_a_individuals_unitemized',
+                                                 'col_a_individual_contribution_total',
+                                                 'col_a_political_party_committees',
+                                                 'col_a_other_political_committees_pacs',
+                                                 'col_a_total_contributions',
+                                                 'col_a_transfers_from_aff_other_party_cmttees',
+                                                 'col_a_total_loans',
+                                                 'col_a_total_loan_repayments_received',
+                                                 'col_a_offsets_to_expenditures',
+                                                 'col_a_federal_refunds',
+                                                 'col_a_other_federal_receipts',
+                                                 'col_a_transfers_from_nonfederal_h3',
+                                                 'col_a_levin_funds',
+                                                 'col_a_total_nonfederal_transfers',
+                                                 'col_a_total_receipts',
+                                                 'col_a_total_federal_receipts',
+                                                 'col_a_shared_operating_expenditures_federal',
+                                                 'col_a_shared_operating_expenditures_nonfederal',
+                                                 'col_a_other_federal_operating_expenditures',
+                                                 'col_a_total_operating_expenditures',
+                                                 'col_a_transfers_to_affiliated',
+                                                 'col_a_contributions_to_candidates',
+                                                 'col_a_independent_expenditures',
+                                                 'col_a_coordinated_expenditures_by_party_committees',
+                                                 'col_a_total_loan_repayments_made',
+                                                 'col_a_loans_made',
+                                                 'col_a_refunds_to_individuals',
+                                                 'col_a_refunds_to_party_committees',
+                                                 'col_a_refunds_to_other_committees',
+                                                 'col_a_total_refunds',
+                                                 'col_a_other_disbursements',
+                                                 'col_a_federal_election_activity_federal_share',
+                                                 'col_a_federal_election_activity_levin_share',
+                                                 'col_a_federal_election_activity_all_federal',
+                                                 'col_a_federal_election_activity_total',
+                                                 'col_a_total_disbursements',
+                                                 'col_a_total_federal_disbursements',
+                                                 'col_a_total_contributions',
+                                                 'col_a_total_contributions_refunds',
+                                                 'col_a_net_contributions',
+                                                 'col_a_total_federal_operating_expenditures',
+                                                 'col_a_total_offsets_to_expenditures',
+                                                 'col_a_net_operating_expenditures',
+                                                 'col_b_cash_on_hand_jan_1',
+                                                 'col_b_year',
+                                                 'col_b_total_receipts',
+                                                 'col_b_subtotal',
+                                                 'col_b_total_disbursements',
+                                                 'col_b_cash_on_hand_close_of_period',
+                                                 'col_b_individuals_itemized',
+                                                 'col_b_individuals_unitemized',
+                                                 'col_b_individual_contribution_total',
+                                                 'col_b_political_party_committees',
+                                                 'col_b_other_political_committees_pacs',
+                                                 'col_b_total_contributions',
+                                                 'col_b_transfers_from_aff_other_party_cmttees',
+                                                 'col_b_total_loans',
+                                                 'col_b_total_loan_repayments_received',
+                                                 'col_b_offsets_to_expenditures',
+                                                 'col_b_federal_refunds',
+                                                 'col_b_other_federal_receipts',
+                                                 'col_b_transfers_from_nonfederal_h3',
+                                                 'col_b_levin_funds',
+                                                 'col_b_total_nonfederal_transfers',
+                                                 'col_b_total_receipts',
+                                                 'col_b_total_federal_receipts',
+                                                 'col_b_shared_operating_expenditures_federal',
+                                                 'col_b_shared_operating_expenditures_nonfederal',
+                                                 'col_b_other_federal_operating_expenditures',
+                                                 'col_b_total_operating_expenditures',
+                                                 'col_b_transfers_to_affiliated',
+                                                 'col_b_contributions_to_candidates',
+                                                 'col_b_independent_expenditures',
+                                                 'col_b_coordinated_expenditures_by_party_committees',
+                                                 'col_b_total_loan_repayments_made',
+                                                 'col_b_loans_made',
+                                                 'col_b_refunds_to_individuals',
+                                                 'col_b_refunds_to_party_committees',
+                                                 'col_b_refunds_to_other_committees',
+                                                 'col_b_total_refunds',
+                                                 'col_b_other_disbursements',
+                                                 'col_b_federal_election_activity_federal_share',
+                                                 'col_b_federal_election_activity_levin_share',
+                                                 'col_b_federal_election_activity_all_federal',
+                                                 'col_b_federal_election_activity_total',
+                                                 'col_b_total_disbursements',
+                                                 'col_b_total_federal_disbursements',
+                                                 'col_b_total_contributions',
+                                                 'col_b_total_contributions_refunds',
+                                                 'col_b_net_contributions',
+                                                 'col_b_total_federal_operating_expenditures',
+                                                 'col_b_total_offsets_to_expenditures',
+                                                 'col_b_net_operating_expenditures',
+                                                 'beginning_image_number'],
+                         '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                                          'filer_committee_id_number',
+                                                                          'committee_name',
+                                                                          'change_of_address',
+                                                                          'street_1',
+                                                                          'street_2',
+                                                                          'city',
+                                                                          'state',
+                                                                          'zip_code',
+                                                                          'report_code',
+                                                                          'election_code',
+                                                                          'date_of_election',
+                                                                          'state_of_election',
+                                                                          'coverage_from_date',
+                                                                          'coverage_through_date',
+                                                                          'qualified_committee',
+                                                                          'treasurer_last_name',
+                                                                          'treasurer_first_name',
+                                                                          'treasurer_middle_name',
+                                                                          'treasurer_prefix',
+                                                                          'treasurer_suffix',
+                                                                          'date_signed',
+                                                                          'col_a_cash_on_hand_beginning_period',
+                                                                          'col_a_total_receipts',
+                                                                          'col_a_subtotal',
+                                                                          'col_a_total_disbursements',
+                                                                          'col_a_cash_on_hand_close_of_period',
+                                                                          'col_a_debts_to',
+                                                                          'col_a_debts_by',
+                                                                          'col_a_individuals_itemized',
+                                                                          'col_a_individuals_unitemized',
+                                                                          'col_a_individual_contribution_total',
+                                                                          'col_a_political_party_committees',
+                                                                          'col_a_other_political_committees_pacs',
+                                                                          'col_a_total_contributions',
+                                                                          'col_a_transfers_from_aff_other_party_cmttees',
+                                                                          'col_a_total_loans',
+                                                                          'col_a_total_loan_repayments_received',
+                                                                          'col_a_offsets_to_expenditures',
+                                                                          'col_a_federal_refunds',
+                                                                          'col_a_other_federal_receipts',
+                                                                          'col_a_transfers_from_nonfederal_h3',
+                                                                          'col_a_levin_funds',
+                                                                          'col_a_total_nonfederal_transfers',
+                                                                          'col_a_total_receipts',
+                                                                          'col_a_total_federal_receipts',
+                                                                          'col_a_shared_operating_expenditures_federal',
+                                                                          'col_a_shared_operating_expenditures_nonfederal',
+                                                                          'col_a_other_federal_operating_expenditures',
+                                                                          'col_a_total_operating_expenditures',
+                                                                          'col_a_transfers_to_affiliated',
+                                                                          'col_a_contributions_to_candidates',
+                                                                          'col_a_independent_expenditures',
+                                                                          'col_a_coordinated_expenditures_by_party_committees',
+                                                                          'col_a_total_loan_repayments_made',
+                                                                          'col_a_loans_made',
+                                                                          'col_a_refunds_to_individuals',
+                                                                          'col_a_refunds_to_party_committees',
+                                                                          'col_a_refunds_to_other_committees',
+                                                                          'col_a_total_refunds',
+                                                                          'col_a_other_disbursements',
+                                                                          'col_a_federal_election_activity_federal_share',
+                                                                          'col_a_federal_election_activity_levin_share',
+                                                                          'col_a_federal_election_activity_all_federal',
+                                                                          'col_a_federal_election_activity_total',
+                                                                          'col_a_total_disbursements',
+                                                                          'col_a_total_federal_disbursements',
+                                                                          'col_a_total_contributions',
+                                                                          'col_a_total_contributions_refunds',
+                                                                          'col_a_net_contributions',
+                                                                          'col_a_total_federal_operating_expenditures',
+                                                                          'col_a_total_offsets_to_expenditures',
+                                                                          'col_a_net_operating_expenditures',
+                                                                          'col_b_cash_on_hand_jan_1',
+                                                                          'col_b_year',
+                                                                          'col_b_total_receipts',
+                                                                          'col_b_subtotal',
+                                                                          'col_b_total_disbursements',
+                                                                          'col_b_cash_on_hand_close_of_period',
+                                                                          'col_b_individuals_itemized',
+                                                                          'col_b_individuals_unitemized',
+                                                                          'col_b_individual_contribution_total',
+                                                                          'col_b_political_party_committees',
+                                                                          'col_b_other_political_committees_pacs',
+                                                                          'col_b_total_contributions',
+                                                                          'col_b_transfers_from_aff_other_party_cmttees',
+                                                                          'col_b_total_loans',
+                                                                          'col_b_total_loan_repayments_received',
+                                                                          'col_b_offsets_to_expenditures',
+                                                                          'col_b_federal_refunds',
+                                                                          'col_b_other_federal_receipts',
+                                                                          'col_b_transfers_from_nonfederal_h3',
+                                                                          'col_b_levin_funds',
+                                                                          'col_b_total_nonfederal_transfers',
+                                                                          'col_b_total_receipts',
+                                                                          'col_b_total_federal_receipts',
+                                                                          'col_b_shared_operating_expenditures_federal',
+                                                                          'col_b_shared_operating_expenditures_nonfederal',
+                                                                          'col_b_other_federal_operating_expenditures',
+                                                                          'col_b_total_operating_expenditures',
+                                                                          'col_b_transfers_to_affiliated',
+                                                                          'col_b_contributions_to_candidates',
+                                                                          'col_b_independent_expenditures',
+                                                                          'col_b_coordinated_expenditures_by_party_committees',
+                                                                          'col_b_total_loan_repayments_made',
+                                                                          'col_b_loans_made',
+                                                                          'col_b_refunds_to_individuals',
+                                                                          'col_b_refunds_to_party_committees',
+                                                                          'col_b_refunds_to_other_committees',
+                                                                          'col_b_total_refunds',
+                                                                          'col_b_other_disbursements',
+                                                                          'col_b_federal_election_activity_federal_share',
+                                                                          'col_b_federal_election_activity_levin_share',
+                                                                          'col_b_federal_election_activity_all_federal',
+                                                                          'col_b_federal_election_activity_total',
+                                                                          'col_b_total_disbursements',
+                                                                          'col_b_total_federal_disbursements',
+                                                                          'col_b_total_contributions',
+                                                                          'col_b_total_contributions_refunds',
+                                                                          'col_b_net_contributions',
+                                                                          'col_b_total_federal_operating_expenditures',
+                                                                          'col_b_total_offsets_to_expenditures',
+                                                                          'col_b_net_operating_expenditures'],
+                         '^5.3|5.2|5.1|5.0': ['form_type',
+                                              'filer_committee_id_number',
+                                              'committee_name',
+                                              'street_1',
+                                              'street_2',
+                                              'city',
+                                              'state',
+                                              'zip_code',
+                                              'change_of_address',
+                                              'qualified_committee',
+                                              'report_code',
+                                              'election_code',
+                                              'date_of_election',
+                                              'state_of_election',
+                                              'coverage_from_date',
+                                              'coverage_through_date',
+                                              'col_a_cash_on_hand_beginning_period',
+                                              'col_a_total_receipts',
+                                              'col_a_subtotal',
+                                              'col_a_total_disbursements',
+                                              'col_a_cash_on_hand_close_of_period',
+                                              'col_a_debts_to',
+                                              'col_a_debts_by',
+                                              'col_a_individuals_itemized',
+                                              'col_a_individuals_unitemized',
+                                              'col_a_individual_contribution_total',
+                                              'col_a_political_party_committees',
+                                              'col_a_other_political_committees_pacs',
+                                              'col_a_total_contributions',
+                                              'col_a_transfers_from_aff_other_party_cmttees',
+                                              'col_a_total_loans',
+                                              'col_a_total_loan_repayments_received',
+                                              'col_a_offsets_to_expenditures',
+                                              'col_a_federal_refunds',
+                                              'col_a_other_federal_receipts',
+                                              'col_a_transfers_from_nonfederal_h3',
+                                              'col_a_total_receipts',
+                                              'col_a_total_federal_receipts',
+                                              'col_a_shared_operating_expenditures_federal',
+                                              'col_a_shared_operating_expenditures_nonfederal',
+                                              'col_a_other_federal_operating_expenditures',
+                                              'col_a_total_operating_expenditures',
+                                              'col_a_transfers_to_affiliated',
+                                              'col_a_contributions_to_candidates',
+                                              'col_a_independent_expenditures',
+                                              'col_a_coordinated_expenditures_by_party_committees',
+                                              'col_a_total_loan_repayments_made',
+                                              'col_a_loans_made',
+                                              'col_a_refunds_to_individuals',
+                                              'col_a_refunds_to_party_committees',
+                                              'col_a_refunds_to_other_committees',
+                                              'col_a_total_refunds',
+                                              'col_a_other_disbursements',
+                                              'col_a_total_disbursements',
+                                              'col_a_total_federal_disbursements',
+                                              'col_a_total_contributions',
+                                              'col_a_total_contributions_refunds',
+                                              'col_a_net_contributions',
+                                              'col_a_total_federal_operating_expenditures',
+                                              'col_a_total_offsets_to_expenditures',
+                                              'col_a_net_operating_expenditures',
+                                              'col_b_cash_on_hand_jan_1',
+                                              'col_b_year',
+                                              'col_b_total_receipts',
+                                              'col_b_subtotal',
+                                              'col_b_total_disbursements',
+                                              'col_b_cash_on_hand_close_of_period',
+                                              'col_b_individuals_itemized',
+                                              'col_b_individuals_unitemized',
+                                              'col_b_individual_contribution_total',
+                                              'col_b_political_party_committees',
+                                              'col_b_other_political_committees_pacs',
+                                              'col_b_total_contributions',
+                                              'col_b_transfers_from_aff_other_party_cmttees',
+                                              'col_b_total_loans',
+                                              'col_b_total_loan_repayments_received',
+                                              'col_b_offsets_to_expenditures',
+                                              'col_b_federal_refunds',
+                                              'col_b_other_federal_receipts',
+                                              'col_b_transfers_from_nonfederal_h3',
+                                              'col_b_total_receipts',
+                                              'col_b_total_federal_receipts',
+                                              'col_b_shared_operating_expenditures_federal',
+                                              'col_b_shared_operating_expenditures_nonfederal',
+                                              'col_b_other_federal_operating_expenditures',
+                                              'col_b_total_operating_expenditures',
+                                              'col_b_transfers_to_affiliated',
+                                              'col_b_contributions_to_candidates',
+                                              'col_b_independent_expenditures',
+                                              'col_b_coordinated_expenditures_by_party_committees',
+                                              'col_b_total_loan_repayments_made',
+                                              'col_b_loans_made',
+                                              'col_b_refunds_to_individuals',
+                                              'col_b_refunds_to_party_committees',
+                                              'col_b_refunds_to_other_committees',
+                                              'col_b_total_refunds',
+                                              'col_b_other_disbursements',
+                                              'col_b_total_disbursements',
+                                              'col_b_total_federal_disbursements',
+                                              'col_b_total_contributions',
+                                              'col_b_total_contributions_refunds',
+                                              'col_b_net_contributions',
+                                              'col_b_total_federal_operating_expenditures',
+                                              'col_b_total_offsets_to_expenditures',
+                                              'col_b_net_operating_expenditures',
+                                              'treasurer_name',
+                                              'date_signed',
+                                              'col_a_levin_funds',
+                                              'col_a_total_nonfederal_transfers',
+                                              'col_a_federal_election_activity_federal_share',
+                                              'col_a_federal_election_activity_levin_share',
+                                              'col_a_federal_election_activity_all_federal',
+                                              'col_a_federal_election_activity_total',
+                                              'col_b_levin_funds',
+                                              'col_b_total_nonfederal_transfers',
+                                              'col_b_federal_election_activity_federal_share',
+                                              'col_b_federal_election_activity_levin_share',
+                                              'col_b_federal_election_activity_all_federal',
+                                              'col_b_federal_election_activity_total'],
+                         '^3|^2|^1': ['form_type',
+                                      'filer_committee_id_number',
+                                      'committee_name',
+                                      'street_1',
+                                      'street_2',
+                                      'city',
+                                      'state',
+                                      'zip_code',
+                                      'change_of_address',
+                                      'qualified_committee',
+                                      'report_code',
+                                      'election_code',
+                                      'date_of_election',
+                                      'state_of_election',
+                                      'coverage_from_date',
+                                      'coverage_through_date',
+                                      'col_a_cash_on_hand_beginning_period',
+                                      'col_a_total_receipts',
+                                      'col_a_subtotal',
+                                      'col_a_total_disbursements',
+                                      'col_a_cash_on_hand_close_of_period',
+                                      'col_a_debts_to',
+                                      'col_a_debts_by',
+                                      'col_a_individuals_itemized',
+                                      'col_a_individuals_unitemized',
+                                      'col_a_individual_contribution_total',
+                                      'col_a_political_party_committees',
+                                      'col_a_other_political_committees_pacs',
+                                      'col_a_total_contributions',
+                                      'col_a_transfers_from_aff_other_party_cmttees',
+                                      'col_a_total_loans',
+                                      'col_a_total_loan_repayments_received',
+                                      'col_a_offsets_to_expenditures',
+                                      'col_a_federal_refunds',
+                                      'col_a_other_federal_receipts',
+                                      'col_a_transfers_from_nonfederal_h3',
+                                      'col_a_total_receipts',
+                                      'col_a_total_federal_receipts',
+                                      'col_a_shared_operating_expenditures_federal',
+                                      'col_a_shared_operating_expenditures_nonfederal',
+                                      'col_a_other_federal_operating_expenditures',
+                                      'col_a_total_operating_expenditures',
+                                      'col_a_transfers_to_affiliated',
+                                      'col_a_contributions_to_candidates',
+                                      'col_a_independent_expenditures',
+                                      'col_a_coordinated_expenditures_by_party_committees',
+                                      'col_a_total_loan_repayments_made',
+                                      'col_a_loans_made',
+                                      'col_a_refunds_to_individuals',
+                                      'col_a_refunds_to_party_committees',
+                                      'col_a_refunds_to_other_committees',
+                                      'col_a_total_refunds',
+                                      'col_a_other_disbursements',
+                                      'col_a_total_disbursements',
+                                      'col_a_total_federal_disbursements',
+                                      'col_a_total_contributions',
+                                      'col_a_total_contributions_refunds',
+                                      'col_a_net_contributions',
+                                      'col_a_total_federal_operating_expenditures',
+                                      'col_a_total_offsets_to_expenditures',
+                                      'col_a_net_operating_expenditures',
+                                      'col_b_cash_on_hand_jan_1',
+                                      'col_b_year',
+                                      'col_b_total_receipts',
+                                      'col_b_subtotal',
+                                      'col_b_total_disbursements',
+                                      'col_b_cash_on_hand_close_of_period',
+                                      'col_b_individuals_itemized',
+                                      'col_b_individuals_unitemized',
+                                      'col_b_individual_contribution_total',
+                                      'col_b_political_party_committees',
+                                      'col_b_other_political_committees_pacs',
+                                      'col_b_total_contributions',
+                                      'col_b_transfers_from_aff_other_party_cmttees',
+                                      'col_b_total_loans',
+                                      'col_b_total_loan_repayments_received',
+                                      'col_b_offsets_to_expenditures',
+                                      'col_b_federal_refunds',
+                                      'col_b_other_federal_receipts',
+                                      'col_b_transfers_from_nonfederal_h3',
+                                      'col_b_total_receipts',
+                                      'col_b_total_federal_receipts',
+                                      'col_b_shared_operating_expenditures_federal',
+                                      'col_b_shared_operating_expenditures_nonfederal',
+                                      'col_b_other_federal_operating_expenditures',
+                                      'col_b_total_operating_expenditures',
+                                      'col_b_transfers_to_affiliated',
+                                      'col_b_contributions_to_candidates',
+                                      'col_b_independent_expenditures',
+                                      'col_b_coordinated_expenditures_by_party_committees',
+                                      'col_b_total_loan_repayments_made',
+                                      'col_b_loans_made',
+                                      'col_b_refunds_to_individuals',
+                                      'col_b_refunds_to_party_committees',
+                                      'col_b_refunds_to_other_committees',
+                                      'col_b_total_refunds',
+                                      'col_b_other_disbursements',
+                                      'col_b_total_disbursements',
+                                      'col_b_total_federal_disbursements',
+                                      'col_b_total_contributions',
+                                      'col_b_total_contributions_refunds',
+                                      'col_b_net_contributions',
+                                      'col_b_total_federal_operating_expenditures',
+                                      'col_b_total_offsets_to_expenditures',
+                                      'col_b_net_operating_expenditures',
+                                      'treasurer_name',
+                                      'date_signed']},
+ '(^f3z$)|(^f3z[t])': {'^(P3|P2)': ['form_type',
+                                    'filer_committee_id_number',
+                                    'principal_committee_name',
+                                    'coverage_from_date',
+                                    'coverage_through_date',
+                                    'authorized_committee_name',
+                                    'col_a_individual_contributions_itemized',
+                                    'col_a_political_party_contributions',
+                                    'col_a_pac_contributions',
+                                    'col_a_candidate_contributions',
+                                    'col_a_total_contributions',
+                                    'col_a_transfers_from_authorized',
+                                    'col_a_candidate_loans',
+                                    'col_a_other_loans',
+                                    'col_a_total_loans',
+                                    'col_a_offset_to_operating_expenditures',
+                                    'col_a_other_receipts',
+                                    'col_a_total_receipts',
+                                    'col_a_operating_expenditures',
+                                    'col_a_transfers_to_authorized',
+                                    'col_a_candidate_loan_repayments',
+                                    'col_a_other_loan_repayments',
+                                    'col_a_total_loan_repayments',
+                                    'col_a_refunds_to_individuals',
+                                    'col_a_refunds_to_party_committees',
+                                    'col_a_refunds_to_other_committees',
+                                    'col_a_total_refunds',
+                                    'col_a_other_disbursements',
+                                    'col_a_total_disbursements',
+                                    'col_a_cash_beginning_reporting_period',
+                                    'col_a_cash_on_hand_close',
+                                    'col_a_debts_to',
+                                    'col_a_debts_by',
+                                    'col_a_net_contributions',
+                                    'col_a_net_operating_expenditures',
+                                    'image_number'],
+                       '^P1': ['form_type',
+                               'filer_committee_id_number',
+                               'principal_committee_name',
+                               'coverage_from_date',
+                               'coverage_through_date',
+                               'col_a_individual_contributions_itemized',
+                               'col_a_political_party_contributions',
+                               'col_a_pac_contributions',
+                               'col_a_candidate_contributions',
+                               'col_a_total_contributions',
+                               'col_a_transfers_from_authorized',
+                               'col_a_candidate_loans',
+                               'col_a_other_loans',
+                               'col_a_total_loans',
+                               'col_a_offset_to_operating_expenditures',
+                               'col_a_other_receipts',
+                               'col_a_total_receipts',
+                               'col_a_operating_expenditures',
+                               'col_a_transfers_to_authorized',
+                               'col_a_candidate_loan_repayments',
+                               'col_a_other_loan_repayments',
+                               'col_a_total_loan_repayments',
+                               'col_a_refunds_to_individuals',
+                               'col_a_refunds_to_party_committees',
+                               'col_a_refunds_to_other_committees',
+                               'col_a_total_refunds',
+                               'col_a_other_disbursements',
+                               'col_a_total_disbursements',
+                               'col_a_cash_beginning_reporting_period',
+                               'col_a_cash_on_hand_close',
+                               'col_a_debts_to',
+                               'col_a_debts_by',
+                               'col_a_net_contributions',
+                               'col_a_net_operating_expenditures',
+                               'image_number'],
+                       '^(8.1|8.0|7.0|6|5|3|2|1)': ['form_type',
+                                                    'filer_committee_id_number',
+                                                    'principal_committee_name',
+                                                    'coverage_from_date',
+                                                    'coverage_through_date',
+                                                    'authorized_committee_id_number',
+                                                    'authorized_committee_name',
+                                                    'col_a_individual_contributions_itemized',
+                                                    'col_a_political_party_contributions',
+                                                    'col_a_pac_contributions',
+                                                    'col_a_candidate_contributions',
+                                                    'col_a_total_contributions',
+                                                    'col_a_transfers_from_authorized',
+                                                    'col_a_candidate_loans',
+                                                    'col_a_other_loans',
+                                                    'col_a_total_loans',
+                                                    'col_a_offset_to_operating_expenditures',
+                                                    'col_a_other_receipts',
+                                                    'col_a_total_receipts',
+                                                    'col_a_operating_expenditures',
+                                                    'col_a_transfers_to_authorized',
+                                                    'col_a_candidate_loan_repayments',
+                                                    'col_a_other_loan_repayments',
+                                                    'col_a_total_loan_repayments',
+                                                    'col_a_refunds_to_individuals',
+                                                    'col_a_refunds_to_party_committees',
+                                                    'col_a_refunds_to_other_committees',
+                                                    'col_a_total_refunds',
+                                                    'col_a_other_disbursements',
+                                                    'col_a_total_disbursements',
+                                                    'col_a_cash_beginning_reporting_period',
+                                                    'col_a_cash_on_hand_close',
+                                                    'col_a_debts_to',
+                                                    'col_a_debts_by',
+                                                    'col_a_net_contributions',
+                                                    'col_a_net_operating_expenditures']},
+ '^f3z1': {'^(P3.4|8.4|8.3|8.2)': ['form_type',
+                                   'filer_committee_id_number',
+                                   'principal_committee_name',
+                                   'coverage_from_date',
+                                   'coverage_through_date',
+                                   'authorized_committee_id_number',
+                                   'authorized_committee_name',
+                                   'col_a_net_contributions',
+                                   'col_a_net_operating_expenditures',
+                                   'col_a_debts_to',
+                                   'col_a_debts_by',
+                                   'col_a_individual_contributions',
+                                   'col_a_political_party_contributions',
+                                   'col_a_pac_contributions',
+                                   'col_a_candidate_contributions',
+                                   'col_a_total_contributions',
+                                   'col_a_transfers_from_authorized',
+                                   'col_a_candidate_loans',
+                                   'col_a_other_loans',
+                                   'col_a_total_loans',
+                                   'col_a_offset_to_operating_expenditures',
+                                   'col_a_other_receipts',
+                                   'col_a_total_receipts',
+                                   'col_a_operating_expenditures',
+                                   'col_a_transfers_to_authorized',
+                                   'col_a_candidate_loan_repayments',
+                                   'col_a_other_loan_repayments',
+                                   'col_a_total_loan_repayments',
+                                   'col_a_refunds_to_individuals',
+                                   'col_a_refunds_to_party_committees',
+                                   'col_a_refunds_to_other_committees',
+                                   'col_a_total_refunds',
+                                   'col_a_other_disbursements',
+                                   'col_a_total_disbursements',
+                                   'col_a_cash_beginning_reporting_period',
+                                   'col_a_cash_on_hand_close']},
+ '^f3z2': {'^(P3.4|8.4|8.3|8.2)': ['form_type',
+                                   'filer_committee_id_number',
+                                   'principal_committee_name',
+                                   'coverage_from_date',
+                                   'coverage_through_date',
+                                   'col_a_net_contributions',
+                                   'col_a_net_operating_expenditures',
+                                   'col_a_debts_to',
+                                   'col_a_debts_by',
+                                   'col_a_individual_contributions',
+                                   'col_a_political_party_contributions',
+                                   'col_a_pac_contributions',
+                                   'col_a_candidate_contributions',
+                                   'col_a_total_contributions',
+                                   'col_a_transfers_from_authorized',
+                                   'col_a_candidate_loans',
+                                   'col_a_other_loans',
+                                   'col_a_total_loans',
+                                   'col_a_offset_to_operating_expenditures',
+                                   'col_a_other_receipts',
+                                   'col_a_total_receipts',
+                                   'col_a_operating_expenditures',
+                                   'col_a_transfers_to_authorized',
+                                   'col_a_candidate_loan_repayments',
+                                   'col_a_other_loan_repayments',
+                                   'col_a_total_loan_repayments',
+                                   'col_a_refunds_to_individuals',
+                                   'col_a_refunds_to_party_committees',
+                                   'col_a_refunds_to_other_committees',
+                                   'col_a_total_refunds',
+                                   'col_a_other_disbursements',
+                                   'col_a_total_disbursements',
+                                   'col_a_cash_beginning_reporting_period',
+                                   'col_a_cash_on_hand_close']},
+ '^f4[ant]': {'^(P3.4|P3.3|P3.2)': ['form_type',
+                                    'filer_committee_id_number',
+                                    'committee_name',
+                                    'street_1',
+                                    'street_2',
+                                    'city',
+                                    'state',
+                                    'zip_code',
+                                    'committee_type',
+                                    'committee_type_description',
+                                    'report_code',
+                                    'coverage_from_date',
+                                    'coverage_through_date',
+                                    'treasurer_last_name',
+                                    'treasurer_first_name',
+                                    'treasurer_middle_name',
+                                    'treasurer_prefix',
+                                    'treasurer_suffix',
+                                    'date_signed',
+                                    'col_a_cash_on_hand_beginning_reporting_period',
+                                    'col_a_total_receipts',
+                                    'col_a_subtotal',
+                                    'col_a_total_disbursements',
+                                    'col_a_cash_on_hand_close_of_period',
+                                    'col_a_debts_to',
+                                    'col_a_debts_by',
+                                    'col_a_convention_expenditures',
+                                    'col_a_convention_refunds',
+                                    'col_a_expenditures_subject_to_limits',
+                                    'col_a_prior_expenditures_subject_to_limits',
+                                    'col_a_federal_funds',
+                                    'col_a_contributions_itemized',
+                                    'col_a_contributions_unitemized',
+                                    'col_a_contributions_subtotal',
+                                    'col_a_transfers_from_affiliated',
+                                    'col_a_loans_received',
+                                    'col_a_loan_repayments_received',
+                                    'col_a_loan_receipts_subtotal',
+                                    'col_a_convention_refunds_itemized',
+                                    'col_a_convention_refunds_unitemized',
+                                    'col_a_convention_refunds_subtotal',
+                                    'col_a_other_refunds_itemized',
+                                    'col_a_other_refunds_unitemized',
+                                    'col_a_other_refunds_subtotal',
+                                    'col_a_other_income_itemized',
+                                    'col_a_other_income_unitemized',
+                                    'col_a_other_income_subtotal',
+                                    'col_a_total_receipts',
+                                    'col_a_convention_expenses_itemized',
+                                    'col_a_convention_expenses_unitemized',
+                                    'col_a_convention_expenses_subtotal',
+                                    'col_a_transfers_to_affiliated',
+                                    'col_a_loans_made',
+                                    'col_a_loan_repayments_made',
+                                    'col_a_loan_disbursements_subtotal',
+                                    'col_a_other_disbursements_itemized',
+                                    'col_a_other_disbursements_unitemized',
+                                    'col_a_other_disbursements_subtotal',
+                                    'col_a_total_disbursements',
+                                    'col_b_cash_on_hand_beginning_year',
+                                    'col_b_beginning_year',
+                                    'col_b_total_receipts',
+                                    'col_b_subtotal',
+                                    'col_b_total_disbursements',
+                                    'col_b_cash_on_hand_close_of_period',
+                                    'col_b_convention_expenditures',
+                                    'col_b_convention_refunds',
+                                    'col_b_expenditures_subject_to_limits',
+                                    'col_b_prior_expendiutres_subject_to_limits',
+                                    'col_b_total_expenditures_subject_to_limits',
+                                    'col_b_federal_funds',
+                                    'col_b_contributions_subtotal',
+                                    'col_b_transfers_from_affiliated',
+                                    'col_b_loan_receipts_subtotal',
+                                    'col_b_convention_refunds_subtotal',
+                                    'col_b_other_refunds_subtotal',
+                                    'col_b_other_income_subtotal',
+                                    'col_b_total_receipts',
+                                    'col_b_convention_expenses_subtotal',
+                                    'col_b_transfers_to_affiliated',
+                                    'col_b_loan_disbursements_subtotal',
+                                    'col_b_other_disbursements_subtotal',
+                                    'col_b_total_disbursements',
+                                    'beginning_image_number',
+                                    'end_image_number',
+                                    'receipt_date'],
+              '^(P3.1|P3.0|P2|P1)': ['form_type',
+                                     'filer_committee_id_number',
+                                     'committee_name',
+                                     'street_1',
+                                     'street_2',
+                                     'city',
+                                     'state',
+                                     'zip_code',
+                                     'committee_type',
+                                     'committee_type_description',
+                                     'report_code',
+                                     'coverage_from_date',
+                                     'coverage_through_date',
+                                     'treasurer_last_name',
+                                     'treasurer_first_name',
+                                     'treasurer_middle_name',
+                                     'treasurer_prefix',
+                                     'treasurer_suffix',
+                                     'date_signed',
+                                     'col_a_cash_on_hand_beginning_reporting_period',
+                                     'col_a_total_receipts',
+                                     'col_a_subtotal',
+                                     'col_a_total_disbursements',
+                                     'col_a_cash_on_hand_close_of_period',
+                                     'col_a_debts_to',
+                                     'col_a_debts_by',
+                                     'col_a_convention_expenditures',
+                                     'col_a_convention_refunds',
+                                     'col_a_expenditures_subject_to_limits',
+                                     'col_a_prior_expenditures_subject_to_limits',
+                                     'col_a_federal_funds',
+                                     'col_a_contributions_itemized',
+                                     'col_a_contributions_unitemized',
+                                     'col_a_contributions_subtotal',
+                                     'col_a_transfers_from_affiliated',
+                                     'col_a_loans_received',
+                                     'col_a_loan_repayments_received',
+                                     'col_a_loan_receipts_subtotal',
+                                     'col_a_convention_refunds_itemized',
+                                     'col_a_convention_refunds_unitemized',
+                                     'col_a_convention_refunds_subtotal',
+                                     'col_a_other_refunds_itemized',
+                                     'col_a_other_refunds_unitemized',
+                                     'col_a_other_refunds_subtotal',
+                                     'col_a_other_income_itemized',
+                                     'col_a_other_income_unitemized',
+                                     'col_a_other_income_subtotal',
+                                     'col_a_total_receipts',
+                                     'col_a_convention_expenses_itemized',
+                                     'col_a_convention_expenses_unitemized',
+                                     'col_a_convention_expenses_subtotal',
+                                     'col_a_transfers_to_affiliated',
+                                     'col_a_loans_made',
+                                     'col_a_loan_repayments_made',
+                                     'col_a_loan_disbursements_subtotal',
+                                     'col_a_other_disbursements_itemized',
+                                     'col_a_other_disbursements_unitemized',
+                                     'col_a_other_disbursements_subtotal',
+                                     'col_a_total_disbursements',
+                                     'col_b_cash_on_hand_beginning_year',
+                                     'col_b_beginning_year',
+                                     'col_b_total_receipts',
+                                     'col_b_subtotal',
+                                     'col_b_total_disbursements',
+                                     'col_b_cash_on_hand_close_of_period',
+                                     'col_b_convention_expenditures',
+                                     'col_b_convention_refunds',
+                                     'col_b_expenditures_subject_to_limits',
+                                     'col_b_prior_expendiutres_subject_to_limits',
+                                     'col_b_total_expenditures_subject_to_limits',
+                                     'col_b_federal_funds',
+                                     'col_b_contributions_subtotal',
+                                     'col_b_transfers_from_affiliated',
+                                     'col_b_loan_receipts_subtotal',
+                                     'col_b_convention_refunds_subtotal',
+                                     'col_b_other_refunds_subtotal',
+                                     'col_b_other_income_subtotal',
+                                     'col_b_total_receipts',
+                                     'col_b_convention_expenses_subtotal',
+                                     'col_b_transfers_to_affiliated',
+                                     'col_b_loan_disbursements_subtotal',
+                                     'col_b_other_disbursements_subtotal',
+                                     'col_b_total_disbursements',
+                                     'beginning_image_number'],
+              '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                               'filer_committee_id_number',
+                                                               'committee_name',
+                                                               'street_1',
+                                                               'street_2',
+                                                               'city',
+                                                               'state',
+                                                               'zip_code',
+                                                               'committee_type',
+                                                               'committee_type_description',
+                                                               'report_code',
+                                                               'coverage_from_date',
+                                                               'coverage_through_date',
+                                                               'treasurer_last_name',
+                                                               'treasurer_first_name',
+                                                               'treasurer_middle_name',
+                                                               'treasurer_prefix',
+                                                               'treasurer_suffix',
+                                                               'date_signed',
+                                                               'col_a_cash_on_hand_beginning_reporting_period',
+                                                               'col_a_total_receipts',
+                                                               'col_a_subtotal',
+                                                               'col_a_total_disbursements',
+                                                               'col_a_cash_on_hand_close_of_period',
+                                                               'col_a_debts_to',
+                                                               'col_a_debts_by',
+                                                               'col_a_convention_expenditures',
+                                                               'col_a_convention_refunds',
+                                                               'col_a_expenditures_subject_to_limits',
+                                                               'col_a_prior_expenditures_subject_to_limits',
+                                                               'col_a_federal_funds',
+                                                               'col_a_contributions_itemized',
+                                                               'col_a_contributions_unitemized',
+                                                               'col_a_contributions_subtotal',
+                                                               'col_a_transfers_from_affiliated',
+                                                               'col_a_loans_received',
+                                                               'col_a_loan_repayments_received',
+                                                               'col_a_loan_receipts_subtotal',
+                                                               'col_a_convention_refunds_itemized',
+                                                               'col_a_convention_refunds_unitemized',
+                                                               'col_a_convention_refunds_subtotal',
+                                                               'col_a_other_refunds_itemized',
+                                                               'col_a_other_refunds_unitemized',
+                                                               'col_a_other_refunds_subtotal',
+                                                               'col_a_other_income_itemized',
+                                                               'col_a_other_income_unitemized',
+                                                               'col_a_other_income_subtotal',
+                                                               'col_a_total_receipts',
+                                                               'col_a_convention_expenses_itemized',
+                                                               'col_a_convention_expenses_unitemized',
+                                                               'col_a_convention_expenses_subtotal',
+                                                               'col_a_transfers_to_affiliated',
+                                                               'col_a_loans_made',
+                                                               'col_a_loan_repayments_made',
+                                                               'col_a_loan_disbursements_subtotal',
+                                                               'col_a_other_disbursements_itemized',
+                                                               'col_a_other_disbursements_unitemized',
+                                                               'col_a_other_disbursements_subtotal',
+                                                               'col_a_total_disbursements',
+                                                               'col_b_cash_on_hand_beginning_year',
+                                                               'col_b_beginning_year',
+                                                               'col_b_total_receipts',
+                                                               'col_b_subtotal',
+                                                               'col_b_total_disbursements',
+                                                               'col_b_cash_on_hand_close_of_period',
+                                                               'col_b_convention_expenditures',
+                                                               'col_b_convention_refunds',
+                                                               'col_b_expenditures_subject_to_limits',
+                                                               'col_b_prior_expendiutres_subject_to_limits',
+                                                               'col_b_total_expenditures_subject_to_limits',
+                                                               'col_b_federal_funds',
+                                                               'col_b_contributions_subtotal',
+                                                               'col_b_transfers_from_affiliated',
+                                                               'col_b_loan_receipts_subtotal',
+                                                               'col_b_convention_refunds_subtotal',
+                                                               'col_b_other_refunds_subtotal',
+                                                               'col_b_other_income_subtotal',
+                                                               'col_b_total_receipts',
+                                                               'col_b_convention_expenses_subtotal',
+                                                               'col_b_transfers_to_affiliated',
+                                                               'col_b_loan_disbursements_subtotal',
+                                                               'col_b_other_disbursements_subtotal',
+                                                               'col_b_total_disbursements'],
+              '^5.3|5.2|5.1|5.0|^3': ['form_type',
+                                      'filer_committee_id_number',
+                                      'committee_name',
+                                      'street_1',
+                                      'street_2',
+                                      'city',
+                                      'state',
+                                      'zip_code',
+                                      'committee_type',
+                                      'committee_type_description',
+                                      'report_code',
+                                      'coverage_from_date',
+                                      'coverage_through_date',
+                                      'col_a_cash_on_hand_beginning_reporting_period',
+                                      'col_a_total_receipts',
+                                      'col_a_subtotal',
+                                      'col_a_total_disbursements',
+                                      'col_a_cash_on_hand_close_of_period',
+                                      'col_a_debts_to',
+                                      'col_a_debts_by',
+                                      'col_a_convention_expenditures',
+                                      'col_a_convention_refunds',
+                                      'col_a_expenditures_subject_to_limits',
+                                      'col_a_prior_expenditures_subject_to_limits',
+                                      'col_a_total_expenditures_subject_to_limits',
+                                      'col_a_federal_funds',
+                                      'col_a_contributions_itemized',
+                                      'col_a_contributions_unitemized',
+                                      'col_a_contributions_subtotal',
+                                      'col_a_transfers_from_affiliated',
+                                      'col_a_loans_received',
+                                      'col_a_loan_repayments_received',
+                                      'col_a_loan_receipts_subtotal',
+                                      'col_a_convention_refunds_itemized',
+                                      'col_a_convention_refunds_unitemized',
+                                      'col_a_convention_refunds_subtotal',
+                                      'col_a_other_refunds_itemized',
+                                      'col_a_other_refunds_unitemized',
+                                      'col_a_other_refunds_subtotal',
+                                      'col_a_other_income_itemized',
+                                      'col_a_other_income_unitemized',
+                                      'col_a_other_income_subtotal',
+                                      'col_a_total_receipts',
+                                      'col_a_convention_expenses_itemized',
+                                      'col_a_convention_expenses_unitemized',
+                                      'col_a_convention_expenses_subtotal',
+                                      'col_a_transfers_to_affiliated',
+                                      'col_a_loans_made',
+                                      'col_a_loan_repayments_made',
+                                      'col_a_loan_disbursements_subtotal',
+                                      'col_a_other_disbursements_itemized',
+                                      'col_a_other_disbursements_unitemized',
+                                      'col_a_other_disbursements_subtotal',
+                                      'col_a_total_disbursements',
+                                      'col_b_cash_on_hand_beginning_year',
+                                      'col_b_beginning_year',
+                                      'col_b_total_receipts',
+                                      'col_b_subtotal',
+                                      'col_b_total_disbursements',
+                                      'col_b_cash_on_hand_close_of_period',
+                                      'col_b_convention_expenditures',
+                                      'col_b_convention_refunds',
+                                      'col_b_expenditures_subject_to_limits',
+                                      'col_b_prior_expendiutres_subject_to_limits',
+                                      'col_b_total_expenditures_subject_to_limits',
+                                      'col_b_federal_funds',
+                                      'col_b_contributions_subtotal',
+                                      'col_b_transfers_from_affiliated',
+                                      'col_b_loan_receipts_subtotal',
+                                      'col_b_convention_refunds_subtotal',
+                                      'col_b_other_refunds_subtotal',
+                                      'col_b_other_income_subtotal',
+                                      'col_b_total_receipts',
+                                      'col_b_convention_expenses_subtotal',
+                                      'col_b_transfers_to_affiliated',
+                                      'col_b_loan_disbursements_subtotal',
+                                      'col_b_other_disbursements_subtotal',
+                                      'col_b_total_disbursements',
+                                      'treasurer_name',
+                                      'date_signed']},
+ '^f5[na]': {'^(P3.4|P3.3|P3.2)': ['form_type',
+                                   'filer_committee_id_number',
+                                   'organization_name',
+                                   'individual_last_name',
+                                   'individual_first_name',
+                                   'individual_middle_name',
+                                   'individual_prefix',
+                                   'individual_suffix',
+                                   'change_of_address',
+                                   'street_1',
+                                   'street_2',
+                                   'city',
+                                   'state',
+                                   'zip_code',
+                                   'individual_occupation',
+                                   'individual_employer',
+                                   'report_code',
+                                   'report_type',
+                                   'original_amendment_date',
+                                   'coverage_from_date',
+                                   'coverage_through_date',
+                                   'total_contribution',
+                                   'total_independent_expenditure',
+                                   'person_completing_last_name',
+                                   'person_completing_first_name',
+                                   'person_completing_middle_name',
+                                   'person_completing_prefix',
+                                   'person_completing_suffix',
+                                   'date_signed',
+                                   'beginning_image_number',
+                                   'end_image_number',
+                                   'receipt_date'],
+             '^P3.1': ['form_type',
+                       'filer_committee_id_number',
+                       'organization_name',
+                       'individual_last_name',
+                       'individual_first_name',
+                       'individual_middle_name',
+                       'individual_prefix',
+                       'individual_suffix',
+                       'change_of_address',
+                       'street_1',
+                       'street_2',
+                       'city',
+                       'state',
+                       'zip_code',
+                       'individual_occupation',
+                       'individual_employer',
+                       'report_code',
+                       'report_type',
+                       'original_amendment_date',
+                       'coverage_from_date',
+                       'coverage_through_date',
+                       'total_contribution',
+                       'total_independent_expenditure',
+                       'person_completing_last_name',
+                       'person_completing_first_name',
+                       'person_completing_middle_name',
+                       'person_completing_prefix',
+                       'person_completing_suffix',
+                       'date_signed',
+                       'beginning_image_number'],
+             '^P2|^P3.0': ['form_type',
+                           'filer_committee_id_number',
+                           'organization_name',
+                           'individual_last_name',
+                           'individual_first_name',
+                           'individual_middle_name',
+                           'individual_prefix',
+                           'individual_suffix',
+                           'change_of_address',
+                           'street_1',
+                           'street_2',
+                           'city',
+                           'state',
+                           'zip_code',
+                           'qualified_nonprofit',
+                           'individual_employer',
+                           'individual_occupation',
+                           'report_code',
+                           'report_type',
+                           'coverage_from_date',
+                           'coverage_through_date',
+                           'total_contribution',
+                           'total_independent_expenditure',
+                           'person_completing_last_name',
+                           'person_completing_first_name',
+                           'person_completing_middle_name',
+                           'person_completing_prefix',
+                           'person_completing_suffix',
+                           'date_signed',
+                           'beginning_image_number'],
+             '^P1': ['form_type',
+                     'filer_committee_id_number',
+                     'organization_name',
+                     'individual_last_name',
+                     'individual_first_name',
+                     'individual_middle_name',
+                     'individual_prefix',
+                     'individual_suffix',
+                     'change_of_address',
+                     'street_1',
+                     'street_2',
+                     'city',
+                     'state',
+                     'zip_code',
+                     'qualified_nonprofit',
+                     'individual_employer',
+                     'individual_occupation',
+                     'report_code',
+                     'report_type',
+                     'election_code',
+                     'election_date',
+                     'election_state',
+                     'coverage_from_date',
+                     'coverage_through_date',
+                     'total_contribution',
+                     'total_independent_expenditure',
+                     'person_completing_last_name',
+                     'person_completing_first_name',
+                     'person_completing_middle_name',
+                     'person_completing_prefix',
+                     'person_completing_suffix',
+                     'date_signed',
+                     'beginning_image_number'],
+             '^(8.5|8.4|8.3|8.2|8.1)': ['form_type',
+                                        'filer_committee_id_number',
+                                        'entity_type',
+                                        'organization_name',
+                                        'individual_last_name',
+                                        'individual_first_name',
+                                        'individual_middle_name',
+                                        'individual_prefix',
+                                        'individual_suffix',
+                                        'change_of_address',
+                                        'street_1',
+                                        'street_2',
+                                        'city',
+                                        'state',
+                                        'zip_code',
+                                        'individual_occupation',
+                                        'individual_employer',
+                                        'report_code',
+                                        'report_type',
+                                        'original_amendment_date',
+                                        'coverage_from_date',
+                                        'coverage_through_date',
+                                        'total_contribution',
+                                        'total_independent_expenditure',
+                                        'person_completing_last_name',
+                                        'person_completing_first_name',
+                                        'person_completing_middle_name',
+                                        'person_completing_prefix',
+                                        'person_completing_suffix',
+                                        'date_signed'],
+             '^(8.0|7.0|6.4|6.3|6.2|6.1)': ['form_type',
+                                            'filer_committee_id_number',
+                                            'entity_type',
+                                            'organization_name',
+                                            'individual_last_name',
+                                            'individual_first_name',
+                                            'individual_middle_name',
+                                            'individual_prefix',
+                                            'individual_suffix',
+                                            'change_of_address',
+                                            'street_1',
+                                            'street_2',
+                                            'city',
+                                            'state',
+                                            'zip_code',
+                                            'qualified_nonprofit',
+                                            'individual_employer',
+                                            'individual_occupation',
+                                            'report_code',
+                                            'report_type',
+                                            'coverage_from_date',
+                                            'coverage_through_date',
+                                            'total_contribution',
+                                            'total_independent_expenditure',
+                                            'person_completing_last_name',
+                                            'person_completing_first_name',
+                                            'person_completing_middle_name',
+                                            'person_completing_prefix',
+                                            'person_completing_suffix',
+                                            'date_signed'],
+             '^5.3': ['form_type',
+                      'filer_committee_id_number',
+                      'committee_name',
+                      'street_1',
+                      'street_2',
+                      'city',
+                      'state',
+                      'zip_code',
+                      'change_of_address',
+                      'qualified_nonprofit',
+                      'individual_employer',
+                      '',
+                      'report_code',
+                      '',
+                      '',
+                      '',
+                      'coverage_from_date',
+                      'coverage_through_date',
+                      'total_contribution',
+                      'total_independent_expenditure',
+                      'person_completing_name',
+                      'date_signed',
+                      '',
+                      '',
+                      '',
+                      'report_type'],
+             '^(5.2|5.1|5.0)': ['form_type',
+                                'filer_committee_id_number',
+                                'committee_name',
+                                'street_1',
+                                'street_2',
+                                'city',
+                                'state',
+                                'zip_code',
+                                'change_of_address',
+                                'qualified_nonprofit',
+                                'individual_employer',
+                                'individual_occupation',
+                                'report_code',
+                                'report_pgi',
+                                'election_date',
+                                'election_state',
+                                'coverage_from_date',
+                                'coverage_through_date',
+                                'total_contribution',
+                                'total_independent_expenditure',
+                                'person_completing_name',
+                                'date_signed',
+                                'date_notarized',
+                                'date_notary_commission_expires',
+                                'notary_name',
+                                'report_type'],
+             '^3': ['form_type',
+                    'filer_committee_id_number',
+                    'committee_name',
+                    'street_1',
+                    'street_2',
+                    'city',
+                    'state',
+                    'zip_code',
+                    'change_of_address',
+                    'qualified_nonprofit',
+                    'individual_employer',
+                    'individual_occupation',
+                    'report_code',
+                    'report_pgi',
+                    'election_date',
+                    'election_state',
+                    'coverage_from_date',
+                    'coverage_through_date',
+                    'total_contribution',
+                    'total_independent_expenditure',
+                    'person_completing_name',
+                    'date_signed',
+                    'date_notarized',
+                    'date_notary_commission_expires',
+                    'notary_name']},
+ '^f56': {'^(P3|P2|P1)': ['form_type',
+                          'filer_committee_id_number',
+                          'contributor_organization_name',
+                          'contributor_last_name',
+                          'contributor_first_name',
+                          'contributor_middle_name',
+                          'contributor_prefix',
+                          'contributor_suffix',
+                          'contributor_street_1',
+                          'contributor_street_2',
+                          'contributor_city',
+                          'contributor_state',
+                          'contributor_zip_code',
+                          'contributor_fec_id',
+                          'contribution_date',
+                          'contribution_amount',
+                          'contributor_employer',
+                          'contributor_occupation',
+                          'image_number'],
+          '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2': ['form_type',
+                                                       'filer_committee_id_number',
+                                                       'transaction_id',
+                                                       'entity_type',
+                                                       'contributor_organization_name',
+                                                       'contributor_last_name',
+                                                       'contributor_first_name',
+                                                       'contributor_middle_name',
+                                                       'contributor_prefix',
+                                                       'contributor_suffix',
+                                                       'contributor_street_1',
+                                                       'contributor_street_2',
+                                                       'contributor_city',
+                                                       'contributor_state',
+                                                       'contributor_zip_code',
+                                                       'contributor_fec_id',
+                                                       'contribution_date',
+                                                       'contribution_amount',
+                                                       'contributor_employer',
+                                                       'contributor_occupation'],
+          '^5.3|5.2|5.1|5.0|^3.0': ['form_type',
+                                    'filer_committee_id_number',
+                                    'entity_type',
+                                    'contributor_name',
+                                    'contributor_street_1',
+                                    'contributor_street_2',
+                                    'contributor_city',
+                                    'contributor_state',
+                                    'contributor_zip_code',
+                                    'contributor_employer',
+                                    'contributor_occupation',
+                                    'contribution_date',
+                                    'contribution_amount',
+                                    'contributor_fec_id',
+                                    'candidate_id',
+                                    'candidate_name',
+                                    'candidate_office',
+                                    'candidate_state',
+                                    'candidate_district',
+                                    'conduit_name',
+                                    'conduit_street_1',
+                                    'conduit_street_2',
+                                    'conduit_city',
+                                    'conduit_state',
+                                    'conduit_zip_code',
+                                    '',
+                                    'transaction_id']},
+ '^f57': {'^P(3|2|1)': ['form_type',
+                        'filer_committee_id_number',
+                        'payee_organization_name',
+                        'payee_last_name',
+                        'payee_first_name',
+                        'payee_middle_name',
+                        'payee_prefix',
+                        'payee_suffix',
+                        'payee_street_1',
+                        'payee_street_2',
+                        'payee_city',
+                        'payee_state',
+                        'payee_zip_code',
+                        'dissemination_date',
+                        'expenditure_amount',
+                        'expenditure_purpose_descrip',
+                        'category_code',
+                        'candidate_last_name',
+                        'candidate_first_name',
+                        'candidate_middle_name',
+                        'candidate_prefix',
+                        'candidate_suffix',
+                        'candidate_office',
+                        'candidate_state',
+                        'candidate_district',
+                        'support_oppose_code',
+                        'calendar_y_t_d_per_election_office',
+                        'election_code',
+                        'election_other_description',
+                        'image_number'],
+          '^8.5|8.4|8.3|8.2|8.1': ['form_type',
+                                   'filer_committee_id_number',
+                                   'transaction_id_number',
+                                   'entity_type',
+                                   'payee_organization_name',
+                                   'payee_last_name',
+                                   'payee_first_name',
+                                   'payee_middle_name',
+                                   'payee_prefix',
+                                   'payee_suffix',
+                                   'payee_street_1',
+                                   'payee_street_2',
+                                   'payee_city',
+                                   'payee_state',
+                                   'payee_zip_code',
+                                   'election_code',
+                                   'election_other_description',
+                                   'dissemination_date',
+                                   'expenditure_amount',
+                                   'calendar_y_t_d_per_election_office',
+                                   'expenditure_purpose_descrip',
+                                   'category_code',
+                                   'payee_cmtte_fec_id_number',
+                                   'support_oppose_code',
+                                   'candidate_id_number',
+                                   'candidate_last_name',
+                                   'candidate_first_name',
+                                   'candidate_middle_name',
+                                   'candidate_prefix',
+                                   'candidate_suffix',
+                                   'candidate_office',
+                                   'candidate_state',
+                                   'candidate_district'],
+          '^8.0': ['form_type',
+                   'filer_committee_id_number',
+                   'transaction_id_number',
+                   'entity_type',
+                   'payee_organization_name',
+                   'payee_last_name',
+                   'payee_first_name',
+                   'payee_middle_name',
+                   'payee_prefix',
+                   'payee_suffix',
+                   'payee_street_1',
+                   'payee_street_2',
+                   'payee_city',
+                   'payee_state',
+                   'payee_zip_code',
+                   'election_code',
+                   'election_other_description',
+                   'dissemination_date',
+                   'expenditure_amount',
+                   'calendar_y_t_d_per_election_office',
+                   'expenditure_purpose_descrip',
+                   'category_code',
+                   'payee_cmtte_fec_id_number',
+                   'support_oppose_code',
+                   'candidate_id_number',
+                   'candidate_last_name',
+                   'candidate_first_name',
+                   'candidate_middle_name',
+                   'candidate_prefix',
+                   'candidate_suffix',
+                   'candidate_office',
+                   'candidate_state',
+                   'candidate_district'],
+          '^7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                   'filer_committee_id_number',
+                                   'transaction_id_number',
+                                   'entity_type',
+                                   'payee_organization_name',
+                                   'payee_last_name',
+                                   'payee_first_name',
+                                   'payee_middle_name',
+                                   'payee_prefix',
+                                   'payee_suffix',
+                                   'payee_street_1',
+                                   'payee_street_2',
+                                   'payee_city',
+                                   'payee_state',
+                                   'payee_zip_code',
+                                   'election_code',
+                                   'election_other_description',
+                                   'dissemination_date',
+                                   'expenditure_amount',
+                                   'calendar_y_t_d_per_election_office',
+                                   'expenditure_purpose_code',
+                                   'expenditure_purpose_descrip',
+                                   'category_code',
+                                   'payee_cmtte_fec_id_number',
+                                   'support_oppose_code',
+                                   'candidate_id_number',
+                                   'candidate_last_name',
+                                   'candidate_first_name',
+                                   'candidate_middle_name',
+                                   'candidate_prefix',
+                                   'candidate_suffix',
+                                   'candidate_office',
+                                   'candidate_state',
+                                   'candidate_district'],
+          '^5.3|5.2|5.1|5.0': ['form_type',
+                               'filer_committee_id_number',
+                               'entity_type',
+                               'payee_name',
+                               'payee_street_1',
+                               'payee_street_2',
+                               'payee_city',
+                               'payee_state',
+                               'payee_zip_code',
+                               'expenditure_purpose_descrip',
+                               'dissemination_date',
+                               'expenditure_amount',
+                               'support_oppose_code',
+                               'candidate_id_number',
+                               'candidate_name',
+                               'candidate_office',
+                               'candidate_state',
+                               'candidate_district',
+                               '',
+                               '',
+                               '',
+                               '',
+                               '',
+                               '',
+                               'conduit_name',
+                               'conduit_street_1',
+                               'conduit_street_2',
+                               'conduit_city',
+                               'conduit_state',
+                               'conduit_zip_code',
+                               '',
+                               'transaction_id_number',
+                               'category_code',
+                               'expenditure_purpose_code',
+                               'calendar_y_t_d_per_election_office',
+                               'election_code',
+                               'election_other_description'],
+          '^3': ['form_type',
+                 'filer_committee_id_number',
+                 'entity_type',
+                 'payee_name',
+                 'payee_street_2',
+                 '',
+                 'payee_city',
+                 'payee_state',
+                 'payee_zip_code',
+                 'expenditure_purpose_descrip',
+                 'dissemination_date',
+                 'expenditure_amount',
+                 'support_oppose_code',
+                 'candidate_id_number',
+                 'candidate_name',
+                 'candidate_office',
+                 'candidate_state',
+                 'candidate_district',
+                 '',
+                 '',
+                 '',
+                 '',
+                 '',
+                 '',
+                 'conduit_name',
+                 'conduit_street_1',
+                 'conduit_street_2',
+                 'conduit_city',
+                 'conduit_state',
+                 'conduit_zip_code',
+                 'amended_code']},
+ '(^f6$)|(^f6[an])': {'^P3.2|^P3.3|^P3.4': ['form_type',
+                                            'filer_committee_id_number',
+                                            'original_amendment_date',
+                                            'committee_name',
+                                            'street_1',
+                                            'street_2',
+                                            'city',
+                                            'state',
+                                            'zip_code',
+                                            'candidate_last_name',
+                                            'candidate_first_name',
+                                            'candidate_middle_name',
+                                            'candidate_prefix',
+                                            'candidate_suffix',
+                                            'candidate_office',
+                                            'candidate_state',
+                                            'candidate_district',
+                                            'date_signed',
+                                            'beginning_image_number',
+                                            'end_image_number',
+                                            'receipt_date'],
+                      '^P3.0|^P3.1': ['form_type',
+                                      'filer_committee_id_number',
+                                      'original_amendment_date',
+                                      'committee_name',
+                                      'street_1',
+                                      'street_2',
+                                      'city',
+                                      'state',
+                                      'zip_code',
+                                      'candidate_last_name',
+                                      'candidate_first_name',
+                                      'candidate_middle_name',
+                                      'candidate_prefix',
+                                      'candidate_suffix',
+                                      'candidate_office',
+                                      'candidate_state',
+                                      'candidate_district',
+                                      'date_signed',
+                                      'beginning_image_number'],
+                      '^P1|^P2': ['form_type',
+                                  'filer_committee_id_number',
+                                  'committee_name',
+                                  'street_1',
+                                  'street_2',
+                                  'city',
+                                  'state',
+                                  'zip_code',
+                                  'candidate_last_name',
+                                  'candidate_first_name',
+                                  'candidate_middle_name',
+                                  'candidate_prefix',
+                                  'candidate_suffix',
+                                  'candidate_office',
+                                  'candidate_state',
+                                  'candidate_district',
+                                  'date_signed',
+                                  'beginning_image_number'],
+                      '^8.5|8.4|8.3|8.2|8.1|8.0': ['form_type',
+                                                   'filer_committee_id_number',
+                                                   'original_amendment_date',
+                                                   'committee_name',
+                                                   'street_1',
+                                                   'street_2',
+                                                   'city',
+                                                   'state',
+                                                   'zip_code',
+                                                   'candidate_id_number',
+                                                   'candidate_last_name',
+                                                   'candidate_first_name',
+                                                   'candidate_middle_name',
+                                                   'candidate_prefix',
+                                                   'candidate_suffix',
+                                                   'candidate_office',
+                                                   'candidate_state',
+                                                   'candidate_district',
+                                                   'signer_last_name',
+                                                   'signer_first_name',
+                                                   'signer_middle_name',
+                                                   'signer_prefix',
+                                                   'signer_suffix',
+                                                   'date_signed'],
+                      '^7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                               'filer_committee_id_number',
+                                               'committee_name',
+                                               'street_1',
+                                               'street_2',
+                                               'city',
+                                               'state',
+                                               'zip_code',
+                                               'candidate_id_number',
+                                               'candidate_last_name',
+                                               'candidate_first_name',
+                                               'candidate_middle_name',
+                                               'candidate_prefix',
+                                               'candidate_suffix',
+                                               'candidate_office',
+                                               'candidate_state',
+                                               'candidate_district',
+                                               'signer_last_name',
+                                               'signer_first_name',
+                                               'signer_middle_name',
+                                               'signer_prefix',
+                                               'signer_suffix',
+                                               'date_signed'],
+                      '^(5.3|5.2|5.1|5.0|3.0|2|1)': ['form_type',
+                                                     'filer_committee_id_number',
+                                                     'committee_name',
+                                                     'street_1',
+                                                     'street_2',
+                                                     'city',
+                                                     'state',
+                                                     'zip_code',
+                                                     'candidate_id_number',
+                                                     'candidate_name',
+                                                     'candidate_office',
+                                                     'candidate_state',
+                                                     'candidate_district',
+                                                     'date_signed']},
+ '^f65': {'^(P3|P2|P1)': ['form_type',
+                          'filer_committee_id_number',
+                          'contributor_organization_name',
+                          'contributor_last_name',
+                          'contributor_first_name',
+                          'contributor_middle_name',
+                          'contributor_prefix',
+                          'contributor_suffix',
+                          'contributor_street_1',
+                          'contributor_street_2',
+                          'contributor_city',
+                          'contributor_state',
+                          'contributor_zip_code',
+                          'contributor_employer',
+                          'contributor_occupation',
+                          'contribution_date',
+                          'contribution_amount',
+                          'image_number'],
+          '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                           'filer_committee_id_number',
+                                                           'transaction_id',
+                                                           'entity_type',
+                                                           'contributor_organization_name',
+                                                           'contributor_last_name',
+                                                           'contributor_first_name',
+                                                           'contributor_middle_name',
+                                                           'contributor_prefix',
+                                                           'contributor_suffix',
+                                                           'contributor_street_1',
+                                                           'contributor_street_2',
+                                                           'contributor_city',
+                                                           'contributor_state',
+                                                           'contributor_zip_code',
+                                                           'contributor_fec_id',
+                                                           'contribution_date',
+                                                           'contribution_amount',
+                                                           'contributor_employer',
+                                                           'contributor_occupation'],
+          '^(5.3|5.2|5.1|5.0|3.0|2)': ['form_type',
+                                       'filer_committee_id_number',
+                                       'entity_type',
+                                       'contributor_name',
+                                       'contributor_street_1',
+                                       'contributor_street_2',
+                                       'contributor_city',
+                                       'contributor_state',
+                                       'contributor_zip_code',
+                                       'contributor_employer',
+                                       'contributor_occupation',
+                                       'contribution_date',
+                                       'contribution_amount',
+                                       'contributor_fec_id',
+                                       'candidate_id',
+                                       'candidate_name',
+                                       'candidate_office',
+                                       'candidate_state',
+                                       'candidate_district',
+                                       'conduit_name',
+                                       'conduit_street_1',
+                                       'conduit_street_2',
+                                       'conduit_city',
+                                       'conduit_state',
+                                       'conduit_zip_code',
+                                       'amended_cd',
+                                       'transaction_id']},
+ '^f7[na]': {'^P(3.4|3.3|3.2)': ['form_type',
+                                 'filer_committee_id_number',
+                                 'organization_name',
+                                 'street_1',
+                                 'street_2',
+                                 'city',
+                                 'state',
+                                 'zip_code',
+                                 'organization_type',
+                                 'report_code',
+                                 'election_date',
+                                 'election_state',
+                                 'coverage_from_date',
+                                 'coverage_through_date',
+                                 'total_costs',
+                                 'person_designated_last_name',
+                                 'person_designated_first_name',
+                                 'person_designated_middle_name',
+                                 'person_designated_prefix',
+                                 'person_designated_suffix',
+                                 'person_designated_title',
+                                 'date_signed',
+                                 'beginning_image_number',
+                                 'end_image_number',
+                                 'receipt_date'],
+             '^P(3.1|3.0|2|1)': ['form_type',
+                                 'filer_committee_id_number',
+                                 'organization_name',
+                                 'street_1',
+                                 'street_2',
+                                 'city',
+                                 'state',
+                                 'zip_code',
+                                 'organization_type',
+                                 'report_code',
+                                 'election_date',
+                                 'election_state',
+                                 'coverage_from_date',
+                                 'coverage_through_date',
+                                 'total_costs',
+                                 'person_designated_last_name',
+                                 'person_designated_first_name',
+                                 'person_designated_middle_name',
+                                 'person_designated_prefix',
+                                 'person_designated_suffix',
+                                 'person_designated_title',
+                                 'date_signed',
+                                 'beginning_image_number'],
+             '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                              'filer_committee_id_number',
+                                                              'organization_name',
+                                                              'street_1',
+                                                              'street_2',
+                                                              'city',
+                                                              'state',
+                                                              'zip_code',
+                                                              'organization_type',
+                                                              'report_code',
+                                                              'election_date',
+                                                              'election_state',
+                                                              'coverage_from_date',
+                                                              'coverage_through_date',
+                                                              'total_costs',
+                                                              'person_designated_last_name',
+                                                              'person_designated_first_name',
+                                                              'person_designated_middle_name',
+                                                              'person_designated_prefix',
+                                                              'person_designated_suffix',
+                                                              'person_designated_title',
+                                                              'date_signed'],
+             '^5.3|5.2|5.1|5.0|^3.0': ['form_type',
+                                       'filer_committee_id_number',
+                                       'organization_name',
+                                       'street_1',
+                                       'street_2',
+                                       'city',
+                                       'state',
+                                       'zip_code',
+                                       'organization_type',
+                                       'report_code',
+                                       'election_date',
+                                       'election_state',
+                                       'coverage_from_date',
+                                       'coverage_through_date',
+                                       'total_costs',
+                                       'person_designated_name',
+                                       'date_signed',
+                                       'person_designated_title']},
+ '^f76': {'^P(3|2|1)': ['form_type',
+                        'filer_committee_id_number',
+                        'communication_type',
+                        'communication_type_description',
+                        'communication_class',
+                        'communication_date',
+                        'support_oppose_code',
+                        'candidate_last_name',
+                        'candidate_first_name',
+                        'candidate_middle_name',
+                        'candidate_prefix',
+                        'candidate_suffix',
+                        'candidate_office',
+                        'candidate_state',
+                        'candidate_district',
+                        'election_code',
+                        'communication_cost',
+                        'image_number'],
+          '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                           'filer_committee_id_number',
+                                                           'transaction_id',
+                                                           'communication_type',
+                                                           'communication_type_description',
+                                                           'communication_class',
+                                                           'communication_date',
+                                                           'communication_cost',
+                                                           'election_code',
+                                                           'election_other_description',
+                                                           'support_oppose_code',
+                                                           'candidate_id_number',
+                                                           'candidate_last_name',
+                                                           'candidate_first_name',
+                                                           'candidate_middle_name',
+                                                           'candidate_prefix',
+                                                           'candidate_suffix',
+                                                           'candidate_office',
+                                                           'candidate_state',
+                                                           'candidate_district'],
+          '^5.3|5.2|5.1|5.0|^3.0': ['form_type',
+                                    'filer_committee_id_number',
+                                    'communication_type',
+                                    'communication_type_description',
+                                    'communication_class',
+                                    'communication_date',
+                                    'support_oppose_code',
+                                    'candidate_id_number',
+                                    'candidate_name',
+                                    'candidate_office',
+                                    'candidate_state',
+                                    'candidate_district',
+                                    'election_code',
+                                    'communication_cost',
+                                    '',
+                                    'transaction_id']},
+ '(^f8$)|(^f8[an])': {'^6': ['form_type',
+                             'filer_committee_id_number',
+                             'committee_name',
+                             'street_1',
+                             'street_2',
+                             'city',
+                             'state',
+                             'zip_code',
+                             'cash_on_hand',
+                             'cash_on_hand_as_of_date',
+                             'total_assets_to_be_liquidated',
+                             'total_assets',
+                             'receipts_ytd',
+                             'disbursements_ytd',
+                             'total_debts_owed',
+                             'total_num_creditors_owed',
+                             'num_creditors_part_ii',
+                             'total_debts_owed_part_ii',
+                             'total_to_be_paid_to_creditors',
+                             'committee_is_terminating_activities',
+                             'planned_termination_report_date',
+                             'other_auth_committees',
+                             'other_auth_committees_description',
+                             'sufficient_funds_to_pay_total',
+                             'steps_taken_description',
+                             'committee_filed_previous_plans',
+                             'residual_funds',
+                             'residual_funds_description',
+                             'sufficient_funds_part_iii',
+                             'sufficient_funds_part_iii_description',
+                             'treasurer_last_name',
+                             'treasurer_first_name',
+                             'treasurer_middle_name',
+                             'treasurer_prefix',
+                             'treasurer_suffix',
+                             'date_signed'],
+                      '^5': ['form_type',
+                             'filer_committee_id_number',
+                             'committee_name',
+                             'street_1',
+                             'street_2',
+                             'city',
+                             'state',
+                             'zip_code',
+                             'cash_on_hand',
+                             'cash_on_hand_as_of_date',
+                             'total_assets_to_be_liquidated',
+                             'total_assets',
+                             'receipts_ytd',
+                             'disbursements_ytd',
+                             'total_debts_owed',
+                             'total_num_creditors_owed',
+                             'num_creditors_part_ii',
+                             'total_debts_owed_part_ii',
+                             'total_to_be_paid_to_creditors',
+                             'committee_is_terminating_activities',
+                             'planned_termination_report_date',
+                             'other_auth_committees',
+                             'other_auth_committees_description',
+                             'sufficient_funds_to_pay_total',
+                             'steps_taken_description',
+                             'committee_filed_previous_plans',
+                             'residual_funds',
+                             'residual_funds_description',
+                             'sufficient_funds_part_iii',
+                             'sufficient_funds_part_iii_description',
+                             'treasurer_name',
+                             'date_signed']},
+ '^f8ii$': {'^6': ['form_type',
+                   'filer_committee_id_number',
+                   'transaction_id',
+                   'entity_type',
+                   'creditor_organization_name',
+                   'creditor_last_name',
+                   'creditor_first_name',
+                   'creditor_middle_name',
+                   'creditor_prefix',
+                   'creditor_suffix',
+                   'creditor_street_1',
+                   'creditor_street_2',
+                   'creditor_city',
+                   'creditor_state',
+                   'creditor_zip_code',
+                   'date_incurred',
+                   'amount_owed_to',
+                   'amount_offered_in',
+                   'creditor_code',
+                   'nature_of_debt_description',
+                   'efforts_made_to_pay_debt',
+                   'steps_taken_to_collect',
+                   'effort_made_by_creditor',
+                   'no_effort_description',
+                   'terms_of_settlement_comparable',
+                   'not_comparable_description',
+                   'creditor_committee_id_number',
+                   'creditor_candidate_id_number',
+                   'creditor_candidate_last_name',
+                   'creditor_candidate_first_name',
+                   'creditor_candidate_middle_name',
+                   'creditor_candidate_prefix',
+                   'creditor_candidate_suffix',
+                   'creditor_candidate_office',
+                   'creditor_candidate_state',
+                   'creditor_candidate_district',
+                   'signer_last_name',
+                   'signer_first_name',
+                   'signer_middle_name',
+                   'signer_prefix',
+                   'signer_suffix',
+                   'date_signed'],
+            '^5': ['form_type',
+                   'filer_committee_id_number',
+                   'creditor_code',
+                   'creditor_name',
+                   'creditor_street_1',
+                   'creditor_street_2',
+                   'creditor_city',
+                   'creditor_state',
+                   'creditor_zip_code',
+                   'date_incurred',
+                   'amount_owed_to',
+                   'amount_offered_in',
+                   'nature_of_debt_description',
+                   'efforts_made_to_pay_debt',
+                   'steps_taken_to_collect',
+                   'effort_made_by_creditor',
+                   'no_effort_description',
+                   'terms_of_settlement_comparable',
+                   'not_comparable_description',
+                   'creditor_committee_id_number',
+                   'creditor_candidate_id_number',
+                   'creditor_candidate_name',
+                   'creditor_candidate_office',
+                   'creditor_candidate_state',
+                   'creditor_candidate_district',
+                   'signer_name',
+                   'date_signed',
+                   'amended_cd',
+                   'transaction_id']},
+ '^f8iii$': {'^6': ['form_type',
+                    'filer_committee_id_number',
+                    'transaction_id',
+                    'entity_type',
+                    'creditor_organization_name',
+                    'creditor_last_name',
+                    'creditor_first_name',
+                    'creditor_middle_name',
+                    'creditor_prefix',
+                    'creditor_suffix',
+                    'creditor_street_1',
+                    'creditor_street_2',
+                    'creditor_city',
+                    'creditor_state',
+                    'creditor_zip_code',
+                    'date_incurred',
+                    'amount_owed_to',
+                    'amount_expected_to_pay',
+                    'creditor_code',
+                    'disputed_debt',
+                    'creditor_committee_id_number',
+                    'creditor_candidate_id_number',
+                    'creditor_candidate_last_name',
+                    'creditor_candidate_first_name',
+                    'creditor_candidate_middle_name',
+                    'creditor_candidate_prefix',
+                    'creditor_candidate_suffix',
+                    'creditor_candidate_office',
+                    'creditor_candidate_state',
+                    'creditor_candidate_district'],
+             '^5': ['form_type',
+                    'filer_committee_id_number',
+                    'creditor_code',
+                    'creditor_name',
+                    'creditor_street_1',
+                    'creditor_street_2',
+                    'creditor_city',
+                    'creditor_state',
+                    'creditor_zip_code',
+                    'disputed_debt',
+                    'date_incurred',
+                    'amount_owed_to',
+                    'amount_expected_to_pay',
+                    'creditor_committee_id_number',
+                    'creditor_candidate_id_number',
+                    'creditor_candidate_name',
+                    'creditor_candidate_office',
+                    'creditor_candidate_state',
+                    'creditor_candidate_district',
+                    'amended_cd',
+                    'transaction_id']},
+ '(^f9$)|(^f9[an])': {'^P(3.4|3.3|3.2)': ['form_type',
+                                          'filer_committee_id_number',
+                                          'organization_name',
+                                          'individual_last_name',
+                                          'individual_first_name',
+                                          'individual_middle_name',
+                                          'individual_prefix',
+                                          'individual_suffix',
+                                          'change_of_address',
+                                          'street_1',
+                                          'street_2',
+                                          'city',
+                                          'state',
+                                          'zip_code',
+                                          'individual_employer',
+                                          'individual_occupation',
+                                          'coverage_from_date',
+                                          'coverage_through_date',
+                                          'date_public_distribution',
+                                          'communication_title',
+                                          'filer_code',
+                                          'filer_code_description',
+                                          'segregated_bank_account',
+                                          'custodian_last_name',
+                                          'custodian_first_name',
+                                          'custodian_middle_name',
+                                          'custodian_prefix',
+                                          'custodian_suffix',
+                                          'custodian_street_1',
+                                          'custodian_street_2',
+                                          'custodian_city',
+                                          'custodian_state',
+                                          'custodian_zip_code',
+                                          'custodian_employer',
+                                          'custodian_occupation',
+                                          'total_donations',
+                                          'total_disbursements',
+                                          'person_completing_last_name',
+                                          'person_completing_first_name',
+                                          'person_completing_middle_name',
+                                          'person_completing_prefix',
+                                          'person_completing_suffix',
+                                          'date_signed',
+                                          'beginning_image_number',
+                                          'end_image_number',
+                                          'receipt_date'],
+                      '^P(3.1|3.0|2.6|2.4)': ['form_type',
+                                              'filer_committee_id_number',
+                                              'organization_name',
+                                              'individual_last_name',
+                                              'individual_first_name',
+                                              'individual_middle_name',
+                                              'individual_prefix',
+                                              'individual_suffix',
+                                              'change_of_address',
+                                              'street_1',
+                                              'street_2',
+                                              'city',
+                                              'state',
+                                              'zip_code',
+                                              'individual_employer',
+                                              'individual_occupation',
+                                              'coverage_from_date',
+                                              'coverage_through_date',
+                                              'date_public_distribution',
+                                              'communication_title',
+                                              'filer_code',
+                                              'filer_code_description',
+                                              'segregated_bank_account',
+                                              'custodian_last_name',
+                                              'custodian_first_name',
+                                              'custodian_middle_name',
+                                              'custodian_prefix',
+                                              'custodian_suffix',
+                                              'custodian_street_1',
+                                              'custodian_street_2',
+                                              'custodian_city',
+                                              'custodian_state',
+                                              'custodian_zip_code',
+                                              'custodian_employer',
+                                              'custodian_occupation',
+                                              'total_donations',
+                                              'total_disbursements',
+                                              'person_completing_last_name',
+                                              'person_completing_first_name',
+                                              'person_completing_middle_name',
+                                              'person_completing_prefix',
+                                              'person_completing_suffix',
+                                              'date_signed',
+                                              'beginning_image_number'],
+                      '^P(2.3|2.2|1)': ['form_type',
+                                        'filer_committee_id_number',
+                                        'organization_name',
+                                        'individual_last_name',
+                                        'individual_first_name',
+                                        'individual_middle_name',
+                                        'individual_prefix',
+                                        'individual_suffix',
+                                        'change_of_address',
+                                        'street_1',
+                                        'street_2',
+                                        'city',
+                                        'state',
+                                        'zip_code',
+                                        'individual_employer',
+                                        'individual_occupation',
+                                        'coverage_from_date',
+                                        'coverage_through_date',
+                                        'date_public_distribution',
+                                        'communication_title',
+                                        'qualified_non_profit',
+                                        'segregated_bank_account',
+                                        'custodian_last_name',
+                                        'custodian_first_name',
+                                        'custodian_middle_name',
+                                        'custodian_prefix',
+                                        'custodian_suffix',
+                                        'custodian_street_1',
+                                        'custodian_street_2',
+                                        'custodian_city',
+                                        'custodian_state',
+                                        'custodian_zip_code',
+                                        'custodian_employer',
+                                        'custodian_occupation',
+                                        'total_donations',
+                                        'total_disbursements',
+                                        'person_completing_last_name',
+                                        'person_completing_first_name',
+                                        'person_completing_middle_name',
+                                        'person_completing_prefix',
+                                        'person_completing_suffix',
+                                        'date_signed',
+                                        'beginning_image_number'],
+                      '^8.5|8.4|8.3': ['form_type',
+                                       'filer_committee_id_number',
+                                       'entity_type',
+                                       'organization_name',
+                                       'individual_last_name',
+                                       'individual_first_name',
+                                       'individual_middle_name',
+                                       'individual_prefix',
+                                       'individual_suffix',
+                                       'change_of_address',
+                                       'street_1',
+                                       'street_2',
+                                       'city',
+                                       'state',
+                                       'zip_code',
+                                       'individual_employer',
+                                       'individual_occupation',
+                                       'original_amendment_date',
+                                       'coverage_from_date',
+                                       'coverage_through_date',
+                                       'date_public_distribution',
+                                       'communication_title',
+                                       'filer_code',
+                                       'filer_code_description',
+                                       'segregated_bank_account',
+                                       'custodian_last_name',
+                                       'custodian_first_name',
+                                       'custodian_middle_name',
+                                       'custodian_prefix',
+                                       'custodian_suffix',
+                                       'custodian_street_1',
+                                       'custodian_street_2',
+                                       'custodian_city',
+                                       'custodian_state',
+                                       'custodian_zip_code',
+                                       'custodian_employer',
+                                       'custodian_occupation',
+                                       'total_donations',
+                                       'total_disbursements',
+                                       'person_completing_last_name',
+                                       'person_completing_first_name',
+                                       'person_completing_middle_name',
+                                       'person_completing_prefix',
+                                       'person_completing_suffix',
+                                       'date_signed'],
+                      '^8.2|8.1|8.0|7.0|6.4|6.3|6.2': ['form_type',
+                                                       'filer_committee_id_number',
+                                                       'entity_type',
+                                                       'organization_name',
+                                                       'individual_last_name',
+                                                       'individual_first_name',
+                                                       'individual_middle_name',
+                                                       'individual_prefix',
+                                                       'individual_suffix',
+                                                       'change_of_address',
+                                                       'street_1',
+                                                       'street_2',
+                                                       'city',
+                                                       'state',
+                                                       'zip_code',
+                                                       'individual_employer',
+                                                       'individual_occupation',
+                                                       'coverage_from_date',
+                                                       'coverage_through_date',
+                                                       'date_public_distribution',
+                                                       'communication_title',
+                                                       'filer_code',
+                                                       'filer_code_description',
+                                                       'segregated_bank_account',
+                                                       'custodian_last_name',
+                                                       'custodian_first_name',
+                                                       'custodian_middle_name',
+                                                       'custodian_prefix',
+                                                       'custodian_suffix',
+                                                       'custodian_street_1',
+                                                       'custodian_street_2',
+                                                       'custodian_city',
+                                                       'custodian_state',
+                                                       'custodian_zip_code',
+                                                       'custodian_employer',
+                                                       'custodian_occupation',
+                                                       'total_donations',
+                                                       'total_disbursements',
+                                                       'person_completing_last_name',
+                                                       'person_completing_first_name',
+                                                       'person_completing_middle_name',
+                                                       'person_completing_prefix',
+                                                       'person_completing_suffix',
+                                                       'date_signed'],
+                      '^6.1': ['form_type',
+                               'filer_committee_id_number',
+                               'entity_type',
+                               'organization_name',
+                               'individual_last_name',
+                               'individual_first_name',
+                               'individual_middle_name',
+                               'individual_prefix',
+                               'individual_suffix',
+                               'change_of_address',
+                               'street_1',
+                               'street_2',
+                               'city',
+                               'state',
+                               'zip_code',
+                               'individual_employer',
+                               'individual_occupation',
+                               'coverage_from_date',
+                               'coverage_through_date',
+                               'date_public_distribution',
+                               'communication_title',
+                               'qualified_non_profit',
+                               'segregated_bank_account',
+                               'custodian_last_name',
+                               'custodian_first_name',
+                               'custodian_middle_name',
+                               'custodian_prefix',
+                               'custodian_suffix',
+                               'custodian_street_1',
+                               'custodian_street_2',
+                               'custodian_city',
+                               'custodian_state',
+                               'custodian_zip_code',
+                               'custodian_employer',
+                               'custodian_occupation',
+                               'total_donations',
+                               'total_disbursements',
+                               'person_completing_last_name',
+                               'person_completing_first_name',
+                               'person_completing_middle_name',
+                               'person_completing_prefix',
+                               'person_completing_suffix',
+                               'date_signed'],
+                      '^5.3|5.2|5.1|5.0': ['form_type',
+                                           'filer_committee_id_number',
+                                           'organization_name',
+                                           'street_1',
+                                           'street_2',
+                                           'city',
+                                           'state',
+                                           'zip_code',
+                                           'change_of_address',
+                                           'individual_employer',
+                                           'individual_occupation',
+                                           'coverage_from_date',
+                                           'coverage_through_date',
+                                           'date_public_distribution',
+                                           'communication_title',
+                                           'qualified_non_profit',
+                                           'segregated_bank_account',
+                                           'custodian_last_name',
+                                           'custodian_street_1',
+                                           'custodian_street_2',
+                                           'custodian_city',
+                                           'custodian_state',
+                                           'custodian_zip_code',
+                                           'custodian_employer',
+                                           'custodian_occupation',
+                                           'total_donations',
+                                           'total_disbursements',
+                                           'person_completing_last_name',
+                                           'date_signed']},
+ '^f91': {'^(P3|P2|P1)': ['form_type',
+                          'filer_committee_id_number',
+                          'controller_last_name',
+                          'controller_first_name',
+                          'controller_middle_name',
+                          'controller_prefix',
+                          'controller_suffix',
+                          'controller_street_1',
+                          'controller_street_2',
+                          'controller_city',
+                          'controller_state',
+                          'controller_zip_code',
+                          'controller_employer',
+                          'controller_occupation',
+                          'image_number'],
+          '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                           'filer_committee_id_number',
+                                                           'transaction_id',
+                                                           'controller_last_name',
+                                                           'controller_first_name',
+                                                           'controller_middle_name',
+                                                           'controller_prefix',
+                                                           'controller_suffix',
+                                                           'controller_street_1',
+                                                           'controller_street_2',
+                                                           'controller_city',
+                                                           'controller_state',
+                                                           'controller_zip_code',
+                                                           'controller_employer',
+                                                           'controller_occupation'],
+          '^5.3': ['form_type',
+                   'filer_committee_id_number',
+                   'controller_last_name',
+                   'controller_street_1',
+                   'controller_street_2',
+                   'controller_city',
+                   'controller_state',
+                   'controller_zip_code',
+                   'controller_employer',
+                   'controller_occupation',
+                   '',
+                   'transaction_id'],
+          '^5.2|5.1|5.0': ['form_type',
+                           'filer_committee_id_number',
+                           'controller_last_name',
+                           'controller_street_1',
+                           'controller_street_2',
+                           'controller_city',
+                           'controller_state',
+                           'controller_zip_code',
+                           'controller_employer',
+                           'controller_occupation',
+                           'amended_cd',
+                           'transaction_id']},
+ '^f92': {'^(P3|P2|P1)': ['form_type',
+                          'filer_committee_id_number',
+                          'contributor_organization_name',
+                          'contributor_last_name',
+                          'contributor_first_name',
+                          'contributor_middle_name',
+                          'contributor_prefix',
+                          'contributor_suffix',
+                          'contributor_street_1',
+                          'contributor_street_2',
+                          'contributor_city',
+                          'contributor_state',
+                          'contributor_zip_code',
+                          'contribution_date',
+                          'contribution_amount',
+                          'memo_text_description',
+                          'image_number'],
+          '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                           'filer_committee_id_number',
+                                                           'transaction_id',
+                                                           'back_reference_tran_id_number',
+                                                           'back_reference_sched_name',
+                                                           'entity_type',
+                                                           'contributor_organization_name',
+                                                           'contributor_last_name',
+                                                           'contributor_first_name',
+                                                           'contributor_middle_name',
+                                                           'contributor_prefix',
+                                                           'contributor_suffix',
+                                                           'contributor_street_1',
+                                                           'contributor_street_2',
+                                                           'contributor_city',
+                                                           'contributor_state',
+                                                           'contributor_zip_code',
+                                                           'contribution_date',
+                                                           'contribution_amount'],
+          '^5.3|5.2': ['form_type',
+                       'filer_committee_id_number',
+                       'entity_type',
+                       'contributor_organization_name',
+                       'contributor_street_1',
+                       'contributor_street_2',
+                       'contributor_city',
+                       'contributor_state',
+                       'contributor_zip_code',
+                       '',
+                       '',
+                       'contributor_employer',
+                       'contributor_occupation',
+                       '',
+                       'contribution_date',
+                       'contribution_amount',
+                       'transaction_type',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       'transaction_id',
+                       'back_reference_tran_id_number',
+                       'back_reference_sched_name'],
+          '^5.1': ['form_type',
+                   'filer_committee_id_number',
+                   'entity_type',
+                   '',
+                   'contributor_street_1',
+                   'contributor_street_2',
+                   'contributor_city',
+                   'contributor_state',
+                   'contributor_zip_code',
+                   '',
+                   '',
+                   'contributor_employer',
+                   'contributor_occupation',
+                   '',
+                   'contribution_date',
+                   'contribution_amount',
+                   'transaction_type',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   'transaction_id',
+                   'back_reference_tran_id_number',
+                   'back_reference_sched_name',
+                   '',
+                   '',
+                   'contributor_organization_name',
+                   'contributor_last_name',
+                   'contributor_first_name',
+                   'contributor_middle_name',
+                   'contributor_prefix',
+                   'contributor_suffix'],
+          '^5.0': ['form_type',
+                   'filer_committee_id_number',
+                   'entity_type',
+                   'contributor_organization_name',
+                   'contributor_street_1',
+                   'contributor_street_2',
+                   'contributor_city',
+                   'contributor_state',
+                   'contributor_zip_code',
+                   '',
+                   '',
+                   'contributor_employer',
+                   'contributor_occupation',
+                   '',
+                   'contribution_date',
+                   'contribution_amount',
+                   'transaction_type',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   'transaction_id',
+                   'back_reference_tran_id_number',
+                   'back_reference_sched_name']},
+ '^f93': {'^(P3.4|3.3|3.2)': ['form_type',
+                              'filer_committee_id_number',
+                              'payee_organization_name',
+                              'payee_last_name',
+                              'payee_first_name',
+                              'payee_middle_name',
+                              'payee_prefix',
+                              'payee_suffix',
+                              'payee_street_1',
+                              'payee_street_2',
+                              'payee_city',
+                              'payee_state',
+                              'payee_zip_code',
+                              'expenditure_date',
+                              'expenditure_amount',
+                              'communication_date',
+                              'expenditure_purpose_descrip',
+                              'transaction_id',
+                              'image_number'],
+          '^(P3.1|3.0|P2|P1)': ['form_type',
+                                'filer_committee_id_number',
+                                'payee_organization_name',
+                                'payee_last_name',
+                                'payee_first_name',
+                                'payee_middle_name',
+                                'payee_prefix',
+                                'payee_suffix',
+                                'payee_street_1',
+                                'payee_street_2',
+                                'payee_city',
+                                'payee_state',
+                                'payee_zip_code',
+                                'expenditure_date',
+                                'expenditure_amount',
+                                'communication_date',
+                                'expenditure_purpose_descrip',
+                                'memo_text_description',
+                                'transaction_id',
+                                'image_number'],
+          '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                           'filer_committee_id_number',
+                                                           'transaction_id',
+                                                           'back_reference_tran_id_number',
+                                                           'back_reference_sched_name',
+                                                           'entity_type',
+                                                           'payee_organization_name',
+                                                           'payee_last_name',
+                                                           'payee_first_name',
+                                                           'payee_middle_name',
+                                                           'payee_prefix',
+                                                           'payee_suffix',
+                                                           'payee_street_1',
+                                                           'payee_street_2',
+                                                           'payee_city',
+                                                           'payee_state',
+                                                           'payee_zip_code',
+                                                           'election_code',
+                                                           'election_other_description',
+                                                           'expenditure_date',
+                                                           'expenditure_amount',
+                                                           'expenditure_purpose_descrip',
+                                                           'payee_employer',
+                                                           'payee_occupation',
+                                                           'communication_date'],
+          '^5.3|5.2': ['form_type',
+                       'filer_committee_id_number',
+                       'entity_type',
+                       '',
+                       'payee_street_1',
+                       'payee_street_2',
+                       'payee_city',
+                       'payee_state',
+                       'payee_zip_code',
+                       'expenditure_purpose_code',
+                       'expenditure_purpose_descrip',
+                       'election_code',
+                       'election_other_description',
+                       'expenditure_date',
+                       'expenditure_amount',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       '',
+                       'transaction_id',
+                       'back_reference_tran_id_number',
+                       'back_reference_sched_name',
+                       '',
+                       '',
+                       '',
+                       'communication_date',
+                       'payee_organization_name',
+                       'payee_last_name',
+                       'payee_first_name',
+                       'payee_middle_name',
+                       'payee_prefix',
+                       'payee_suffix'],
+          '^5.1': ['form_type',
+                   'filer_committee_id_number',
+                   'entity_type',
+                   'payee_organization_name',
+                   'payee_street_1',
+                   'payee_street_2',
+                   'payee_city',
+                   'payee_state',
+                   'payee_zip_code',
+                   'expenditure_purpose_descrip',
+                   'expenditure_purpose_code',
+                   'election_code',
+                   'election_other_description',
+                   'expenditure_date',
+                   'expenditure_amount',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   'transaction_id',
+                   'back_reference_tran_id_number',
+                   'back_reference_sched_name',
+                   '',
+                   '',
+                   '',
+                   'communication_date',
+                   '',
+                   'payee_last_name',
+                   'payee_first_name',
+                   'payee_middle_name',
+                   'payee_prefix',
+                   'payee_suffix'],
+          '^5.0': ['form_type',
+                   'filer_committee_id_number',
+                   'entity_type',
+                   'payee_organization_name',
+                   'payee_street_1',
+                   'payee_street_2',
+                   'payee_city',
+                   'payee_state',
+                   'payee_zip_code',
+                   'election_code',
+                   'election_other_description',
+                   'payee_employer',
+                   'payee_occupation',
+                   '',
+                   'expenditure_date',
+                   'expenditure_amount',
+                   'expenditure_purpose_descrip',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   '',
+                   'transaction_id',
+                   'back_reference_tran_id_number',
+                   'back_reference_sched_name']},
+ '^f94': {'^(P3|P2|P1)': ['form_type',
+                          'filer_committee_id_number',
+                          'candidate_last_name',
+                          'candidate_first_name',
+                          'candidate_middle_name',
+                          'candidate_prefix',
+                          'candidate_suffix',
+                          'candidate_office',
+                          'candidate_state',
+                          'candidate_district',
+                          'election_code',
+                          'election_other_description',
+                          'back_reference_tran_id_number',
+                          'image_number'],
+          '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                           'filer_committee_id_number',
+                                                           'transaction_id',
+                                                           'back_reference_tran_id_number',
+                                                           'back_reference_sched_name',
+                                                           'candidate_id_number',
+                                                           'candidate_last_name',
+                                                           'candidate_first_name',
+                                                           'candidate_middle_name',
+                                                           'candidate_prefix',
+                                                           'candidate_suffix',
+                                                           'candidate_office',
+                                                           'candidate_state',
+                                                           'candidate_district',
+                                                           'election_code',
+                                                           'election_other_description'],
+          '^5.3|5.2|5.1|5.0': ['form_type',
+                               'filer_committee_id_number',
+                               'candidate_id_number',
+                               'candidate_name',
+                               'candidate_office',
+                               'candidate_state',
+                               'candidate_district',
+                               'election_code',
+                               'election_other_description',
+                               '',
+                               'transaction_id',
+                               'back_reference_tran_id_number',
+                               'back_reference_sched_name']},
+ '^f99': {'^(P3.4|P3.3|P3.2)': ['form_type',
+                                'filer_committee_id_number',
+                                'beginning_image_number',
+                                'end_image_number',
+                                'receipt_date'],
+          '^8.5': ['form_type',
+                   'filer_committee_id_number',
+                   'committee_name',
+                   'street_1',
+                   'street_2',
+                   'city',
+                   'state',
+                   'zip_code',
+                   'treasurer_last_name',
+                   'treasurer_first_name',
+                   'treasurer_middle_name',
+                   'treasurer_prefix',
+                   'treasurer_suffix',
+                   'date_signed',
+                   'text_code',
+                   'filing_frequency',
+                   'pdf_attachment',
+                   'text'],
+          '^8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                       'filer_committee_id_number',
+                                                       'committee_name',
+                                                       'street_1',
+                                                       'street_2',
+                                                       'city',
+                                                       'state',
+                                                       'zip_code',
+                                                       'treasurer_last_name',
+                                                       'treasurer_first_name',
+                                                       'treasurer_middle_name',
+                                                       'treasurer_prefix',
+                                                       'treasurer_suffix',
+                                                       'date_signed',
+                                                       'text_code',
+                                                       'text'],
+          '^5.3|5.2|5.1|5.0': ['form_type',
+                               'filer_committee_id_number',
+                               'committee_name',
+                               'street_1',
+                               'street_2',
+                               'city',
+                               'state',
+                               'zip_code',
+                               'treasurer_name',
+                               'date_signed',
+                               'text_code',
+                               'text'],
+          '^3': ['form_type',
+                 'filer_committee_id_number',
+                 'committee_name',
+                 'street_1',
+                 'street_2',
+                 'city',
+                 'state',
+                 'zip_code',
+                 'treasurer_name',
+                 'date_signed',
+                 'text']},
+ '^f10$': {'^6': ['form_type',
+                  'filer_committee_id_number',
+                  'committee_name',
+                  'street_1',
+                  'street_2',
+                  'city',
+                  'state',
+                  'zip_code',
+                  'candidate_id',
+                  'candidate_last_name',
+                  'candidate_first_name',
+                  'candidate_middle_name',
+                  'candidate_prefix',
+                  'candidate_suffix',
+                  'candidate_office',
+                  'candidate_state',
+                  'candidate_district',
+                  'previous_expenditure_aggregate',
+                  'expenditure_total_this_report',
+                  'expenditure_total_cycle_to_date',
+                  'meets_f6_filing_requirements',
+                  'candidate_employer',
+                  'candidate_occupation',
+                  'treasurer_last_name',
+                  'treasurer_first_name',
+                  'treasurer_middle_name',
+                  'treasurer_prefix',
+                  'treasurer_suffix',
+                  'date_signed'],
+           '^5.3': ['form_type',
+                    'filer_committee_id_number',
+                    'candidate_name',
+                    'candidate_id',
+                    'candidate_office',
+                    'candidate_state',
+                    'candidate_district',
+                    'committee_name',
+                    'street_1',
+                    'street_2',
+                    'city',
+                    'state',
+                    'zip_code',
+                    'previous_expenditure_aggregate',
+                    'expenditure_total_this_report',
+                    'expenditure_total_cycle_to_date',
+                    'signer_name',
+                    'date_signed',
+                    'meets_f6_filing_requirements',
+                    'candidate_employer',
+                    'candidate_occupation'],
+           '^(5.0|5.1|5.2)': ['form_type',
+                              'filer_committee_id_number',
+                              'candidate_name',
+                              'candidate_id',
+                              'candidate_office',
+                              'candidate_state',
+                              'candidate_district',
+                              'committee_name',
+                              'street_1',
+                              'street_2',
+                              'city',
+                              'state',
+                              'zip_code',
+                              'previous_expenditure_aggregate',
+                              'expenditure_total_this_report',
+                              'expenditure_total_cycle_to_date',
+                              'signer_name',
+                              'date_signed']},
+ '^f105$': {'^6': ['form_type',
+                   'filer_committee_id_number',
+                   'transaction_id',
+                   'election_code',
+                   'election_other_description',
+                   'expenditure_date',
+                   'expenditure_amount',
+                   'loan_check'],
+            '^5': ['form_type',
+                   'filer_committee_id_number',
+                   'expenditure_date',
+                   'item_elect_cd',
+                   'item_elect_other',
+                   'expenditure_amount',
+                   'loan_check',
+                   'amended_cd',
+                   'transaction_id']},
+ '^h1': {'^P3.4': ['form_type',
+                   'filer_committee_id_number',
+                   'presidential_only_election_year',
+                   'presidential_senate_election_year',
+                   'senate_only_election_year',
+                   'non_presidential_non_senate_election_year',
+                   'federal_percent',
+                   'nonfederal_percent',
+                   'administrative_ratio_applies',
+                   'generic_voter_drive_ratio_applies',
+                   'public_communications_referencing_party_ratio_applies',
+                   'image_number'],
+         '^P1|^P2|^P3.0|^P3.1|^P3.2|^P3.3': ['form_type',
+                                             'filer_committee_id_number',
+                                             'presidential_only_election_year',
+                                             'presidential_senate_election_year',
+                                             'senate_only_election_year',
+                                             'non_presidential_non_senate_election_year',
+                                             'flat_minimum_federal_percentage',
+                                             'federal_percent',
+                                             'nonfederal_percent',
+                                             'administrative_ratio_applies',
+                                             'generic_voter_drive_ratio_applies',
+                                             'public_communications_referencing_party_ratio_applies',
+                                             'image_number'],
+         '^8.5|8.4|8.3|8.2': ['form_type',
+                              'filer_committee_id_number',
+                              'transaction_id',
+                              'presidential_only_election_year',
+                              'presidential_senate_election_year',
+                              'senate_only_election_year',
+                              'non_presidential_non_senate_election_year',
+                              'federal_percent',
+                              'nonfederal_percent',
+                              'administrative_ratio_applies',
+                              'generic_voter_drive_ratio_applies',
+                              'public_communications_referencing_party_ratio_applies'],
+         '^8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                          'filer_committee_id_number',
+                                          'transaction_id',
+                                          'presidential_only_election_year',
+                                          'presidential_senate_election_year',
+                                          'senate_only_election_year',
+                                          'non_presidential_non_senate_election_year',
+                                          'flat_minimum_federal_percentage',
+                                          'federal_percent',
+                                          'nonfederal_percent',
+                                          'administrative_ratio_applies',
+                                          'generic_voter_drive_ratio_applies',
+                                          'public_communications_referencing_party_ratio_applies'],
+         '^5.3|5.2': ['form_type',
+                      'filer_committee_id_number',
+                      'transaction_id',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      '',
+                      'presidential_only_election_year',
+                      'presidential_senate_election_year',
+                      'senate_only_election_year',
+                      'non_presidential_non_senate_election_year',
+                      'flat_minimum_federal_percentage',
+                      'federal_percent',
+                      'nonfederal_percent',
+                      'administrative_ratio_applies',
+                      'generic_voter_drive_ratio_applies',
+                      'public_communications_referencing_party_ratio_applies'],
+         '^5.1|5.0': ['form_type',
+                      'filer_committee_id_number',
+                      'national_party_committee_percentage',
+                      'house_senate_party_committees_minimum_federal_percentage',
+                      'house_senate_party_committees_percentage_federal_candidate_support',
+                      'house_senate_party_committees_percentage_nonfederal_candidate_support',
+                      'house_senate_party_committees_actual_federal_candidate_support',
+                      'house_senate_party_committees_actual_nonfederal_candidate_support',
+                      'house_senate_party_committees_percentage_actual_federal',
+                      'federal_percent',
+                      'nonfederal_percent',
+                      'actual_direct_candidate_support_federal',
+                      'actual_direct_candidate_support_nonfederal',
+                      'actual_direct_candidate_support_federal_percent',
+                      'ballot_presidential',
+                      'ballot_senate',
+                      'ballot_house',
+                      'subtotal_federal',
+                      'ballot_governor',
+                      'ballot_other_statewide',
+                      'ballot_state_senate',
+                      'ballot_state_representative',
+                      'ballot_local_candidates',
+                      'extra_nonfederal_point',
+                      'subtotal',
+                      'total_points',
+                      'flat_minimum_federal_percentage',
+                      '',
+                      'transaction_id',
+                      'presidential_only_election_year',
+                      'presidential_senate_election_year',
+                      'senate_only_election_year',
+                      'non_presidential_non_senate_election_year'],
+         '^3.0|^2|^1': ['ballot_local_candidates',
+                        'filer_committee_id_number',
+                        'national_party_committee_percentage',
+                        'house_senate_party_committees_minimum_federal_percentage',
+                        'house_senate_party_committees_percentage_federal_candidate_support',
+                        'house_senate_party_committees_percentage_nonfederal_candidate_support',
+                        'house_senate_party_committees_actual_federal_candidate_support',
+                        'house_senate_party_committees_actual_nonfederal_candidate_support',
+                        'house_senate_party_committees_percentage_actual_federal',
+                        'federal_percent',
+                        'nonfederal_percent',
+                        'actual_direct_candidate_support_federal',
+                        'actual_direct_candidate_support_nonfederal',
+                        'actual_direct_candidate_support_federal_percent',
+                        'ballot_presidential',
+                        'ballot_senate',
+                        'ballot_house',
+                        'subtotal_federal',
+                        'ballot_governor',
+                        'ballot_other_statewide',
+                        'ballot_state_senate',
+                        'ballot_state_representative',
+                        'ballot_local_candidates',
+                        'extra_nonfederal_point',
+                        'subtotal',
+                        'total_points',
+                        'flat_minimum_federal_percentage',
+                        'amended_cd',
+                        'transaction_id']},
+ '^h2': {'^P3|^P2|^P1': ['form_type',
+                         'filer_committee_id_number',
+                         'activity_event_name',
+                         'direct_fundraising',
+                         'direct_candidate_support',
+                         'ratio_code',
+                         'federal_percentage',
+                         'nonfederal_percentage',
+                         'image_number'],
+         '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                          'filer_committee_id_number',
+                                                          'transaction_id',
+                                                          'activity_event_name',
+                                                          'direct_fundraising',
+                                                          'direct_candidate_support',
+                                                          'ratio_code',
+                                                          'federal_percentage',
+                                                          'nonfederal_percentage'],
+         '^5.3|5.2|5.1': ['form_type',
+                          'filer_committee_id_number',
+                          'activity_event_name',
+                          'direct_fundraising',
+                          '',
+                          'direct_candidate_support',
+                          'ratio_code',
+                          'federal_percentage',
+                          'nonfederal_percentage',
+                          '',
+                          'transaction_id'],
+         '^5.0|^3.0|^2|^1': ['form_type',
+                             'filer_committee_id_number',
+                             'activity_event_name',
+                             'direct_fundraising',
+                             'exempt_activity',
+                             'direct_candidate_support',
+                             'ratio_code',
+                             'federal_percentage',
+                             'nonfederal_percentage',
+                             'amended_cd',
+                             'transaction_id']},
+ '^h3': {'^P3|^P2|^P1': ['form_type',
+                         'filer_committee_id_number',
+                         'account_name',
+                         'receipt_date',
+                         'total_amount_transferred',
+                         'event_type',
+                         'transferred_amount',
+                         'event_activity_name',
+                         'image_number'],
+         '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                          'filer_committee_id_number',
+                                                          'transaction_id',
+                                                          'back_reference_tran_id_number',
+                                                          'account_name',
+                                                          'event_type',
+                                                          'event_activity_name',
+                                                          'receipt_date',
+                                                          'total_amount_transferred',
+                                                          'transferred_amount'],
+         '^5.3|5.2|5.1|5.0|^3.0': ['form_type',
+                                   'filer_committee_id_number',
+                                   'back_reference_tran_id_number',
+                                   'account_name',
+                                   'event_activity_name',
+                                   'event_type',
+                                   'receipt_date',
+                                   'transferred_amount',
+                                   'total_amount_transferred',
+                                   'amended_cd',
+                                   'transaction_id'],
+         '^2': ['form_type',
+                'filer_committee_id_number',
+                'account_name',
+                'receipt_date',
+                'total_amount_transferred',
+                'administrative_voter_drive_activity',
+                'direct_fundraising',
+                'exempt_activity',
+                'amended_cd',
+                'transaction_id',
+                'orig_tran_id',
+                'supr_tran_id']},
+ '^h4': {'^P3.2|^P3.3|^P3.4': ['form_type',
+                               'filer_committee_id_number',
+                               'payee_organization_name',
+                               'payee_last_name',
+                               'payee_first_name',
+                               'payee_middle_name',
+                               'payee_prefix',
+                               'payee_suffix',
+                               'payee_street_1',
+                               'payee_street_2',
+                               'payee_city',
+                               'payee_state',
+                               'payee_zip_code',
+                               'expenditure_purpose_description',
+                               'account_identifier',
+                               'category_code',
+                               'administrative_voter_drive_activity',
+                               'fundraising_activity',
+                               'exempt_activity',
+                               'generic_voter_drive_activity',
+                               'direct_candidate_support_activity',
+                               'public_communications_party_activity',
+                               'event_year_to_date',
+                               'expenditure_date',
+                               'federal_share',
+                               'nonfederal_share',
+                               'total_amount',
+                               'memo_code',
+                               'memo_text',
+                               'image_number'],
+         '^P1|^P2|^P3.0|^P3.1': ['form_type',
+                                 'filer_committee_id_number',
+                                 'payee_organization_name',
+                                 'payee_last_name',
+                                 'payee_first_name',
+                                 'payee_middle_name',
+                                 'payee_prefix',
+                                 'payee_suffix',
+                                 'payee_street_1',
+                                 'payee_street_2',
+                                 'payee_city',
+                                 'payee_state',
+                                 'payee_zip_code',
+                                 'expenditure_purpose_description',
+                                 'account_identifier',
+                                 'category_code',
+                                 'administrative_voter_drive_activity',
+                                 'fundraising_activity',
+                                 'exempt_activity',
+                                 'generic_voter_drive_activity',
+                                 'direct_candidate_support_activity',
+                                 'public_communications_party_activity',
+                                 'event_year_to_date',
+                                 'expenditure_date',
+                                 'federal_share',
+                                 'nonfederal_share',
+                                 'total_amount',
+                                 'image_number'],
+         '^8.5|8.4|8.3|8.2|8.1|8.0': ['form_type',
+                                      'filer_committee_id_number',
+                                      'transaction_id_number',
+                                      'back_reference_tran_id_number',
+                                      'back_reference_sched_name',
+                                      'entity_type',
+                                      'payee_organization_name',
+                                      'payee_last_name',
+                                      'payee_first_name',
+                                      'payee_middle_name',
+                                      'payee_prefix',
+                                      'payee_suffix',
+                                      'payee_street_1',
+                                      'payee_street_2',
+                                      'payee_city',
+                                      'payee_state',
+                                      'payee_zip_code',
+                                      'account_identifier',
+                                      'expenditure_date',
+                                      'total_amount',
+                                      'federal_share',
+                                      'nonfederal_share',
+                                      'event_year_to_date',
+                                      'expenditure_purpose_description',
+                                      'category_code',
+                                      'administrative_voter_drive_activity',
+                                      'fundraising_activity',
+                                      'exempt_activity',
+                                      'generic_voter_drive_activity',
+                                      'direct_candidate_support_activity',
+                                      'public_communications_party_activity',
+                                      'memo_code',
+                                      'memo_text'],
+         '^7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                  'filer_committee_id_number',
+                                  'transaction_id_number',
+                                  'back_reference_tran_id_number',
+                                  'back_reference_sched_name',
+                                  'entity_type',
+                                  'payee_organization_name',
+                                  'payee_last_name',
+                                  'payee_first_name',
+                                  'payee_middle_name',
+                                  'payee_prefix',
+                                  'payee_suffix',
+                                  'payee_street_1',
+                                  'payee_street_2',
+                                  'payee_city',
+                                  'payee_state',
+                                  'payee_zip_code',
+                                  'account_identifier',
+                                  'expenditure_date',
+                                  'total_amount',
+                                  'federal_share',
+                                  'nonfederal_share',
+                                  'event_year_to_date',
+                                  'expenditure_purpose_code',
+                                  'expenditure_purpose_description',
+                                  'category_code',
+                                  'administrative_voter_drive_activity',
+                                  'fundraising_activity',
+                                  'exempt_activity',
+                                  'generic_voter_drive_activity',
+                                  'direct_candidate_support_activity',
+                                  'public_communications_party_activity',
+                                  'memo_code',
+                                  'memo_text'],
+         '^5.3|5.2': ['form_type',
+                      'filer_committee_id_number',
+                      'entity_type',
+                      'payee_name',
+                      'payee_street_1',
+                      'payee_street_2',
+                      'payee_city',
+                      'payee_state',
+                      'payee_zip_code',
+                      'expenditure_purpose_description',
+                      'expenditure_date',
+                      'total_amount',
+                      'federal_share',
+                      'nonfederal_share',
+                      '',
+                      'fundraising_activity',
+                      'exempt_activity',
+                      'direct_candidate_support_activity',
+                      'event_year_to_date',
+                      'account_identifier',
+                      'fec_committee_id_number',
+                      'fec_candidate_id_number',
+                      'candidate_name',
+                      'candidate_office',
+                      'candidate_state',
+                      'candidate_district',
+                      'conduit_name',
+                      'conduit_street_1',
+                      'conduit_street_2',
+                      'conduit_city',
+                      'conduit_state',
+                      'conduit_zip_code',
+                      '',
+                      'transaction_id_number',
+                      'memo_code',
+                      'memo_text',
+                      'back_reference_tran_id_number',
+                      'back_reference_sched_name',
+                      'administrative_voter_drive_activity',
+                      'generic_voter_drive_activity',
+                      'category_code',
+                      'expenditure_purpose_code',
+                      'public_communications_party_activity'],
+         '^5.1|5.0': ['form_type',
+                      'filer_committee_id_number',
+                      'entity_type',
+                      'payee_name',
+                      'payee_street_1',
+                      'payee_street_2',
+                      'payee_city',
+                      'payee_state',
+                      'payee_zip_code',
+                      'expenditure_purpose_description',
+                      'expenditure_date',
+                      'total_amount',
+                      'federal_share',
+                      'nonfederal_share',
+                      '',
+                      'fundraising_activity',
+                      'exempt_activity',
+                      'direct_candidate_support_activity',
+                      'event_year_to_date',
+                      'account_identifier',
+                      'fec_committee_id_number',
+                      'fec_candidate_id_number',
+                      'candidate_name',
+                      'candidate_office',
+                      'candidate_state',
+                      'candidate_district',
+                      'conduit_name',
+                      'conduit_street_1',
+                      'conduit_street_2',
+                      'conduit_city',
+                      'conduit_state',
+                      'conduit_zip_code',
+                      '',
+                      'transaction_id_number',
+                      'memo_code',
+                      'memo_text',
+                      'back_reference_tran_id_number',
+                      'back_reference_sched_name',
+                      'administrative_voter_drive_activity',
+                      'generic_voter_drive_activity',
+                      'category_code',
+                      'expenditure_purpose_code'],
+         '^3.0': ['form_type',
+                  'filer_committee_id_number',
+                  'entity_type',
+                  'payee_name',
+                  'payee_street_1',
+                  'payee_street_2',
+                  'payee_city',
+                  'payee_state',
+                  'payee_zip_code',
+                  'expenditure_purpose_description',
+                  'expenditure_date',
+                  'total_amount',
+                  'federal_share',
+                  'nonfederal_share',
+                  'administrative_voter_drive_activity',
+                  'fundraising_activity',
+                  'exempt_activity',
+                  'direct_candidate_support_activity',
+                  'event_year_to_date',
+                  'account_identifier',
+                  'fec_committee_id_number',
+                  'fec_candidate_id_number',
+                  'candidate_name',
+                  'candidate_office',
+                  'candidate_state',
+                  'candidate_district',
+                  'conduit_name',
+                  'conduit_street_1',
+                  'conduit_street_2',
+                  'conduit_city',
+                  'conduit_state',
+                  'conduit_zip_code',
+                  'amended_cd',
+                  'transaction_id_number',
+                  'memo_code',
+                  'memo_text',
+                  'back_reference_tran_id_number',
+                  'back_reference_sched_name'],
+         '^2': ['form_type',
+                'filer_committee_id_number',
+                'entity_type',
+                'payee_name',
+                'payee_street_1',
+                'payee_street_2',
+                'payee_city',
+                'payee_state',
+                'payee_zip_code',
+                'expenditure_purpose_description',
+                'expenditure_date',
+                'total_amount',
+                'federal_share',
+                'nonfederal_share',
+                'administrative_voter_drive_activity',
+                'fundraising_activity',
+                'exempt_activity',
+                'direct_candidate_support_activity',
+                'event_year_to_date',
+                'account_identifier',
+                'fec_committee_id_number',
+                'fec_candidate_id_number',
+                'candidate_name',
+                'candidate_office',
+                'candidate_state',
+                'candidate_district',
+                'conduit_name',
+                'conduit_street_1',
+                'conduit_street_2',
+                'conduit_city',
+                'conduit_state',
+                'conduit_zip_code',
+                'amended_cd',
+                'transaction_id_number',
+                'orig_tran_id',
+                'supr_tran_id']},
+ '^h5': {'^(P3|P2|P1)': ['form_type',
+                         'filer_committee_id_number',
+                         'account_name',
+                         'receipt_date',
+                         'total_amount_transferred',
+                         'voter_registration_amount',
+                         'voter_id_amount',
+                         'gotv_amount',
+                         'generic_campaign_amount',
+                         'image_number'],
+         '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                          'filer_committee_id_number',
+                                                          'transaction_id',
+                                                          'account_name',
+                                                          'receipt_date',
+                                                          'total_amount_transferred',
+                                                          'voter_registration_amount',
+                                                          'voter_id_amount',
+                                                          'gotv_amount',
+                                                          'generic_campaign_amount'],
+         '^5.3|5.2|5.1|5.0': ['form_type',
+                              'filer_committee_id_number',
+                              'account_name',
+                              'receipt_date',
+                              'voter_registration_amount',
+                              'voter_id_amount',
+                              'gotv_amount',
+                              'generic_campaign_amount',
+                              'total_amount_transferred',
+                              '',
+                              'transaction_id']},
+ '^h6': {'^(P3.4|P3.3|P3.2)': ['form_type',
+                               'filer_committee_id_number',
+                               'payee_organization_name',
+                               'payee_last_name',
+                               'payee_first_name',
+                               'payee_middle_name',
+                               'payee_prefix',
+                               'payee_suffix',
+                               'payee_street_1',
+                               'payee_street_2',
+                               'payee_city',
+                               'payee_state',
+                               'payee_zip_code',
+                               'expenditure_purpose_description',
+                               'category_code',
+                               'voter_registration_activity',
+                               'gotv_activity',
+                               'voter_id_activity',
+                               'generic_campaign_activity',
+                               'event_year_to_date',
+                               'expenditure_date',
+                               'federal_share',
+                               'levin_share',
+                               'total_amount',
+                               'memo_code',
+                               'memo_text',
+                               'image_number'],
+         '^(P3.1|P3.0|P2|P1)': ['form_type',
+                                'filer_committee_id_number',
+                                'payee_organization_name',
+                                'payee_last_name',
+                                'payee_first_name',
+                                'payee_middle_name',
+                                'payee_prefix',
+                                'payee_suffix',
+                                'payee_street_1',
+                                'payee_street_2',
+                                'payee_city',
+                                'payee_state',
+                                'payee_zip_code',
+                                'expenditure_purpose_description',
+                                'category_code',
+                                'voter_registration_activity',
+                                'gotv_activity',
+                                'voter_id_activity',
+                                'generic_campaign_activity',
+                                'event_year_to_date',
+                                'expenditure_date',
+                                'federal_share',
+                                'levin_share',
+                                'total_amount',
+                                'image_number'],
+         '^8.5|8.4|8.3|8.2|8.1|8.0': ['form_type',
+                                      'filer_committee_id_number',
+                                      'transaction_id_number',
+                                      'back_reference_tran_id_number',
+                                      'back_reference_sched_name',
+                                      'entity_type',
+                                      'payee_organization_name',
+                                      'payee_last_name',
+                                      'payee_first_name',
+                                      'payee_middle_name',
+                                      'payee_prefix',
+                                      'payee_suffix',
+                                      'payee_street_1',
+                                      'payee_street_2',
+                                      'payee_city',
+                                      'payee_state',
+                                      'payee_zip_code',
+                                      'account_identifier',
+                                      'expenditure_date',
+                                      'total_amount',
+                                      'federal_share',
+                                      'levin_share',
+                                      'event_year_to_date',
+                                      'expenditure_purpose_description',
+                                      'category_code',
+                                      'voter_registration_activity',
+                                      'gotv_activity',
+                                      'voter_id_activity',
+                                      'generic_campaign_activity',
+                                      'memo_code',
+                                      'memo_text'],
+         '^7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                  'filer_committee_id_number',
+                                  'transaction_id_number',
+                                  'back_reference_tran_id_number',
+                                  'back_reference_sched_name',
+                                  'entity_type',
+                                  'payee_organization_name',
+                                  'payee_last_name',
+                                  'payee_first_name',
+                                  'payee_middle_name',
+                                  'payee_prefix',
+                                  'payee_suffix',
+                                  'payee_street_1',
+                                  'payee_street_2',
+                                  'payee_city',
+                                  'payee_state',
+                                  'payee_zip_code',
+                                  'account_identifier',
+                                  'expenditure_date',
+                                  'total_amount',
+                                  'federal_share',
+                                  'levin_share',
+                                  'event_year_to_date',
+                                  'expenditure_purpose_code',
+                                  'expenditure_purpose_description',
+                                  'category_code',
+                                  'voter_registration_activity',
+                                  'gotv_activity',
+                                  'voter_id_activity',
+                                  'generic_campaign_activity',
+                                  'memo_code',
+                                  'memo_text'],
+         '^5.3|5.2|5.1|5.0': ['form_type',
+                              'filer_committee_id_number',
+                              'entity_type',
+                              'payee_name',
+                              'payee_street_1',
+                              'payee_street_2',
+                              'payee_city',
+                              'payee_state',
+                              'payee_zip_code',
+                              'category_code',
+                              'expenditure_purpose_code',
+                              'expenditure_purpose_description',
+                              'expenditure_date',
+                              'total_amount',
+                              'federal_share',
+                              'levin_share',
+                              'voter_registration_activity',
+                              'gotv_activity',
+                              'voter_id_activity',
+                              'generic_campaign_activity',
+                              'event_year_to_date',
+                              'account_identifier',
+                              'fec_committee_id_number',
+                              'fec_candidate_id_number',
+                              'candidate_name',
+                              'candidate_office',
+                              'candidate_state',
+                              'candidate_district',
+                              'conduit_committee_id',
+                              'conduit_name',
+                              'conduit_street_1',
+                              'conduit_street_2',
+                              'conduit_city',
+                              'conduit_state',
+                              'conduit_zip_code',
+                              'memo_code',
+                              'memo_text',
+                              '',
+                              'transaction_id_number',
+                              'back_reference_tran_id_number',
+                              'back_reference_sched_name']},
+ '^sa[^3]': {'^P3.2|^P3.3|^P3.4': ['form_type',
+                                   'filer_committee_id_number',
+                                   'contributor_organization_name',
+                                   'contributor_last_name',
+                                   'contributor_first_name',
+                                   'contributor_middle_name',
+                                   'contributor_prefix',
+                                   'contributor_suffix',
+                                   'contributor_street_1',
+                                   'contributor_street_2',
+                                   'contributor_city',
+                                   'contributor_state',
+                                   'contributor_zip_code',
+                                   'contribution_date',
+                                   'donor_committee_fec_id',
+                                   'contributor_employer',
+                                   'contributor_occupation',
+                                   'election_code',
+                                   'election_other_description',
+                                   'contribution_aggregate',
+                                   'contribution_amount',
+                                   'memo_code',
+                                   'memo_text_description',
+                                   'image_number'],
+             '^(P2.6|P3.0|P3.1)': ['form_type',
+                                   'filer_committee_id_number',
+                                   'contributor_organization_name',
+                                   'contributor_last_name',
+                                   'contributor_first_name',
+                                   'contributor_middle_name',
+                                   'contributor_prefix',
+                                   'contributor_suffix',
+                                   'contributor_street_1',
+                                   'contributor_street_2',
+                                   'contributor_city',
+                                   'contributor_state',
+                                   'contributor_zip_code',
+                                   'contribution_date',
+                                   'donor_committee_fec_id',
+                                   'contributor_employer',
+                                   'contributor_occupation',
+                                   'election_code',
+                                   'election_other_description',
+                                   'contribution_aggregate',
+                                   'contribution_amount',
+                                   'memo_text_description',
+                                   'image_number'],
+             '^(P1|P2.2|P2.3|P2.4)': ['form_type',
+                                      'filer_committee_id_number',
+                                      'contributor_organization_name',
+                                      'contributor_last_name',
+                                      'contributor_first_name',
+                                      'contributor_middle_name',
+                                      'contributor_prefix',
+                                      'contributor_suffix',
+                                      'contributor_street_1',
+                                      'contributor_street_2',
+                                      'contributor_city',
+                                      'contributor_state',
+                                      'contributor_zip_code',
+                                      'contribution_date',
+                                      'donor_committee_fec_id',
+                                      'contributor_employer',
+                                      'contributor_occupation',
+                                      'election_code',
+                                      'election_other_description',
+                                      'contribution_aggregate',
+                                      'contribution_amount',
+                                      'memo_text_description',
+                                      'increased_limit_code',
+                                      'image_number'],
+             '^8.5|8.4|8.3|8.2|8.1|8.0': ['form_type',
+                                          'filer_committee_id_number',
+                                          'transaction_id',
+                                          'back_reference_tran_id_number',
+                                          'back_reference_sched_name',
+                                          'entity_type',
+                                          'contributor_organization_name',
+                                          'contributor_last_name',
+                                          'contributor_first_name',
+                                          'contributor_middle_name',
+                                          'contributor_prefix',
+                                          'contributor_suffix',
+                                          'contributor_street_1',
+                                          'contributor_street_2',
+                                          'contributor_city',
+                                          'contributor_state',
+                                          'contributor_zip_code',
+                                          'election_code',
+                                          'election_other_description',
+                                          'contribution_date',
+                                          'contribution_amount',
+                                          'contribution_aggregate',
+                                          'contribution_purpose_descrip',
+                                          'contributor_employer',
+                                          'contributor_occupation',
+                                          'donor_committee_fec_id',
+                                          'donor_committee_name',
+                                          'donor_candidate_fec_id',
+                                          'donor_candidate_last_name',
+                                          'donor_candidate_first_name',
+                                          'donor_candidate_middle_name',
+                                          'donor_candidate_prefix',
+                                          'donor_candidate_suffix',
+                                          'donor_candidate_office',
+                                          'donor_candidate_state',
+                                          'donor_candidate_district',
+                                          'conduit_name',
+                                          'conduit_street1',
+                                          'conduit_street2',
+                                          'conduit_city',
+                                          'conduit_state',
+                                          'conduit_zip_code',
+                                          'memo_code',
+                                          'memo_text_description',
+                                          'reference_code'],
+             '^7.0|6.4': ['form_type',
+                          'filer_committee_id_number',
+                          'transaction_id',
+                          'back_reference_tran_id_number',
+                          'back_reference_sched_name',
+                          'entity_type',
+                          'contributor_organization_name',
+                          'contributor_last_name',
+                          'contributor_first_name',
+                          'contributor_middle_name',
+                          'contributor_prefix',
+                          'contributor_suffix',
+                          'contributor_street_1',
+                          'contributor_street_2',
+                          'contributor_city',
+                          'contributor_state',
+                          'contributor_zip_code',
+                          'election_code',
+                          'election_other_description',
+                          'contribution_date',
+                          'contribution_amount',
+                          'contribution_aggregate',
+                          'contribution_purpose_code',
+                          'contribution_purpose_descrip',
+                          'contributor_employer',
+                          'contributor_occupation',
+                          'donor_committee_fec_id',
+                          'donor_committee_name',
+                          'donor_candidate_fec_id',
+                          'donor_candidate_last_name',
+                          'donor_candidate_first_name',
+                          'donor_candidate_middle_name',
+                          'donor_candidate_prefix',
+                          'donor_candidate_suffix',
+                          'donor_candidate_office',
+                          'donor_candidate_state',
+                          'donor_candidate_district',
+                          'conduit_name',
+                          'conduit_street1',
+                          'conduit_street2',
+                          'conduit_city',
+                          'conduit_state',
+                          'conduit_zip_code',
+                          'memo_code',
+                          'memo_text_description',
+                          'reference_code'],
+             '^6.3|6.2': ['form_type',
+                          'filer_committee_id_number',
+                          'transaction_id',
+                          'back_reference_tran_id_number',
+                          'back_reference_sched_name',
+                          'entity_type',
+                          'contributor_organization_name',
+                          'contributor_last_name',
+                          'contributor_first_name',
+                          'contributor_middle_name',
+                          'contributor_prefix',
+                          'contributor_suffix',
+                          'contributor_street_1',
+                          'contributor_street_2',
+                          'contributor_city',
+                          'contributor_state',
+                          'contributor_zip_code',
+                          'election_code',
+                          'election_other_description',
+                          'contribution_date',
+                          'contribution_amount',
+                          'contribution_aggregate',
+                          'contribution_purpose_code',
+                          'contribution_purpose_descrip',
+                          'increased_limit_code',
+                          'contributor_employer',
+                          'contributor_occupation',
+                          'donor_committee_fec_id',
+                          'donor_committee_name',
+                          'donor_candidate_fec_id',
+                          'donor_candidate_last_name',
+                          'donor_candidate_first_name',
+                          'donor_candidate_middle_name',
+                          'donor_candidate_prefix',
+                          'donor_candidate_suffix',
+                          'donor_candidate_office',
+                          'donor_candidate_state',
+                          'donor_candidate_district',
+                          'conduit_name',
+                          'conduit_street1',
+                          'conduit_street2',
+                          'conduit_city',
+                          'conduit_state',
+                          'conduit_zip_code',
+                          'memo_code',
+                          'memo_text_description',
+                          'reference_code'],
+             '^6.1': ['form_type',
+                      'filer_committee_id_number',
+                      'transaction_id',
+                      'back_reference_tran_id_number',
+                      'back_reference_sched_name',
+                      'entity_type',
+                      'contributor_organization_name',
+                      'contributor_last_name',
+                      'contributor_first_name',
+                      'contributor_middle_name',
+                      'contributor_prefix',
+                      'contributor_suffix',
+                      'contributor_street_1',
+                      'contributor_street_2',
+                      'contributor_city',
+                      'contributor_state',
+                      'contributor_zip_code',
+                      'election_code',
+                      'election_other_description',
+                      'contribution_date',
+                      'contribution_amount',
+                      'contribution_aggregate',
+                      'contribution_purpose_code',
+                      'contribution_purpose_descrip',
+                      'increased_limit_code',
+                      'contributor_employer',
+                      'contributor_occupation',
+                      'donor_committee_fec_id',
+                      'donor_candidate_fec_id',
+                      'donor_candidate_last_name',
+                      'donor_candidate_first_name',
+                      'donor_candidate_middle_name',
+                      'donor_candidate_prefix',
+                      'donor_candidate_suffix',
+                      'donor_candidate_office',
+                      'donor_candidate_state',
+                      'donor_candidate_district',
+                      'conduit_name',
+                      'conduit_street1',
+                      'conduit_street2',
+                      'conduit_city',
+                      'conduit_state',
+                      'conduit_zip_code',
+                      'memo_code',
+                      'memo_text_description',
+                      'reference_code'],
+             '^5.3': ['form_type',
+                      'filer_committee_id_number',
+                      'entity_type',
+                      'contributor_name',
+                      'contributor_street_1',
+                      'contributor_street_2',
+                      'contributor_city',
+                      'contributor_state',
+                      'contributor_zip_code',
+                      'election_code',
+                      'election_other_description',
+                      'contributor_employer',
+                      'contributor_occupation',
+                      'contribution_aggregate',
+                      'contribution_date',
+                      'contribution_amount',
+                      'contribution_purpose_code',
+                      'contribution_purpose_descrip',
+                      'donor_committee_fec_id',
+                      'donor_candidate_fec_id',
+                      'donor_candidate_name',
+                      'donor_candidate_office',
+                      'donor_candidate_state',
+                      'donor_candidate_district',
+                      'conduit_name',
+                      'conduit_street1',
+                      'conduit_street2',
+                      'conduit_city',
+                      'conduit_state',
+                      'conduit_zip_code',
+                      'memo_code',
+                      'memo_text_description',
+                      'amended_cd',
+                      'transaction_id',
+                      'back_reference_tran_id_number',
+                      'back_reference_sched_name',
+                      'reference_code',
+                      'increased_limit_code',
+                      'contributor_organization_name',
+                      'contributor_last_name',
+                      'contributor_first_name',
+                      'contributor_middle_name',
+                      'contributor_prefix',
+                      'contributor_suffix'],
+             '^5.2': ['form_type',
+                      'filer_committee_id_number',
+                      'entity_type',
+                      'contributor_name',
+                      'contributor_street_1',
+                      'contributor_street_2',
+                      'contributor_city',
+                      'contributor_state',
+                      'contributor_zip_code',
+                      'election_code',
+                      'election_other_description',
+                      'contributor_employer',
+                      'contributor_occupation',
+                      'contribution_aggregate',
+                      'contribution_date',
+                      'contribution_amount',
+                      'contribution_purpose_code',
+                      'contribution_purpose_descrip',
+                      'donor_committee_fec_id',
+                      'donor_candidate_fec_id',
+                      'donor_candidate_name',
+                      'donor_candidate_office',
+                      'donor_candidate_state',
+                      'donor_candidate_district',
+                      'conduit_name',
+                      'conduit_street1',
+                      'conduit_street2',
+                      'conduit_city',
+                      'conduit_state',
+                      'conduit_zip_code',
+                      'memo_code',
+                      'memo_text_description',
+                      'amended_cd',
+                      'transaction_id',
+                      'back_reference_tran_id_number',
+                      'back_reference_sched_name',
+                      'reference_code',
+                      'increased_limit_code',
+                      'contributor_organization_name',
+                      'contributor_last_name',
+                      'contributor_first_name',
+                      'contributor_middle_name',
+                      'contributor_prefix',
+                      'contributor_suffix'],
+             '^5.1': ['form_type',
+                      'filer_committee_id_number',
+                      'entity_type',
+                      'contributor_name',
+                      'contributor_street_1',
+                      'contributor_street_2',
+                      'contributor_city',
+                      'contributor_state',
+                      'contributor_zip_code',
+                      'election_code',
+                      'election_other_description',
+                      'contributor_employer',
+                      'contributor_occupation',
+                      'contribution_aggregate',
+                      'contribution_date',
+                      'contribution_amount',
+                      'contribution_purpose_code',
+                      'contribution_purpose_descrip',
+                      'donor_committee_fec_id',
+                      'donor_candidate_fec_id',
+                      'donor_candidate_name',
+                      'donor_candidate_office',
+                      'donor_candidate_state',
+                      'donor_candidate_district',
+                      'conduit_name',
+                      'conduit_street1',
+                      'conduit_street2',
+                      'conduit_city',
+                      'conduit_state',
+                      'conduit_zip_code',
+                      'memo_code',
+                      'memo_text_description',
+                      'amended_cd',
+                      'transaction_id',
+                      'back_reference_tran_id_number',
+                      'back_reference_sched_name',
+                      'reference_code',
+                      'increased_limit_code',
+                      'contributor_organization_name',
+                      'contributor_last_name',
+                      'contributor_first_name',
+                      'contributor_middle_name',
+                      'contributor_prefix',
+                      'contributor_suffix'],
+             '^5.0': ['form_type',
+                      'filer_committee_id_number',
+                      'entity_type',
+                      'contributor_name',
+                      'contributor_street_1',
+                      'contributor_street_2',
+                      'contributor_city',
+                      'contributor_state',
+                      'contributor_zip_code',
+                      'election_code',
+                      'election_other_description',
+                      'contributor_employer',
+                      'contributor_occupation',
+                      'contribution_aggregate',
+                      'contribution_date',
+                      'contribution_amount',
+                      'contribution_purpose_code',
+                      'contribution_purpose_descrip',
+                      'donor_committee_fec_id',
+                      'donor_candidate_fec_id',
+                      'donor_candidate_name',
+                      'donor_candidate_office',
+                      'donor_candidate_state',
+                      'donor_candidate_district',
+                      'conduit_name',
+                      'conduit_street1',
+                      'conduit_street2',
+                      'conduit_city',
+                      'conduit_state',
+                      'conduit_zip_code',
+                      'memo_code',
+                      'memo_text_description',
+                      'amended_cd',
+                      'transaction_id',
+                      'back_reference_tran_id_number',
+                      'back_reference_sched_name',
+                      'reference_code',
+                      'increased_limit_code'],
+             '^3': ['form_type',
+                    'filer_committee_id_number',
+                    'entity_type',
+                    'contributor_name',
+                    'contributor_street_1',
+                    'contributor_street_2',
+                    'contributor_city',
+                    'contributor_state',
+                    'contributor_zip_code',
+                    'election_code',
+                    'election_other_description',
+                    'contributor_employer',
+                    'contributor_occupation',
+                    'contribution_aggregate',
+                    'contribution_date',
+                    'contribution_amount',
+                    'contribution_purpose_code',
+                    'contribution_purpose_descrip',
+                    'donor_committee_fec_id',
+                    'donor_candidate_fec_id',
+                    'donor_candidate_name',
+                    'donor_candidate_office',
+                    'donor_candidate_state',
+                    'donor_candidate_district',
+                    'conduit_name',
+                    'conduit_street1',
+                    'conduit_street2',
+                    'conduit_city',
+                    'conduit_state',
+                    'conduit_zip_code',
+                    'memo_code',
+                    'memo_text_description',
+                    'amended_cd',
+                    'transaction_id',
+                    'back_reference_tran_id_number',
+                    'back_reference_sched_name',
+                    'reference_code'],
+             '^2': ['form_type',
+                    'filer_committee_id_number',
+                    'entity_type',
+                    'contributor_name',
+                    'contributor_street_1',
+                    'contributor_street_2',
+                    'contributor_city',
+                    'contributor_state',
+                    'contributor_zip_code',
+                    'election_code',
+                    'election_other_description',
+                    'contributor_employer',
+                    'contributor_occupation',
+                    'contribution_aggregate',
+                    'contribution_date',
+                    'contribution_amount',
+                    'contribution_purpose_code',
+                    'contribution_purpose_descrip',
+                    'donor_committee_fec_id',
+                    'donor_candidate_fec_id',
+                    'donor_candidate_name',
+                    'donor_candidate_office',
+                    'donor_candidate_state',
+                    'donor_candidate_district',
+                    'conduit_name',
+                    'conduit_street1',
+                    'conduit_street2',
+                    'conduit_city',
+                    'conduit_state',
+                    'conduit_zip_code',
+                    'memo_code',
+                    'memo_text_description',
+                    'amended_cd',
+                    'transaction_id',
+                    'back_reference_tran_id_number',
+                    'back_reference_sched_name'],
+             '^1': ['form_type',
+                    'filer_committee_id_number',
+                    'contributor_name',
+                    'contributor_street_1',
+                    'contributor_street_2',
+                    'contributor_city',
+                    'contributor_state',
+                    'contributor_zip_code',
+                    'election_code',
+                    'election_other_description',
+                    'contributor_employer',
+                    'contributor_occupation',
+                    'contribution_aggregate',
+                    'contribution_date',
+                    'contribution_amount',
+                    'contribution_purpose_code',
+                    'contribution_purpose_descrip',
+                    'donor_committee_fec_id',
+                    'conduit_name',
+                    'conduit_street1',
+                    'conduit_street2',
+                    'conduit_city',
+                    'conduit_state',
+                    'conduit_zip_code',
+                    'donor_candidate_fec_id',
+                    'donor_candidate_name',
+                    'donor_candidate_office',
+                    'donor_candidate_state',
+                    'donor_candidate_district',
+                    'memo_code',
+                    'memo_text_description',
+                    'amended_cd']},
+ '^sa3l': {'^8.5|8.4|8.3|8.2|8.1|8.0': ['form_type',
+                                        'filer_committee_id_number',
+                                        'transaction_id',
+                                        'back_reference_tran_id_number',
+                                        'back_reference_sched_name',
+                                        'entity_type',
+                                        'lobbyist_registrant_organization_name',
+                                        'lobbyist_registrant_last_name',
+                                        'lobbyist_registrant_first_name',
+                                        'lobbyist_registrant_middle_name',
+                                        'lobbyist_registrant_prefix',
+                                        'lobbyist_registrant_suffix',
+                                        'lobbyist_registrant_street_1',
+                                        'lobbyist_registrant_street_2',
+                                        'lobbyist_registrant_city',
+                                        'lobbyist_registrant_state',
+                                        'lobbyist_registrant_zip_code',
+                                        'election_code',
+                                        'election_other_description',
+                                        'contribution_date',
+                                        'bundled_amount_period',
+                                        'bundled_amount_semi_annual',
+                                        'contribution_purpose_descrip',
+                                        'lobbyist_registrant_employer',
+                                        'lobbyist_registrant_occupation',
+                                        'donor_committee_fec_id',
+                                        'donor_committee_name',
+                                        'donor_candidate_fec_id',
+                                        'donor_candidate_last_name',
+                                        'donor_candidate_first_name',
+                                        'donor_candidate_middle_name',
+                                        'donor_candidate_prefix',
+                                        'donor_candidate_suffix',
+                                        'donor_candidate_office',
+                                        'donor_candidate_state',
+                                        'donor_candidate_district',
+                                        'conduit_name',
+                                        'conduit_street1',
+                                        'conduit_street2',
+                                        'conduit_city',
+                                        'conduit_state',
+                                        'conduit_zip_code',
+                                        'associated_text_record',
+                                        'memo_text',
+                                        'reference_code'],
+           '^7.0|6.4': ['form_type',
+                        'filer_committee_id_number',
+                        'transaction_id',
+                        'back_reference_tran_id_number',
+                        'back_reference_sched_name',
+                        'entity_type',
+                        'lobbyist_registrant_organization_name',
+                        'lobbyist_registrant_last_name',
+                        'lobbyist_registrant_first_name',
+                        'lobbyist_registrant_middle_name',
+                        'lobbyist_registrant_prefix',
+                        'lobbyist_registrant_suffix',
+                        'lobbyist_registrant_street_1',
+                        'lobbyist_registrant_street_2',
+                        'lobbyist_registrant_city',
+                        'lobbyist_registrant_state',
+                        'lobbyist_registrant_zip_code',
+                        'election_code',
+                        'election_other_description',
+                        'contribution_date',
+                        'bundled_amount_period',
+                        'bundled_amount_semi_annual',
+                        'contribution_purpose_code',
+                        'contribution_purpose_descrip',
+                        'lobbyist_registrant_employer',
+                        'lobbyist_registrant_occupation',
+                        'donor_committee_fec_id',
+                        'donor_committee_name',
+                        'donor_candidate_fec_id',
+                        'donor_candidate_last_name',
+                        'donor_candidate_first_name',
+                        'donor_candidate_middle_name',
+                        'donor_candidate_prefix',
+                        'donor_candidate_suffix',
+                        'donor_candidate_office',
+                        'donor_candidate_state',
+                        'donor_candidate_district',
+                        'conduit_name',
+                        'conduit_street1',
+                        'conduit_street2',
+                        'conduit_city',
+                        'conduit_state',
+                        'conduit_zip_code',
+                        'associated_text_record',
+                        'memo_text',
+                        'reference_code']},
+ '^sb': {'^P3.3|^P3.4': ['form_type',
+                         'filer_committee_id_number',
+                         'payee_organization_name',
+                         'payee_last_name',
+                         'payee_first_name',
+                         'payee_middle_name',
+                         'payee_prefix',
+                         'payee_suffix',
+                         'payee_street_1',
+                         'payee_street_2',
+                         'payee_city',
+                         'payee_state',
+                         'payee_zip_code',
+                         'expenditure_date',
+                         'expenditure_purpose_descrip',
+                         'beneficiary_committee_name',
+                         'beneficiary_candidate_last_name',
+                         'beneficiary_candidate_first_name',
+                         'beneficiary_candidate_middle_name',
+                         'beneficiary_candidate_prefix',
+                         'beneficiary_candidate_suffix',
+                         'category_code',
+                         'beneficiary_candidate_office',
+                         'beneficiary_candidate_state',
+                         'beneficiary_candidate_district',
+                         'election_code',
+                         'election_other_description',
+                         'expenditure_amount',
+                         'semi_annual_refunded_bundled_amt',
+                         'memo_code',
+                         'memo_text_description',
+                         'image_number',
+                         'beneficiary_committee_fec_id'],
+         '^P3.2': ['form_type',
+                   'filer_committee_id_number',
+                   'payee_organization_name',
+                   'payee_last_name',
+                   'payee_first_name',
+                   'payee_middle_name',
+                   'payee_prefix',
+                   'payee_suffix',
+                   'payee_street_1',
+                   'payee_street_2',
+                   'payee_city',
+                   'payee_state',
+                   'payee_zip_code',
+                   'expenditure_date',
+                   'expenditure_purpose_descrip',
+                   'beneficiary_committee_name',
+                   'beneficiary_candidate_last_name',
+                   'beneficiary_candidate_first_name',
+                   'beneficiary_candidate_middle_name',
+                   'beneficiary_candidate_prefix',
+                   'beneficiary_candidate_suffix',
+                   'category_code',
+                   'beneficiary_candidate_office',
+                   'beneficiary_candidate_state',
+                   'beneficiary_candidate_district',
+                   'election_code',
+                   'election_other_description',
+                   'expenditure_amount',
+                   'semi_annual_refunded_bundled_amt',
+                   'memo_code',
+                   'memo_text_description',
+                   'image_number'],
+         '^(P2.6|P3.0|P3.1)': ['form_type',
+                               'filer_committee_id_number',
+                               'payee_organization_name',
+                               'payee_last_name',
+                               'payee_first_name',
+                               'payee_middle_name',
+                               'payee_prefix',
+                               'payee_suffix',
+                               'payee_street_1',
+                               'payee_street_2',
+                               'payee_city',
+                               'payee_state',
+                               'payee_zip_code',
+                               'expenditure_date',
+                               'expenditure_purpose_descrip',
+                               'beneficiary_committee_name',
+                               'beneficiary_candidate_last_name',
+                               'beneficiary_candidate_first_name',
+                               'beneficiary_candidate_middle_name',
+                               'beneficiary_candidate_prefix',
+                               'beneficiary_candidate_suffix',
+                               'category_code',
+                               'beneficiary_candidate_office',
+                               'beneficiary_candidate_state',
+                               'beneficiary_candidate_district',
+                               'election_code',
+                               'election_other_description',
+                               'expenditure_amount',
+                               'semi_annual_refunded_bundled_amt',
+                               'memo_text_description',
+                               'image_number'],
+         '^P2.4': ['form_type',
+                   'filer_committee_id_number',
+                   'payee_organization_name',
+                   'payee_last_name',
+                   'payee_first_name',
+                   'payee_middle_name',
+                   'payee_prefix',
+                   'payee_suffix',
+                   'payee_street_1',
+                   'payee_street_2',
+                   'payee_city',
+                   'payee_state',
+                   'payee_zip_code',
+                   'expenditure_date',
+                   'expenditure_purpose_descrip',
+                   'beneficiary_committee_name',
+                   'beneficiary_candidate_last_name',
+                   'beneficiary_candidate_first_name',
+                   'beneficiary_candidate_middle_name',
+                   'beneficiary_candidate_prefix',
+                   'beneficiary_candidate_suffix',
+                   'category_code',
+                   'beneficiary_candidate_office',
+                   'beneficiary_candidate_state',
+                   'beneficiary_candidate_district',
+                   'election_code',
+                   'election_other_description',
+                   'expenditure_amount',
+                   'memo_text_description',
+                   'refund_or_disposal_of_excess',
+                   'image_number'],
+         '^(P1|P2.2|P2.3)': ['form_type',
+                             'filer_committee_id_number',
+                             'payee_organization_name',
+                             'payee_last_name',
+                             'payee_first_name',
+                             'payee_middle_name',
+                             'payee_prefix',
+                             'payee_suffix',
+                             'payee_street_1',
+                             'payee_street_2',
+                             'payee_city',
+                             'payee_state',
+                             'payee_zip_code',
+                             'expenditure_date',
+                             'expenditure_purpose_descrip',
+                             'beneficiary_candidate_last_name',
+                             'beneficiary_candidate_first_name',
+                             'beneficiary_candidate_middle_name',
+                             'beneficiary_candidate_prefix',
+                             'beneficiary_candidate_suffix',
+                             'category_code',
+                             'beneficiary_candidate_office',
+                             'beneficiary_candidate_state',
+                             'beneficiary_candidate_district',
+                             'election_code',
+                             'election_other_description',
+                             'expenditure_amount',
+                             'memo_text_description',
+                             'refund_or_disposal_of_excess',
+                             'image_number'],
+         '^8.5|8.4|8.3|8.2|8.1|8.0': ['form_type',
+                                      'filer_committee_id_number',
+                                      'transaction_id_number',
+                                      'back_reference_tran_id_number',
+                                      'back_reference_sched_name',
+                                      'entity_type',
+                                      'payee_organization_name',
+                                      'payee_last_name',
+                                      'payee_first_name',
+                                      'payee_middle_name',
+                                      'payee_prefix',
+                                      'payee_suffix',
+                                      'payee_street_1',
+                                      'payee_street_2',
+                                      'payee_city',
+                                      'payee_state',
+                                      'payee_zip_code',
+                                      'election_code',
+                                      'election_other_description',
+                                      'expenditure_date',
+                                      'expenditure_amount',
+                                      'semi_annual_refunded_bundled_amt',
+                                      'expenditure_purpose_descrip',
+                                      'category_code',
+                                      'beneficiary_committee_fec_id',
+                                      'beneficiary_committee_name',
+                                      'beneficiary_candidate_fec_id',
+                                      'beneficiary_candidate_last_name',
+                                      'beneficiary_candidate_first_name',
+                                      'beneficiary_candidate_middle_name',
+                                      'beneficiary_candidate_prefix',
+                                      'beneficiary_candidate_suffix',
+                                      'beneficiary_candidate_office',
+                                      'beneficiary_candidate_state',
+                                      'beneficiary_candidate_district',
+                                      'conduit_name',
+                                      'conduit_street_1',
+                                      'conduit_street_2',
+                                      'conduit_city',
+                                      'conduit_state',
+                                      'conduit_zip_code',
+                                      'memo_code',
+                                      'memo_text_description',
+                                      'reference_to_si_or_sl_system_code_that_identifies_the_account'],
+         '^7.0|6.4': ['form_type',
+                      'filer_committee_id_number',
+                      'transaction_id_number',
+                      'back_reference_tran_id_number',
+                      'back_reference_sched_name',
+                      'entity_type',
+                      'payee_organization_name',
+                      'payee_last_name',
+                      'payee_first_name',
+                      'payee_middle_name',
+                      'payee_prefix',
+                      'payee_suffix',
+                      'payee_street_1',
+                      'payee_street_2',
+                      'payee_city',
+                      'payee_state',
+                      'payee_zip_code',
+                      'election_code',
+                      'election_other_description',
+                      'expenditure_date',
+                      'expenditure_amount',
+                      'semi_annual_refunded_bundled_amt',
+                      'expenditure_purpose_code',
+                      'expenditure_purpose_descrip',
+                      'category_code',
+                      'beneficiary_committee_fec_id',
+                      'beneficiary_committee_name',
+                      'beneficiary_candidate_fec_id',
+                      'beneficiary_candidate_last_name',
+                      'beneficiary_candidate_first_name',
+                      'beneficiary_candidate_middle_name',
+                      'beneficiary_candidate_prefix',
+                      'beneficiary_candidate_suffix',
+                      'beneficiary_candidate_office',
+                      'beneficiary_candidate_state',
+                      'beneficiary_candidate_district',
+                      'conduit_name',
+                      'conduit_street_1',
+                      'conduit_street_2',
+                      'conduit_city',
+                      'conduit_state',
+                      'conduit_zip_code',
+                      'memo_code',
+                      'memo_text_description',
+                      'reference_to_si_or_sl_system_code_that_identifies_the_account'],
+         '^6.3|6.2': ['form_type',
+                      'filer_committee_id_number',
+                      'transaction_id_number',
+                      'back_reference_tran_id_number',
+                      'back_reference_sched_name',
+                      'entity_type',
+                      'payee_organization_name',
+                      'payee_last_name',
+                      'payee_first_name',
+                      'payee_middle_name',
+                      'payee_prefix',
+                      'payee_suffix',
+                      'payee_street_1',
+                      'payee_street_2',
+                      'payee_city',
+                      'payee_state',
+                      'payee_zip_code',
+                      'election_code',
+                      'election_other_description',
+                      'expenditure_date',
+                      'expenditure_amount',
+                      'expenditure_purpose_code',
+                      'expenditure_purpose_descrip',
+                      'category_code',
+                      'refund_or_disposal_of_excess',
+                      'communication_date',
+                      'beneficiary_committee_fec_id',
+                      'beneficiary_committee_name',
+                      'beneficiary_candidate_fec_id',
+                      'beneficiary_candidate_last_name',
+                      'beneficiary_candidate_first_name',
+                      'beneficiary_candidate_middle_name',
+                      'beneficiary_candidate_prefix',
+                      'beneficiary_candidate_suffix',
+                      'beneficiary_candidate_office',
+                      'beneficiary_candidate_state',
+                      'beneficiary_candidate_district',
+                      'conduit_name',
+                      'conduit_street_1',
+                      'conduit_street_2',
+                      'conduit_city',
+                      'conduit_state',
+                      'conduit_zip_code',
+                      'memo_code',
+                      'memo_text_description',
+                      'reference_to_si_or_sl_system_code_that_identifies_the_account'],
+         '^6.1': ['form_type',
+                  'filer_committee_id_number',
+                  'transaction_id_number',
+                  'back_reference_tran_id_number',
+                  'back_reference_sched_name',
+                  'entity_type',
+                  'payee_organization_name',
+                  'payee_last_name',
+                  'payee_first_name',
+                  'payee_middle_name',
+                  'payee_prefix',
+                  'payee_suffix',
+                  'payee_street_1',
+                  'payee_street_2',
+                  'payee_city',
+                  'payee_state',
+                  'payee_zip_code',
+                  'election_code',
+                  'election_other_description',
+                  'expenditure_date',
+                  'expenditure_amount',
+                  'expenditure_purpose_code',
+                  'expenditure_purpose_descrip',
+                  'category_code',
+                  'refund_or_disposal_of_excess',
+                  'communication_date',
+                  'beneficiary_committee_fec_id',
+                  'beneficiary_candidate_fec_id',
+                  'beneficiary_candidate_last_name',
+                  'beneficiary_candidate_first_name',
+                  'beneficiary_candidate_middle_name',
+                  'beneficiary_candidate_prefix',
+                  'beneficiary_candidate_suffix',
+                  'beneficiary_candidate_office',
+                  'beneficiary_candidate_state',
+                  'beneficiary_candidate_district',
+                  'conduit_name',
+                  'conduit_street_1',
+                  'conduit_street_2',
+                  'conduit_city',
+                  'conduit_state',
+                  'conduit_zip_code',
+                  'memo_code',
+                  'memo_text_description',
+                  'reference_to_si_or_sl_system_code_that_identifies_the_account'],
+         '^5.3': ['form_type',
+                  'filer_committee_id_number',
+                  'entity_type',
+                  'payee_name',
+                  'payee_street_1',
+                  'payee_street_2',
+                  'payee_city',
+                  'payee_state',
+                  'payee_zip_code',
+                  'expenditure_purpose_code',
+                  'expenditure_purpose_descrip',
+                  'election_code',
+                  'election_other_description',
+                  'expenditure_date',
+                  'expenditure_amount',
+                  'beneficiary_committee_fec_id',
+                  'beneficiary_candidate_fec_id',
+                  'beneficiary_candidate_name',
+                  'beneficiary_candidate_office',
+                  'beneficiary_candidate_state',
+                  'beneficiary_candidate_district',
+                  'conduit_name',
+                  'conduit_street_1',
+                  'conduit_street_2',
+                  'conduit_city',
+                  'conduit_state',
+                  'conduit_zip_code',
+                  'memo_code',
+                  'memo_text_description',
+                  'amended_cd',
+                  'transaction_id_number',
+                  'back_reference_tran_id_number',
+                  'back_reference_sched_name',
+                  'reference_to_si_or_sl_system_code_that_identifies_the_account',
+                  'refund_or_disposal_of_excess',
+                  'category_code',
+                  'communication_date',
+                  'payee_organization_name',
+                  'payee_last_name',
+                  'payee_first_name',
+                  'payee_middle_name',
+                  'payee_prefix',
+                  'payee_suffix'],
+         '^5.2|5.1': ['form_type',
+                      'filer_committee_id_number',
+                      'entity_type',
+                      'payee_name',
+                      'payee_street_1',
+                      'payee_street_2',
+                      'payee_city',
+                      'payee_state',
+                      'payee_zip_code',
+                      'expenditure_purpose_code',
+                      'expenditure_purpose_descrip',
+                      'election_code',
+                      'election_other_description',
+                      'expenditure_date',
+                      'expenditure_amount',
+                      'beneficiary_committee_fec_id',
+                      'beneficiary_candidate_fec_id',
+                      'beneficiary_candidate_name',
+                      'beneficiary_candidate_office',
+                      'beneficiary_candidate_state',
+                      'beneficiary_candidate_district',
+                      'conduit_name',
+                      'conduit_street_1',
+                      'conduit_street_2',
+                      'conduit_city',
+                      'conduit_state',
+                      'conduit_zip_code',
+                      'memo_code',
+                      'memo_text_description',
+                      'amended_cd',
+                      'transaction_id_number',
+                      'back_reference_tran_id_number',
+                      'back_reference_sched_name',
+                      'reference_to_si_or_sl_system_code_that_identifies_the_account',
+                      'refund_or_disposal_of_excess',
+                      'category_code',
+                      'communication_date',
+                      'payee_organization_name',
+                      'payee_last_name',
+                      'payee_first_name',
+                      'payee_middle_name',
+                      'payee_prefix',
+                      'payee_suffix'],
+         '^5.0': ['form_type',
+                  'filer_committee_id_number',
+                  'entity_type',
+                  'payee_name',
+                  'payee_street_1',
+                  'payee_street_2',
+                  'payee_city',
+                  'payee_state',
+                  'payee_zip_code',
+                  'expenditure_purpose_code',
+                  'expenditure_purpose_descrip',
+                  'election_code',
+                  'election_other_description',
+                  'expenditure_date',
+                  'expenditure_amount',
+                  'beneficiary_committee_fec_id',
+                  'beneficiary_candidate_fec_id',
+                  'beneficiary_candidate_name',
+                  'beneficiary_candidate_office',
+                  'beneficiary_candidate_state',
+                  'beneficiary_candidate_district',
+                  'conduit_name',
+                  'conduit_street_1',
+                  'conduit_street_2',
+                  'conduit_city',
+                  'conduit_state',
+                  'conduit_zip_code',
+                  'memo_code',
+                  'memo_text_description',
+                  'amended_cd',
+                  'transaction_id_number',
+                  'back_reference_tran_id_number',
+                  'back_reference_sched_name',
+                  'reference_to_si_or_sl_system_code_that_identifies_the_account',
+                  'refund_or_disposal_of_excess',
+                  'category_code',
+                  'communication_date'],
+         '^3|^2': ['form_type',
+                   'filer_committee_id_number',
+                   'entity_type',
+                   'payee_name',
+                   'payee_street_1',
+                   'payee_street_2',
+                   'payee_city',
+                   'payee_state',
+                   'payee_zip_code',
+                   'expenditure_purpose_code',
+                   'expenditure_purpose_descrip',
+                   'election_code',
+                   'election_other_description',
+                   'expenditure_date',
+                   'expenditure_amount',
+                   'beneficiary_committee_fec_id',
+                   'beneficiary_candidate_fec_id',
+                   'beneficiary_candidate_name',
+                   'beneficiary_candidate_office',
+                   'beneficiary_candidate_state',
+                   'beneficiary_candidate_district',
+                   'conduit_name',
+                   'conduit_street_1',
+                   'conduit_street_2',
+                   'conduit_city',
+                   'conduit_state',
+                   'conduit_zip_code',
+                   'memo_code',
+                   'memo_text_description',
+                   'amended_cd',
+                   'transaction_id_number',
+                   'back_reference_tran_id_number',
+                   'back_reference_sched_name',
+                   'reference_to_si_or_sl_system_code_that_identifies_the_account'],
+         '^1': ['form_type',
+                'filer_committee_id_number',
+                'payee_name',
+                'payee_street_1',
+                'payee_street_2',
+                'payee_city',
+                'payee_state',
+                'payee_zip_code',
+                'expenditure_purpose_code',
+                'expenditure_purpose_descrip',
+                'election_code',
+                'election_other_description',
+                'expenditure_date',
+                'expenditure_amount',
+                'beneficiary_committee_fec_id',
+                'conduit_name',
+                'conduit_street_1',
+                'conduit_street_2',
+                'conduit_city',
+                'conduit_state',
+                'conduit_zip_code',
+                'beneficiary_candidate_fec_id',
+                'beneficiary_candidate_name',
+                'beneficiary_candidate_office',
+                'beneficiary_candidate_state',
+                'beneficiary_candidate_district',
+                'memo_code',
+                'memo_text_description',
+                'amended_cd']},
+ '^sc[^1-2]': {'^P3.4|^P3.3|^P3.2': ['form_type',
+                                     'filer_committee_id_number',
+                                     'receipt_line_number',
+                                     'lender_organization_name',
+                                     'lender_last_name',
+                                     'lender_first_name',
+                                     'lender_middle_name',
+                                     'lender_prefix',
+                                     'lender_suffix',
+                                     'lender_street_1',
+                                     'lender_street_2',
+                                     'lender_city',
+                                     'lender_state',
+                                     'lender_zip_code',
+                                     'election_code',
+                                     'election_other_description',
+                                     'loan_amount_original',
+                                     'loan_payment_to_date',
+                                     'loan_balance',
+                                     'loan_incurred_date_terms',
+                                     'loan_due_date_terms',
+                                     'loan_interest_rate_terms',
+                                     'secured',
+                                     'memo_code',
+                                     'memo_text_description',
+                                     'image_number'],
+               '^P3.1|^P3.0|^P2.6|^P2.4': ['form_type',
+                                           'filer_committee_id_number',
+                                           'receipt_line_number',
+                                           'lender_organization_name',
+                                           'lender_last_name',
+                                           'lender_first_name',
+                                           'lender_middle_name',
+                                           'lender_prefix',
+                                           'lender_suffix',
+                                           'lender_street_1',
+                                           'lender_street_2',
+                                           'lender_city',
+                                           'lender_state',
+                                           'lender_zip_code',
+                                           'election_code',
+                                           'election_other_description',
+                                           'loan_amount_original',
+                                           'loan_payment_to_date',
+                                           'loan_balance',
+                                           'loan_incurred_date_terms',
+                                           'loan_due_date_terms',
+                                           'loan_interest_rate_terms',
+                                           'secured',
+                                           'memo_text_description',
+                                           'image_number'],
+               '^P2.3|^P2.2|^P1': ['form_type',
+                                   'filer_committee_id_number',
+                                   'receipt_line_number',
+                                   'lender_organization_name',
+                                   'lender_last_name',
+                                   'lender_first_name',
+                                   'lender_middle_name',
+                                   'lender_prefix',
+                                   'lender_suffix',
+                                   'lender_street_1',
+                                   'lender_street_2',
+                                   'lender_city',
+                                   'lender_state',
+                                   'lender_zip_code',
+                                   'election_code',
+                                   'election_other_description',
+                                   'loan_amount_original',
+                                   'loan_payment_to_date',
+                                   'loan_balance',
+                                   'loan_incurred_date_terms',
+                                   'loan_due_date_terms',
+                                   'loan_interest_rate_terms',
+                                   'secured',
+                                   'image_number'],
+               '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2': ['form_type',
+                                                            'filer_committee_id_number',
+                                                            'transaction_id_number',
+                                                            'receipt_line_number',
+                                                            'entity_type',
+                                                            'lender_organization_name',
+                                                            'lender_last_name',
+                                                            'lender_first_name',
+                                                            'lender_middle_name',
+                                                            'lender_prefix',
+                                                            'lender_suffix',
+                                                            'lender_street_1',
+                                                            'lender_street_2',
+                                                            'lender_city',
+                                                            'lender_state',
+                                                            'lender_zip_code',
+                                                            'election_code',
+                                                            'election_other_description',
+                                                            'loan_amount_original',
+                                                            'loan_payment_to_date',
+                                                            'loan_balance',
+                                                            'loan_incurred_date_terms',
+                                                            'loan_due_date_terms',
+                                                            'loan_interest_rate_terms',
+                                                            'secured',
+                                                            'personal_funds',
+                                                            'lender_committee_id_number',
+                                                            'lender_candidate_id_number',
+                                                            'lender_candidate_last_name',
+                                                            'lender_candidate_first_name',
+                                                            'lender_candidate_middle_nm',
+                                                            'lender_candidate_prefix',
+                                                            'lender_candidate_suffix',
+                                                            'lender_candidate_office',
+                                                            'lender_candidate_state',
+                                                            'lender_candidate_district',
+                                                            'memo_code',
+                                                            'memo_text_description'],
+               '^6.1': ['form_type',
+                        'filer_committee_id_number',
+                        'transaction_id_number',
+                        'receipt_line_number',
+                        'entity_type',
+                        'lender_organization_name',
+                        'lender_last_name',
+                        'lender_first_name',
+                        'lender_middle_name',
+                        'lender_prefix',
+                        'lender_suffix',
+                        'lender_street_1',
+                        'lender_street_2',
+                        'lender_city',
+                        'lender_state',
+                        'lender_zip_code',
+                        'election_code',
+                        'election_other_description',
+                        'loan_amount_original',
+                        'loan_payment_to_date',
+                        'loan_balance',
+                        'loan_incurred_date_terms',
+                        'loan_due_date_terms',
+                        'loan_interest_rate_terms',
+                        'secured',
+                        'lender_committee_id_number',
+                        'lender_candidate_id_number',
+                        'lender_candidate_last_name',
+                        'lender_candidate_first_name',
+                        'lender_candidate_middle_nm',
+                        'lender_candidate_prefix',
+                        'lender_candidate_suffix',
+                        'lender_candidate_office',
+                        'lender_candidate_state',
+                        'lender_candidate_district'],
+               '^5.3': ['form_type',
+                        'filer_committee_id_number',
+                        'entity_type',
+                        'lender_name',
+                        'lender_street_1',
+                        'lender_street_2',
+                        'lender_city',
+                        'lender_state',
+                        'lender_zip_code',
+                        'election_code',
+                        'election_other_description',
+                        'loan_amount_original',
+                        'loan_payment_to_date',
+                        'loan_balance',
+                        'loan_incurred_date_terms',
+                        'loan_due_date_terms',
+                        'loan_interest_rate_terms',
+                        'secured',
+                        'lender_committee_id_number',
+                        'lender_candidate_id_number',
+                        'lender_candidate_name',
+                        'lender_candidate_office',
+                        'lender_candidate_state',
+                        'lender_candidate_district',
+                        'amended_cd',
+                        'transaction_id_number',
+                        'receipt_line_number'],
+               '^5.2|5.1': ['form_type',
+                            'filer_committee_id_number',
+                            'entity_type',
+                            'lender_name',
+                            'lender_street_1',
+                            'lender_street_2',
+                            'lender_city',
+                            'lender_state',
+                            'lender_zip_code',
+                            'election_code',
+                            'election_other_description',
+                            'loan_amount_original',
+                            'loan_payment_to_date',
+                            'loan_balance',
+                            'loan_incurred_date_terms',
+                            'loan_due_date_terms',
+                            'loan_interest_rate_terms',
+                            'secured',
+                            'lender_committee_id_number',
+                            'lender_candidate_id_number',
+                            'lender_candidate_name',
+                            'lender_candidate_office',
+                            'lender_candidate_state',
+                            'lender_candidate_district',
+                            'amended_cd',
+                            'transaction_id_number',
+                            'receipt_line_number'],
+               '^5.0|^3|^2|^1': ['form_type',
+                                 'filer_committee_id_number',
+                                 'entity_type',
+                                 'lender_name',
+                                 'lender_street_1',
+                                 'lender_street_2',
+                                 'lender_city',
+                                 'lender_state',
+                                 'lender_zip_code',
+                                 'election_code',
+                                 'election_other_description',
+                                 'loan_amount_original',
+                                 'loan_payment_to_date',
+                                 'loan_balance',
+                                 'loan_incurred_date_terms',
+                                 'loan_due_date_terms',
+                                 'loan_interest_rate_terms',
+                                 'secured',
+                                 'lender_committee_id_number',
+                                 'lender_candidate_id_number',
+                                 'lender_candidate_name',
+                                 'lender_candidate_office',
+                                 'lender_candidate_state',
+                                 'lender_candidate_district',
+                                 'amended_cd',
+                                 'transaction_id_number']},
+ '^sc1': {'^(P3.4|P3.3|P3.2)': ['form_type',
+                                'filer_committee_id_number',
+                                'lender_organization_name',
+                                'lender_street_1',
+                                'lender_street_2',
+                                'lender_city',
+                                'lender_state',
+                                'lender_zip_code',
+                                'loan_amount',
+                                'loan_interest_rate',
+                                'loan_incurred_date',
+                                'loan_due_date',
+                                'loan_restructured',
+                                'loan_incurred_date_original',
+                                'credit_amount_this_draw',
+                                'total_balance',
+                                'others_liable',
+                                'collateral',
+                                'description',
+                                'collateral_value_amount',
+                                'perfected_interest',
+                                'future_income',
+                                'description',
+                                'estimated_value',
+                                'established_date',
+                                'account_location_name',
+                                'street_1',
+                                'street_2',
+                                'city',
+                                'state',
+                                'zip_code',
+                                'f_basis_of_loan_description',
+                                'treasurer_last_name',
+                                'treasurer_first_name',
+                                'treasurer_middle_name',
+                                'treasurer_prefix',
+                                'treasurer_suffix',
+                                'date_signed',
+                                'authorized_last_name',
+                                'authorized_first_name',
+                                'authorized_middle_name',
+                                'authorized_prefix',
+                                'authorized_suffix',
+                                'authorized_title',
+                                'authorized_date',
+                                'deposit_acct_auth_date_presidential',
+                                'image_number'],
+          '^(P1|P2|P3.0|P3.1)': ['form_type',
+                                 'filer_committee_id_number',
+                                 'lender_organization_name',
+                                 'lender_street_1',
+                                 'lender_street_2',
+                                 'lender_city',
+                                 'lender_state',
+                                 'lender_zip_code',
+                                 'loan_amount',
+                                 'loan_interest_rate',
+                                 'loan_incurred_date',
+                                 'loan_due_date',
+                                 'loan_restructured',
+                                 'loan_incurred_date_original',
+                                 'credit_amount_this_draw',
+                                 'total_balance',
+                                 'others_liable',
+                                 'collateral',
+                                 'description',
+                                 'collateral_value_amount',
+                                 'perfected_interest',
+                                 'future_income',
+                                 'description',
+                                 'estimated_value',
+                                 'established_date',
+                                 'account_location_name',
+                                 'street_1',
+                                 'street_2',
+                                 'city',
+                                 'state',
+                                 'zip_code',
+                                 'f_basis_of_loan_description',
+                                 'treasurer_last_name',
+                                 'treasurer_first_name',
+                                 'treasurer_middle_name',
+                                 'treasurer_prefix',
+                                 'treasurer_suffix',
+                                 'date_signed',
+                                 'authorized_last_name',
+                                 'authorized_first_name',
+                                 'authorized_middle_name',
+                                 'authorized_prefix',
+                                 'authorized_suffix',
+                                 'authorized_title',
+                                 'authorized_date',
+                                 'image_number'],
+          '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                           'filer_committee_id_number',
+                                                           'transaction_id_number',
+                                                           'back_reference_tran_id_number',
+                                                           'lender_organization_name',
+                                                           'lender_street_1',
+                                                           'lender_street_2',
+                                                           'lender_city',
+                                                           'lender_state',
+                                                           'lender_zip_code',
+                                                           'loan_amount',
+                                                           'loan_interest_rate',
+                                                           'loan_incurred_date',
+                                                           'loan_due_date',
+                                                           'loan_restructured',
+                                                           'loan_incurred_date_original',
+                                                           'credit_amount_this_draw',
+                                                           'total_balance',
+                                                           'others_liable',
+                                                           'collateral',
+                                                           'description',
+                                                           'collateral_value_amount',
+                                                           'perfected_interest',
+                                                           'future_income',
+                                                           'description',
+                                                           'estimated_value',
+                                                           'established_date',
+                                                           'account_location_name',
+                                                           'street_1',
+                                                           'street_2',
+                                                           'city',
+                                                           'state',
+                                                           'zip_code',
+                                                           'deposit_acct_auth_date_presidential',
+                                                           'f_basis_of_loan_description',
+                                                           'treasurer_last_name',
+                                                           'treasurer_first_name',
+                                                           'treasurer_middle_name',
+                                                           'treasurer_prefix',
+                                                           'treasurer_suffix',
+                                                           'date_signed',
+                                                           'authorized_last_name',
+                                                           'authorized_first_name',
+                                                           'authorized_middle_name',
+                                                           'authorized_prefix',
+                                                           'authorized_suffix',
+                                                           'authorized_title',
+                                                           'authorized_date'],
+          '^5.3': ['form_type',
+                   'filer_committee_id_number',
+                   'back_reference_tran_id_number',
+                   'entity_type',
+                   'lender_organization_name',
+                   'lender_street_1',
+                   'lender_street_2',
+                   'lender_city',
+                   'lender_state',
+                   'lender_zip_code',
+                   'loan_amount',
+                   'loan_interest_rate',
+                   'loan_incurred_date',
+                   'loan_due_date',
+                   'loan_restructured',
+                   'loan_incurred_date_original',
+                   'credit_amount_this_draw',
+                   'total_balance',
+                   'others_liable',
+                   'collateral',
+                   'description',
+                   'collateral_value_amount',
+                   'perfected_interest',
+                   'future_income',
+                   'description',
+                   'estimated_value',
+                   'established_date',
+                   'account_location_name',
+                   'street_1',
+                   'street_2',
+                   'city',
+                   'state',
+                   'zip_code',
+                   'deposit_acct_auth_date_presidential',
+                   'f_basis_of_loan_description',
+                   'treasurer_name',
+                   'date_signed',
+                   'authorized_name',
+                   'authorized_title',
+                   'authorized_date'],
+          '^5.2|5.1|5.0': ['form_type',
+                           'filer_committee_id_number',
+                           'back_reference_tran_id_number',
+                           'entity_type',
+                           'lender_organization_name',
+                           'lender_street_1',
+                           'lender_street_2',
+                           'lender_city',
+                           'lender_state',
+                           'lender_zip_code',
+                           'loan_amount',
+                           'loan_interest_rate',
+                           'loan_incurred_date',
+                           'loan_due_date',
+                           'loan_restructured',
+                           'loan_incurred_date_original',
+                           'credit_amount_this_draw',
+                           'total_balance',
+                           'others_liable',
+                           'collateral',
+                           'description',
+                           'collateral_value_amount',
+                           'perfected_interest',
+                           'future_income',
+                           'description',
+                           'estimated_value',
+                           'established_date',
+                           'account_location_name',
+                           'street_1',
+                           'street_2',
+                           'city',
+                           'state',
+                           'zip_code',
+                           'deposit_acct_auth_date_presidential',
+                           'f_basis_of_loan_description',
+                           'treasurer_name',
+                           'date_signed',
+                           'authorized_name',
+                           'authorized_title',
+                           'authorized_date'],
+          '^3': ['form_type',
+                 'filer_committee_id_number',
+                 'back_reference_tran_id_number',
+                 'entity_type',
+                 'lender_organization_name',
+                 'lender_street_1',
+                 'lender_street_2',
+                 'lender_city',
+                 'lender_state',
+                 'lender_zip_code',
+                 'loan_amount',
+                 'loan_interest_rate',
+                 'loan_incurred_date',
+                 'loan_due_date',
+                 'loan_restructured',
+                 'loan_incurred_date_original',
+                 'credit_amount_this_draw',
+                 'total_balance',
+                 'others_liable',
+                 'collateral',
+                 'description',
+                 'collateral_value_amount',
+                 'perfected_interest',
+                 'future_income',
+                 'description',
+                 'estimated_value',
+                 'established_date',
+                 'account_location_name',
+                 'street_1',
+                 'street_2',
+                 'city',
+                 'state',
+                 'zip_code',
+                 'deposit_acct_auth_date_presidential',
+                 'f_basis_of_loan_description',
+                 'treasurer_name',
+                 'date_signed',
+                 'authorized_name',
+                 'authorized_title',
+                 'authorized_date'],
+          '^2': ['form_type',
+                 'filer_committee_id_number',
+                 'back_reference_tran_id_number',
+                 'entity_type',
+                 'lender_organization_name',
+                 'lender_street_1',
+                 'lender_street_2',
+                 'lender_city',
+                 'lender_state',
+                 'lender_zip_code',
+                 'loan_amount',
+                 'loan_interest_rate',
+                 'loan_incurred_date',
+                 'loan_due_date',
+                 'loan_restructured',
+                 'loan_incurred_date_original',
+                 'credit_amount_this_draw',
+                 'total_balance',
+                 'others_liable',
+                 'collateral',
+                 'description',
+                 'collateral_value_amount',
+                 'perfected_interest',
+                 'future_income',
+                 'description',
+                 'estimated_value',
+                 'established_date',
+                 'account_location_name',
+                 'street_1',
+                 'street_2',
+                 'city',
+                 'state',
+                 'zip_code',
+                 'deposit_acct_auth_date_presidential',
+                 'f_basis_of_loan_description',
+                 'treasurer_name',
+                 'date_signed',
+                 'authorized_name',
+                 'authorized_title']},
+ '^sc2': {'^(P1|P2|P3)': ['form_type',
+                          'filer_committee_id_number',
+                          'guarantor_last_name',
+                          'guarantor_first_name',
+                          'guarantor_middle_name',
+                          'guarantor_prefix',
+                          'guarantor_suffix',
+                          'guarantor_street_1',
+                          'guarantor_street_2',
+                          'guarantor_city',
+                          'guarantor_state',
+                          'guarantor_zip_code',
+                          'guarantor_employer',
+                          'guarantor_occupation',
+                          'guaranteed_amount',
+                          'image_number'],
+          '^8.5': ['form_type',
+                   'filer_committee_id_number',
+                   'transaction_id_number',
+                   'back_reference_tran_id_number',
+                   'guarantor_entity',
+                   'guarantor_organization_name',
+                   'guarantor_committee_fec_id',
+                   'guarantor_last_name',
+                   'guarantor_first_name',
+                   'guarantor_middle_name',
+                   'guarantor_prefix',
+                   'guarantor_suffix',
+                   'guarantor_street_1',
+                   'guarantor_street_2',
+                   'guarantor_city',
+                   'guarantor_state',
+                   'guarantor_zip_code',
+                   'guarantor_employer',
+                   'guarantor_occupation',
+                   'guaranteed_amount'],
+          '^8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                       'filer_committee_id_number',
+                                                       'transaction_id_number',
+                                                       'back_reference_tran_id_number',
+                                                       'guarantor_last_name',
+                                                       'guarantor_first_name',
+                                                       'guarantor_middle_name',
+                                                       'guarantor_prefix',
+                                                       'guarantor_suffix',
+                                                       'guarantor_street_1',
+                                                       'guarantor_street_2',
+                                                       'guarantor_city',
+                                                       'guarantor_state',
+                                                       'guarantor_zip_code',
+                                                       'guarantor_employer',
+                                                       'guarantor_occupation',
+                                                       'guaranteed_amount'],
+          '^5.3': ['form_type',
+                   'filer_committee_id_number',
+                   'back_reference_tran_id_number',
+                   'guarantor_name',
+                   'guarantor_street_1',
+                   'guarantor_street_2',
+                   'guarantor_city',
+                   'guarantor_state',
+                   'guarantor_zip_code',
+                   'guarantor_employer',
+                   'guarantor_occupation',
+                   'guaranteed_amount'],
+          '^5.2|5.1|5.0': ['form_type',
+                           'filer_committee_id_number',
+                           'back_reference_tran_id_number',
+                           'guarantor_name',
+                           'guarantor_street_1',
+                           'guarantor_street_2',
+                           'guarantor_city',
+                           'guarantor_state',
+                           'guarantor_zip_code',
+                           'guarantor_employer',
+                           'guarantor_occupation',
+                           'guaranteed_amount'],
+          '^3|^2': ['form_type',
+                    'filer_committee_id_number',
+                    'back_reference_tran_id_number',
+                    'guarantor_name',
+                    'guarantor_street_1',
+                    'guarantor_street_2',
+                    'guarantor_city',
+                    'guarantor_state',
+                    'guarantor_zip_code',
+                    'guarantor_employer',
+                    'guarantor_occupation',
+                    'guaranteed_amount']},
+ '^sd': {'^P3|^P2|^P1': ['form_type',
+                         'filer_committee_id_number',
+                         'creditor_organization_name',
+                         'creditor_last_name',
+                         'creditor_first_name',
+                         'creditor_middle_name',
+                         'creditor_prefix',
+                         'creditor_suffix',
+                         'creditor_street_1',
+                         'creditor_street_2',
+                         'creditor_city',
+                         'creditor_state',
+                         'creditor_zip_code',
+                         'purpose_of_debt_or_obligation',
+                         'beginning_balance_this_period',
+                         'incurred_amount_this_period',
+                         'payment_amount_this_period',
+                         'balance_at_close_this_period',
+                         'image_number'],
+         '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                          'filer_committee_id_number',
+                                                          'transaction_id_number',
+                                                          'entity_type',
+                                                          'creditor_organization_name',
+                                                          'creditor_last_name',
+                                                          'creditor_first_name',
+                                                          'creditor_middle_name',
+                                                          'creditor_prefix',
+                                                          'creditor_suffix',
+                                                          'creditor_street_1',
+                                                          'creditor_street_2',
+                                                          'creditor_city',
+                                                          'creditor_state',
+                                                          'creditor_zip_code',
+                                                          'purpose_of_debt_or_obligation',
+                                                          'beginning_balance_this_period',
+                                                          'incurred_amount_this_period',
+                                                          'payment_amount_this_period',
+                                                          'balance_at_close_this_period'],
+         '^5.3': ['form_type',
+                  'filer_committee_id_number',
+                  'entity_type',
+                  'creditor_name',
+                  'creditor_street_1',
+                  'creditor_street_2',
+                  'creditor_city',
+                  'creditor_state',
+                  'creditor_zip_code',
+                  'purpose_of_debt_or_obligation',
+                  'beginning_balance_this_period',
+                  'incurred_amount_this_period',
+                  'payment_amount_this_period',
+                  'balance_at_close_this_period',
+                  'fec_committee_id_number',
+                  'fec_candidate_id_number',
+                  'candidate_name',
+                  'candidate_office',
+                  'candidate_state',
+                  'candidate_district',
+                  'conduit_name',
+                  'conduit_street_1',
+                  'conduit_street_2',
+                  'conduit_city',
+                  'conduit_state',
+                  'conduit_zip_code',
+                  'amended_cd',
+                  'transaction_id_number'],
+         '^5.2|5.1|5.0|^3|^2': ['form_type',
+                                'filer_committee_id_number',
+                                'entity_type',
+                                'creditor_name',
+                                'creditor_street_1',
+                                'creditor_street_2',
+                                'creditor_city',
+                                'creditor_state',
+                                'creditor_zip_code',
+                                'purpose_of_debt_or_obligation',
+                                'beginning_balance_this_period',
+                                'incurred_amount_this_period',
+                                'payment_amount_this_period',
+                                'balance_at_close_this_period',
+                                'fec_committee_id_number',
+                                'fec_candidate_id_number',
+                                'candidate_name',
+                                'candidate_office',
+                                'candidate_state',
+                                'candidate_district',
+                                'conduit_name',
+                                'conduit_street_1',
+                                'conduit_street_2',
+                                'conduit_city',
+                                'conduit_state',
+                                'conduit_zip_code',
+                                'amended_cd',
+                                'transaction_id_number'],
+         '^1': ['form_type',
+                'filer_committee_id_number',
+                'creditor_name',
+                'creditor_street_1',
+                'creditor_street_2',
+                'creditor_city',
+                'creditor_state',
+                'creditor_zip_code',
+                'purpose_of_debt_or_obligation',
+                'beginning_balance_this_period',
+                'incurred_amount_this_period',
+                'payment_amount_this_period',
+                'balance_at_close_this_period',
+                'amended_cd']},
+ '^se': {'^(P3.4|P3.3|P3.2)': ['form_type',
+                               'filer_committee_id_number',
+                               'payee_organization_name',
+                               'payee_last_name',
+                               'payee_first_name',
+                               'payee_middle_name',
+                               'payee_prefix',
+                               'payee_suffix',
+                               'payee_street_1',
+                               'payee_street_2',
+                               'payee_city',
+                               'payee_state',
+                               'payee_zip_code',
+                               'dissemination_date',
+                               'expenditure_amount',
+                               'disbursement_date',
+                               'expenditure_purpose_descrip',
+                               'category_code',
+                               'candidate_last_name',
+                               'candidate_first_name',
+                               'candidate_middle_name',
+                               'candidate_prefix',
+                               'candidate_suffix',
+                               'candidate_office',
+                               'candidate_district',
+                               'candidate_state',
+                               'support_oppose_code',
+                               'calendar_y_t_d_per_election_office',
+                               'election_code',
+                               'election_other_description',
+                               'completing_last_name',
+                               'completing_first_name',
+                               'completing_middle_name',
+                               'completing_prefix',
+                               'completing_suffix',
+                               'date_signed',
+                               'memo_code',
+                               'memo_text_description',
+                               'image_number'],
+         '^P3.1': ['form_type',
+                   'filer_committee_id_number',
+                   'payee_organization_name',
+                   'payee_last_name',
+                   'payee_first_name',
+                   'payee_middle_name',
+                   'payee_prefix',
+                   'payee_suffix',
+                   'payee_street_1',
+                   'payee_street_2',
+                   'payee_city',
+                   'payee_state',
+                   'payee_zip_code',
+                   'dissemination_date',
+                   'expenditure_amount',
+                   'disbursement_date',
+                   'expenditure_purpose_descrip',
+                   'category_code',
+                   'candidate_last_name',
+                   'candidate_first_name',
+                   'candidate_middle_name',
+                   'candidate_prefix',
+                   'candidate_suffix',
+                   'candidate_office',
+                   'candidate_district',
+                   'candidate_state',
+                   'support_oppose_code',
+                   'calendar_y_t_d_per_election_office',
+                   'election_code',
+                   'election_other_description',
+                   'completing_last_name',
+                   'completing_first_name',
+                   'completing_middle_name',
+                   'completing_prefix',
+                   'completing_suffix',
+                   'date_signed',
+                   'image_number'],
+         '^(P1|P2|P3.0)': ['form_type',
+                           'filer_committee_id_number',
+                           'payee_organization_name',
+                           'payee_last_name',
+                           'payee_first_name',
+                           'payee_middle_name',
+                           'payee_prefix',
+                           'payee_suffix',
+                           'payee_street_1',
+                           'payee_street_2',
+                           'payee_city',
+                           'payee_state',
+                           'payee_zip_code',
+                           'dissemination_date',
+                           'expenditure_amount',
+                           'expenditure_purpose_descrip',
+                           'category_code',
+                           'candidate_last_name',
+                           'candidate_first_name',
+                           'candidate_middle_name',
+                           'candidate_prefix',
+                           'candidate_suffix',
+                           'candidate_office',
+                           'candidate_district',
+                           'candidate_state',
+                           'support_oppose_code',
+                           'calendar_y_t_d_per_election_office',
+                           'election_code',
+                           'election_other_description',
+                           'completing_last_name',
+                           'completing_first_name',
+                           'completing_middle_name',
+                           'completing_prefix',
+                           'completing_suffix',
+                           'date_signed',
+                           'image_number'],
+         '^8.5|8.4|8.3|8.2|8.1': ['form_type',
+                                  'filer_committee_id_number',
+                                  'transaction_id_number',
+                                  'back_reference_tran_id_number',
+                                  'back_reference_sched_name',
+                                  'entity_type',
+                                  'payee_organization_name',
+                                  'payee_last_name',
+                                  'payee_first_name',
+                                  'payee_middle_name',
+                                  'payee_prefix',
+                                  'payee_suffix',
+                                  'payee_street_1',
+                                  'payee_street_2',
+                                  'payee_city',
+                                  'payee_state',
+                                  'payee_zip_code',
+                                  'election_code',
+                                  'election_other_description',
+                                  'dissemination_date',
+                                  'expenditure_amount',
+                                  'disbursement_date',
+                                  'calendar_y_t_d_per_election_office',
+                                  'expenditure_purpose_descrip',
+                                  'category_code',
+                                  'payee_cmtte_fec_id_number',
+                                  'support_oppose_code',
+                                  'candidate_id_number',
+                                  'candidate_last_name',
+                                  'candidate_first_name',
+                                  'candidate_middle_name',
+                                  'candidate_prefix',
+                                  'candidate_suffix',
+                                  'candidate_office',
+                                  'candidate_district',
+                                  'candidate_state',
+                                  'completing_last_name',
+                                  'completing_first_name',
+                                  'completing_middle_name',
+                                  'completing_prefix',
+                                  'completing_suffix',
+                                  'date_signed',
+                                  'memo_code',
+                                  'memo_text_description'],
+         '^8.0': ['form_type',
+                  'filer_committee_id_number',
+                  'transaction_id_number',
+                  'back_reference_tran_id_number',
+                  'back_reference_sched_name',
+                  'entity_type',
+                  'payee_organization_name',
+                  'payee_last_name',
+                  'payee_first_name',
+                  'payee_middle_name',
+                  'payee_prefix',
+                  'payee_suffix',
+                  'payee_street_1',
+                  'payee_street_2',
+                  'payee_city',
+                  'payee_state',
+                  'payee_zip_code',
+                  'election_code',
+                  'election_other_description',
+                  'dissemination_date',
+                  'expenditure_amount',
+                  'calendar_y_t_d_per_election_office',
+                  'expenditure_purpose_descrip',
+                  'category_code',
+                  'payee_cmtte_fec_id_number',
+                  'support_oppose_code',
+                  'candidate_id_number',
+                  'candidate_last_name',
+                  'candidate_first_name',
+                  'candidate_middle_name',
+                  'candidate_prefix',
+                  'candidate_suffix',
+                  'candidate_office',
+                  'candidate_state',
+                  'candidate_district',
+                  'completing_last_name',
+                  'completing_first_name',
+                  'completing_middle_name',
+                  'completing_prefix',
+                  'completing_suffix',
+                  'date_signed',
+                  'memo_code',
+                  'memo_text_description'],
+         '^7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                  'filer_committee_id_number',
+                                  'transaction_id_number',
+                                  'back_reference_tran_id_number',
+                                  'back_reference_sched_name',
+                                  'entity_type',
+                                  'payee_organization_name',
+                                  'payee_last_name',
+                                  'payee_first_name',
+                                  'payee_middle_name',
+                                  'payee_prefix',
+                                  'payee_suffix',
+                                  'payee_street_1',
+                                  'payee_street_2',
+                                  'payee_city',
+                                  'payee_state',
+                                  'payee_zip_code',
+                                  'election_code',
+                                  'election_other_description',
+                                  'dissemination_date',
+                                  'expenditure_amount',
+                                  'calendar_y_t_d_per_election_office',
+                                  'expenditure_purpose_code',
+                                  'expenditure_purpose_descrip',
+                                  'category_code',
+                                  'payee_cmtte_fec_id_number',
+                                  'support_oppose_code',
+                                  'candidate_id_number',
+                                  'candidate_last_name',
+                                  'candidate_first_name',
+                                  'candidate_middle_name',
+                                  'candidate_prefix',
+                                  'candidate_suffix',
+                                  'candidate_office',
+                                  'candidate_state',
+                                  'candidate_district',
+                                  'completing_last_name',
+                                  'completing_first_name',
+                                  'completing_middle_name',
+                                  'completing_prefix',
+                                  'completing_suffix',
+                                  'date_signed',
+                                  'memo_code',
+                                  'memo_text_description'],
+         '^5.3': ['form_type',
+                  'filer_committee_id_number',
+                  'entity_type',
+                  'payee_name',
+                  'payee_street_1',
+                  'payee_street_2',
+                  'payee_city',
+                  'payee_state',
+                  'payee_zip_code',
+                  'expenditure_purpose_descrip',
+                  'dissemination_date',
+                  'expenditure_amount',
+                  'support_oppose_code',
+                  'candidate_id_number',
+                  'candidate_name',
+                  'candidate_office',
+                  'candidate_state',
+                  'candidate_district',
+                  'payee_cmtte_fec_id_number',
+                  '',
+                  '',
+                  '',
+                  '',
+                  '',
+                  'conduit_name',
+                  'conduit_street_1',
+                  'conduit_street_2',
+                  'conduit_city',
+                  'conduit_state',
+                  'conduit_zip_code',
+                  'ind_name_as_signed',
+                  'date_signed',
+                  'date_notarized',
+                  'date_notary_commission_expires',
+                  'ind_name_notary',
+                  '',
+                  'transaction_id_number',
+                  'memo_code',
+                  'memo_text_description',
+                  'back_reference_tran_id_number',
+                  'back_reference_sched_name',
+                  'election_code',
+                  'election_other_description',
+                  'category_code',
+                  'expenditure_purpose_code',
+                  'calendar_y_t_d_per_election_office'],
+         '^5.2|5.1|5.0': ['form_type',
+                          'filer_committee_id_number',
+                          'entity_type',
+                          'payee_name',
+                          'payee_street_1',
+                          'payee_street_2',
+                          'payee_city',
+                          'payee_state',
+                          'payee_zip_code',
+                          'expenditure_purpose_descrip',
+                          'dissemination_date',
+                          'expenditure_amount',
+                          'support_oppose_code',
+                          'candidate_id_number',
+                          'candidate_name',
+                          'candidate_office',
+                          'candidate_state',
+                          'candidate_district',
+                          'payee_cmtte_fec_id_number',
+                          '',
+                          '',
+                          '',
+                          '',
+                          '',
+                          'conduit_name',
+                          'conduit_street_1',
+                          'conduit_street_2',
+                          'conduit_city',
+                          'conduit_state',
+                          'conduit_zip_code',
+                          'ind_name_as_signed',
+                          'date_signed',
+                          'date_notarized',
+                          'date_notary_commission_expires',
+                          'ind_name_notary',
+                          '',
+                          'transaction_id_number',
+                          'memo_code',
+                          'memo_text_description',
+                          'back_reference_tran_id_number',
+                          'back_reference_sched_name',
+                          'election_code',
+                          'election_other_description',
+                          'category_code',
+                          'expenditure_purpose_code',
+                          'calendar_y_t_d_per_election_office'],
+         '^3': ['form_type',
+                'filer_committee_id_number',
+                'entity_type',
+                'payee_name',
+                'payee_street_1',
+                'payee_street_2',
+                'payee_city',
+                'payee_state',
+                'payee_zip_code',
+                'expenditure_purpose_descrip',
+                'dissemination_date',
+                'expenditure_amount',
+                'support_oppose_code',
+                'candidate_id_number',
+                'candidate_name',
+                'candidate_office',
+                'candidate_state',
+                'candidate_district',
+                'payee_cmtte_fec_id_number',
+                '',
+                '',
+                '',
+                '',
+                '',
+                'conduit_name',
+                'conduit_street_1',
+                'conduit_street_2',
+                'conduit_city',
+                'conduit_state',
+                'conduit_zip_code',
+                'ind_name_as_signed',
+                'date_signed',
+                'date_notarized',
+                'date_notary_commission_expires',
+                'ind_name_notary',
+                '',
+                'transaction_id_number',
+                'memo_code',
+                'memo_text_description',
+                'back_reference_tran_id_number',
+                'back_reference_sched_name'],
+         '^2': ['form_type',
+                'filer_committee_id_number',
+                'entity_type',
+                'payee_name',
+                'payee_street_1',
+                'payee_street_2',
+                'payee_city',
+                'payee_state',
+                'payee_zip_code',
+                'expenditure_purpose_descrip',
+                'dissemination_date',
+                'expenditure_amount',
+                'support_oppose_code',
+                'candidate_id_number',
+                'candidate_name',
+                'candidate_office',
+                'candidate_state',
+                'candidate_district',
+                'payee_cmtte_fec_id_number',
+                '',
+                '',
+                '',
+                '',
+                '',
+                'conduit_name',
+                'conduit_street_1',
+                'conduit_street_2',
+                'conduit_city',
+                'conduit_state',
+                'conduit_zip_code',
+                'ind_name_as_signed',
+                'date_signed',
+                'date_notarized',
+                'date_notary_commission_expires',
+                'ind_name_notary',
+                'amended_cd',
+                'transaction_id_number',
+                'back_reference_tran_id_number',
+                'back_reference_sched_name'],
+         '^1': ['form_type',
+                'filer_committee_id_number',
+                'payee_name',
+                'payee_street_1',
+                'payee_street_2',
+                'payee_city',
+                'payee_state',
+                'payee_zip_code',
+                'expenditure_purpose_descrip',
+                'dissemination_date',
+                'expenditure_amount',
+                'candidate_id_number',
+                'candidate_name',
+                'candidate_office',
+                'candidate_state',
+                'candidate_district',
+                'support_oppose_code',
+                'ind_name_as_signed',
+                'date_signed',
+                'date_notarized',
+                'date_notary_commission_expires',
+                'ind_name_notary',
+                'amended_cd']},
+ '^sf': {'^(P3.4|P3.3|P3.2)': ['form_type',
+                               'filer_committee_id_number',
+                               'coordinated_expenditures',
+                               'designating_committee_name',
+                               'subordinate_committee_name',
+                               'subordinate_street_1',
+                               'subordinate_street_2',
+                               'subordinate_city',
+                               'subordinate_state',
+                               'subordinate_zip_code',
+                               'payee_organization_name',
+                               'payee_last_name',
+                               'payee_first_name',
+                               'payee_middle_name',
+                               'payee_prefix',
+                               'payee_suffix',
+                               'payee_street_1',
+                               'payee_street_2',
+                               'payee_city',
+                               'payee_state',
+                               'payee_zip_code',
+                               'expenditure_purpose_descrip',
+                               'category_code',
+                               'expenditure_date',
+                               'payee_candidate_last_name',
+                               'payee_candidate_first_name',
+                               'payee_candidate_middle_name',
+                               'payee_candidate_prefix',
+                               'payee_candidate_suffix',
+                               'payee_candidate_office',
+                               'payee_candidate_state',
+                               'payee_candidate_district',
+                               'aggregate_general_elec_expended',
+                               'expenditure_amount',
+                               'memo_code',
+                               'memo_text_description',
+                               'image_number'],
+         '^(P2.6|P3.0|P3.1)': ['form_type',
+                               'filer_committee_id_number',
+                               'coordinated_expenditures',
+                               'designating_committee_name',
+                               'subordinate_committee_name',
+                               'subordinate_street_1',
+                               'subordinate_street_2',
+                               'subordinate_city',
+                               'subordinate_state',
+                               'subordinate_zip_code',
+                               'payee_organization_name',
+                               'payee_last_name',
+                               'payee_first_name',
+                               'payee_middle_name',
+                               'payee_prefix',
+                               'payee_suffix',
+                               'payee_street_1',
+                               'payee_street_2',
+                               'payee_city',
+                               'payee_state',
+                               'payee_zip_code',
+                               'expenditure_purpose_descrip',
+                               'category_code',
+                               'expenditure_date',
+                               'payee_candidate_last_name',
+                               'payee_candidate_first_name',
+                               'payee_candidate_middle_name',
+                               'payee_candidate_prefix',
+                               'payee_candidate_suffix',
+                               'payee_candidate_office',
+                               'payee_candidate_state',
+                               'payee_candidate_district',
+                               'aggregate_general_elec_expended',
+                               'expenditure_amount',
+                               'image_number'],
+         '^(P1|P2.2|P2.3|P2.4)': ['form_type',
+                                  'filer_committee_id_number',
+                                  '24_hour_notice',
+                                  'coordinated_expenditures',
+                                  'designating_committee_name',
+                                  'subordinate_committee_name',
+                                  'subordinate_street_1',
+                                  'subordinate_street_2',
+                                  'subordinate_city',
+                                  'subordinate_state',
+                                  'subordinate_zip_code',
+                                  'payee_organization_name',
+                                  'payee_last_name',
+                                  'payee_first_name',
+                                  'payee_middle_name',
+                                  'payee_prefix',
+                                  'payee_suffix',
+                                  'payee_street_1',
+                                  'payee_street_2',
+                                  'payee_city',
+                                  'payee_state',
+                                  'payee_zip_code',
+                                  'expenditure_purpose_descrip',
+                                  'category_code',
+                                  'expenditure_date',
+                                  'payee_candidate_last_name',
+                                  'payee_candidate_first_name',
+                                  'payee_candidate_middle_name',
+                                  'payee_candidate_prefix',
+                                  'payee_candidate_suffix',
+                                  'payee_candidate_office',
+                                  'payee_candidate_state',
+                                  'payee_candidate_district',
+                                  'aggregate_general_elec_expended',
+                                  'expenditure_amount',
+                                  'increased_limit',
+                                  'image_number'],
+         '^8.5|8.4|8.3|8.2|8.1|8.0': ['form_type',
+                                      'filer_committee_id_number',
+                                      'transaction_id_number',
+                                      'back_reference_tran_id_number',
+                                      'back_reference_sched_name',
+                                      'coordinated_expenditures',
+                                      'designating_committee_id_number',
+                                      'designating_committee_name',
+                                      'subordinate_committee_id_number',
+                                      'subordinate_committee_name',
+                                      'subordinate_street_1',
+                                      'subordinate_street_2',
+                                      'subordinate_city',
+                                      'subordinate_state',
+                                      'subordinate_zip_code',
+                                      'entity_type',
+                                      'payee_organization_name',
+                                      'payee_last_name',
+                                      'payee_first_name',
+                                      'payee_middle_name',
+                                      'payee_prefix',
+                                      'payee_suffix',
+                                      'payee_street_1',
+                                      'payee_street_2',
+                                      'payee_city',
+                                      'payee_state',
+                                      'payee_zip_code',
+                                      'expenditure_date',
+                                      'expenditure_amount',
+                                      'aggregate_general_elec_expended',
+                                      'expenditure_purpose_descrip',
+                                      'category_code',
+                                      'payee_committee_id_number',
+                                      'payee_candidate_id_number',
+                                      'payee_candidate_last_name',
+                                      'payee_candidate_first_name',
+                                      'payee_candidate_middle_name',
+                                      'payee_candidate_prefix',
+                                      'payee_candidate_suffix',
+                                      'payee_candidate_office',
+                                      'payee_candidate_state',
+                                      'payee_candidate_district',
+                                      'memo_code',
+                                      'memo_text_description'],
+         '^7.0|6.4': ['form_type',
+                      'filer_committee_id_number',
+                      'transaction_id_number',
+                      'back_reference_tran_id_number',
+                      'back_reference_sched_name',
+                      'coordinated_expenditures',
+                      'designating_committee_id_number',
+                      'designating_committee_name',
+                      'subordinate_committee_id_number',
+                      'subordinate_committee_name',
+                      'subordinate_street_1',
+                      'subordinate_street_2',
+                      'subordinate_city',
+                      'subordinate_state',
+                      'subordinate_zip_code',
+                      'entity_type',
+                      'payee_organization_name',
+                      'payee_last_name',
+                      'payee_first_name',
+                      'payee_middle_name',
+                      'payee_prefix',
+                      'payee_suffix',
+                      'payee_street_1',
+                      'payee_street_2',
+                      'payee_city',
+                      'payee_state',
+                      'payee_zip_code',
+                      'expenditure_date',
+                      'expenditure_amount',
+                      'aggregate_general_elec_expended',
+                      'expenditure_purpose_code',
+                      'expenditure_purpose_descrip',
+                      'category_code',
+                      'payee_committee_id_number',
+                      'payee_candidate_id_number',
+                      'payee_candidate_last_name',
+                      'payee_candidate_first_name',
+                      'payee_candidate_middle_name',
+                      'payee_candidate_prefix',
+                      'payee_candidate_suffix',
+                      'payee_candidate_office',
+                      'payee_candidate_state',
+                      'payee_candidate_district',
+                      'memo_code',
+                      'memo_text_description'],
+         '^6.3|6.2|6.1': ['form_type',
+                          'filer_committee_id_number',
+                          'transaction_id_number',
+                          'back_reference_tran_id_number',
+                          'back_reference_sched_name',
+                          'coordinated_expenditures',
+                          'designating_committee_id_number',
+                          'designating_committee_name',
+                          'subordinate_committee_id_number',
+                          'subordinate_committee_name',
+                          'subordinate_street_1',
+                          'subordinate_street_2',
+                          'subordinate_city',
+                          'subordinate_state',
+                          'subordinate_zip_code',
+                          'entity_type',
+                          'payee_organization_name',
+                          'payee_last_name',
+                          'payee_first_name',
+                          'payee_middle_name',
+                          'payee_prefix',
+                          'payee_suffix',
+                          'payee_street_1',
+                          'payee_street_2',
+                          'payee_city',
+                          'payee_state',
+                          'payee_zip_code',
+                          'expenditure_date',
+                          'expenditure_amount',
+                          'aggregate_general_elec_expended',
+                          'expenditure_purpose_code',
+                          'expenditure_purpose_descrip',
+                          'category_code',
+                          'increased_limit',
+                          'payee_committee_id_number',
+                          'payee_candidate_id_number',
+                          'payee_candidate_last_name',
+                          'payee_candidate_first_name',
+                          'payee_candidate_middle_name',
+                          'payee_candidate_prefix',
+                          'payee_candidate_suffix',
+                          'payee_candidate_office',
+                          'payee_candidate_state',
+                          'payee_candidate_district',
+                          'memo_code',
+                          'memo_text_description'],
+         '^5.3': ['form_type',
+                  'filer_committee_id_number',
+                  'coordinated_expenditures',
+                  'designating_committee_id_number',
+                  'designating_committee_name',
+                  'subordinate_committee_id_number',
+                  'subordinate_committee_name',
+                  'subordinate_street_1',
+                  'subordinate_street_2',
+                  'subordinate_city',
+                  'subordinate_state',
+                  'subordinate_zip_code',
+                  'entity_type',
+                  'payee_name',
+                  'payee_street_1',
+                  'payee_street_2',
+                  'payee_city',
+                  'payee_state',
+                  'payee_zip_code',
+                  'aggregate_general_elec_expended',
+                  'expenditure_purpose_descrip',
+                  'expenditure_date',
+                  'expenditure_amount',
+                  'payee_committee_id_number',
+                  'payee_candidate_id_number',
+                  'payee_candidate_name',
+                  'payee_candidate_office',
+                  'payee_candidate_state',
+                  'payee_candidate_district',
+                  'conduit_name',
+                  'conduit_street_1',
+                  'conduit_street_2',
+                  'conduit_city',
+                  'conduit_state',
+                  'conduit_zip_code',
+                  '',
+                  'transaction_id_number',
+                  'memo_code',
+                  'memo_text_description',
+                  'back_reference_tran_id_number',
+                  'back_reference_sched_name',
+                  'increased_limit',
+                  'category_code',
+                  'expenditure_purpose_code'],
+         '^5.2|5.1|5.0': ['form_type',
+                          'filer_committee_id_number',
+                          'coordinated_expenditures',
+                          'designating_committee_id_number',
+                          'designating_committee_name',
+                          'subordinate_committee_id_number',
+                          'subordinate_committee_name',
+                          'subordinate_street_1',
+                          'subordinate_street_2',
+                          'subordinate_city',
+                          'subordinate_state',
+                          'subordinate_zip_code',
+                          'entity_type',
+                          'payee_name',
+                          'payee_street_1',
+                          'payee_street_2',
+                          'payee_city',
+                          'payee_state',
+                          'payee_zip_code',
+                          'aggregate_general_elec_expended',
+                          'expenditure_purpose_descrip',
+                          'expenditure_date',
+                          'expenditure_amount',
+                          'payee_committee_id_number',
+                          'payee_candidate_id_number',
+                          'payee_candidate_name',
+                          'payee_candidate_office',
+                          'payee_candidate_state',
+                          'payee_candidate_district',
+                          'conduit_name',
+                          'conduit_street_1',
+                          'conduit_street_2',
+                          'conduit_city',
+                          'conduit_state',
+                          'conduit_zip_code',
+                          '',
+                          'transaction_id_number',
+                          'memo_code',
+                          'memo_text_description',
+                          'back_reference_tran_id_number',
+                          'back_reference_sched_name',
+                          'increased_limit',
+                          'category_code',
+                          'expenditure_purpose_code'],
+         '^3': ['form_type',
+                'filer_committee_id_number',
+                'coordinated_expenditures',
+                'designating_committee_id_number',
+                'designating_committee_name',
+                'subordinate_committee_id_number',
+                'subordinate_committee_name',
+                'subordinate_street_1',
+                'subordinate_street_2',
+                'subordinate_city',
+                'subordinate_state',
+                'subordinate_zip_code',
+                'entity_type',
+                'payee_name',
+                'payee_street_1',
+                'payee_street_2',
+                'payee_city',
+                'payee_state',
+                'payee_zip_code',
+                'aggregate_general_elec_expended',
+                'expenditure_purpose_descrip',
+                'expenditure_date',
+                'expenditure_amount',
+                'payee_committee_id_number',
+                'payee_candidate_id_number',
+                'payee_candidate_name',
+                'payee_candidate_office',
+                'payee_candidate_state',
+                'payee_candidate_district',
+                'conduit_name',
+                'conduit_street_1',
+                'conduit_street_2',
+                'conduit_city',
+                'conduit_state',
+                'conduit_zip_code',
+                'amended_cd',
+                'transaction_id_number',
+                'memo_code',
+                'memo_text_description',
+                'back_reference_tran_id_number',
+                'back_reference_sched_name'],
+         '^2': ['form_type',
+                'filer_committee_id_number',
+                'coordinated_expenditures',
+                'designating_committee_id_number',
+                'designating_committee_name',
+                'subordinate_committee_id_number',
+                'subordinate_committee_name',
+                'subordinate_street_1',
+                'subordinate_street_2',
+                'subordinate_city',
+                'subordinate_state',
+                'subordinate_zip_code',
+                'entity_type',
+                'payee_name',
+                'payee_street_1',
+                'payee_street_2',
+                'payee_city',
+                'payee_state',
+                'payee_zip_code',
+                'aggregate_general_elec_expended',
+                'expenditure_purpose_descrip',
+                'expenditure_date',
+                'expenditure_amount',
+                'payee_committee_id_number',
+                'payee_candidate_id_number',
+                'payee_candidate_name',
+                'payee_candidate_office',
+                'payee_candidate_state',
+                'payee_candidate_district',
+                'conduit_name',
+                'conduit_street_1',
+                'conduit_street_2',
+                'conduit_city',
+                'conduit_state',
+                'conduit_zip_code',
+                'amended_cd',
+                'transaction_id_number',
+                'orig_tran_id',
+                'supr_tran_id']},
+ '^si': {'^(6|7)': ['form_type',
+                    'filer_committee_id_number',
+                    'transaction_id_number',
+                    'record_id_number',
+                    'account_name',
+                    'bank_account_id',
+                    'coverage_from_date',
+                    'coverage_through_date',
+                    'col_a_total_receipts',
+                    'col_a_transfers_to_fed',
+                    'col_a_transfers_to_state_local',
+                    'col_a_direct_state_local_support',
+                    'col_a_other_disbursements',
+                    'col_a_total_disbursements',
+                    'col_a_cash_on_hand_beginning_period',
+                    'col_a_receipts_period',
+                    'col_a_subtotal',
+                    'col_a_disbursements_period',
+                    'col_a_cash_on_hand_close_of_period',
+                    'col_b_total_receipts',
+                    'col_b_transfers_to_fed',
+                    'col_b_transfers_to_state_local',
+                    'col_b_direct_state_local_support',
+                    'col_b_other_disbursements',
+                    'col_b_total_disbursements',
+                    'col_b_cash_on_hand_beginning_period',
+                    'col_b_receipts_period',
+                    'col_b_subtotal',
+                    'col_b_disbursements_period',
+                    'col_b_cash_on_hand_close_of_period'],
+         '^(3|5)': ['form_type',
+                    'filer_committee_id_number',
+                    'bank_account_id',
+                    'account_name',
+                    'coverage_from_date',
+                    'coverage_through_date',
+                    'col_a_total_receipts',
+                    'col_a_transfers_to_fed',
+                    'col_a_transfers_to_state_local',
+                    'col_a_direct_state_local_support',
+                    'col_a_other_disbursements',
+                    'col_a_total_disbursements',
+                    'col_a_cash_on_hand_beginning_period',
+                    'col_a_receipts_period',
+                    'col_a_subtotal',
+                    'col_a_disbursements_period',
+                    'col_a_cash_on_hand_close_of_period',
+                    'col_b_total_receipts',
+                    'col_b_transfers_to_fed',
+                    'col_b_transfers_to_state_local',
+                    'col_b_direct_state_local_support',
+                    'col_b_other_disbursements',
+                    'col_b_total_disbursements',
+                    'col_b_cash_on_hand_beginning_period',
+                    'col_b_receipts_period',
+                    'col_b_subtotal',
+                    'col_b_disbursements_period',
+                    'col_b_cash_on_hand_close_of_period',
+                    'amended_cd',
+                    'transaction_id',
+                    'account_identifier']},
+ '^sl': {'^(P3|P2|P1)': ['form_type',
+                         'filer_committee_id_number',
+                         'account_name',
+                         'col_a_itemized_receipts_persons',
+                         'col_a_unitemized_receipts_persons',
+                         'col_a_total_receipts_persons',
+                         'col_a_other_receipts',
+                         'col_a_total_receipts',
+                         'col_a_voter_registration_disbursements',
+                         'col_a_voter_id_disbursements',
+                         'col_a_gotv_disbursements',
+                         'col_a_generic_campaign_disbursements',
+                         'col_a_disbursements_subtotal',
+                         'col_a_other_disbursements',
+                         'col_a_total_disbursements',
+                         'col_a_cash_on_hand_beginning_period',
+                         'col_a_receipts_period',
+                         'col_a_subtotal_period',
+                         'col_a_disbursements_period',
+                         'col_a_cash_on_hand_close_of_period',
+                         'col_b_itemized_receipts_persons',
+                         'col_b_unitemized_receipts_persons',
+                         'col_b_total_receipts_persons',
+                         'col_b_other_receipts',
+                         'col_b_total_receipts',
+                         'col_b_voter_registration_disbursements',
+                         'col_b_voter_id_disbursements',
+                         'col_b_gotv_disbursements',
+                         'col_b_generic_campaign_disbursements',
+                         'col_b_disbursements_subtotal',
+                         'col_b_other_disbursements',
+                         'col_b_total_disbursements',
+                         'col_b_cash_on_hand_beginning_period',
+                         'col_b_receipts_period',
+                         'col_b_subtotal_period',
+                         'col_b_disbursements_period',
+                         'col_b_cash_on_hand_close_of_period',
+                         'image_number'],
+         '^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['form_type',
+                                                          'filer_committee_id_number',
+                                                          'transaction_id_number',
+                                                          'record_id_number',
+                                                          'account_name',
+                                                          'coverage_from_date',
+                                                          'coverage_through_date',
+                                                          'col_a_itemized_receipts_persons',
+                                                          'col_a_unitemized_receipts_persons',
+                                                          'col_a_total_receipts_persons',
+                                                          'col_a_other_receipts',
+                                                          'col_a_total_receipts',
+                                                          'col_a_voter_registration_disbursements',
+                                                          'col_a_voter_id_disbursements',
+                                                          'col_a_gotv_disbursements',
+                                                          'col_a_generic_campaign_disbursements',
+                                                          'col_a_disbursements_subtotal',
+                                                          'col_a_other_disbursements',
+                                                          'col_a_total_disbursements',
+                                                          'col_a_cash_on_hand_beginning_period',
+                                                          'col_a_receipts_period',
+                                                          'col_a_subtotal_period',
+                                                          'col_b_disbursements_period',
+                                                          'col_b_cash_on_hand_close_of_period',
+                                                          'col_b_itemized_receipts_persons',
+                                                          'col_b_unitemized_receipts_persons',
+                                                          'col_b_total_receipts_persons',
+                                                          'col_b_other_receipts',
+                                                          'col_b_total_receipts',
+                                                          'col_b_voter_registration_disbursements',
+                                                          'col_b_voter_id_disbursements',
+                                                          'col_b_gotv_disbursements',
+                                                          'col_b_generic_campaign_disbursements',
+                                                          'col_b_disbursements_subtotal',
+                                                          'col_b_other_disbursements',
+                                                          'col_b_total_disbursements',
+                                                          'col_b_cash_on_hand_beginning_period',
+                                                          'col_b_receipts_period',
+                                                          'col_b_subtotal_period',
+                                                          'col_b_disbursements_period',
+                                                          'col_b_cash_on_hand_close_of_period'],
+         '^5.3|5.2|5.1|5.0': ['form_type',
+                              'filer_committee_id_number',
+                              'account_name',
+                              'record_id_number',
+                              'coverage_from_date',
+                              'coverage_through_date',
+                              'col_a_itemized_receipts_persons',
+                              'col_a_unitemized_receipts_persons',
+                              'col_a_total_receipts_persons',
+                              'col_a_other_receipts',
+                              'col_a_total_receipts',
+                              'col_a_voter_registration_disbursements',
+                              'col_a_voter_id_disbursements',
+                              'col_a_gotv_disbursements',
+                              'col_a_generic_campaign_disbursements',
+                              'col_a_disbursements_subtotal',
+                              'col_a_other_disbursements',
+                              'col_a_total_disbursements',
+                              'col_a_cash_on_hand_beginning_period',
+                              'col_a_receipts_period',
+                              'col_a_subtotal_period',
+                              'col_b_disbursements_period',
+                              'col_b_itemized_receipts_persons',
+                              'col_b_unitemized_receipts_persons',
+                              'col_b_total_receipts_persons',
+                              'col_b_other_receipts',
+                              'col_b_total_receipts',
+                              'col_b_voter_registration_disbursements',
+                              'col_b_voter_id_disbursements',
+                              'col_b_gotv_disbursements',
+                              'col_b_generic_campaign_disbursements',
+                              'col_b_disbursements_subtotal',
+                              'col_b_other_disbursements',
+                              'col_b_total_disbursements',
+                              'col_b_cash_on_hand_beginning_period',
+                              'col_b_receipts_period',
+                              'col_b_subtotal_period',
+                              'col_b_disbursements_period',
+                              'col_b_cash_on_hand_close_of_period',
+                              '',
+                              'transaction_id_number']},
+ '^text': {'^8.5|8.4|8.3|8.2|8.1|8.0|7.0|6.4|6.3|6.2|6.1': ['rec_type',
+                                                            'filer_committee_id_number',
+                                                            'transaction_id_number',
+                                                            'back_reference_tran_id_number',
+                                                            'back_reference_sched_form_name',
+                                                            'text'],
+           '^5.3': ['rec_type',
+                    'form_type',
+                    'back_reference_tran_id_number',
+                    'text'],
+           '^5.2|5.1|5.0': ['rec_type',
+                            'form_type',
+                            'back_reference_tran_id_number',
+                            'text'],
+           '^3': ['rec_type',
+                  'form_type',
+                  'back_reference_tran_id_number',
+                  'text']}}
+
+TYPES = {'^f1[an]': {'.*': {'^date_signed': {'type': 'date', 'format': '%Y%m%d'},
+                    '^effective_date': {'type': 'date', 'format': '%Y%m%d'}}},
+ '^(f1m$|f1m[a|n])': {'.*': {'.*_date$': {'type': 'date', 'format': '%Y%m%d'},
+                             '^date_signed': {'type': 'date',
+                                              'format': '%Y%m%d'}}},
+ '^f13[an]': {'.*': {'.*_date$': {'type': 'date', 'format': '%Y%m%d'},
+                     '^date_signed': {'type': 'date', 'format': '%Y%m%d'}}},
+ '(^f132)|(^f133)': {'.*': {'.*_date$': {'type': 'date', 'format': '%Y%m%d'},
+                            '.*_amount$': {'type': 'float'}}},
+ '(^f2$)|(^f2[^4])': {'.*': {'^date_signed': {'type': 'date',
+                                              'format': '%Y%m%d'}}},
+ '(^f24$)|(^f24[an])': {'.*': {'^date_signed': {'type': 'date',
+                                                'format': '%Y%m%d'}}},
+ '^(f3[ant]|f3p$|(f3p[^s|3])|f3x$|f3x[ant]|f3z)': {'.*': {'^col_': {'type': 'float'},
+                                                          '^coverage_from_date': {'type': 'date',
+                                                                                  'format': '%Y%m%d'},
+                                                          '^coverage_through_date': {'type': 'date',
+                                                                                     'format': '%Y%m%d'},
+                                                          '^date_signed': {'type': 'date',
+                                                                           'format': '%Y%m%d'},
+                                                          '^election_date': {'type': 'date',
+                                                                             'format': '%Y%m%d'}}},
+ '^f3s': {'.*': {'^date_general_election': {'type': 'date', 'format': '%Y%m%d'},
+                 '^date_day_after_general_election': {'type': 'date',
+                                                      'format': '%Y%m%d'},
+                 '^[abcde]_': {'type': 'float'},
+                 '^(transfers|offsets|other|total)': {'type': 'float'}}},
+ '^f4.*': {'.*': {'^col_': {'type': 'float'},
+                  '^coverage_from_date': {'type': 'date', 'format': '%Y%m%d'},
+                  '^coverage_through_date': {'type': 'date',
+                                             'format': '%Y%m%d'},
+                  '^date_signed': {'type': 'date', 'format': '%Y%m%d'}}},
+ '^f5[na]': {'.*': {'^coverage_from_date': {'type': 'date', 'format': '%Y%m%d'},
+                    '^coverage_through_date': {'type': 'date',
+                                               'format': '%Y%m%d'},
+                    '^date_signed': {'type': 'date', 'format': '%Y%m%d'},
+                    '^total_contribution': {'type': 'float'},
+                    '^total_independent_expenditure': {'type': 'float'}}},
+ '^f57': {'.*': {'^calendar_y_t_d_per_election_office': {'type': 'float'},
+                 '^dissemination_date': {'type': 'date', 'format': '%Y%m%d'},
+                 '^expenditure_amount': {'type': 'float'}}},
+ '(^f6$)|(^f6[an])': {'.*': {'^date_signed': {'type': 'date',
+                                              'format': '%Y%m%d'}}},
+ '^f65': {'.*': {'^contribution_amount': {'type': 'float'},
+                 '^contribution_date': {'type': 'date', 'format': '%Y%m%d'}}},
+ '(^f8$)|(^f8[an])': {'.*': {'^cash_on_hand$': {'type': 'float'},
+                             '^cash_on_hand_as_of_date': {'type': 'date',
+                                                          'format': '%Y%m%d'},
+                             '^total_assets': {'type': 'float'},
+                             '^receipts_ytd': {'type': 'float'},
+                             '^disbursements_ytd': {'type': 'float'},
+                             '^total_debts_owed': {'type': 'float'},
+                             '^total_num_creditors_owed': {'type': 'float'},
+                             '^num_creditors_part_ii': {'type': 'float'},
+                             '^total_debts_owed_part_ii': {'type': 'float'},
+                             '^total_to_be_paid_to_creditors': {'type': 'float'},
+                             '^date_signed': {'type': 'date',
+                                              'format': '%Y%m%d'}}},
+ '^f8ii$': {'.*': {'^date_incurred': {'type': 'date', 'format': '%Y%m%d'},
+                   '^amount_owed_to': {'type': 'float'},
+                   '^amount_offered_in': {'type': 'float'},
+                   '^date_signed': {'type': 'date', 'format': '%Y%m%d'}}},
+ '^f8iii$': {'.*': {'^date_incurred': {'type': 'date', 'format': '%Y%m%d'},
+                    '^amount_owed_to': {'type': 'float'},
+                    '^amount_expected_to_pay': {'type': 'float'}}},
+ '(^f9$)|(^f9[an])': {'.*': {'^original_amendment_date': {'type': 'date',
+                                                          'format': '%Y%m%d'},
+                             '^coverage_from_date': {'type': 'date',
+                                                     'format': '%Y%m%d'},
+                             '^coverage_through_date': {'type': 'date',
+                                                        'format': '%Y%m%d'},
+                             '^date_public_distribution': {'type': 'date',
+                                                           'format': '%Y%m%d'},
+                             '^total_donations': {'type': 'float'},
+                             '^total_disbursements': {'type': 'float'},
+                             '^date_signed': {'type': 'date',
+                                              'format': '%Y%m%d'}}},
+ '^f92': {'.*': {'^contribution_date': {'type': 'date', 'format': '%Y%m%d'},
+                 '^contribution_amount': {'type': 'float'}}},
+ '^f93': {'.*': {'^expenditure_date': {'type': 'date', 'format': '%Y%m%d'},
+                 '^expenditure_amount': {'type': 'float'},
+                 '^communication_date': {'type': 'date', 'format': '%Y%m%d'}}},
+ '^f99': {'.*': {'^date_signed': {'type': 'date', 'format': '%Y%m%d'}}},
+ '^f10$': {'.*': {'^expenditure_total_': {'type': 'float'},
+                  '^previous_expenditure_aggregate': {'type': 'float'},
+                  '^date_signed': {'type': 'date', 'format': '%Y%m%d'}}},
+ '^f105$': {'.*': {'^expenditure_amount': {'type': 'float'},
+                   '^expenditure_date': {'type': 'date', 'format': '%Y%m%d'}}},
+ '^sa': {'.*': {'^contribution_aggregate': {'type': 'float'},
+                '^contribution_amount': {'type': 'float'},
+                '^contribution_date': {'type': 'date', 'format': '%Y%m%d'}}},
+ '^sb': {'.*': {'^expenditure_amount': {'type': 'float'},
+                '^semi_annual_refunded_bundled_amt': {'type': 'float'},
+                '^expenditure_date': {'type': 'date', 'format': '%Y%m%d'}}},
+ '^sc': {'.*': {'^authorized_date': {'type': 'date', 'format': '%Y%m%d'},
+                '^date_signed': {'type': 'date', 'format': '%Y%m%d'},
+                '^deposit_acct_auth_date_presidential': {'type': 'date',
+                                                         'format': '%Y%m%d'},
+                '^established_date': {'type': 'date', 'format': '%Y%m%d'},
+                '^loan_amount_original': {'type': 'float'},
+                '^loan_balance': {'type': 'float'},
+                '^loan_incurred_date': {'type': 'date', 'format': '%Y%m%d'},
+                '^loan_payment_to_date': {'type': 'float'}}},
+ '^sd': {'.*': {'^balance_at_close_this_period': {'type': 'float'},
+                '^beginning_balance_this_period': {'type': 'float'},
+                '^incurred_amount_this_period': {'type': 'float'},
+                '^payment_amount_this_period': {'type': 'float'}}},
+ '^se': {'.*': {'^calendar_y_t_d_per_election_office': {'type': 'float'},
+                '^date_signed': {'type': 'date', 'format': '%Y%m%d'},
+                '^disbursement_date': {'type': 'date', 'format': '%Y%m%d'},
+                '^dissemination_date': {'type': 'date', 'format': '%Y%m%d'},
+                '^expenditure_amount': {'type': 'float'}}},
+ '^sf': {'.*': {'^expenditure_date': {'type': 'date', 'format': '%Y%m%d'},
+                '^expenditure_amount': {'type': 'float'},
+                '^aggregate_general_elec_expended': {'type': 'float'}}},
+ '^si': {'.*': {'^col_': {'type': 'float'},
+                '^coverage_from_date': {'type': 'date', 'format': '%Y%m%d'},
+                '^coverage_through_date': {'type': 'date',
+                                           'format': '%Y%m%d'}}},
+ '^sl': {'.*': {'^col_': {'type': 'float'},
+                '^coverage_from_date': {'type': 'date', 'format': '%Y%m%d'},
+                '^coverage_through_date': {'type': 'date',
+                                           'format': '%Y%m%d'}}}}
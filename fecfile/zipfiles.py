@@ -0,0 +1,86 @@
+from itertools import chain
+import os
+import zipfile
+
+from . import fecparser
+
+
+def filing_id(member_name):
+    return os.path.splitext(os.path.basename(member_name))[0]
+
+
+def selected_members(zip_file, filing_ids=None):
+    """ the names of the .fec files in a zip archive, limited to the given
+    filing ids, which only requires reading the archive's directory """
+    if filing_ids is not None:
+        filing_ids = set(str(i) for i in filing_ids)
+    return [
+        info.filename for info in zip_file.infolist()
+        if info.filename.lower().endswith('.fec') and (
+            filing_ids is None or filing_id(info.filename) in filing_ids
+        )
+    ]
+
+
+def has_form_type(summary, form_types):
+    form_type = summary.get('form_type') or ''
+    return any(form_type.upper().startswith(f.upper()) for f in form_types)
+
+
+def iter_member(member, options, form_types=None):
+    """Iterates over the FecItems of an open zip archive member. If
+    ``form_types`` is given, and the filing's summary line has a form type
+    that doesn't start with any of them, nothing after the summary line is
+    read and nothing is yielded."""
+    items = fecparser.iter_lines(fecparser.read_lines(member), options)
+    if form_types is None:
+        return items
+    peeked = []
+    for item in items:
+        peeked.append(item)
+        if item.data_type == 'summary':
+            if not has_form_type(item.data, form_types):
+                return iter(())
+            break
+    return chain(peeked, items)
+
+
+def parse_member(zip_path, name, options, form_types):
+    with zipfile.ZipFile(zip_path, 'r') as zip_file:
+        with zip_file.open(name) as member:
+            items = [
+                (item.data_type, item.data, item.line_num, item.offset)
+                for item in iter_member(member, options, form_types)
+            ]
+    return filing_id(name), items
+
+
+def iter_zip(zip_path, options={}, filing_ids=None, form_types=None,
+             workers=1):
+    """Yields a ``(filing_id, items)`` tuple for each filing in the zip archive
+    at ``zip_path``, streaming each one out of the archive without extracting
+    it to disk. With one worker, ``items`` is an iterator that parses the
+    filing as it is consumed, and it must be consumed before moving on to the
+    next filing. With more workers, filings are parsed in a process pool and
+    yielded as they finish, with ``items`` as a list of FecItems."""
+    with zipfile.ZipFile(zip_path, 'r') as zip_file:
+        names = selected_members(zip_file, filing_ids)
+        if workers == 1:
+            for name in names:
+                with zip_file.open(name) as member:
+                    items = iter_member(member, options, form_types)
+                    first = next(items, None)
+                    if first is not None:
+                        yield filing_id(name), chain([first], items)
+            return
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from .parallel import warm_worker
+    with ProcessPoolExecutor(workers, initializer=warm_worker) as executor:
+        futures = [
+            executor.submit(parse_member, zip_path, name, options, form_types)
+            for name in names
+        ]
+        for future in as_completed(futures):
+            member_id, items = future.result()
+            if items:
+                yield member_id, [fecparser.FecItem(*item) for item in items]
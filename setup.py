@@ -1,3 +1,4 @@
+import re
 from setuptools import setup, find_packages
 
 
@@ -5,6 +6,10 @@ with open('README.md', 'r') as file:
     long_description = '\n'.join(file.readlines()[3:])
 
 
+with open('fecfile/__init__.py', 'r') as file:
+    version = re.search(r"__version__ = '(.+)'", file.read()).group(1)
+
+
 requirements = [
     'pytz>=2018.4',
     'requests>=2.19.1',
@@ -13,7 +18,7 @@ requirements = [
 
 setup(
     name='fecfile',
-    version='0.9.1',
+    version=version,
     description='a python parser for the .fec file format',
     long_description=long_description,
     long_description_content_type="text/markdown",
@@ -37,5 +42,13 @@ setup(
     packages=find_packages(exclude=['docs', 'test-data']),
     package_data={'fecfile': ['mappings.json', 'types.json']},
     install_requires=requirements,
+    extras_require={
+        'pandas': ['pandas'],
+        'arrow': ['pyarrow'],
+        'aio': ['aiohttp'],
+    },
+    entry_points={
+        'console_scripts': ['fecfile=fecfile.cli:main'],
+    },
     zip_safe=False,
     )
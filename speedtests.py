@@ -1,5 +1,17 @@
 import unittest
 from datetime import datetime
+import csv
+import io
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import timeit
+import tracemalloc
+import zipfile
+import sys
 import fecfile
 
 from collections import Counter
@@ -50,6 +62,581 @@ def from_file_speed(filepath, options={}):
     ))
 
 
+def index_build_speed():
+    print('++++\nBuilding regex indexes for mappings.json and types.json')
+    tables = fecfile.fecparser.load_tables()
+    start = datetime.now()
+    mapping_index = fecfile.cache.RegexIndex(tables['mappings'])
+    type_index = fecfile.cache.RegexIndex(
+        tables['types'],
+        compile_value=fecfile.cache.compile_properties,
+    )
+    end = datetime.now()
+    print('built {0} mapping and {1} type patterns in {2}'.format(
+        len(mapping_index.entries),
+        len(type_index.entries),
+        end - start,
+    ))
+
+
+# a cold import took about 18ms once the mappings were loaded on first use,
+# so this leaves room for a slower machine but not for eager imports of
+# concurrent.futures, pandas or the export modules
+IMPORT_BUDGET = 0.04
+
+
+def import_speed(filepath):
+    print('++++\nTiming a cold import of fecfile and a first parse of ' + filepath)
+    script = (
+        'from datetime import datetime\n'
+        'start = datetime.now()\n'
+        'import fecfile\n'
+        'imported = datetime.now()\n'
+        'fecfile.from_file({0!r})\n'
+        'parsed = datetime.now()\n'
+        'print((imported - start).total_seconds(), parsed - imported)\n'
+    ).format(filepath)
+    output = subprocess.check_output([sys.executable, '-c', script])
+    import_time, parse_time = output.decode('utf-8').split()
+    print('imported fecfile in {0}s, first parse took {1}'.format(
+        import_time,
+        parse_time,
+    ))
+    return float(import_time)
+
+
+def split_speed(filepath):
+    print('++++\nSplitting the comma-delimited lines of {0}'.format(filepath))
+    with open(filepath) as file:
+        lines = file.read().split('\n')
+
+    start = datetime.now()
+    for line in lines:
+        fields = next(csv.reader([line]))
+        list(map(
+            lambda x: x[1:-1] if (x.startswith('"') and x.endswith('"')) else x,
+            fields
+        ))
+    per_line = datetime.now() - start
+
+    start = datetime.now()
+    feeder = fecfile.fecparser.LineFeeder(iter([]))
+    reader = csv.reader(feeder)
+    for line in lines:
+        feeder.feed(line)
+        fecfile.fecparser.strip_quotes(next(reader, []))
+    streamed = datetime.now() - start
+
+    for label, elapsed in (('csv.reader per line', per_line),
+                           ('one streaming csv.reader', streamed)):
+        print('\t{0}: {1:,.0f} rows/sec'.format(
+            label,
+            len(lines) / elapsed.total_seconds(),
+        ))
+
+
+def stream_csv_speed(filepath):
+    print('++++\nParsing {0} with and without stream_csv'.format(filepath))
+    # parse once first, so neither option pays for building the row
+    # decoders, then alternate between them and keep the best time of each
+    num_items = sum(1 for item in fecfile.iter_file(filepath))
+    all_options = ({}, {'stream_csv': True})
+    best = {}
+    for i in range(10):
+        for n, options in enumerate(all_options):
+            elapsed = timeit.timeit(
+                lambda: sum(1 for item in fecfile.iter_file(filepath, options)),
+                number=1,
+            )
+            best[n] = min(best.get(n, elapsed), elapsed)
+    for n, options in enumerate(all_options):
+        print('\t{0}: {1:,.0f} rows/sec'.format(options, num_items / best[n]))
+
+
+def filter_speed(filepath, filter_list):
+    print('++++\nFiltering {0} for {1}'.format(filepath, filter_list))
+    with open(filepath, 'rb') as file:
+        lines = list(fecfile.fecparser.read_lines(file))
+    fecfile.fecparser.warm_caches()
+    start = datetime.now()
+    for line in fecfile.fecparser.decode_lines(lines):
+        fecfile.fecparser.include_line(line, filter_list)
+    decoded = datetime.now() - start
+    start = datetime.now()
+    prefixes = fecfile.fecparser.line_prefixes(filter_list)[1]
+    for line in lines:
+        line.startswith(prefixes)
+    prefiltered = datetime.now() - start
+    start = datetime.now()
+    options = {'filter_itemizations': filter_list}
+    num_items = sum(1 for item in fecfile.fecparser.iter_lines(lines, options))
+    filtered = datetime.now() - start
+    start = datetime.now()
+    for item in fecfile.fecparser.iter_lines(lines):
+        pass
+    unfiltered = datetime.now() - start
+    print('\tdecoding and checking {0} lines: {1}'.format(len(lines), decoded))
+    print('\tchecking {0} undecoded lines: {1}'.format(len(lines), prefiltered))
+    print('\tparsing {0} filtered items: {1}'.format(num_items, filtered))
+    print('\tparsing every item: {0}'.format(unfiltered))
+
+
+def columns_speed(filepath, columns):
+    print('++++\nParsing {0} with every column and with {1}'.format(
+        filepath, columns
+    ))
+    with open(filepath) as file:
+        unparsed = file.read()
+    fecfile.fecparser.warm_caches()
+    start = datetime.now()
+    fecfile.loads(unparsed)
+    every = datetime.now() - start
+    start = datetime.now()
+    fecfile.loads(unparsed, {'columns': columns})
+    projected = datetime.now() - start
+    print('\tevery column: {0}'.format(every))
+    print('\t{0} columns: {1}'.format(len(columns), projected))
+
+
+def dates_speed(filepath):
+    print('++++\nParsing {0} with each kind of date'.format(filepath))
+    with open(filepath) as file:
+        unparsed = file.read()
+    fecfile.fecparser.warm_caches()
+    for dates in (None, 'naive', 'date'):
+        start = datetime.now()
+        fecfile.loads(unparsed, {'dates': dates})
+        print('\tdates={0}: {1}'.format(dates, datetime.now() - start))
+
+
+class SpeedTestDates(unittest.TestCase):
+    def test_dates(self):
+        dates_speed('test-data/27789.fec')
+
+
+class SpeedTestColumns(unittest.TestCase):
+    def test_columns(self):
+        columns_speed('test-data/1229017.fec', [
+            'contributor_last_name',
+            'contributor_zip_code',
+            'contribution_date',
+            'contribution_amount',
+            'memo_code',
+        ])
+
+
+class SpeedTestFilter(unittest.TestCase):
+    def test_filter(self):
+        filter_speed('test-data/27789.fec', ['SB'])
+
+
+class SpeedTestCommaSplitting(unittest.TestCase):
+    def test_split(self):
+        split_speed('test-data/27789.fec')
+
+    def test_stream_csv(self):
+        stream_csv_speed('test-data/27789.fec')
+
+
+class SpeedTestImport(unittest.TestCase):
+    def test_import(self):
+        import_time = min(
+            import_speed('test-data/1229017.fec') for i in range(3)
+        )
+        self.assertLess(import_time, IMPORT_BUDGET)
+
+
+class SpeedTestIndexBuild(unittest.TestCase):
+    def test_build(self):
+        index_build_speed()
+
+
+def columnar_memory(filepath):
+    print('++++\nMemory used by from_file for {0}'.format(filepath))
+    for options in ({}, {'columnar': True}):
+        tracemalloc.start()
+        parsed = fecfile.from_file(filepath, options)
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del parsed
+        print('\t{0}: {1:,} bytes'.format(options, used))
+
+
+def row_memory(filepath):
+    print('++++\nMemory used by from_file for {0} by kind of row'.format(
+        filepath
+    ))
+    for options in (
+        {},
+        {'intern': True},
+        {'records': True},
+        {'records': True, 'intern': True},
+        {'columnar': True, 'intern': True},
+    ):
+        tracemalloc.start()
+        parsed = fecfile.from_file(filepath, options)
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del parsed
+        print('\t{0}: {1:,} bytes'.format(options, used))
+
+
+def peak_memory(filepath):
+    print('++++\nPeak memory parsing {0}'.format(filepath))
+
+    def read_and_loads():
+        with open(filepath) as file:
+            return fecfile.loads(file.read())
+
+    fecfile.fecparser.warm_caches()
+    for name, parse in (
+        ('read and loads', read_and_loads),
+        ('from_file', lambda: fecfile.from_file(filepath)),
+    ):
+        tracemalloc.start()
+        parsed = parse()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del parsed
+        print('\t{0}: {1:,} bytes'.format(name, peak))
+
+
+def mixed_encoding_speed(filepath):
+    print('++++\nIterating over {0} with one ISO-8859-1 line at the end'.format(
+        filepath
+    ))
+    with open(filepath, 'rb') as file:
+        lines = file.read().rstrip(b'\n').split(b'\n')
+    lines[-1] = lines[-1] + 'ñ'.encode('ISO-8859-1')
+    fec_dir = tempfile.mkdtemp()
+    mixed_path = os.path.join(fec_dir, 'mixed.fec')
+    with open(mixed_path, 'wb') as file:
+        file.write(b'\n'.join(lines) + b'\n')
+
+    def restarting():
+        # how iter_file used to work
+        try:
+            with open(mixed_path, 'r') as file:
+                for item in fecfile.fecparser.iter_lines(file):
+                    yield item
+        except UnicodeDecodeError:
+            with open(mixed_path, 'r', encoding='ISO-8859-1') as file:
+                for item in fecfile.fecparser.iter_lines(file):
+                    yield item
+
+    fecfile.fecparser.warm_caches()
+    for name, items in (
+        ('restarting in text mode', restarting()),
+        ('iter_file', fecfile.iter_file(mixed_path)),
+    ):
+        start = datetime.now()
+        num_items = sum(1 for item in items)
+        print('\t{0}: {1} items in {2}'.format(
+            name, num_items, datetime.now() - start
+        ))
+    shutil.rmtree(fec_dir)
+
+
+class SpeedTestMixedEncoding(unittest.TestCase):
+    def test_mixed_encoding(self):
+        mixed_encoding_speed('test-data/27789.fec')
+
+
+def jsonl_speed(filepath):
+    print('++++\nWriting {0} as JSON Lines'.format(filepath))
+
+    def with_json_dumps(out):
+        for item in fecfile.iter_file(filepath):
+            out.write(json.dumps(
+                {'data_type': item.data_type, 'data': item.data}, default=str
+            ) + '\n')
+
+    fecfile.fecparser.warm_caches()
+    for name, write in (
+        ('json.dumps for each item', with_json_dumps),
+        ('dump_jsonl', lambda out: fecfile.dump_jsonl(filepath, out)),
+    ):
+        out = io.StringIO()
+        start = datetime.now()
+        write(out)
+        print('\t{0}: {1} bytes in {2}'.format(
+            name, len(out.getvalue()), datetime.now() - start
+        ))
+
+
+def csv_export_speed(filepath):
+    print('++++\nWriting the itemizations in {0} to CSV files'.format(
+        filepath
+    ))
+    fecfile.fecparser.warm_caches()
+    out_dir = tempfile.mkdtemp()
+
+    def with_dict_writer():
+        parsed = fecfile.from_file(filepath)
+        for name, rows in parsed['itemizations'].items():
+            path = os.path.join(out_dir, name + '.csv')
+            with open(path, 'w', newline='') as file:
+                writer = csv.DictWriter(file, fieldnames=list(rows[0].keys()))
+                writer.writeheader()
+                for row in rows:
+                    writer.writerow(row)
+
+    for name, write in (
+        ('from_file and csv.DictWriter', with_dict_writer),
+        ('to_csv', lambda: fecfile.to_csv(filepath, out_dir)),
+        ('to_csv in batches of 500 rows',
+         lambda: fecfile.to_csv(filepath, out_dir, batch_size=500)),
+    ):
+        start = datetime.now()
+        tracemalloc.start()
+        write()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print('\t{0}: {1} with a peak of {2:.1f}MB'.format(
+            name, datetime.now() - start, peak / 1e6
+        ))
+    shutil.rmtree(out_dir)
+
+
+class SpeedTestCsvExport(unittest.TestCase):
+    def test_csv(self):
+        csv_export_speed('test-data/27789.fec')
+
+
+def load_into_speed(filepath):
+    print('++++\nLoading the itemizations in {0} into SQLite'.format(filepath))
+    fecfile.fecparser.warm_caches()
+    db_dir = tempfile.mkdtemp()
+
+    def row_by_row(conn):
+        tables = set()
+        num_rows = 0
+        for item in fecfile.iter_file(filepath):
+            if item.data_type != 'itemization':
+                continue
+            table = 'naive_' + item.data['form_type'][:2]
+            keys = list(item.data.keys())
+            if table not in tables:
+                conn.execute('CREATE TABLE IF NOT EXISTS {0} ({1})'.format(
+                    table, ', '.join('"{0}"'.format(k) for k in keys)
+                ))
+                tables.add(table)
+            conn.execute('INSERT INTO {0} ({1}) VALUES ({2})'.format(
+                table,
+                ', '.join('"{0}"'.format(k) for k in keys),
+                ', '.join(['?'] * len(keys)),
+            ), [v if v is None or type(v) in (str, int, float) else str(v)
+                for v in item.data.values()])
+            num_rows += 1
+        conn.commit()
+        return num_rows
+
+    def batched(conn):
+        return sum(fecfile.load_into(conn, filepath).values())
+
+    for name, load in (
+        ('iter_file and one INSERT per row', row_by_row),
+        ('load_into', batched),
+    ):
+        conn = sqlite3.connect(os.path.join(db_dir, name + '.db'))
+        start = datetime.now()
+        num_rows = load(conn)
+        elapsed = datetime.now() - start
+        conn.close()
+        print('\t{0}: {1} rows in {2} ({3:,.0f} rows/s)'.format(
+            name, num_rows, elapsed, num_rows / elapsed.total_seconds()
+        ))
+    shutil.rmtree(db_dir)
+
+
+class SpeedTestLoadInto(unittest.TestCase):
+    def test_load_into(self):
+        load_into_speed('test-data/27789.fec')
+
+
+def resume_speed(filepath):
+    print('++++\nFinishing {0} after stopping 80% of the way in'.format(
+        filepath
+    ))
+    fecfile.fecparser.warm_caches()
+    num_items = sum(1 for item in fecfile.iter_file(filepath))
+    state = fecfile.ParserState()
+    items = fecfile.iter_file(filepath, state=state)
+    for i in range(num_items * 4 // 5):
+        next(items)
+    token = state.token()
+    items.close()
+
+    def restarting():
+        for item in fecfile.iter_file(filepath):
+            pass
+
+    def resuming():
+        for item in fecfile.iter_file(filepath, state=token):
+            pass
+
+    for name, finish in (
+        ('restarting from the beginning', restarting),
+        ('resuming from the token', resuming),
+    ):
+        start = datetime.now()
+        finish()
+        print('\t{0}: {1}'.format(name, datetime.now() - start))
+
+
+class SpeedTestResume(unittest.TestCase):
+    def test_resume(self):
+        resume_speed('test-data/27789.fec')
+
+
+class SpeedTestJsonLines(unittest.TestCase):
+    def test_jsonl(self):
+        jsonl_speed('test-data/27789.fec')
+
+
+class SpeedTestPeakMemory(unittest.TestCase):
+    def test_memory(self):
+        peak_memory('test-data/27789.fec')
+
+
+class SpeedTestRowMemory(unittest.TestCase):
+    def test_memory(self):
+        row_memory('test-data/27789.fec')
+
+
+class SpeedTestColumnarMemory(unittest.TestCase):
+    def test_memory(self):
+        columnar_memory('test-data/27789.fec')
+
+
+def dataframe_speed(filepath):
+    print('++++\nBuilding a Schedule A DataFrame for {0}'.format(filepath))
+    import pandas
+    start = datetime.now()
+    pandas.DataFrame(fecfile.from_file(filepath)['itemizations']['Schedule A'])
+    from_dicts = datetime.now() - start
+    start = datetime.now()
+    fecfile.to_dataframes(filepath)['Schedule A']
+    direct = datetime.now() - start
+    print('\tpandas.DataFrame(from_file(...)): {0}'.format(from_dicts))
+    print('\tfecfile.to_dataframes(...): {0}'.format(direct))
+
+
+class SpeedTestDataFrames(unittest.TestCase):
+    def test_dataframes(self):
+        try:
+            import pandas
+        except ImportError:
+            self.skipTest('pandas is not installed')
+        dataframe_speed('test-data/27789.fec')
+
+
+def parse_many_speed(zip_path):
+    print('++++\nParsing the filings in {0} one at a time and in parallel'.format(
+        zip_path
+    ))
+    fec_dir = tempfile.mkdtemp()
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        zip_ref.extractall(fec_dir)
+    paths = [os.path.join(fec_dir, f) for f in sorted(os.listdir(fec_dir))]
+    start = datetime.now()
+    for path in paths:
+        fecfile.from_file(path)
+    sequential = datetime.now() - start
+    start = datetime.now()
+    errors = [r for r in fecfile.parse_many(paths) if r.error is not None]
+    parallel = datetime.now() - start
+    shutil.rmtree(fec_dir)
+    print('\tparsed {0} files with from_file in {1}'.format(
+        len(paths),
+        sequential,
+    ))
+    print('\tparsed {0} files with parse_many in {1} ({2} errors)'.format(
+        len(paths),
+        parallel,
+        len(errors),
+    ))
+
+
+class SpeedTestParseMany(unittest.TestCase):
+    def test_parse_many(self):
+        parse_many_speed('test-data/20180616.zip')
+
+
+def iter_file_parallel_speed(filepath):
+    print('++++\nIterating over {0} in one process and in parallel'.format(
+        filepath
+    ))
+    start = datetime.now()
+    num_items = sum(1 for item in fecfile.iter_file(filepath))
+    sequential = datetime.now() - start
+    start = datetime.now()
+    num_parallel = sum(
+        1 for item in fecfile.iter_file_parallel(filepath, chunk_size=65536)
+    )
+    parallel = datetime.now() - start
+    print('\titer_file: {0} items in {1}'.format(num_items, sequential))
+    print('\titer_file_parallel: {0} items in {1}'.format(
+        num_parallel,
+        parallel,
+    ))
+
+
+class SpeedTestIterFileParallel(unittest.TestCase):
+    def test_iter_file_parallel(self):
+        iter_file_parallel_speed('test-data/27789.fec')
+
+
+def iter_zip_speed(zip_path):
+    print('++++\nParsing the filings in {0} with and without extracting'.format(
+        zip_path
+    ))
+    start = datetime.now()
+    fec_dir = tempfile.mkdtemp()
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        zip_ref.extractall(fec_dir)
+    for f in sorted(os.listdir(fec_dir)):
+        for item in fecfile.iter_file(os.path.join(fec_dir, f)):
+            pass
+    shutil.rmtree(fec_dir)
+    extracted = datetime.now() - start
+    start = datetime.now()
+    for filing_id, items in fecfile.iter_zip(zip_path):
+        for item in items:
+            pass
+    streamed = datetime.now() - start
+    print('\textractall and iter_file: {0}'.format(extracted))
+    print('\titer_zip: {0}'.format(streamed))
+
+
+class SpeedTestIterZip(unittest.TestCase):
+    def test_iter_zip(self):
+        iter_zip_speed('test-data/20180616.zip')
+
+
+def parse_cache_speed(filepath):
+    print('++++\nParsing {0} with an empty and a filled parse cache'.format(
+        filepath
+    ))
+    cache_dir = tempfile.mkdtemp()
+    fecfile.set_parse_cache(cache_dir)
+    start = datetime.now()
+    fecfile.from_file(filepath, {'columnar': True})
+    first = datetime.now() - start
+    start = datetime.now()
+    fecfile.from_file(filepath, {'columnar': True})
+    second = datetime.now() - start
+    fecfile.set_parse_cache(None)
+    shutil.rmtree(cache_dir)
+    print('\tparsed and saved: {0}'.format(first))
+    print('\tloaded from the cache: {0}'.format(second))
+
+
+class SpeedTestParseCache(unittest.TestCase):
+    def test_parse_cache(self):
+        parse_cache_speed('test-data/27789.fec')
+
+
 class SpeedTestSmallFile(unittest.TestCase):
     def test_simple(self):
         speed_test('test-data/1229017.fec')
@@ -83,10 +670,57 @@ if __name__ == '__main__':
         SpeedTestSmallOldFile('test_simple'),
         SpeedTestMediumRecentFile('test_simple'),
     ])
+    startup_tests = unittest.TestSuite([
+        SpeedTestImport('test_import'),
+        SpeedTestIndexBuild('test_build'),
+    ])
+    filter_tests = unittest.TestSuite([
+        SpeedTestFilter('test_filter'),
+        SpeedTestColumns('test_columns'),
+        SpeedTestDates('test_dates'),
+    ])
+    comma_tests = unittest.TestSuite([
+        SpeedTestCommaSplitting('test_split'),
+        SpeedTestCommaSplitting('test_stream_csv'),
+    ])
+    memory_tests = unittest.TestSuite([
+        SpeedTestColumnarMemory('test_memory'),
+        SpeedTestRowMemory('test_memory'),
+        SpeedTestPeakMemory('test_memory'),
+        SpeedTestDataFrames('test_dataframes'),
+    ])
+    encoding_tests = unittest.TestSuite([
+        SpeedTestMixedEncoding('test_mixed_encoding'),
+    ])
+    parallel_tests = unittest.TestSuite([
+        SpeedTestParseMany('test_parse_many'),
+        SpeedTestIterFileParallel('test_iter_file_parallel'),
+        SpeedTestIterZip('test_iter_zip'),
+    ])
+    cache_tests = unittest.TestSuite([
+        SpeedTestParseCache('test_parse_cache'),
+    ])
+    export_tests = unittest.TestSuite([
+        SpeedTestJsonLines('test_jsonl'),
+        SpeedTestCsvExport('test_csv'),
+        SpeedTestLoadInto('test_load_into'),
+    ])
+    resume_tests = unittest.TestSuite([
+        SpeedTestResume('test_resume'),
+    ])
     from_file_tests = unittest.TestSuite([
         SpeedTestSmallFile('test_from_file'),
         SpeedTestSmallOldFile('test_from_file'),
         SpeedTestMediumRecentFile('test_from_file'),
     ])
 
+    unittest.TextTestRunner().run(startup_tests)
+    unittest.TextTestRunner().run(filter_tests)
+    unittest.TextTestRunner().run(comma_tests)
+    unittest.TextTestRunner().run(memory_tests)
+    unittest.TextTestRunner().run(encoding_tests)
+    unittest.TextTestRunner().run(parallel_tests)
+    unittest.TextTestRunner().run(cache_tests)
+    unittest.TextTestRunner().run(export_tests)
+    unittest.TextTestRunner().run(resume_tests)
     unittest.TextTestRunner().run(from_file_tests)
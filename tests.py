@@ -1,13 +1,24 @@
 import unittest
 import fecfile
+import fecfile.build_tables
+import fecfile.cli
+import asyncio
+import csv
 from datetime import datetime
+import io
 import os
 import json
+import pickle
 import shutil
+import sqlite3
 import zipfile
 import random
+import subprocess
 import sys
+import threading
+import unittest.mock
 import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 
 class CandidateTest(unittest.TestCase):
@@ -335,6 +346,22 @@ class Windows1252Encoding(unittest.TestCase):
         self.assertIsInstance(parsed['filing']['date_signed'], datetime)
         self.assertEqual(parsed['filing']['city'], 'Denton')
 
+    def test_mixed(self):
+        with open('test-data/1229017.fec', 'rb') as file:
+            lines = file.read().split(b'\n')
+        lines[-3] = lines[-3].replace(b'Somerville', 'Peña'.encode('utf-8'))
+        lines[-2] = lines[-2].replace(b'Portland', 'Peña'.encode('ISO-8859-1'))
+        file_path = os.path.join('test-data', 'mixed-encoding.fec')
+        try:
+            with open(file_path, 'wb') as file:
+                file.write(b'\n'.join(lines))
+            items = list(fecfile.iter_file(file_path))
+        finally:
+            os.remove(file_path)
+        self.assertEqual(len(items), 235)
+        cities = [item.data['payee_city'] for item in items[-2:]]
+        self.assertEqual(cities, ['Peña', 'Peña'])
+
 
 class OptionsFilterItemizations(unittest.TestCase):
     def test_read(self):
@@ -345,6 +372,163 @@ class OptionsFilterItemizations(unittest.TestCase):
         self.assertEqual(len(parsed['itemizations']['Schedule B']), 47)
         self.assertNotIn('Schedule A', parsed['itemizations'])
 
+    def test_undecoded(self):
+        file_path = 'test-data/27789.fec'
+        a_filter = {'filter_itemizations': ['SB']}
+        with open(file_path, 'rb') as file:
+            lines = file.read().split(b'\n')
+        parsed = fecfile.loads(lines, options=a_filter)
+        self.assertEqual(parsed, fecfile.from_file(file_path, a_filter))
+        self.assertEqual(len(parsed['itemizations']['Schedule B']), 211)
+        self.assertNotIn('Schedule A', parsed['itemizations'])
+
+
+class ColumnsOption(unittest.TestCase):
+    def test_read(self):
+        file_path = 'test-data/1229017.fec'
+        columns = ['contribution_date', 'contribution_amount', 'memo_code']
+        parsed = fecfile.from_file(file_path, options={'columns': columns})
+        full = fecfile.from_file(file_path)
+        self.assertEqual(parsed['filing'], full['filing'])
+        sched_a = parsed['itemizations']['Schedule A']
+        self.assertEqual(len(sched_a), 186)
+        self.assertEqual(
+            list(sched_a[0].keys()),
+            ['form_type', 'contribution_date', 'contribution_amount',
+             'memo_code'],
+        )
+        self.assertEqual(
+            sched_a[0]['contribution_amount'],
+            full['itemizations']['Schedule A'][0]['contribution_amount'],
+        )
+        self.assertEqual(
+            list(parsed['itemizations']['Schedule B'][0].keys()),
+            ['form_type', 'memo_code'],
+        )
+
+    def test_parse_line(self):
+        with open('test-data/1229017.fec') as file:
+            line = file.readlines()[2]
+        parsed = fecfile.parse_line(line, '8.2', columns=['contribution_amount'])
+        self.assertEqual(
+            parsed, {'form_type': 'SA11AI', 'contribution_amount': 1000.0}
+        )
+
+
+class DatesOption(unittest.TestCase):
+    def test_read(self):
+        file_path = 'test-data/1229017.fec'
+        aware = fecfile.from_file(file_path)
+        naive = fecfile.from_file(file_path, options={'dates': 'naive'})
+        dates = fecfile.from_file(file_path, options={'dates': 'date'})
+        signed = aware['filing']['date_signed']
+        self.assertEqual(str(signed), '2018-05-03 00:00:00-04:00')
+        self.assertEqual(
+            naive['filing']['date_signed'],
+            signed.replace(tzinfo=None),
+        )
+        self.assertEqual(dates['filing']['date_signed'], signed.date())
+        aware_a = aware['itemizations']['Schedule A']
+        dates_a = dates['itemizations']['Schedule A']
+        for aware_row, date_row in zip(aware_a, dates_a):
+            self.assertEqual(
+                aware_row['contribution_date'].date(),
+                date_row['contribution_date'],
+            )
+
+    def test_formats(self):
+        to_date = fecfile.fecparser.date_converter('%Y%m%d', 'date')
+        self.assertEqual(str(to_date('20180503')), '2018-05-03')
+        self.assertEqual(str(to_date(' 2018053 ')), '2018-05-03')
+        self.assertIsNone(to_date('  '))
+        with self.assertRaises(ValueError):
+            to_date('20180231')
+
+
+class InternOption(unittest.TestCase):
+    def test_read(self):
+        file_path = 'test-data/27789.fec'
+        parsed = fecfile.from_file(file_path, options={'intern': True})
+        self.assertEqual(parsed, fecfile.from_file(file_path))
+        sched_a = parsed['itemizations']['Schedule A']
+        self.assertIs(sched_a[0]['contributor_state'],
+                      sched_a[1]['contributor_state'])
+        self.assertIsNot(sched_a[0]['contributor_name'],
+                         sched_a[1]['contributor_name'])
+        # each parse has tables of its own
+        again = fecfile.from_file(file_path, options={'intern': True})
+        self.assertIsNot(
+            again['itemizations']['Schedule A'][0]['contributor_state'],
+            sched_a[0]['contributor_state'],
+        )
+
+    def test_columns(self):
+        interned = fecfile.fecparser.interned_column
+        self.assertTrue(interned('entity_type'))
+        self.assertTrue(interned('contributor_employer'))
+        self.assertTrue(interned('filer_committee_id_number'))
+        self.assertFalse(interned('transaction_id_number'))
+        self.assertFalse(interned('contributor_last_name'))
+        self.assertFalse(interned('memo_text_description'))
+
+    def test_tables(self):
+        decoder = fecfile.fecparser.getRowDecoder('SA11AI', '8.2')
+        tables = {}
+        interned = decoder.intern_tables(tables)
+        entity_type = ''.join(['I', 'ND'])
+        first = decoder.values(
+            ['SA11AI', 'C1', 'T1', '', '', entity_type], interned=interned
+        )
+        second = decoder.values(
+            ['SA11AI', 'C1', 'T1', '', '', 'IND'], interned=interned
+        )
+        self.assertIs(first[5], second[5])
+        self.assertIs(tables['entity_type'][entity_type], entity_type)
+        self.assertNotIn('transaction_id', tables)
+        self.assertNotIn('contribution_amount', tables)
+        limit = fecfile.fecparser.INTERN_LIMIT
+        for i in range(limit + 10):
+            decoder.values(['SA11AI', str(i)], interned=interned)
+        self.assertEqual(len(tables['filer_committee_id_number']), limit)
+
+
+class RecordsOption(unittest.TestCase):
+    def test_read(self):
+        file_path = 'test-data/1229017.fec'
+        parsed = fecfile.from_file(file_path, options={'records': True})
+        full = fecfile.from_file(file_path)
+        self.assertEqual(parsed['filing'].to_dict(), full['filing'])
+        sched_a = parsed['itemizations']['Schedule A']
+        self.assertEqual(
+            [row.to_dict() for row in sched_a],
+            full['itemizations']['Schedule A'],
+        )
+        self.assertIsInstance(sched_a[0], tuple)
+        self.assertIs(type(sched_a[0]), type(sched_a[1]))
+        self.assertEqual(sched_a[0].contribution_amount, 1000.0)
+        self.assertEqual(sched_a[0].form_type, 'SA11AI')
+        self.assertEqual(pickle.loads(pickle.dumps(parsed)), parsed)
+
+    def test_record_type(self):
+        record_type = fecfile.records.record_type
+        cls = record_type('F24', ('form_type', '24_hour_notice', 'count'))
+        self.assertIs(
+            cls, record_type('F24', ('form_type', '24_hour_notice', 'count'))
+        )
+        row = cls(['F24N', 'X', 1])
+        self.assertEqual(row.form_type, 'F24N')
+        self.assertEqual(row.count('X'), 1)
+        self.assertEqual(
+            row.to_dict(),
+            {'form_type': 'F24N', '24_hour_notice': 'X', 'count': 1},
+        )
+
+    def test_iter_file(self):
+        items = fecfile.iter_file('test-data/27789.fec', {'records': True})
+        for item in items:
+            if item.data_type == 'itemization':
+                self.assertIsInstance(item.data, fecfile.FecRecord)
+
 
 class AsStringsOption(unittest.TestCase):
     def test_request(self):
@@ -385,6 +569,847 @@ class ParseFileIterator(unittest.TestCase):
         self.assertEqual(num_itemizations, 186)
 
 
+class RowDecoderIsReused(unittest.TestCase):
+    def test_decode(self):
+        decoder = fecfile.fecparser.getRowDecoder('SA11AI', '8.2')
+        self.assertIs(decoder, fecfile.fecparser.getRowDecoder('SA11AI', '8.2'))
+        self.assertEqual(decoder.columns[0], 'form_type')
+        parsed = decoder.decode(['SA11AI', 'C00000000'])
+        self.assertEqual(len(parsed), len(decoder.columns))
+        self.assertIsNone(parsed['contribution_amount'])
+        self.assertIsNone(parsed['contribution_date'])
+
+
+class RegexIndexLookups(unittest.TestCase):
+    def test_prefixes(self):
+        self.assertEqual(fecfile.cache.literal_prefix('^sa[^3]'), 'sa')
+        self.assertEqual(fecfile.cache.literal_prefix('(^f2$)|(^f2[^4])'), 'f2')
+        self.assertEqual(fecfile.cache.literal_prefix('^(f1m$|f1m[a|n])'), 'f1m')
+        self.assertEqual(fecfile.cache.literal_prefix('^f4.*'), 'f4')
+        self.assertEqual(fecfile.cache.literal_prefix('.*'), '')
+
+    def test_lookup(self):
+        index = fecfile.cache.RegexIndex({
+            '^sa[^3]': {'^8': 'sa8', '^P': 'saP'},
+            '^sa3l': {'.*': 'sa3l'},
+            '^s': {'.*': 's'},
+        })
+        self.assertEqual(index.lookup('SA11AI', '8.2'), ['sa8', 's'])
+        self.assertEqual(index.lookup('SA3L', '8.2'), ['sa3l', 's'])
+        self.assertEqual(index.lookup('SB23', 'P3.2'), ['s'])
+        self.assertEqual(index.lookup('F3X', '8.2'), [])
+        self.assertGreater(index.build_time, 0)
+
+    def test_threads(self):
+        types = fecfile.fecparser.load_tables()['types']
+        interval = sys.getswitchinterval()
+        # switch threads as often as possible, so they interleave while
+        # entries are being compiled
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+        for trial in range(20):
+            index = fecfile.cache.RegexIndex(
+                types, fecfile.cache.compile_properties
+            )
+            barrier = threading.Barrier(8)
+            errors = []
+
+            def lookup():
+                barrier.wait()
+                try:
+                    for form in ('SA11AI', 'SB23', 'F3XN', 'SC/10', 'F24N'):
+                        index.lookup(form, '8.3')
+                except Exception as ex:
+                    errors.append(ex)
+            threads = [threading.Thread(target=lookup) for i in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(errors, [])
+
+
+class BoundedCaches(unittest.TestCase):
+    def test_stats(self):
+        fecfile.clear_cache()
+        fecfile.parse_line('SA11AI,C00000000', '5.3')
+        fecfile.parse_line(' sa11ai ,C00000000', '5.3')
+        stats = fecfile.cache_stats()
+        self.assertEqual(stats['row_decoders']['size'], 1)
+        self.assertEqual(stats['row_decoders']['hits'], 1)
+        self.assertEqual(stats['row_decoders']['misses'], 1)
+        self.assertEqual(stats['mappings']['size'], 1)
+
+    def test_eviction(self):
+        lru = fecfile.cache.LRUCache(2)
+        lru['a'] = 1
+        lru['b'] = 2
+        self.assertEqual(lru['a'], 1)
+        lru['c'] = 3
+        self.assertNotIn('b', lru)
+        self.assertIn('a', lru)
+        self.assertEqual(lru.stats()['evictions'], 1)
+        lru.resize(1)
+        self.assertEqual(len(lru), 1)
+        self.assertIn('c', lru)
+
+
+class LazyTables(unittest.TestCase):
+    def test_import(self):
+        script = (
+            'import sys, fecfile\n'
+            'print(len(fecfile.fecparser.TABLES), "requests" in sys.modules)\n'
+        )
+        output = subprocess.check_output([sys.executable, '-c', script])
+        self.assertEqual(output.decode('utf-8').split(), ['0', 'False'])
+
+    def test_lazy_modules(self):
+        script = (
+            'import sys, fecfile\n'
+            'print(*sorted(m for m in sys.modules if m in {0!r}))\n'
+            'fecfile.parallel\n'
+            'print(*sorted(m for m in sys.modules if m in {0!r}))\n'
+        ).format(['concurrent.futures', 'pandas', 'pyarrow'] + [
+            'fecfile.' + name for name in fecfile.LAZY_MODULES
+        ])
+        output = subprocess.check_output([sys.executable, '-c', script])
+        self.assertEqual(output.decode('utf-8').split('\n'), [
+            '', 'fecfile.parallel', '',
+        ])
+        self.assertIs(fecfile.ParseResult, fecfile.parallel.ParseResult)
+
+    def test_tables_match_json(self):
+        with open(fecfile.build_tables.tables_file) as file:
+            self.assertEqual(file.read(), fecfile.build_tables.render_tables())
+
+
+class MemoryMappedFile(unittest.TestCase):
+    def test_line_endings(self):
+        with open('test-data/1229017.fec', 'rb') as file:
+            unparsed = file.read()
+        file_path = os.path.join('test-data', 'line-endings.fec')
+        expected = fecfile.loads(unparsed.decode('utf-8'))
+        try:
+            for newline in (b'\r\n', b'\r'):
+                with open(file_path, 'wb') as file:
+                    file.write(unparsed.replace(b'\n', newline))
+                self.assertEqual(fecfile.from_file(file_path), expected)
+            with open(file_path, 'wb') as file:
+                pass
+            self.assertEqual(fecfile.from_file(file_path)['itemizations'], {})
+        finally:
+            os.remove(file_path)
+
+    def test_map_lines(self):
+        with open('test-data/27789.fec', 'rb') as file:
+            lines = list(fecfile.fecparser.map_lines(file))
+        with open('test-data/27789.fec') as file:
+            self.assertEqual(
+                [line.decode('utf-8') for line in lines],
+                file.read().split('\n')[:-1],
+            )
+
+
+class ResumableParsing(unittest.TestCase):
+    def test_positions(self):
+        with open('test-data/27789.fec', 'rb') as file:
+            data = file.read()
+        lines = data.split(b'\n')
+        for item in fecfile.iter_file('test-data/27789.fec'):
+            line = lines[item.line_num - 1]
+            self.assertEqual(data[item.offset:item.offset + len(line)], line)
+        items = list(fecfile.fecparser.iter_lines(lines))
+        self.assertEqual([item.line_num for item in items[:3]], [1, 2, 3])
+        self.assertIsNone(items[0].offset)
+
+    def test_resume(self):
+        file_path = 'test-data/27789.fec'
+        expected = [
+            (item.data_type, item.data, item.line_num, item.offset)
+            for item in fecfile.iter_file(file_path)
+        ]
+        for stop in (0, 1, 2000, len(expected) - 1):
+            state = fecfile.ParserState()
+            items = fecfile.iter_file(file_path, state=state)
+            for i in range(stop + 1):
+                next(items)
+            token = json.loads(json.dumps(state.token()))
+            self.assertEqual(token['line_num'], expected[stop][2])
+            self.assertEqual(token['version'], '3.00')
+            resumed = [
+                (item.data_type, item.data, item.line_num, item.offset)
+                for item in fecfile.iter_file(file_path, state=token)
+            ]
+            self.assertEqual(resumed, expected[stop + 1:])
+
+    def test_resume_text(self):
+        with open('test-data/1229017.fec', 'rb') as file:
+            lines = file.read().split(b'\n')
+        file_path = os.path.join('test-data', 'resume.fec')
+        with open(file_path, 'wb') as file:
+            file.write(b'\r'.join(lines[:3]) + b'\r\n[BEGINTEXT]\nsome\r\n'
+                       b'text\n[ENDTEXT]\n' + b'\r\n'.join(lines[3:]))
+        try:
+            options = {'columns': ['contribution_amount']}
+            expected = [
+                (item.data_type, item.data, item.line_num)
+                for item in fecfile.iter_file(file_path, options)
+            ]
+            self.assertEqual(expected[3], ('F99_text', 'some\ntext', 4))
+            stops = list(range(6)) + list(range(6, len(expected), 25))
+            for stop in stops:
+                state = fecfile.ParserState()
+                items = fecfile.iter_file(file_path, options, state)
+                for i in range(stop + 1):
+                    next(items)
+                state = fecfile.ParserState.from_token(state.token())
+                resumed = [
+                    (item.data_type, item.data, item.line_num)
+                    for item in fecfile.iter_file(file_path, options, state)
+                ]
+                self.assertEqual(resumed, expected[stop + 1:])
+        finally:
+            os.remove(file_path)
+
+
+class StreamCsvOption(unittest.TestCase):
+    def test_same_as_per_line(self):
+        file_path = 'test-data/27789.fec'
+        per_line = fecfile.from_file(file_path)
+        streamed = fecfile.from_file(file_path, options={'stream_csv': True})
+        self.assertEqual(per_line, streamed)
+
+    def test_embedded_newline(self):
+        with open('test-data/27789.fec') as file:
+            lines = file.read().split('\n')[0:2]
+        lines.append(
+            '"SB21B","C00097485","","First Union National Bank",'
+            '"1420 Irving Street","","Rahway","NJ","07065","",'
+            '"Bank Charges:\nWire Transfer Fee","","","20010716","9.00"'
+        )
+        lines.append(lines[-1].replace('9.00', '10.00'))
+        parsed = fecfile.loads('\n'.join(lines), {'stream_csv': True})
+        sched_b = parsed['itemizations']['Schedule B']
+        self.assertEqual(len(sched_b), 2)
+        self.assertEqual(
+            sched_b[0]['expenditure_purpose_descrip'],
+            'Bank Charges:\nWire Transfer Fee',
+        )
+        self.assertEqual(sched_b[1]['expenditure_amount'], 10.0)
+
+
+class ColumnarOption(unittest.TestCase):
+    def test_read(self):
+        file_path = 'test-data/1229017.fec'
+        parsed = fecfile.from_file(file_path)
+        columnar = fecfile.from_file(file_path, options={'columnar': True})
+        sched_a = columnar['itemizations']['Schedule A']
+        self.assertIsInstance(sched_a, fecfile.FecTable)
+        self.assertEqual(len(sched_a), 186)
+        self.assertEqual(
+            sched_a.column('contribution_amount'),
+            [a['contribution_amount']
+             for a in parsed['itemizations']['Schedule A']],
+        )
+        self.assertEqual(
+            sched_a.to_dicts()[0],
+            parsed['itemizations']['Schedule A'][0],
+        )
+        self.assertEqual(columnar['filing'], parsed['filing'])
+
+    def test_mixed_columns(self):
+        table = fecfile.FecTable('Schedule A')
+        decoder = fecfile.fecparser.getRowDecoder('SA11AI', '8.2')
+        row = decoder.values(['SA11AI', 'C00000000'])
+        row[decoder.keys.index('contribution_amount')] = 'N/A'
+        table.append(decoder, decoder.values(['SA11AI', 'C1', 'IND']))
+        table.append(decoder, row)
+        self.assertEqual(table.column('contribution_amount'), [None, 'N/A'])
+        self.assertEqual(table.column('transaction_id'), ['IND', ''])
+
+    def test_batches(self):
+        file_path = 'test-data/1229017.fec'
+        sizes = []
+        for item in fecfile.iter_batches(file_path, batch_size=100):
+            if item.data_type == 'itemizations':
+                sizes.append((item.data.name, len(item.data)))
+                self.assertIsNone(item.line_num)
+            else:
+                self.assertIsNotNone(item.line_num)
+        self.assertEqual(
+            sorted(sizes),
+            [('Schedule A', 86), ('Schedule A', 100), ('Schedule B', 47)],
+        )
+
+
+class DataFrameExport(unittest.TestCase):
+    def test_pandas(self):
+        try:
+            import pandas
+        except ImportError:
+            self.skipTest('pandas is not installed')
+        frames = fecfile.to_dataframes('test-data/1229017.fec')
+        sched_a = frames['Schedule A']
+        self.assertEqual(len(sched_a), 186)
+        self.assertEqual(len(frames['Schedule B']), 47)
+        self.assertEqual(str(sched_a['contribution_amount'].dtype), 'float64')
+        self.assertEqual(
+            sched_a['contribution_date'][0],
+            pandas.Timestamp('2018-04-25', tz='US/Eastern'),
+        )
+
+    def test_arrow(self):
+        try:
+            import pyarrow
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+        tables = fecfile.to_arrow('test-data/1229017.fec')
+        sched_b = tables['Schedule B']
+        self.assertEqual(sched_b.num_rows, 47)
+        amounts = sched_b.column('expenditure_amount')
+        self.assertEqual(amounts.type, pyarrow.float64())
+
+
+class ParseManyFiles(unittest.TestCase):
+    def test_parse(self):
+        file_paths = [
+            'test-data/1229017.fec',
+            'test-data/27789.fec',
+            'test-data/does-not-exist.fec',
+        ]
+        results = {}
+        for result in fecfile.parse_many(file_paths, workers=2):
+            results[result.path] = result
+        self.assertEqual(len(results), 3)
+        sched_a = results['test-data/1229017.fec'].data['itemizations']
+        self.assertEqual(len(sched_a['Schedule A']), 186)
+        self.assertIsNone(results['test-data/27789.fec'].error)
+        missing = results['test-data/does-not-exist.fec']
+        self.assertIsNone(missing.data)
+        self.assertIsInstance(missing.error, FileNotFoundError)
+
+
+class ParseFileInParallel(unittest.TestCase):
+    def items(self, iterator):
+        return [
+            (item.data_type, item.data, item.line_num, item.offset)
+            for item in iterator
+        ]
+
+    def test_parse(self):
+        file_path = 'test-data/1229017.fec'
+        expected = self.items(fecfile.iter_file(file_path))
+        items = fecfile.iter_file_parallel(
+            file_path,
+            workers=2,
+            chunk_size=4096,
+        )
+        self.assertEqual(self.items(items), expected)
+
+    def test_text_sections(self):
+        file_path = 'test-data/1236235.fec'
+        expected = self.items(fecfile.iter_file(file_path))
+        items = fecfile.iter_file_parallel(
+            file_path,
+            workers=1,
+            chunk_size=100,
+        )
+        self.assertEqual(self.items(items), expected)
+        self.assertEqual(expected[-1][0], 'F99_text')
+        self.assertIsNotNone(expected[-1][2])
+
+    def test_count_lines(self):
+        data = b'a\r\nb\rc\nd\r\n\r\re\n'
+        for step in range(1, len(data) + 1):
+            self.assertEqual(
+                fecfile.parallel.count_lines(data, 0, len(data), step), 7
+            )
+        self.assertEqual(fecfile.parallel.count_lines(data, 3, 10), 3)
+
+    def test_text_markers(self):
+        data = (b'x\r  [BEGINTEXT] \r\nsee [endtext] here\n\t[End Text]\r'
+                b'y [BEGIN TEXT] z\n')
+        self.assertEqual(
+            fecfile.parallel.text_sections(data),
+            [(2, data.index(b'y'))],
+        )
+
+    def test_carriage_returns(self):
+        file_path = 'test-data/1229017-cr.fec'
+        with open('test-data/1229017.fec', 'rb') as file:
+            data = file.read().replace(b'\r\n', b'\n').replace(b'\n', b'\r')
+        with open(file_path, 'wb') as file:
+            file.write(data)
+        try:
+            expected = self.items(fecfile.iter_file(file_path))
+            items = fecfile.iter_file_parallel(
+                file_path,
+                workers=2,
+                chunk_size=4096,
+            )
+            self.assertEqual(self.items(items), expected)
+            self.assertGreater(len(expected), 2)
+        finally:
+            os.remove(file_path)
+
+
+class IterateOverZipFile(unittest.TestCase):
+    def test_iterate(self):
+        z_file = 'test-data/20180616.zip'
+        num_filings = 0
+        for filing_id, items in fecfile.iter_zip(z_file):
+            num_filings += 1
+            for item in items:
+                if item.data_type == 'summary':
+                    self.assertIsInstance(item.data['date_signed'], datetime)
+        self.assertEqual(num_filings, 52)
+
+    def test_select(self):
+        z_file = 'test-data/20180616.zip'
+        selected = fecfile.iter_zip(z_file, filing_ids=[1238405, '1238371'])
+        self.assertEqual(
+            sorted(filing_id for filing_id, items in selected),
+            ['1238371', '1238405'],
+        )
+        f3x_filings = fecfile.iter_zip(z_file, form_types=['F3X'], workers=2)
+        num_filings = 0
+        for filing_id, items in f3x_filings:
+            num_filings += 1
+            self.assertTrue(items[1].data['form_type'].startswith('F3X'))
+            self.assertEqual(items[1].line_num, 2)
+        self.assertEqual(num_filings, 14)
+
+    def test_other_members(self):
+        z_file = os.path.join('test-data', 'other-members.zip')
+        with zipfile.ZipFile(z_file, 'w') as zip_file:
+            zip_file.writestr('README.txt', 'not a filing\n')
+            zip_file.write('test-data/1229017.fec', 'filings/1229017.fec')
+            zip_file.writestr('filings/', '')
+        try:
+            for workers in (1, 2):
+                filings = [
+                    (filing_id, list(items)) for filing_id, items in
+                    fecfile.iter_zip(z_file, workers=workers)
+                ]
+                self.assertEqual([f[0] for f in filings], ['1229017'])
+            self.assertEqual(
+                fecfile.cli.find_filings([z_file]),
+                [(z_file, 'filings/1229017.fec',
+                  os.path.getsize('test-data/1229017.fec'))],
+            )
+        finally:
+            os.remove(z_file)
+
+
+class ParseCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = os.path.join('test-data', 'parse-cache')
+        fecfile.set_parse_cache(self.cache_dir)
+
+    def tearDown(self):
+        fecfile.set_parse_cache(None)
+        shutil.rmtree(self.cache_dir)
+
+    def test_from_file(self):
+        file_path = 'test-data/1229017.fec'
+        expected = fecfile.from_file(file_path)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertEqual(fecfile.from_file(file_path), expected)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        as_strings = fecfile.from_file(file_path, {'as_strings': True})
+        self.assertEqual(as_strings['filing']['date_signed'], '20180503')
+        with open(file_path) as file:
+            self.assertEqual(fecfile.loads(file.read()), expected)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+        columnar = fecfile.from_file(file_path, {'columnar': True})
+        cached = fecfile.from_file(file_path, {'columnar': True})
+        self.assertEqual(
+            cached['itemizations']['Schedule A'].to_dicts(),
+            columnar['itemizations']['Schedule A'].to_dicts(),
+        )
+
+    def test_eviction(self):
+        fecfile.set_parse_cache(self.cache_dir, max_bytes=1)
+        fecfile.from_file('test-data/1229017.fec')
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_unreadable_entry(self):
+        file_path = 'test-data/1229017.fec'
+        expected = fecfile.from_file(file_path)
+        [name] = os.listdir(self.cache_dir)
+        for contents in (b'', b'not a pickle', b'cno_such_module\nName\n.'):
+            with open(os.path.join(self.cache_dir, name), 'wb') as file:
+                file.write(contents)
+            self.assertEqual(fecfile.from_file(file_path), expected)
+            self.assertEqual(os.listdir(self.cache_dir), [name])
+        self.assertEqual(fecfile.from_file(file_path), expected)
+
+
+class JsonLinesExport(unittest.TestCase):
+    def test_dump(self):
+        file_path = 'test-data/1229017.fec'
+        out = io.StringIO()
+        num_lines = fecfile.dump_jsonl(file_path, out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(num_lines, len(lines))
+        items = list(fecfile.iter_file(file_path))
+        self.assertEqual(len(lines), len(items))
+        summary = json.loads(lines[1])
+        self.assertEqual(summary['data_type'], 'summary')
+        self.assertEqual(summary['data']['date_signed'],
+                         '2018-05-03T00:00:00-04:00')
+        itemization = json.loads(lines[2])
+        self.assertEqual(itemization['data']['contribution_amount'], 1000.0)
+        self.assertEqual(
+            itemization['data']['contributor_last_name'],
+            items[2].data['contributor_last_name'],
+        )
+
+    def test_command_line(self):
+        out_path = os.path.join('test-data', '27789.jsonl')
+        try:
+            fecfile.jsonl.main(['test-data/27789.fec', out_path,
+                                '--filter', 'SB'])
+            with open(out_path) as file:
+                lines = [json.loads(line) for line in file]
+        finally:
+            os.remove(out_path)
+        data_types = [line['data_type'] for line in lines]
+        self.assertEqual(data_types.count('itemization'), 211)
+
+
+class TableExport(unittest.TestCase):
+    def setUp(self):
+        self.out_dir = os.path.join('test-data', 'tables')
+
+    def tearDown(self):
+        shutil.rmtree(self.out_dir)
+
+    def test_csv(self):
+        paths = fecfile.to_csv('test-data/1229017.fec', self.out_dir)
+        self.assertEqual(sorted(paths), ['Schedule A', 'Schedule B'])
+        parsed = fecfile.from_file('test-data/1229017.fec')
+        with open(paths['Schedule A']) as file:
+            rows = list(csv.reader(file))
+        mapping = fecfile.fecparser.getMapping(
+            fecfile.fecparser.load_tables()['mappings'], 'SA11AI', '8.2'
+        )
+        # followed by the columns only Schedule A lines for lobbyists have
+        self.assertEqual(rows[0][:len(mapping)], list(mapping))
+        self.assertIn('lobbyist_registrant_organization_name', rows[0])
+        self.assertEqual(len(rows), len(parsed['itemizations']['Schedule A']) + 1)
+        first = dict(zip(rows[0], rows[1]))
+        self.assertEqual(first['contribution_date'], '2018-04-25T00:00:00-04:00')
+        self.assertEqual(first['contribution_amount'], '1000.0')
+        self.assertEqual(first['contributor_street_2'], '')
+
+    def test_schedule_columns(self):
+        paths = fecfile.to_csv('test-data/1385191.fec', self.out_dir)
+        with open(paths['Schedule C']) as file:
+            rows = list(csv.DictReader(file))
+        parsed = fecfile.from_file('test-data/1385191.fec')
+        loans = parsed['itemizations']['Schedule C']
+        self.assertEqual([row['form_type'] for row in rows],
+                         [loan['form_type'] for loan in loans])
+        for row, loan in zip(rows, loans):
+            for k, v in loan.items():
+                self.assertIn(k, row)
+            for k, v in row.items():
+                if k not in loan:
+                    self.assertEqual(v, '')
+
+    def test_parquet(self):
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+        paths = fecfile.to_parquet(
+            'test-data/27789.fec', self.out_dir, batch_size=100
+        )
+        parquet_file = pyarrow.parquet.ParquetFile(paths['Schedule B'])
+        self.assertEqual(parquet_file.num_row_groups, 3)
+        table = parquet_file.read()
+        self.assertEqual(table.num_rows, 211)
+        self.assertEqual(str(table.schema.field('expenditure_amount').type),
+                         'double')
+        self.assertEqual(str(table.schema.field('expenditure_date').type),
+                         'timestamp[us, tz=US/Eastern]')
+        parsed = fecfile.from_file('test-data/27789.fec')
+        self.assertEqual(
+            table.column('expenditure_amount').to_pylist(),
+            [row['expenditure_amount']
+             for row in parsed['itemizations']['Schedule B']],
+        )
+
+
+class LoadIntoDatabase(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(':memory:')
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_load(self):
+        loaded = fecfile.load_into(self.conn, 'test-data/1229017.fec')
+        self.assertEqual(loaded, {'schedule_a': 186, 'schedule_b': 47})
+        parsed = fecfile.from_file('test-data/1229017.fec')
+        contributions = parsed['itemizations']['Schedule A']
+        rows = self.conn.execute(
+            'SELECT filing_id, contributor_last_name, contribution_amount, '
+            'contribution_date FROM schedule_a ORDER BY rowid'
+        ).fetchall()
+        self.assertEqual(len(rows), len(contributions))
+        self.assertEqual(rows[0][0], '1229017')
+        self.assertEqual(
+            [row[1:3] for row in rows],
+            [(c['contributor_last_name'], c['contribution_amount'])
+             for c in contributions],
+        )
+        self.assertEqual(rows[0][3], '2018-04-25T00:00:00-04:00')
+        types = {
+            row[1]: row[2] for row in
+            self.conn.execute('PRAGMA table_info(schedule_a)')
+        }
+        self.assertEqual(types['contribution_amount'], 'DOUBLE PRECISION')
+        self.assertEqual(types['contribution_date'], 'TIMESTAMP')
+        self.assertEqual(types['contributor_last_name'], 'TEXT')
+
+    def test_existing_tables(self):
+        fecfile.load_into(self.conn, 'test-data/27789.fec', batch_size=100)
+        loaded = fecfile.load_into(
+            self.conn, 'test-data/1229017.fec', {'filter_itemizations': ['SA']}
+        )
+        self.assertEqual(loaded, {'schedule_a': 186})
+        counts = self.conn.execute(
+            'SELECT filing_id, COUNT(*) FROM schedule_a GROUP BY filing_id '
+            'ORDER BY filing_id'
+        ).fetchall()
+        self.assertEqual(counts, [('1229017', 186), ('27789', 2626)])
+
+    def test_columns(self):
+        with open('test-data/1229017.fec', 'rb') as file:
+            lines = file.read().splitlines()
+        fecfile.load_into(
+            self.conn, lines, {'columns': ['contribution_amount']},
+            filing_id='1229017', table_prefix='fec_',
+        )
+        columns = [
+            row[1] for row in
+            self.conn.execute('PRAGMA table_info(fec_schedule_a)')
+        ]
+        self.assertEqual(
+            columns, ['filing_id', 'form_type', 'contribution_amount']
+        )
+
+
+class CommandLine(unittest.TestCase):
+    def setUp(self):
+        self.out_dir = os.path.join('test-data', 'converted')
+
+    def tearDown(self):
+        shutil.rmtree(self.out_dir)
+
+    def convert(self, *args, status=0):
+        report = io.StringIO()
+        with unittest.mock.patch('sys.stderr', report):
+            result = fecfile.cli.main(['-o', self.out_dir] + list(args))
+        self.assertEqual(result, status)
+        return report.getvalue()
+
+    def test_jsonl(self):
+        report = self.convert('test-data/1229017.fec', 'test-data/20180616.zip')
+        self.assertIn('converted 53 filings (0 failed)', report)
+        self.assertIn('1229017: 233 itemizations', report)
+        self.assertIn('itemizations/s', report)
+        self.assertIn('MB/s', report)
+        self.assertIn('SA11AI', report)
+        with open(os.path.join(self.out_dir, '1229017.jsonl')) as file:
+            lines = [json.loads(line) for line in file]
+        self.assertEqual(len(lines), 235)
+        self.assertTrue(os.path.exists(
+            os.path.join(self.out_dir, '1238364.jsonl')
+        ))
+
+    def test_csv(self):
+        report = self.convert(
+            '--format', 'csv', '--filter', 'SA', '--columns',
+            'contribution_amount', 'test-data/1229017.fec', '--workers', '2',
+        )
+        self.assertIn('1229017: 186 itemizations', report)
+        path = os.path.join(self.out_dir, '1229017', 'schedule_a.csv')
+        with open(path) as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows[0], ['form_type', 'contribution_amount'])
+        self.assertEqual(rows[1], ['SA11AI', '1000.0'])
+        self.assertEqual(len(rows), 187)
+        self.assertFalse(os.path.exists(
+            os.path.join(self.out_dir, '1229017', 'schedule_b.csv')
+        ))
+
+    def test_repeated_options(self):
+        self.convert(
+            '--format', 'csv', '--filter', 'SA11', '--filter', 'SB,SC',
+            '--columns', 'contribution_amount,expenditure_amount',
+            'test-data/1229017.fec',
+        )
+        out_dir = os.path.join(self.out_dir, '1229017')
+        self.assertEqual(
+            sorted(os.listdir(out_dir)), ['schedule_a.csv', 'schedule_b.csv']
+        )
+        with open(os.path.join(out_dir, 'schedule_b.csv')) as file:
+            header = next(csv.reader(file))
+        self.assertEqual(header, ['form_type', 'expenditure_amount'])
+
+    def test_duplicate_filing_ids(self):
+        z_file = os.path.join('test-data', 'duplicate-ids.zip')
+        with zipfile.ZipFile(z_file, 'w') as zip_file:
+            zip_file.writestr('1229017.fec', 'not the same filing\n')
+        try:
+            report = self.convert(
+                'test-data/1229017.fec', z_file, '-f', 'csv', status=1
+            )
+        finally:
+            os.remove(z_file)
+        self.assertIn('converted 1 filings (1 failed)', report)
+        self.assertIn(
+            'has the same filing id as test-data/1229017.fec', report
+        )
+        self.assertTrue(os.path.exists(
+            os.path.join(self.out_dir, '1229017', 'schedule_a.csv')
+        ))
+
+
+class StandInFecServer(BaseHTTPRequestHandler):
+    """ serves 1229017 and 1236235 as electronic filings and 27789 as a
+    paper filing, with a 503 error the first time 1236235 is requested.
+    Filings have an ETag, and unchanged filings get a 304 response. """
+    failures = {'1236235'}
+    not_modified = 0
+
+    def do_GET(self):
+        kind, posted, name = self.path.strip('/').split('/')
+        file_number = name.split('.')[0]
+        if file_number in self.failures:
+            self.failures.discard(file_number)
+            self.send_error(503)
+            return
+        paper = file_number == '27789'
+        if (kind == 'paper') != paper or file_number not in (
+            '1229017', '1236235', '27789'
+        ):
+            self.send_error(404)
+            return
+        etag = '"{0}-1"'.format(file_number)
+        if self.headers.get('If-None-Match') == etag:
+            StandInFecServer.not_modified += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+        with open('test-data/{0}.fec'.format(file_number), 'rb') as file:
+            body = file.read()
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StandInServerTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInFecServer)
+        threading.Thread(target=self.server.serve_forever).start()
+        base = 'http://127.0.0.1:{0}'.format(self.server.server_port)
+        self.urls = (base + '/dcdev/posted/{n}.fec',
+                     base + '/paper/posted/{n}.fec')
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class ConditionalRequests(StandInServerTest):
+    def test_client(self):
+        cache_dir = os.path.join('test-data', 'http-cache')
+        StandInFecServer.not_modified = 0
+        expected = fecfile.from_file('test-data/27789.fec')
+        try:
+            with fecfile.FecClient(cache_dir, urls=self.urls) as client:
+                self.assertEqual(client.from_http(27789), expected)
+                self.assertEqual(StandInFecServer.not_modified, 0)
+                self.assertEqual(client.from_http(27789), expected)
+                items = list(client.iter_http(27789))
+                self.assertEqual(StandInFecServer.not_modified, 2)
+                self.assertEqual(items[1].data, expected['filing'])
+                self.assertIsNone(client.from_http(1))
+                with self.assertRaises(fecfile.FilingUnavailableError):
+                    list(client.iter_http(1))
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_without_cache(self):
+        with fecfile.FecClient(urls=self.urls) as client:
+            self.assertEqual(
+                client.from_http(1229017),
+                fecfile.from_file('test-data/1229017.fec'),
+            )
+
+    def test_default_client_per_thread(self):
+        client = fecfile.client.default_client()
+        self.assertIs(fecfile.client.default_client(), client)
+        clients = []
+        thread = threading.Thread(
+            target=lambda: clients.append(fecfile.client.default_client())
+        )
+        thread.start()
+        thread.join()
+        self.assertIsNot(clients[0], client)
+
+
+class AsyncDownloads(StandInServerTest):
+    def setUp(self):
+        try:
+            import aiohttp
+        except ImportError:
+            self.skipTest('aiohttp is not installed')
+        import fecfile.aio
+        super(AsyncDownloads, self).setUp()
+
+    def test_iter_http(self):
+        async def collect(file_number):
+            return [
+                item async for item in fecfile.aio.iter_http(
+                    file_number, urls=self.urls, backoff=0
+                )
+            ]
+        items = asyncio.run(collect(27789))
+        expected = list(fecfile.iter_file('test-data/27789.fec'))
+        self.assertEqual(len(items), len(expected))
+        self.assertEqual(items[-1].data, expected[-1].data)
+        with self.assertRaises(fecfile.FilingUnavailableError):
+            asyncio.run(collect(1))
+
+    def test_fetch_many(self):
+        async def collect():
+            return {
+                result.path: result async for result in fecfile.aio.fetch_many(
+                    [1229017, 1236235, 27789, 1], urls=self.urls, backoff=0
+                )
+            }
+        results = asyncio.run(collect())
+        self.assertEqual(sorted(results), [1, 27789, 1229017, 1236235])
+        for file_number in (1229017, 1236235):
+            self.assertIsNone(results[file_number].error)
+            self.assertEqual(
+                results[file_number].data,
+                fecfile.from_file('test-data/{0}.fec'.format(file_number)),
+            )
+        self.assertIsNone(results[1].data)
+        self.assertIsNone(results[1].error)
+
+
 class AllFormsHaveMappings(unittest.TestCase):
     def test_request(self):
         missing_mappings = {}
@@ -437,10 +1462,72 @@ if __name__ == '__main__':
         V2Filing('test_request'),
         V1Filing('test_request'),
         Windows1252Encoding('test_read'),
+        Windows1252Encoding('test_mixed'),
         OptionsFilterItemizations('test_read'),
+        OptionsFilterItemizations('test_undecoded'),
+        ColumnsOption('test_read'),
+        ColumnsOption('test_parse_line'),
+        DatesOption('test_read'),
+        DatesOption('test_formats'),
+        InternOption('test_read'),
+        InternOption('test_columns'),
+        InternOption('test_tables'),
+        RecordsOption('test_read'),
+        RecordsOption('test_record_type'),
+        RecordsOption('test_iter_file'),
         AsStringsOption('test_request'),
         ParseHttpIterator('test_parse'),
         ParseFileIterator('test_parse'),
+        RowDecoderIsReused('test_decode'),
+        RegexIndexLookups('test_prefixes'),
+        RegexIndexLookups('test_lookup'),
+        RegexIndexLookups('test_threads'),
+        BoundedCaches('test_stats'),
+        BoundedCaches('test_eviction'),
+        LazyTables('test_import'),
+        LazyTables('test_lazy_modules'),
+        LazyTables('test_tables_match_json'),
+        MemoryMappedFile('test_line_endings'),
+        MemoryMappedFile('test_map_lines'),
+        StreamCsvOption('test_same_as_per_line'),
+        StreamCsvOption('test_embedded_newline'),
+        ColumnarOption('test_read'),
+        ColumnarOption('test_mixed_columns'),
+        ColumnarOption('test_batches'),
+        DataFrameExport('test_pandas'),
+        DataFrameExport('test_arrow'),
+        ParseManyFiles('test_parse'),
+        ParseFileInParallel('test_parse'),
+        ParseFileInParallel('test_text_sections'),
+        ParseFileInParallel('test_count_lines'),
+        ParseFileInParallel('test_text_markers'),
+        ParseFileInParallel('test_carriage_returns'),
+        IterateOverZipFile('test_iterate'),
+        IterateOverZipFile('test_select'),
+        IterateOverZipFile('test_other_members'),
+        ParseCache('test_from_file'),
+        ParseCache('test_eviction'),
+        ParseCache('test_unreadable_entry'),
+        JsonLinesExport('test_dump'),
+        JsonLinesExport('test_command_line'),
+        TableExport('test_csv'),
+        TableExport('test_schedule_columns'),
+        TableExport('test_parquet'),
+        LoadIntoDatabase('test_load'),
+        LoadIntoDatabase('test_existing_tables'),
+        LoadIntoDatabase('test_columns'),
+        ResumableParsing('test_positions'),
+        ResumableParsing('test_resume'),
+        ResumableParsing('test_resume_text'),
+        CommandLine('test_jsonl'),
+        CommandLine('test_csv'),
+        CommandLine('test_repeated_options'),
+        CommandLine('test_duplicate_filing_ids'),
+        ConditionalRequests('test_client'),
+        ConditionalRequests('test_without_cache'),
+        ConditionalRequests('test_default_client_per_thread'),
+        AsyncDownloads('test_iter_http'),
+        AsyncDownloads('test_fetch_many'),
     ])
     mappings_test = unittest.TestSuite([AllFormsHaveMappings('test_request')])
     if len(sys.argv) > 1 and sys.argv[1] == 'mappings':